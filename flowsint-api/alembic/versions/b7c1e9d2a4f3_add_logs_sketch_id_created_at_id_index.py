@@ -0,0 +1,40 @@
+"""add_logs_sketch_id_created_at_id_index
+
+Revision ID: b7c1e9d2a4f3
+Revises: f4d42260273d
+Create Date: 2026-10-17 10:12:44.518203
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b7c1e9d2a4f3"
+down_revision: Union[str, None] = "f4d42260273d"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # The logs table can be large, don't lock it while the index is built
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "idx_logs_sketch_id_created_at_id",
+            "logs",
+            ["sketch_id", "created_at", "id"],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "idx_logs_sketch_id_created_at_id",
+            table_name="logs",
+            postgresql_concurrently=True,
+        )
@@ -0,0 +1,154 @@
+"""partition_logs_by_month
+
+Revision ID: c3d8f2a6e1b4
+Revises: b7c1e9d2a4f3
+Create Date: 2026-10-17 14:03:27.904511
+
+Logs are copied to the partitioned table in the migration's transaction,
+with the old table locked from its rename until the commit: writing logs
+(and so running scans) blocks for the duration of the copy. On large logs
+tables, stop the workers before upgrading.
+
+"""
+
+from datetime import date, datetime, timezone
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "c3d8f2a6e1b4"
+down_revision: Union[str, None] = "b7c1e9d2a4f3"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Partitions created ahead of the current month, the maintenance task
+# (maintain_logs) keeps creating them afterwards
+PARTITIONS_AHEAD = 3
+
+
+def _add_months(month: date, months: int) -> date:
+    index = month.year * 12 + month.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def _create_partition(month: date) -> None:
+    end = _add_months(month, 1)
+    op.execute(
+        f"CREATE TABLE logs_y{month.year:04d}m{month.month:02d} PARTITION OF logs "
+        f"FOR VALUES FROM ('{month.isoformat()} 00:00:00+00') "
+        f"TO ('{end.isoformat()} 00:00:00+00')"
+    )
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "log_daily_rollups",
+        sa.Column("sketch_id", sa.UUID(), nullable=False),
+        sa.Column("day", sa.Date(), nullable=False),
+        sa.Column("enricher", sa.String(), nullable=False),
+        sa.Column(
+            "type",
+            postgresql.ENUM(name="eventlevel", create_type=False),
+            nullable=False,
+        ),
+        sa.Column("count", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["sketch_id"], ["sketches.id"], onupdate="CASCADE", ondelete="CASCADE"
+        ),
+        sa.PrimaryKeyConstraint("sketch_id", "day", "enricher", "type"),
+    )
+
+    # The partition key must be part of the primary key
+    op.execute("ALTER TABLE logs RENAME TO logs_unpartitioned")
+    op.execute(
+        "ALTER TABLE logs_unpartitioned "
+        "RENAME CONSTRAINT logs_pkey TO logs_unpartitioned_pkey"
+    )
+    op.execute(
+        "ALTER INDEX idx_logs_sketch_id_created_at_id "
+        "RENAME TO idx_logs_unpartitioned_sketch_id_created_at_id"
+    )
+    op.execute("""
+        CREATE TABLE logs (
+            id UUID NOT NULL,
+            content JSON,
+            created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT now(),
+            sketch_id UUID REFERENCES sketches (id)
+                ON UPDATE CASCADE ON DELETE CASCADE,
+            type eventlevel DEFAULT 'INFO',
+            CONSTRAINT logs_pkey PRIMARY KEY (id, created_at)
+        ) PARTITION BY RANGE (created_at)
+        """)
+    op.create_index(
+        "idx_logs_sketch_id_created_at_id",
+        "logs",
+        ["sketch_id", "created_at", "id"],
+        unique=False,
+    )
+
+    oldest, newest = (
+        op.get_bind()
+        .execute(
+            sa.text("SELECT min(created_at), max(created_at) FROM logs_unpartitioned")
+        )
+        .one()
+    )
+    current = datetime.now(timezone.utc).date().replace(day=1)
+    month = min(oldest.date().replace(day=1), current) if oldest else current
+    last = _add_months(current, PARTITIONS_AHEAD)
+    if newest:
+        last = max(last, newest.date().replace(day=1))
+    while month <= last:
+        _create_partition(month)
+        month = _add_months(month, 1)
+    # Catches the logs of months whose partition wasn't created yet, the
+    # maintenance task moves them to their partition
+    op.execute("CREATE TABLE logs_default PARTITION OF logs DEFAULT")
+
+    op.execute(
+        "INSERT INTO logs (id, content, created_at, sketch_id, type) "
+        "SELECT id, content, COALESCE(created_at, now()), sketch_id, type "
+        "FROM logs_unpartitioned"
+    )
+    op.execute("DROP TABLE logs_unpartitioned")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("ALTER TABLE logs RENAME TO logs_partitioned")
+    op.execute(
+        "ALTER TABLE logs_partitioned "
+        "RENAME CONSTRAINT logs_pkey TO logs_partitioned_pkey"
+    )
+    op.execute(
+        "ALTER INDEX idx_logs_sketch_id_created_at_id "
+        "RENAME TO idx_logs_partitioned_sketch_id_created_at_id"
+    )
+    op.execute("""
+        CREATE TABLE logs (
+            id UUID NOT NULL,
+            content JSON,
+            created_at TIMESTAMP WITH TIME ZONE DEFAULT now(),
+            sketch_id UUID REFERENCES sketches (id)
+                ON UPDATE CASCADE ON DELETE CASCADE,
+            type eventlevel DEFAULT 'INFO',
+            CONSTRAINT logs_pkey PRIMARY KEY (id)
+        )
+        """)
+    op.create_index(
+        "idx_logs_sketch_id_created_at_id",
+        "logs",
+        ["sketch_id", "created_at", "id"],
+        unique=False,
+    )
+    op.execute(
+        "INSERT INTO logs (id, content, created_at, sketch_id, type) "
+        "SELECT id, content, created_at, sketch_id, type FROM logs_partitioned"
+    )
+    # Drops the partitions too
+    op.execute("DROP TABLE logs_partitioned")
+    op.drop_table("log_daily_rollups")
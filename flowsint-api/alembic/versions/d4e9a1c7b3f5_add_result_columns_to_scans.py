@@ -0,0 +1,35 @@
+"""add_result_columns_to_scans
+
+Revision ID: d4e9a1c7b3f5
+Revises: c3d8f2a6e1b4
+Create Date: 2026-10-17 16:21:45.118203
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "d4e9a1c7b3f5"
+down_revision: Union[str, None] = "c3d8f2a6e1b4"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Existing scans keep their results inline, in details
+    op.add_column("scans", sa.Column("result_key", sa.String(), nullable=True))
+    op.add_column("scans", sa.Column("result_count", sa.Integer(), nullable=True))
+    op.add_column("scans", sa.Column("result_size", sa.Integer(), nullable=True))
+    op.create_index(op.f("ix_scans_result_key"), "scans", ["result_key"], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f("ix_scans_result_key"), table_name="scans")
+    op.drop_column("scans", "result_size")
+    op.drop_column("scans", "result_count")
+    op.drop_column("scans", "result_key")
@@ -0,0 +1,15 @@
+"""Helpers serving the cached catalogs with ETags."""
+
+from fastapi import Request, Response
+from flowsint_core.core.services import Catalog
+from flowsint_core.core.services.catalog_service import etag_matches
+
+
+def catalog_response(request: Request, catalog: Catalog) -> Response:
+    """Serve a catalog, or a 304 when the client already has this version."""
+    headers = {"ETag": catalog.etag, "Cache-Control": "private, no-cache"}
+    if etag_matches(request.headers.get("if-none-match"), catalog.etag):
+        return Response(status_code=304, headers=headers)
+    return Response(
+        content=catalog.body, media_type="application/json", headers=headers
+    )
@@ -3,13 +3,14 @@
 from typing import List
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
 from flowsint_core.core.models import Profile
 from flowsint_core.core.postgre_db import get_db
 from flowsint_core.core.services import (
     ConflictError,
     NotFoundError,
     ValidationError,
+    create_catalog_service,
     create_enricher_template_service,
     create_template_generator_service,
 )
@@ -20,6 +21,7 @@ from sqlalchemy.orm import Session
 
 from flowsint_types.registry import get_type as get_type_from_registry, load_all_types
 
+from app.api.catalog_utils import catalog_response
 from app.api.deps import get_current_user
 from app.api.schemas.enricher_template import (
     EnricherTemplateCreate,
@@ -67,6 +69,7 @@ def create_template(
 
 @router.get("", response_model=List[EnricherTemplateList])
 def list_templates(
+    request: Request,
     category: str = Query(None, description="Filter by category"),
     include_public: bool = Query(
         True, description="Include public templates from other users"
@@ -75,8 +78,16 @@ def list_templates(
     current_user: Profile = Depends(get_current_user),
 ):
     """List enricher templates."""
-    service = create_enricher_template_service(db)
-    return service.list_templates(current_user.id, category, include_public)
+    service = create_catalog_service(db)
+    catalog = service.get_template_catalog(
+        current_user.id,
+        category,
+        include_public,
+        serialize=lambda template: EnricherTemplateList.model_validate(
+            template
+        ).model_dump(mode="json"),
+    )
+    return catalog_response(request, catalog)
 
 
 @router.post("/generate", response_model=EnricherTemplateGenerateResponse)
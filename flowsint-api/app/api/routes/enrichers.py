@@ -1,12 +1,12 @@
 from typing import List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query
-from flowsint_core.core.celery import celery
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from flowsint_core.core.celery import celery, launch_priority
 from flowsint_core.core.graph import create_graph_service
 from flowsint_core.core.models import Profile
 from flowsint_core.core.postgre_db import get_db
 from flowsint_core.core.services import (
-    create_enricher_service,
+    create_catalog_service,
     create_enricher_template_service,
 )
 from flowsint_core.core.services.type_registry_service import create_type_registry_service
@@ -14,6 +14,7 @@ from flowsint_enrichers import ENRICHER_REGISTRY, load_all_enrichers
 from pydantic import BaseModel
 from sqlalchemy.orm import Session
 
+from app.api.catalog_utils import catalog_response
 from app.api.deps import get_current_user
 
 load_all_enrichers()
@@ -29,15 +30,17 @@ router = APIRouter()
 
 @router.get("")
 def get_enrichers(
+    request: Request,
     category: Optional[str] = Query(None),
     db: Session = Depends(get_db),
     current_user: Profile = Depends(get_current_user),
 ):
     """Get all enrichers, optionally filtered by category."""
-    enricher_service = create_enricher_service(db)
-    return enricher_service.get_all_enrichers(
+    catalog_service = create_catalog_service(db)
+    catalog = catalog_service.get_enricher_catalog(
         category, current_user.id, ENRICHER_REGISTRY
     )
+    return catalog_response(request, catalog)
 
 
 @router.post("/{enricher_name}/launch")
@@ -84,6 +87,7 @@ async def launch_enricher(
                 payload.sketch_id,
                 str(current_user.id),
             ],
+            priority=launch_priority(str(current_user.id), len(entities)),
         )
         return {"id": task.id}
 
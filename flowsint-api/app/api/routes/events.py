@@ -1,18 +1,18 @@
-from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 from sqlalchemy.orm import Session
 from sse_starlette.sse import EventSourceResponse
 import json
-import asyncio
-from datetime import datetime
+from datetime import date, datetime
 
 from flowsint_core.core.postgre_db import get_db
-from flowsint_core.core.events import event_emitter
+from flowsint_core.core.events import HEARTBEAT_INTERVAL, get_event_hub
 from flowsint_core.core.models import Profile
 from flowsint_core.core.services import (
     create_log_service,
     NotFoundError,
     PermissionDeniedError,
     DatabaseError,
+    ValidationError,
 )
 from app.api.deps import get_current_user
 
@@ -22,19 +22,57 @@ router = APIRouter()
 @router.get("/sketch/{sketch_id}/logs")
 def get_logs_by_sketch(
     sketch_id: str,
-    limit: int = 100,
+    response: Response,
+    limit: int = Query(100, ge=1, le=1000),
     since: datetime | None = None,
+    cursor: str | None = None,
     db: Session = Depends(get_db),
     current_user: Profile = Depends(get_current_user),
 ):
-    """Get historical logs for a specific sketch with optional filtering."""
+    """
+    Get historical logs for a specific sketch with optional filtering.
+
+    The newest logs are returned, oldest to newest. When older logs remain,
+    the X-Next-Cursor header holds the cursor to pass to get them.
+    """
+    service = create_log_service(db)
+    try:
+        page = service.get_log_page(sketch_id, current_user.id, limit, since, cursor)
+    except NotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except PermissionDeniedError:
+        raise HTTPException(status_code=403, detail="Forbidden")
+    except ValidationError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if page.next_cursor:
+        response.headers["X-Next-Cursor"] = page.next_cursor
+    return page.items
+
+
+@router.get("/sketch/{sketch_id}/logs/stats")
+def get_log_stats_by_sketch(
+    sketch_id: str,
+    since: date | None = None,
+    db: Session = Depends(get_db),
+    current_user: Profile = Depends(get_current_user),
+):
+    """Get the daily number of logs of a sketch per enricher and level."""
     service = create_log_service(db)
     try:
-        return service.get_logs_by_sketch(sketch_id, current_user.id, limit, since)
+        rollups = service.get_daily_stats(sketch_id, current_user.id, since)
     except NotFoundError as e:
         raise HTTPException(status_code=404, detail=str(e))
     except PermissionDeniedError:
         raise HTTPException(status_code=403, detail="Forbidden")
+    return [
+        {
+            "day": rollup.day,
+            "enricher": rollup.enricher or None,
+            "type": rollup.type,
+            "count": rollup.count,
+        }
+        for rollup in rollups
+    ]
 
 
 @router.get("/sketch/{sketch_id}/stream")
@@ -55,35 +93,19 @@ async def stream_events(
         raise HTTPException(status_code=403, detail="Forbidden")
 
     async def event_generator():
-        channel = sketch_id
-        await event_emitter.subscribe(channel)
-        try:
+        async with get_event_hub().listen(sketch_id) as subscription:
             yield json.dumps({"event": "connected", "data": "Connected to log stream"})
-            while True:
-                if await request.is_disconnected():
-                    break
-
-                data = await event_emitter.get_message(channel)
-                if data is None:
-                    await asyncio.sleep(0.1)
-                    continue
-
+            # Cancelled by EventSourceResponse when the client disconnects
+            async for data in subscription:
                 if isinstance(data, dict) and data.get("type") == "enricher_complete":
                     yield json.dumps({"event": "enricher_complete", "data": data})
                 else:
                     yield json.dumps({"event": "log", "data": data})
-                await asyncio.sleep(0.1)
-
-        except asyncio.CancelledError:
-            print(f"[EventEmitter] Client disconnected from sketch_id: {sketch_id}")
-        except Exception as e:
-            print(f"[EventEmitter] Error in stream_logs: {str(e)}")
-        finally:
-            await event_emitter.unsubscribe(channel)
 
     return EventSourceResponse(
         event_generator(),
         media_type="text/event-stream",
+        ping=HEARTBEAT_INTERVAL,
         headers={
             "Cache-Control": "no-cache",
             "Connection": "keep-alive",
@@ -127,33 +149,15 @@ async def stream_sketch_status(
         raise HTTPException(status_code=403, detail="Forbidden")
 
     async def status_generator():
-        channel = f"{sketch_id}_status"
-        await event_emitter.subscribe(channel)
-        try:
+        async with get_event_hub().listen(f"{sketch_id}_status") as subscription:
             yield json.dumps({"event": "connected", "data": "Connected to status stream"})
-
-            while True:
-                if await request.is_disconnected():
-                    break
-
-                data = await event_emitter.get_message(channel)
-                if data is None:
-                    await asyncio.sleep(0.1)
-                    continue
-
+            async for data in subscription:
                 yield json.dumps({"event": "status", "data": data})
-                await asyncio.sleep(0.1)
-
-        except asyncio.CancelledError:
-            print(f"[EventEmitter] Client disconnected from status stream for sketch_id: {sketch_id}")
-        except Exception as e:
-            print(f"[EventEmitter] Error in stream_sketch_status: {str(e)}")
-        finally:
-            await event_emitter.unsubscribe(channel)
 
     return EventSourceResponse(
         status_generator(),
         media_type="text/event-stream",
+        ping=HEARTBEAT_INTERVAL,
         headers={
             "Cache-Control": "no-cache",
             "Connection": "keep-alive",
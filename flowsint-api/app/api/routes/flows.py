@@ -1,20 +1,23 @@
 from typing import Any, Dict, List, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
-from flowsint_core.core.celery import celery
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from flowsint_core.core.celery import celery, launch_priority
 from flowsint_core.core.graph import create_graph_service
 from flowsint_core.core.models import Profile
 from flowsint_core.core.postgre_db import get_db
+from flowsint_core.core.flow_compiler import FlowCompiler
 from flowsint_core.core.services import (
     NotFoundError,
     PermissionDeniedError,
+    ValidationError,
     create_flow_service,
+    get_catalog_cache,
 )
 from flowsint_core.core.services.type_registry_service import (
     create_type_registry_service,
 )
-from flowsint_core.core.types import FlowBranch, FlowEdge, FlowNode, FlowStep
+from flowsint_core.core.types import FlowBranch, FlowDag, FlowEdge, FlowNode
 from flowsint_core.utils import extract_input_schema_flow
 from flowsint_enrichers import ENRICHER_REGISTRY, load_all_enrichers
 from flowsint_types import (
@@ -39,6 +42,7 @@ from flowsint_types import (
 from pydantic import BaseModel
 from sqlalchemy.orm import Session
 
+from app.api.catalog_utils import catalog_response
 from app.api.deps import get_current_user
 from app.api.schemas.flow import FlowCreate, FlowRead, FlowUpdate
 
@@ -53,6 +57,7 @@ class FlowComputationRequest(BaseModel):
 
 class FlowComputationResponse(BaseModel):
     flowBranches: List[FlowBranch]
+    flowDag: FlowDag
     initialData: Any
 
 
@@ -80,7 +85,14 @@ def get_flows(
 
 
 @router.get("/raw_materials")
-async def get_material_list():
+async def get_material_list(request: Request):
+    catalog = get_catalog_cache().get(
+        ("raw_materials",), ENRICHER_REGISTRY.version, build_material_list
+    )
+    return catalog_response(request, catalog)
+
+
+def build_material_list() -> Dict[str, Any]:
     enrichers = ENRICHER_REGISTRY.list_by_categories()
     enricher_categories = {
         category: [
@@ -131,9 +143,13 @@ async def get_material_list():
 
 
 @router.get("/input_type/{input_type}")
-async def get_material_by_input_type(input_type: str):
-    enrichers = ENRICHER_REGISTRY.list_by_input_type(input_type)
-    return {"items": enrichers}
+async def get_material_by_input_type(input_type: str, request: Request):
+    catalog = get_catalog_cache().get(
+        ("enrichers_by_input_type", input_type.lower()),
+        ENRICHER_REGISTRY.version,
+        lambda: {"items": ENRICHER_REGISTRY.list_by_input_type(input_type)},
+    )
+    return catalog_response(request, catalog)
 
 
 @router.post("/create", response_model=FlowRead, status_code=status.HTTP_201_CREATED)
@@ -212,7 +228,7 @@ async def launch_flow(
         )
         entities = graph_service.get_nodes_by_ids_for_task(payload.node_ids)
 
-        # Compute flow branches
+        # Compile the flow
         nodes = [FlowNode(**node) for node in flow.flow_schema["nodes"]]
         edges = [FlowEdge(**edge) for edge in flow.flow_schema["edges"]]
 
@@ -225,17 +241,21 @@ async def launch_flow(
             if len(entities)
             else "sample_value"
         )
-        flow_branches = compute_flow_branches(sample_value, nodes, edges)
-        serializable_branches = [branch.model_dump() for branch in flow_branches]
+        # The task runs the DAG, whose size is linear in the flow, instead of
+        # the branches expanded from it
+        flow_dag = FlowCompiler(
+            nodes, edges, sample_value, simulate_outputs=process_node_data
+        ).dag()
 
         task = celery.send_task(
             "run_flow",
             args=[
-                serializable_branches,
+                flow_dag.model_dump(),
                 entities,
                 payload.sketch_id,
                 str(current_user.id),
             ],
+            priority=launch_priority(str(current_user.id), len(entities)),
         )
         return {"id": task.id}
 
@@ -243,6 +263,8 @@ async def launch_flow(
         raise HTTPException(status_code=404, detail=str(e))
     except PermissionDeniedError:
         raise HTTPException(status_code=403, detail="Forbidden")
+    except ValidationError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         print(e)
         raise HTTPException(status_code=500, detail=f"Error launching flow: {str(e)}")
@@ -253,8 +275,19 @@ def compute_flows(
     request: FlowComputationRequest, current_user: Profile = Depends(get_current_user)
 ):
     initial_data = generate_sample_data(request.inputType or "string")
-    flow_branches = compute_flow_branches(initial_data, request.nodes, request.edges)
-    return FlowComputationResponse(flowBranches=flow_branches, initialData=initial_data)
+    try:
+        compiler = FlowCompiler(
+            request.nodes,
+            request.edges,
+            initial_data,
+            simulate_outputs=process_node_data,
+        )
+        flow_branches = compiler.branches()
+    except ValidationError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return FlowComputationResponse(
+        flowBranches=flow_branches, flowDag=compiler.dag(), initialData=initial_data
+    )
 
 
 def generate_sample_data(type_str: str) -> Any:
@@ -281,198 +314,6 @@ def generate_sample_data(type_str: str) -> Any:
         return f"sample_{type_str}"
 
 
-def compute_flow_branches(
-    initial_value: Any, nodes: List[FlowNode], edges: List[FlowEdge]
-) -> List[FlowBranch]:
-    """Computes flow branches based on nodes and edges with proper DFS traversal"""
-    input_nodes = [node for node in nodes if node.data.get("type") == "type"]
-
-    if not input_nodes:
-        return [
-            FlowBranch(
-                id="error",
-                name="Error",
-                steps=[
-                    FlowStep(
-                        nodeId="error",
-                        inputs={},
-                        params={},
-                        type="error",
-                        outputs={},
-                        status="error",
-                        branchId="error",
-                        depth=0,
-                    )
-                ],
-            )
-        ]
-
-    node_map = {node.id: node for node in nodes}
-    branches = []
-    branch_counter = 0
-    enricher_outputs = {}
-
-    def calculate_path_length(start_node: str, visited: set = None) -> int:
-        if visited is None:
-            visited = set()
-        if start_node in visited:
-            return float("inf")
-        visited.add(start_node)
-        out_edges = [edge for edge in edges if edge.source == start_node]
-        if not out_edges:
-            return 1
-        min_length = float("inf")
-        for edge in out_edges:
-            length = calculate_path_length(edge.target, visited.copy())
-            min_length = min(min_length, length)
-        return 1 + min_length
-
-    def get_outgoing_edges(node_id: str) -> List[FlowEdge]:
-        out_edges = [edge for edge in edges if edge.source == node_id]
-        return sorted(out_edges, key=lambda e: calculate_path_length(e.target))
-
-    def create_step(
-        node_id: str,
-        branch_id: str,
-        depth: int,
-        input_data: Dict[str, Any],
-        is_input_node: bool,
-        outputs: Dict[str, Any],
-        node_params: Optional[Dict[str, Any]] = None,
-    ) -> FlowStep:
-        return FlowStep(
-            nodeId=node_id,
-            params=node_params,
-            inputs={} if is_input_node else input_data,
-            outputs=outputs,
-            type="type" if is_input_node else "enricher",
-            status="pending",
-            branchId=branch_id,
-            depth=depth,
-        )
-
-    def explore_branch(
-        current_node_id: str,
-        branch_id: str,
-        branch_name: str,
-        depth: int,
-        input_data: Dict[str, Any],
-        path: List[str],
-        branch_visited: set,
-        steps: List[FlowStep],
-        parent_outputs: Dict[str, Any] = None,
-    ) -> None:
-        nonlocal branch_counter
-
-        if current_node_id in path:
-            return
-
-        current_node = node_map.get(current_node_id)
-        if not current_node:
-            return
-
-        is_input_node = current_node.data.get("type") == "type"
-        if is_input_node:
-            outputs_array = current_node.data["outputs"].get("properties", [])
-            first_output_name = (
-                outputs_array[0].get("name", "output") if outputs_array else "output"
-            )
-            current_outputs = {first_output_name: initial_value}
-        else:
-            if current_node_id in enricher_outputs:
-                current_outputs = enricher_outputs[current_node_id]
-            else:
-                current_outputs = process_node_data(current_node, input_data)
-                enricher_outputs[current_node_id] = current_outputs
-
-        node_params = current_node.data.get("params", {})
-
-        current_step = create_step(
-            current_node_id,
-            branch_id,
-            depth,
-            input_data,
-            is_input_node,
-            current_outputs,
-            node_params,
-        )
-        steps.append(current_step)
-        path.append(current_node_id)
-        branch_visited.add(current_node_id)
-
-        out_edges = get_outgoing_edges(current_node_id)
-
-        if not out_edges:
-            branches.append(FlowBranch(id=branch_id, name=branch_name, steps=steps[:]))
-        else:
-            for i, edge in enumerate(out_edges):
-                if edge.target in path:
-                    continue
-
-                output_key = edge.sourceHandle
-                if not output_key and current_outputs:
-                    output_key = list(current_outputs.keys())[0]
-
-                output_value = current_outputs.get(output_key) if output_key else None
-                if output_value is None and parent_outputs:
-                    output_value = (
-                        parent_outputs.get(output_key) if output_key else None
-                    )
-
-                next_input = {edge.targetHandle or "input": output_value}
-
-                if i == 0:
-                    explore_branch(
-                        edge.target,
-                        branch_id,
-                        branch_name,
-                        depth + 1,
-                        next_input,
-                        path,
-                        branch_visited,
-                        steps,
-                        current_outputs,
-                    )
-                else:
-                    branch_counter += 1
-                    new_branch_id = f"{branch_id}-{branch_counter}"
-                    new_branch_name = f"{branch_name} (Branch {branch_counter})"
-                    new_steps = steps[: len(steps)]
-                    new_branch_visited = branch_visited.copy()
-                    explore_branch(
-                        edge.target,
-                        new_branch_id,
-                        new_branch_name,
-                        depth + 1,
-                        next_input,
-                        path[:],
-                        new_branch_visited,
-                        new_steps,
-                        current_outputs,
-                    )
-
-        path.pop()
-        steps.pop()
-
-    for index, input_node in enumerate(input_nodes):
-        branch_id = f"branch-{index}"
-        branch_name = f"Flow {index + 1}" if len(input_nodes) > 1 else "Main Flow"
-        explore_branch(
-            input_node.id,
-            branch_id,
-            branch_name,
-            0,
-            {},
-            [],
-            set(),
-            [],
-            None,
-        )
-
-    branches.sort(key=lambda branch: len(branch.steps))
-    return branches
-
-
 def process_node_data(node: FlowNode, inputs: Dict[str, Any]) -> Dict[str, Any]:
     """Process node data based on node type and inputs"""
     outputs = {}
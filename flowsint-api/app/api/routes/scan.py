@@ -1,7 +1,7 @@
 from typing import List
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 from flowsint_core.core.models import Profile
 from flowsint_core.core.postgre_db import get_db
 from flowsint_core.core.services import (
@@ -43,6 +43,23 @@ def get_scan_by_id(
         raise HTTPException(status_code=403, detail="Forbidden")
 
 
+@router.get("/{id}/results")
+def get_scan_results(
+    id: UUID,
+    db: Session = Depends(get_db),
+    current_user: Profile = Depends(get_current_user),
+):
+    """Get the full results of a scan, fetched from the blob store if offloaded."""
+    service = create_scan_service(db)
+    try:
+        results = service.get_results(id, current_user.id)
+    except NotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except PermissionDeniedError:
+        raise HTTPException(status_code=403, detail="Forbidden")
+    return Response(content=results, media_type="application/json")
+
+
 @router.delete("/{id}", status_code=status.HTTP_204_NO_CONTENT)
 def delete_scan_by_id(
     id: UUID,
@@ -8,9 +8,11 @@ from fastapi import (
     File,
     Form,
     HTTPException,
+    Query,
     UploadFile,
     status,
 )
+from fastapi.responses import StreamingResponse
 from flowsint_core.core.graph import GraphNode
 from flowsint_core.core.models import Profile
 from flowsint_core.core.postgre_db import get_db
@@ -91,6 +93,10 @@ class UpdatePositionsInput(BaseModel):
     positions: List[NodePosition]
 
 
+STREAMING_IMPORT_EXTENSIONS = (".txt", ".csv", ".ndjson", ".jsonl")
+IMPORT_EXTENSIONS = STREAMING_IMPORT_EXTENSIONS + (".json",)
+
+
 class EntityMappingInput(BaseModel):
     """Pydantic model for parsing entity mapping input from frontend."""
     id: str
@@ -203,6 +209,24 @@ async def get_sketch_nodes(
         raise HTTPException(status_code=403, detail="Forbidden")
 
 
+@router.get("/{sketch_id}/graph/stream")
+async def stream_sketch_graph(
+    sketch_id: str,
+    chunk_size: int = Query(1000, ge=1, le=10000),
+    db: Session = Depends(get_db),
+    current_user: Profile = Depends(get_current_user),
+):
+    """Stream the nodes, then the edges, of a sketch as NDJSON chunks."""
+    service = create_sketch_service(db)
+    try:
+        lines = service.stream_graph(UUID(sketch_id), current_user.id, chunk_size)
+    except NotFoundError:
+        raise HTTPException(status_code=404, detail="Graph not found")
+    except PermissionDeniedError:
+        raise HTTPException(status_code=403, detail="Forbidden")
+    return StreamingResponse(lines, media_type="application/x-ndjson")
+
+
 @router.post("/{sketch_id}/nodes/add")
 @update_sketch_timestamp
 def add_node(
@@ -411,7 +435,7 @@ async def analyze_import_file(
     db: Session = Depends(get_db),
     current_user: Profile = Depends(get_current_user),
 ):
-    """Analyze an uploaded TXT or JSON file for import."""
+    """Analyze an uploaded TXT, CSV, NDJSON or JSON file for import."""
     service = create_sketch_service(db)
     try:
         service.get_by_id(UUID(sketch_id), current_user.id)
@@ -420,24 +444,20 @@ async def analyze_import_file(
     except PermissionDeniedError:
         raise HTTPException(status_code=403, detail="Forbidden")
 
-    if not file.filename or not file.filename.lower().endswith((".txt", ".json")):
+    if not file.filename or not file.filename.lower().endswith(IMPORT_EXTENSIONS):
         raise HTTPException(
             status_code=400,
-            detail="Only .txt and .json files are supported. Please upload a correct format.",
+            detail="Only .txt, .csv, .ndjson, .jsonl and .json files are supported. Please upload a correct format.",
         )
 
-    try:
-        content = await file.read()
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=f"Failed to read file: {str(e)}")
-
     try:
         type_registry = create_type_registry_service(db)
         resolver = type_registry.build_type_resolver(current_user.id)
         graph_service = create_graph_service(sketch_id=sketch_id, enable_batching=False, type_resolver=resolver)
         import_service = create_import_service(graph_service)
+        # Streaming formats are read line by line from the spooled upload
         result = import_service.analyze_file(
-            file_content=content,
+            file_content=file.file,
             filename=file.filename or "unknown.txt",
         )
     except ValueError as e:
@@ -513,6 +533,61 @@ async def execute_import(
     )
 
 
+@router.post("/{sketch_id}/import/file", response_model=ImportExecuteResponse)
+@update_sketch_timestamp
+def import_file(
+    sketch_id: str,
+    file: UploadFile = File(...),
+    exclude_types: Optional[str] = Form(None),
+    background_tasks: BackgroundTasks = BackgroundTasks(),
+    db: Session = Depends(get_db),
+    current_user: Profile = Depends(get_current_user),
+):
+    """Import every entity of a TXT, CSV or NDJSON file, without a preview step.
+
+    Entities are imported with their detected type, except the comma-separated
+    `exclude_types`. The file is streamed and written in chunks, in the
+    threadpool so that large imports don't block the event loop.
+    """
+    service = create_sketch_service(db)
+    try:
+        service.get_by_id(UUID(sketch_id), current_user.id)
+    except NotFoundError:
+        raise HTTPException(status_code=404, detail="Sketch not found")
+    except PermissionDeniedError:
+        raise HTTPException(status_code=403, detail="Forbidden")
+
+    if not file.filename or not file.filename.lower().endswith(STREAMING_IMPORT_EXTENSIONS):
+        raise HTTPException(
+            status_code=400,
+            detail="Only .txt, .csv, .ndjson and .jsonl files can be imported directly.",
+        )
+
+    type_registry = create_type_registry_service(db)
+    resolver = type_registry.build_type_resolver(current_user.id)
+    graph_service = create_graph_service(sketch_id=sketch_id, enable_batching=False, type_resolver=resolver)
+    import_service = create_import_service(graph_service)
+
+    excluded = [t.strip() for t in (exclude_types or "").split(",") if t.strip()]
+    try:
+        result = import_service.import_file(
+            file_content=file.file,
+            filename=file.filename,
+            exclude_types=excluded,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Import failed: {str(e)}")
+
+    return ImportExecuteResponse(
+        status=result.status,
+        nodes_created=result.nodes_created,
+        nodes_skipped=result.nodes_skipped,
+        errors=result.errors,
+    )
+
+
 @router.get("/{id}/export")
 async def export_sketch(
     id: str,
@@ -1,10 +1,14 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Request
 from pydantic import BaseModel
 from sqlalchemy.orm import Session
 
 from flowsint_core.core.models import Profile
 from flowsint_core.core.postgre_db import get_db
-from flowsint_core.core.services import create_type_registry_service
+from flowsint_core.core.services import (
+    create_catalog_service,
+    create_type_registry_service,
+)
+from app.api.catalog_utils import catalog_response
 from app.api.deps import get_current_user
 
 router = APIRouter()
@@ -12,11 +16,13 @@ router = APIRouter()
 
 @router.get("")
 async def get_types_list(
-    db: Session = Depends(get_db), current_user: Profile = Depends(get_current_user)
+    request: Request,
+    db: Session = Depends(get_db),
+    current_user: Profile = Depends(get_current_user),
 ):
     """Get the complete types list for sketches."""
-    service = create_type_registry_service(db)
-    return service.get_types_list(current_user.id)
+    service = create_catalog_service(db)
+    return catalog_response(request, service.get_type_catalog(current_user.id))
 
 
 class DetectRequest(BaseModel):
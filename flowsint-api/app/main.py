@@ -2,6 +2,7 @@ import os
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from flowsint_core.core.events import init_events
 
 # Routes to be included
 from app.api.routes import auth
@@ -35,7 +36,10 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    # Pagination cursor of the logs
+    expose_headers=["X-Next-Cursor"],
 )
+init_events(app)
 
 
 @app.get("/health")
@@ -13,6 +13,7 @@ import pytest
 from fastapi.testclient import TestClient
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
 
 from flowsint_core.core.models import Base
 from flowsint_core.core.postgre_db import get_db
@@ -21,8 +22,11 @@ from app.main import app
 
 @pytest.fixture
 def db_session():
+    # StaticPool: the app runs in another thread and must see the same database
     engine = create_engine(
-        "sqlite:///:memory:", connect_args={"check_same_thread": False}
+        "sqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
     )
     Base.metadata.create_all(engine)
     Session = sessionmaker(bind=engine)
@@ -0,0 +1,45 @@
+"""ETag contract of the catalog endpoints."""
+
+from flowsint_core.core.auth import create_access_token
+from flowsint_core.core.models import Profile
+
+
+def auth_headers(db_session):
+    db_session.add(Profile(email="user@example.com", hashed_password="x"))
+    db_session.commit()
+    token = create_access_token({"sub": "user@example.com"})
+    return {"Authorization": f"Bearer {token}"}
+
+
+def test_types_catalog_is_served_with_an_etag(client, db_session):
+    headers = auth_headers(db_session)
+
+    res = client.get("/api/types", headers=headers)
+    assert res.status_code == 200
+    assert res.headers["etag"]
+    assert any(category["type"] == "network_category" for category in res.json())
+
+    cached = client.get(
+        "/api/types", headers={**headers, "If-None-Match": res.headers["etag"]}
+    )
+    assert cached.status_code == 304
+    assert cached.headers["etag"] == res.headers["etag"]
+    assert cached.content == b""
+
+
+def test_stale_etag_gets_the_catalog(client, db_session):
+    headers = auth_headers(db_session)
+
+    res = client.get("/api/types", headers={**headers, "If-None-Match": '"stale"'})
+    assert res.status_code == 200
+
+
+def test_raw_materials_catalog(client):
+    res = client.get("/api/flows/raw_materials")
+    assert res.status_code == 200
+    assert "types" in res.json()["items"]
+
+    cached = client.get(
+        "/api/flows/raw_materials", headers={"If-None-Match": res.headers["etag"]}
+    )
+    assert cached.status_code == 304
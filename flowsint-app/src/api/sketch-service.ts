@@ -100,6 +100,15 @@ export const sketchService = {
       body: formData
     })
   },
+  importFile: async (sketchId: string, file: File): Promise<any> => {
+    const formData = new FormData()
+    formData.append('file', file)
+
+    return fetchWithAuth(`/api/sketches/${sketchId}/import/file`, {
+      method: 'POST',
+      body: formData
+    })
+  },
   executeImport: async (
     sketchId: string,
     entityMappings: Array<{
@@ -12,7 +12,8 @@ import {
 import { Checkbox } from '@/components/ui/checkbox'
 import { Input } from '@/components/ui/input'
 import { Badge } from '@/components/ui/badge'
-import { CheckCircle2, XCircle, Loader2, ChevronLeft, ChevronRight } from 'lucide-react'
+import { Alert, AlertDescription, AlertTitle } from '@/components/ui/alert'
+import { CheckCircle2, XCircle, Loader2, ChevronLeft, ChevronRight, Info } from 'lucide-react'
 import { sketchService } from '@/api/sketch-service'
 import { useActionItems } from '@/hooks/use-action-items'
 import { toast } from 'sonner'
@@ -28,8 +29,12 @@ interface EntityMapping {
   data: Record<string, any>
 }
 
+// Formats the /import/file route streams without a preview
+const STREAMING_EXTENSIONS = ['.txt', '.csv', '.ndjson', '.jsonl']
+
 interface ImportPreviewProps {
   analysisResult: any
+  file: File
   sketchId: string
   onSuccess: () => void
   onCancel: () => void
@@ -349,6 +354,7 @@ SimpleTypeTable.displayName = 'SimpleTypeTable'
 
 export function ImportPreview({
   analysisResult,
+  file,
   sketchId,
   onSuccess,
   onCancel
@@ -537,11 +543,23 @@ export function ImportPreview({
     return result
   }, [mappingIdsByType, getMappingsForType])
 
-  const handleImport = useCallback(async () => {
+  // Only the first entities of large files are previewed
+  const isTruncated = Boolean(analysisResult.truncated)
+  const canImportAll =
+    isTruncated &&
+    STREAMING_EXTENSIONS.some((extension) => file.name.toLowerCase().endsWith(extension))
+
+  const handleImport = useCallback(async (importAll = false) => {
     setIsImporting(true)
     try {
-      const mappingsArray = Array.from(mappingsById.values()).filter((m) => m.include)
-      const result = await sketchService.executeImport(sketchId, mappingsArray, edges)
+      let result
+      if (importAll) {
+        // Every entity of the file, with its detected type
+        result = await sketchService.importFile(sketchId, file)
+      } else {
+        const mappingsArray = Array.from(mappingsById.values()).filter((m) => m.include)
+        result = await sketchService.executeImport(sketchId, mappingsArray, edges)
+      }
       setImportResult(result)
 
       if (result.status === 'completed') {
@@ -561,7 +579,7 @@ export function ImportPreview({
       setIsImporting(false)
       toast.error(error?.message)
     }
-  }, [mappingsById, sketchId, onSuccess, refetchGraph])
+  }, [mappingsById, sketchId, file, onSuccess, refetchGraph])
 
   const typeNames = useMemo(() => Object.keys(mappingIdsByType), [mappingIdsByType])
   const [activeTab, setActiveTab] = useState('')
@@ -652,6 +670,21 @@ export function ImportPreview({
 
   return (
     <div className="flex flex-col h-full overflow-hidden">
+      {isTruncated && (
+        <div className="px-4 pt-4">
+          <Alert>
+            <Info />
+            <AlertTitle>Large file</AlertTitle>
+            <AlertDescription>
+              Only the first {mappingsById.size} of {analysisResult.total_entities}{' '}
+              entities are previewed, and importing the preview leaves the others out.
+              {canImportAll
+                ? ' Use "Import all" to import every entity with its detected type.'
+                : ' Split the file to import the others.'}
+            </AlertDescription>
+          </Alert>
+        </div>
+      )}
       <Tabs
         value={activeTab}
         onValueChange={setActiveTab}
@@ -714,7 +747,12 @@ export function ImportPreview({
         <Button variant="outline" onClick={onCancel} disabled={isImporting}>
           Cancel
         </Button>
-        <Button onClick={handleImport} disabled={isImporting}>
+        {canImportAll && (
+          <Button variant="outline" onClick={() => handleImport(true)} disabled={isImporting}>
+            Import all {analysisResult.total_entities} entities
+          </Button>
+        )}
+        <Button onClick={() => handleImport()} disabled={isImporting}>
           {isImporting && <Loader2 className="mr-2 h-4 w-4 animate-spin" />}
           {isImporting ? 'Importing...' : `Import ${includedCount} entities`}
         </Button>
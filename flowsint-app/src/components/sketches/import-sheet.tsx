@@ -188,6 +188,7 @@ export function ImportSheet({ sketchId }: ImportSheetProps) {
             <div className="flex flex-col grow overflow-hidden">
               <ImportPreview
                 analysisResult={analysisResult}
+                file={file}
                 sketchId={sketchId}
                 onSuccess={handleClose}
                 onCancel={handleReset}
@@ -0,0 +1,173 @@
+"""
+Content-addressed blob storage.
+
+Blobs are stored under their key (a content hash chosen by the caller), so
+storing the same content twice stores it once. Two backends:
+- "local" (default): files under BLOB_STORE_DIR, which must be shared by the
+  API and the Celery workers (e.g. a Docker volume)
+- "s3": a bucket (BLOB_STORE_S3_BUCKET) of S3 or of an S3-compatible server
+  such as MinIO (BLOB_STORE_S3_ENDPOINT_URL). Credentials are read by boto3,
+  from AWS_ACCESS_KEY_ID and AWS_SECRET_ACCESS_KEY. Requires the `s3` extra.
+"""
+
+import os
+import tempfile
+import threading
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Iterator, Optional, Protocol, Tuple
+
+
+class BlobNotFoundError(KeyError):
+    """No blob is stored under the key."""
+
+
+class BlobStore(Protocol):
+    """Protocol for blob storage backends."""
+
+    def put(self, key: str, data: bytes) -> None:
+        """Store a blob, replacing any blob stored under the key."""
+        ...
+
+    def get(self, key: str) -> bytes:
+        """Get a blob, raising BlobNotFoundError if there is none."""
+        ...
+
+    def exists(self, key: str) -> bool:
+        """Whether a blob is stored under the key."""
+        ...
+
+    def delete(self, key: str) -> None:
+        """Delete a blob, if it exists."""
+        ...
+
+    def iter_blobs(self) -> Iterator[Tuple[str, datetime]]:
+        """Iterate over the keys of the blobs and their last write time (UTC)."""
+        ...
+
+
+class LocalBlobStore:
+    """Blobs stored as files, fanned out in directories by key prefix."""
+
+    def __init__(self, root: str):
+        self._root = Path(root)
+
+    def _path(self, key: str) -> Path:
+        return self._root / key[:2] / key[2:4] / key
+
+    def put(self, key: str, data: bytes) -> None:
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Written aside then renamed, readers never see a partial blob
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as file:
+                file.write(data)
+            os.replace(tmp_path, path)
+        except BaseException:
+            Path(tmp_path).unlink(missing_ok=True)
+            raise
+
+    def get(self, key: str) -> bytes:
+        try:
+            return self._path(key).read_bytes()
+        except FileNotFoundError:
+            raise BlobNotFoundError(key)
+
+    def exists(self, key: str) -> bool:
+        return self._path(key).is_file()
+
+    def delete(self, key: str) -> None:
+        self._path(key).unlink(missing_ok=True)
+
+    def iter_blobs(self) -> Iterator[Tuple[str, datetime]]:
+        for path in self._root.glob("*/*/*"):
+            if path.name.startswith(".tmp-"):
+                continue
+            try:
+                mtime = path.stat().st_mtime
+            except FileNotFoundError:
+                continue
+            yield path.name, datetime.fromtimestamp(mtime, timezone.utc)
+
+
+class S3BlobStore:
+    """Blobs stored as objects of an S3 (or MinIO) bucket."""
+
+    def __init__(
+        self, bucket: str, prefix: str = "", endpoint_url: Optional[str] = None
+    ):
+        try:
+            import boto3
+        except ImportError:
+            raise RuntimeError(
+                "The s3 blob store requires boto3, install flowsint-core[s3]"
+            )
+        self._client = boto3.client("s3", endpoint_url=endpoint_url)
+        self._bucket = bucket
+        self._prefix = prefix
+
+    def put(self, key: str, data: bytes) -> None:
+        self._client.put_object(Bucket=self._bucket, Key=self._prefix + key, Body=data)
+
+    def get(self, key: str) -> bytes:
+        try:
+            response = self._client.get_object(
+                Bucket=self._bucket, Key=self._prefix + key
+            )
+        except self._client.exceptions.NoSuchKey:
+            raise BlobNotFoundError(key)
+        return response["Body"].read()
+
+    def exists(self, key: str) -> bool:
+        from botocore.exceptions import ClientError
+
+        try:
+            self._client.head_object(Bucket=self._bucket, Key=self._prefix + key)
+            return True
+        except ClientError as e:
+            if e.response.get("Error", {}).get("Code") in ("404", "NoSuchKey"):
+                return False
+            raise
+
+    def delete(self, key: str) -> None:
+        self._client.delete_object(Bucket=self._bucket, Key=self._prefix + key)
+
+    def iter_blobs(self) -> Iterator[Tuple[str, datetime]]:
+        paginator = self._client.get_paginator("list_objects_v2")
+        for page in paginator.paginate(Bucket=self._bucket, Prefix=self._prefix):
+            for item in page.get("Contents", []):
+                yield item["Key"][len(self._prefix) :], item["LastModified"]
+
+
+def create_blob_store() -> BlobStore:
+    """
+    Create the blob store configured by the environment.
+
+    Configured with BLOB_STORE_BACKEND ("local" or "s3"), BLOB_STORE_DIR,
+    BLOB_STORE_S3_BUCKET, BLOB_STORE_S3_PREFIX and BLOB_STORE_S3_ENDPOINT_URL.
+    """
+    backend = os.getenv("BLOB_STORE_BACKEND", "local")
+    if backend == "local":
+        return LocalBlobStore(os.getenv("BLOB_STORE_DIR", "data/blobs"))
+    if backend == "s3":
+        return S3BlobStore(
+            bucket=os.environ["BLOB_STORE_S3_BUCKET"],
+            prefix=os.getenv("BLOB_STORE_S3_PREFIX", ""),
+            endpoint_url=os.getenv("BLOB_STORE_S3_ENDPOINT_URL") or None,
+        )
+    raise ValueError(f"Unknown blob store backend '{backend}', expected local or s3")
+
+
+_blob_store: Optional[BlobStore] = None
+_blob_store_lock = threading.Lock()
+
+
+def get_blob_store() -> BlobStore:
+    """Get the process-wide blob store."""
+    global _blob_store
+    if _blob_store is None:
+        with _blob_store_lock:
+            if _blob_store is None:
+                _blob_store = create_blob_store()
+    return _blob_store
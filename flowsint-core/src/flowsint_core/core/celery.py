@@ -1,6 +1,77 @@
+"""
+Celery application and queue topology.
+
+Tasks are routed to a queue per workload, so that a long Docker scan can't
+hold up quick lookups or event emission:
+- "events": emit_event and emit_status_event
+- "enrichers": enrichers making network or API calls, and templates
+- "docker": enrichers running Docker tools (`Enricher.queue = "docker"`)
+- "flows": run_flow
+- "celery": everything else (maintenance)
+
+The chunks of large enricher launches (see fan_out.py) go to the queue of
+their enricher, with the priority of the launch.
+
+A worker consumes every queue unless started with -Q/-X. Its prefetch
+multiplier is the lowest of QUEUE_PREFETCH_MULTIPLIERS over the queues it
+consumes, unless set with --prefetch-multiplier.
+
+Within a queue, launches are ordered by priority (0 is the highest, as on
+the Redis broker): interactive launches of a few entities come first, then
+bulk launches, each bulk launch queued by a user lowering the priority of
+their next one so that one user can't starve the others.
+"""
+
+import os
+from typing import Any, Dict, Optional
+
+import redis
 from celery import Celery
+from celery.schedules import crontab
+from celery.signals import task_postrun, worker_init
+from kombu import Queue
+
 from .config import settings
 
+QUEUE_DEFAULT = "celery"
+QUEUE_EVENTS = "events"
+QUEUE_ENRICHERS = "enrichers"
+QUEUE_DOCKER = "docker"
+QUEUE_FLOWS = "flows"
+
+# Quick tasks are prefetched in batches, long ones one at a time so that
+# queued tasks stay available to idle workers
+QUEUE_PREFETCH_MULTIPLIERS: Dict[str, int] = {
+    QUEUE_DEFAULT: 1,
+    QUEUE_EVENTS: 16,
+    QUEUE_ENRICHERS: 4,
+    QUEUE_DOCKER: 1,
+    QUEUE_FLOWS: 1,
+}
+
+TASK_QUEUES: Dict[str, str] = {
+    "emit_event": QUEUE_EVENTS,
+    "emit_status_event": QUEUE_EVENTS,
+    "run_enricher": QUEUE_ENRICHERS,
+    "run_enricher_chunk": QUEUE_ENRICHERS,
+    "merge_enricher_chunks": QUEUE_ENRICHERS,
+    "fail_enricher_chunks": QUEUE_ENRICHERS,
+    "run_template_enricher": QUEUE_ENRICHERS,
+    "run_flow": QUEUE_FLOWS,
+}
+
+# Tasks launched by users, whose args start with (name or branches,
+# entities, sketch_id, user_id)
+LAUNCH_TASKS = ("run_enricher", "run_template_enricher", "run_flow")
+
+PRIORITY_INTERACTIVE = 0
+PRIORITY_BULK = 3
+PRIORITY_LOWEST = 9
+# Launches of up to this many entities are interactive
+INTERACTIVE_MAX_ITEMS = int(os.getenv("CELERY_INTERACTIVE_MAX_ITEMS", "5"))
+
+TASK_TIME_LIMIT = 3600  # 1 hour
+
 celery = Celery(
     "flowsint",
     broker=settings.CELERY_BROKER_URL,
@@ -9,9 +80,27 @@ celery = Celery(
         "flowsint_core.tasks.event",
         "flowsint_core.tasks.enricher",
         "flowsint_core.tasks.flow",
+        "flowsint_core.tasks.maintenance",
     ],
 )
 
+
+def route_task(
+    name: str, args: Any, kwargs: Any, options: Any, task: Any = None, **kw
+) -> Optional[Dict[str, str]]:
+    """Route a task to the queue of its workload."""
+    if name in ("run_enricher", "run_enricher_chunk") and args:
+        # Imported here, the enricher registry imports the core
+        from flowsint_enrichers.registry import ENRICHER_REGISTRY
+
+        enricher = ENRICHER_REGISTRY.get_enricher_class(args[0])
+        if enricher is not None:
+            return {"queue": enricher.queue}
+    if name in TASK_QUEUES:
+        return {"queue": TASK_QUEUES[name]}
+    return None
+
+
 celery.conf.update(
     task_serializer="json",
     accept_content=["json"],
@@ -19,7 +108,119 @@ celery.conf.update(
     timezone="UTC",
     enable_utc=True,
     task_track_started=True,
-    task_time_limit=3600,  # 1 hour
+    task_time_limit=TASK_TIME_LIMIT,
     worker_max_tasks_per_child=1000,
-    worker_prefetch_multiplier=4,  # Allow each worker to prefetch up to 4 tasks
+    # Overridden per worker from the queues it consumes, see configure_prefetch
+    worker_prefetch_multiplier=1,
+    task_default_queue=QUEUE_DEFAULT,
+    task_queues=[
+        Queue(queue, routing_key=queue) for queue in QUEUE_PREFETCH_MULTIPLIERS
+    ],
+    task_routes=(route_task,),
+    task_default_priority=PRIORITY_BULK,
+    # Chunks of a launch keep its priority
+    task_inherit_parent_priority=True,
+    broker_transport_options={"priority_steps": list(range(PRIORITY_LOWEST + 1))},
+    beat_schedule={
+        # Log partitions, rollups and retention
+        "maintain-logs": {
+            "task": "maintain_logs",
+            "schedule": crontab(hour=3, minute=0),
+        },
+        # Result blobs of deleted scans, sketches and investigations
+        "sweep-scan-results": {
+            "task": "sweep_scan_results",
+            "schedule": crontab(hour=3, minute=30),
+        },
+    },
 )
+
+
+@worker_init.connect
+def configure_prefetch(sender=None, **kwargs) -> None:
+    """Set the prefetch multiplier of a worker from the queues it consumes."""
+    if sender is None or sender.app is not celery:
+        return
+    if sender.prefetch_multiplier != celery.conf.worker_prefetch_multiplier:
+        # Set with --prefetch-multiplier
+        return
+    queues = list(celery.amqp.queues.consume_from)
+    sender.prefetch_multiplier = min(
+        (QUEUE_PREFETCH_MULTIPLIERS.get(queue, 1) for queue in queues), default=1
+    )
+
+
+_redis_client: Optional[redis.Redis] = None
+
+
+def _get_redis() -> redis.Redis:
+    global _redis_client
+    if _redis_client is None:
+        _redis_client = redis.from_url(
+            settings.CELERY_BROKER_URL, socket_connect_timeout=2, socket_timeout=2
+        )
+    return _redis_client
+
+
+def _queued_launches_key(user_id: str) -> str:
+    return f"flowsint:queued_launches:{user_id}"
+
+
+def launch_priority(
+    user_id: str, item_count: int, client: Optional[redis.Redis] = None
+) -> int:
+    """
+    Priority of a launch of an enricher or flow by a user.
+
+    Bulk launches are counted per user until they finish, each queued bulk
+    launch of a user lowering the priority of the next one.
+
+    Args:
+        user_id: ID of the user launching the task
+        item_count: Number of entities the task runs on
+        client: Redis client, the broker's by default
+
+    Returns:
+        Priority of the task, 0 being the highest
+    """
+    if item_count <= INTERACTIVE_MAX_ITEMS:
+        return PRIORITY_INTERACTIVE
+    client = client or _get_redis()
+    key = _queued_launches_key(user_id)
+    try:
+        pipe = client.pipeline()
+        pipe.incr(key)
+        # Counts left behind by crashed workers expire
+        pipe.expire(key, TASK_TIME_LIMIT)
+        queued = pipe.execute()[0]
+    except redis.RedisError:
+        return PRIORITY_BULK
+    return min(PRIORITY_BULK + queued - 1, PRIORITY_LOWEST)
+
+
+def launch_finished(
+    user_id: str, item_count: int, client: Optional[redis.Redis] = None
+) -> None:
+    """Stop counting a launch counted by launch_priority()."""
+    if item_count <= INTERACTIVE_MAX_ITEMS:
+        return
+    client = client or _get_redis()
+    key = _queued_launches_key(user_id)
+    try:
+        if client.decr(key) <= 0:
+            client.delete(key)
+    except redis.RedisError:
+        pass
+
+
+@task_postrun.connect
+def _on_launch_finished(sender=None, args=None, retval=None, **kwargs) -> None:
+    if sender is None or sender.name not in LAUNCH_TASKS:
+        return
+    if isinstance(retval, dict) and retval.get("chunks"):
+        # Fanned out, counted until merge_enricher_chunks or
+        # fail_enricher_chunks runs
+        return
+    if not args or len(args) < 4 or args[3] is None:
+        return
+    launch_finished(str(args[3]), len(args[1] or []))
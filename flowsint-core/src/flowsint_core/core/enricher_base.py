@@ -1,12 +1,16 @@
+import asyncio
+import inspect
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional
 
 from pydantic import BaseModel, Field, TypeAdapter, ValidationError, create_model
 from pydantic.config import ConfigDict
 
-from ..utils import resolve_type
+from ..utils import resolve_type, to_json_serializable
 from .graph import GraphService, create_graph_service
+from .http_client import HttpClientPool, get_http_pool
 from .logger import Logger
+from .result_cache import KEY_PREFIX, get_result_cache, stable_hash
 from .vault import VaultProtocol
 
 
@@ -102,12 +106,48 @@ class Enricher(ABC):
     - Consistent schema generation across all enrichers
 
     Subclasses can override input_schema() or output_schema() if needed for special cases.
+
+    ## Per-item fan-out
+
+    Enrichers that make one network call per input can implement scan_item()
+    and let map_items() run it across inputs concurrently:
+
+    ```python
+    async def scan_item(self, domain: Domain) -> Ip | None:
+        return Ip(address=socket.gethostbyname(domain.domain))
+
+    async def scan(self, data: List[InputType]) -> List[OutputType]:
+        ips = await self.map_items(data)
+        return [ip for ip in ips if ip is not None]
+    ```
+
+    A plain (non-async) callable passed to map_items() is considered blocking
+    and runs in a worker thread instead of the event loop.
+
+    Setting `cache_ttl` (seconds) caches map_items() results per input item in
+    the persistent result cache. Bump `version` when the output of an enricher
+    changes so that stale entries are ignored.
+
+    Enrichers running Docker tools set `queue = "docker"` to run on the
+    workers dedicated to long-running scans.
     """
 
     # Abstract type aliases that must be defined in subclasses for runtime use
     InputType = NotImplemented
     OutputType = NotImplemented
 
+    # Fan-out defaults used by map_items(), overridable per enricher
+    max_concurrency: int = 10
+    item_timeout: Optional[float] = 30.0
+
+    # Result cache settings used by map_items(), disabled by default
+    cache_ttl: Optional[int] = None
+    version: str = "1"
+
+    # Celery queue the enricher runs on, "docker" for enrichers running Docker
+    # tools so that long scans don't hold up network lookups
+    queue: str = "enrichers"
+
     def __init__(
         self,
         sketch_id: Optional[str] = None,
@@ -336,6 +376,129 @@ class Enricher(ABC):
     async def scan(self, values: List[str]) -> List[Dict[str, Any]]:
         pass
 
+    async def scan_item(self, item: Any) -> Any:
+        """
+        Process a single input item. Used by map_items() when no callable is given.
+        Override this method in enrichers that work item by item.
+        """
+        raise NotImplementedError(f"scan_item is not implemented in {self.name()}")
+
+    async def map_items(
+        self,
+        items: List[Any],
+        func: Optional[Callable[[Any], Any]] = None,
+        concurrency: Optional[int] = None,
+        timeout: Optional[float] = None,
+    ) -> List[Any]:
+        """
+        Run a per-item callable across items with bounded concurrency.
+
+        Coroutine functions run on the event loop, plain functions are offloaded
+        to a worker thread. An item that raises or exceeds the timeout is logged
+        and yields None, so one bad input never fails the whole scan.
+
+        When `cache_ttl` is set, cached results are reused and only the
+        remaining items are processed.
+
+        Args:
+            items: Input items
+            func: Callable taking one item (defaults to scan_item)
+            concurrency: Maximum items in flight (defaults to max_concurrency)
+            timeout: Per-item timeout in seconds (defaults to item_timeout)
+
+        Returns:
+            Results in the same order as items
+        """
+        func = func or self.scan_item
+        concurrency = concurrency or self.max_concurrency
+        timeout = timeout if timeout is not None else self.item_timeout
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+        is_async = inspect.iscoroutinefunction(func)
+
+        async def run(item: Any) -> Any:
+            async with semaphore:
+                call = func(item) if is_async else asyncio.to_thread(func, item)
+                try:
+                    return await asyncio.wait_for(call, timeout)
+                except asyncio.TimeoutError:
+                    Logger.warn(
+                        self.sketch_id,
+                        {
+                            "message": f"Enricher {self.name()} timed out after {timeout}s on {item}",
+                            "enricher": self.name(),
+                        },
+                    )
+                except Exception as e:
+                    Logger.info(
+                        self.sketch_id,
+                        {
+                            "message": f"Enricher {self.name()} failed on {item}: {e}",
+                            "enricher": self.name(),
+                        },
+                    )
+                return None
+
+        results: List[Any] = [None] * len(items)
+        pending = list(range(len(items)))
+
+        cache = get_result_cache() if self.cache_ttl else None
+        if cache is not None:
+            namespace = self._cache_namespace(func)
+            keys = [f"{namespace}:{stable_hash(item)}" for item in items]
+            cached = await asyncio.to_thread(cache.get_many, keys)
+            pending = [index for index, value in enumerate(cached) if value is None]
+            for index, value in enumerate(cached):
+                if value is not None:
+                    results[index] = self.decode_cached_result(value)
+            await asyncio.to_thread(
+                cache.record, self.name(), len(items) - len(pending), len(pending)
+            )
+
+        computed = await asyncio.gather(*(run(items[index]) for index in pending))
+
+        fresh: Dict[str, Any] = {}
+        for index, value in zip(pending, computed):
+            results[index] = value
+            # Failed items are not cached so they are retried next time
+            if cache is not None and value is not None:
+                fresh[keys[index]] = to_json_serializable(value)
+        if fresh:
+            await asyncio.to_thread(cache.set_many, fresh, self.cache_ttl)
+
+        return results
+
+    def _cache_namespace(self, func: Callable[[Any], Any]) -> str:
+        """
+        Build the cache key prefix of this enricher.
+        Secret params are left out so that rotating an API key keeps the cache.
+        """
+        secret_names = {
+            param["name"]
+            for param in self.params_schema
+            if param.get("type") == "vaultSecret"
+        }
+        params = {k: v for k, v in self.params.items() if k not in secret_names}
+        func_name = getattr(func, "__name__", "item")
+        return f"{KEY_PREFIX}:{self.name()}:{self.version}:{func_name}:{stable_hash(params)}"
+
+    def decode_cached_result(self, value: Any) -> Any:
+        """
+        Rebuild a map_items() result read from the result cache.
+        By default, dicts are validated back into OutputType.
+        Override this method if the per-item results are not OutputType instances.
+        """
+        output_type = self.OutputType
+        if not (isinstance(output_type, type) and issubclass(output_type, BaseModel)):
+            return value
+        if isinstance(value, dict):
+            return output_type.model_validate(value)
+        if isinstance(value, list):
+            return [
+                output_type.model_validate(item) if isinstance(item, dict) else item
+                for item in value
+            ]
+        return value
+
     def set_params(self, params: Dict[str, Any]) -> None:
         self.params = params
 
@@ -405,7 +568,8 @@ class Enricher(ABC):
             Logger.warn(
                 self.sketch_id,
                 {
-                    "message": f"No valid input were provided to enricher '{self.name()}'."
+                    "message": f"No valid input were provided to enricher '{self.name()}'.",
+                    "enricher": self.name(),
                 },
             )
             return values
@@ -418,7 +582,13 @@ class Enricher(ABC):
 
     async def execute(self, values: List[Any]) -> List[Dict[str, Any]]:
         if self.name() != "enricher_orchestrator":
-            Logger.info(self.sketch_id, {"message": f"Enricher {self.name()} started."})
+            Logger.info(
+                self.sketch_id,
+                {
+                    "message": f"Enricher {self.name()} started.",
+                    "enricher": self.name(),
+                },
+            )
         try:
             await self.async_init()
             preprocessed = self.preprocess(values)
@@ -430,7 +600,11 @@ class Enricher(ABC):
 
             if self.name() != "enricher_orchestrator":
                 Logger.completed(
-                    self.sketch_id, {"message": f"Enricher {self.name()} finished."}
+                    self.sketch_id,
+                    {
+                        "message": f"Enricher {self.name()} finished.",
+                        "enricher": self.name(),
+                    },
                 )
 
             return processed
@@ -439,7 +613,10 @@ class Enricher(ABC):
             if self.name() != "enricher_orchestrator":
                 Logger.error(
                     self.sketch_id,
-                    {"message": f"Enricher {self.name()} errored: {str(e)}"},
+                    {
+                        "message": f"Enricher {self.name()} errored: {str(e)}",
+                        "enricher": self.name(),
+                    },
                 )
             return []
 
@@ -506,3 +683,19 @@ class Enricher(ABC):
             GraphService instance for advanced operations
         """
         return self._graph_service
+
+    @property
+    def http(self) -> HttpClientPool:
+        """
+        Get the shared HTTP client pool.
+
+        Use it instead of opening a client per scan to reuse connections and
+        respect per-host rate limits:
+            ```python
+            response = await self.http.get(url, rate_limit_key=api_key)
+            ```
+
+        Returns:
+            Process-wide HttpClientPool instance
+        """
+        return get_http_pool()
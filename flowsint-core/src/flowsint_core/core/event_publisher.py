@@ -0,0 +1,209 @@
+"""
+Non-blocking publisher for real-time log events.
+
+Logging used to publish every event synchronously, opening a new Redis
+client per call. Events are now put on a bounded in-memory queue and a
+background thread publishes them in batches, through a pooled Redis client
+and a single pipeline per batch.
+
+When the queue is full (Redis down or too slow), the overflow policy decides
+what happens:
+- "drop_oldest" (default): discard the oldest queued event, keep the new one
+- "drop_newest": discard the new event
+- "block": wait up to `block_timeout` seconds for room, then drop the new event
+
+Events are for live display only (logs are persisted separately), so dropping
+them never loses data. Dropped events are counted in `dropped`.
+"""
+
+import atexit
+import logging
+import os
+import queue
+import threading
+from typing import Dict, List, Optional, Tuple
+
+import redis
+
+from .enums import EventLevel
+from .types import Event
+
+logger = logging.getLogger(__name__)
+
+OVERFLOW_POLICIES = ("drop_oldest", "drop_newest", "block")
+
+# (channel, log_id, sketch_id, level, content)
+QueuedEvent = Tuple[str, str, str, EventLevel, Dict]
+
+
+class EventPublisher:
+    """
+    Thread-safe buffered Redis event publisher.
+
+    Implements the EventEmitter protocol from logger_protocols.
+    """
+
+    def __init__(
+        self,
+        redis_url: Optional[str] = None,
+        max_queue_size: int = 10000,
+        batch_size: int = 200,
+        flush_interval: float = 0.05,
+        overflow: str = "drop_oldest",
+        block_timeout: float = 0.5,
+    ):
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError(
+                f"Unknown overflow policy '{overflow}', expected one of {OVERFLOW_POLICIES}"
+            )
+        self._redis_url = redis_url
+        self._batch_size = batch_size
+        self._flush_interval = flush_interval
+        self._overflow = overflow
+        self._block_timeout = block_timeout
+        self._queue: "queue.Queue[QueuedEvent]" = queue.Queue(maxsize=max_queue_size)
+        self._redis: Optional[redis.Redis] = None
+        self._worker: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self._shutdown_event = threading.Event()
+        self.dropped = 0
+
+    def emit(
+        self, log_id: str, sketch_id: str, level: EventLevel, content: Dict
+    ) -> None:
+        """Queue an event on the sketch channel."""
+        self._enqueue((str(sketch_id), log_id, str(sketch_id), level, content))
+
+    def emit_status(
+        self, log_id: str, sketch_id: str, level: EventLevel, content: Dict
+    ) -> None:
+        """Queue an event on the sketch status channel (graph refresh)."""
+        self._enqueue((f"{sketch_id}_status", log_id, str(sketch_id), level, content))
+
+    def _enqueue(self, event: QueuedEvent) -> None:
+        self._ensure_worker()
+        if self._overflow == "block":
+            try:
+                self._queue.put(event, timeout=self._block_timeout)
+            except queue.Full:
+                self._count_drop()
+            return
+
+        while True:
+            try:
+                self._queue.put_nowait(event)
+                return
+            except queue.Full:
+                if self._overflow == "drop_newest":
+                    self._count_drop()
+                    return
+                # drop_oldest: make room and try again
+                try:
+                    self._queue.get_nowait()
+                    self._count_drop()
+                except queue.Empty:
+                    pass
+
+    def _count_drop(self) -> None:
+        with self._lock:
+            self.dropped += 1
+
+    def _ensure_worker(self) -> None:
+        if self._worker is not None and self._worker.is_alive():
+            return
+        with self._lock:
+            if self._worker is None or not self._worker.is_alive():
+                self._shutdown_event.clear()
+                self._worker = threading.Thread(
+                    target=self._run, daemon=True, name="LoggerEventPublisher"
+                )
+                self._worker.start()
+
+    def _client(self) -> redis.Redis:
+        if self._redis is None:
+            url = self._redis_url or os.environ["REDIS_URL"]
+            self._redis = redis.Redis(
+                connection_pool=redis.ConnectionPool.from_url(url)
+            )
+        return self._redis
+
+    def _run(self) -> None:
+        while not self._shutdown_event.is_set():
+            self._publish_pending(wait=self._flush_interval)
+
+    def _publish_pending(self, wait: Optional[float] = None) -> int:
+        """
+        Publish up to one batch of queued events.
+
+        Args:
+            wait: Seconds to wait for a first event, None to return at once
+
+        Returns:
+            Number of events taken from the queue
+        """
+        batch: List[QueuedEvent] = []
+        try:
+            if wait is None:
+                batch.append(self._queue.get_nowait())
+            else:
+                batch.append(self._queue.get(timeout=wait))
+        except queue.Empty:
+            return 0
+        while len(batch) < self._batch_size:
+            try:
+                batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+
+        try:
+            pipe = self._client().pipeline(transaction=False)
+            for channel, log_id, sketch_id, level, content in batch:
+                event = Event(
+                    id=log_id, sketch_id=sketch_id, type=level, payload=content
+                )
+                pipe.publish(channel, event.model_dump_json())
+            pipe.execute()
+        except Exception as e:
+            # Don't let event emission errors break logging
+            with self._lock:
+                self.dropped += len(batch)
+            logger.error(f"Failed to publish {len(batch)} log event(s): {e}")
+        return len(batch)
+
+    def flush(self) -> None:
+        """Publish every queued event from the calling thread."""
+        while self._publish_pending():
+            pass
+
+    def shutdown(self) -> None:
+        """Stop the worker thread and publish the remaining events."""
+        self._shutdown_event.set()
+        if self._worker and self._worker.is_alive():
+            self._worker.join(timeout=2.0)
+        self.flush()
+
+    @property
+    def queue_size(self) -> int:
+        return self._queue.qsize()
+
+
+_publisher: Optional[EventPublisher] = None
+_publisher_lock = threading.Lock()
+
+
+def get_event_publisher() -> EventPublisher:
+    """
+    Get the process-wide event publisher.
+
+    Configured with LOG_EVENT_QUEUE_SIZE and LOG_EVENT_OVERFLOW.
+    """
+    global _publisher
+    if _publisher is None:
+        with _publisher_lock:
+            if _publisher is None:
+                _publisher = EventPublisher(
+                    max_queue_size=int(os.getenv("LOG_EVENT_QUEUE_SIZE", "10000")),
+                    overflow=os.getenv("LOG_EVENT_OVERFLOW", "drop_oldest"),
+                )
+                atexit.register(_publisher.shutdown)
+    return _publisher
@@ -1,69 +1,216 @@
-from typing import Dict, Set
-import uuid
-from fastapi import FastAPI
-import json
+"""
+Real-time events for the SSE endpoints.
+
+SSE requests used to open one Redis pub/sub connection each and poll it
+every 100 ms. Each API process now runs a single EventHub instead: one Redis
+connection, pattern-subscribed to the sketch channels (`<sketch_id>` for
+logs, `<sketch_id>_status` for graph refreshes), and a listener task that
+dispatches every message to the in-memory queues of the clients streaming
+its channel. Clients wait on their queue, so an event is forwarded as soon
+as it is published and idle streams cost nothing.
+
+Each client has its own bounded queue (EVENT_CLIENT_QUEUE_SIZE): a client
+reading too slowly drops its oldest events without holding up the others.
+Events are for live display only (logs are persisted separately), so dropping
+them never loses data.
+"""
+
 import asyncio
-from uuid import UUID
-import redis.asyncio as redis
+import json
+import logging
 import os
+import threading
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, Optional, Set
+
+import redis.asyncio as redis
+from fastapi import FastAPI
+
+logger = logging.getLogger(__name__)
+
+# Channels starting with a UUID (sketch ID), not Celery's own channels
+DEFAULT_CHANNEL_PATTERN = os.getenv(
+    "EVENT_HUB_PATTERN", "????????-????-????-????-????????????*"
+)
+DEFAULT_CLIENT_QUEUE_SIZE = int(os.getenv("EVENT_CLIENT_QUEUE_SIZE", "256"))
+# Seconds between two heartbeats sent to idle SSE clients
+HEARTBEAT_INTERVAL = int(os.getenv("EVENT_HEARTBEAT_INTERVAL", "15"))
+MIN_RECONNECT_DELAY = 1.0
+MAX_RECONNECT_DELAY = 30.0
+
+
+class Subscription:
+    """
+    Events of a channel, buffered for one client.
+
+    Iterate over it to get the event payloads as they are published.
+    """
+
+    def __init__(self, channel: str, max_size: int = DEFAULT_CLIENT_QUEUE_SIZE):
+        self.channel = channel
+        self._queue: "asyncio.Queue[str]" = asyncio.Queue(maxsize=max_size)
+        self.dropped = 0
+
+    def put(self, data: str) -> None:
+        """Queue an event, dropping the oldest one if the queue is full."""
+        while True:
+            try:
+                self._queue.put_nowait(data)
+                return
+            except asyncio.QueueFull:
+                self._queue.get_nowait()
+                self.dropped += 1
+
+    async def get(self) -> str:
+        """Wait for the next event."""
+        return await self._queue.get()
 
+    def __aiter__(self) -> "Subscription":
+        return self
 
-class EventEmitter:
-    def __init__(self):
-        self.id = uuid.uuid4()
-        self.redis = redis.from_url(os.environ["REDIS_URL"])
-        self.pubsubs: Dict[str, redis.client.PubSub] = {}
-
-    async def subscribe(self, channel: str):
-        """Subscribe to Redis channel"""
-        if channel not in self.pubsubs:
-            pubsub = self.redis.pubsub()
-            await pubsub.subscribe(channel)
-            self.pubsubs[channel] = pubsub
-
-    async def unsubscribe(self, channel: str):
-        """Unsubscribe from Redis channel"""
-        if channel in self.pubsubs:
-            await self.pubsubs[channel].unsubscribe(channel)
-            await self.pubsubs[channel].close()
-            del self.pubsubs[channel]
-
-    async def get_message(self, channel: str = None):
-        """Get the next message from Redis for a specific channel"""
-        if channel not in self.pubsubs:
-            return None
-
-        message = await self.pubsubs[channel].get_message(
-            ignore_subscribe_messages=True
-        )
-        if message is None:
-            await asyncio.sleep(0.1)
-            return None
-
-        if message:
-            data = message["data"]
-            if isinstance(data, bytes):
-                decoded = data.decode("utf-8")
-                return decoded
-            return str(data)
-        return None
-
-    async def emit(self, channel: str, data: any):
-        """Emit an event to a Redis channel"""
-        await self.redis.publish(channel, json.dumps(data))
-
-    def _is_valid_uuid(self, uuid_str: str) -> bool:
-        """Validate if the string is a valid UUID"""
+    async def __anext__(self) -> str:
+        return await self.get()
+
+
+class EventHub:
+    """
+    Per-process Redis subscriber fanning events out to SSE clients.
+
+    The listener task is started by the first subscription, in the running
+    event loop, and reconnects with backoff if Redis goes away.
+    """
+
+    def __init__(
+        self,
+        redis_url: Optional[str] = None,
+        pattern: str = DEFAULT_CHANNEL_PATTERN,
+        client_queue_size: int = DEFAULT_CLIENT_QUEUE_SIZE,
+    ):
+        self._redis_url = redis_url
+        self._pattern = pattern
+        self._client_queue_size = client_queue_size
+        self._subscriptions: Dict[str, Set[Subscription]] = {}
+        self._redis: Optional[redis.Redis] = None
+        self._listener: Optional[asyncio.Task] = None
+
+    def _client(self) -> redis.Redis:
+        if self._redis is None:
+            self._redis = redis.from_url(self._redis_url or os.environ["REDIS_URL"])
+        return self._redis
+
+    def subscribe(self, channel: str) -> Subscription:
+        """Start buffering the events of a channel for a new client."""
+        self._ensure_listener()
+        subscription = Subscription(channel, self._client_queue_size)
+        self._subscriptions.setdefault(channel, set()).add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        subscriptions = self._subscriptions.get(subscription.channel)
+        if subscriptions is None:
+            return
+        subscriptions.discard(subscription)
+        if not subscriptions:
+            del self._subscriptions[subscription.channel]
+        if subscription.dropped:
+            logger.warning(
+                f"Dropped {subscription.dropped} event(s) of a slow client "
+                f"on channel {subscription.channel}"
+            )
+
+    @asynccontextmanager
+    async def listen(self, channel: str) -> AsyncIterator[Subscription]:
+        """Subscribe to a channel for the duration of the context."""
+        subscription = self.subscribe(channel)
         try:
-            UUID(uuid_str)
-            return True
-        except ValueError:
-            return False
+            yield subscription
+        finally:
+            self.unsubscribe(subscription)
+
+    def subscriber_count(self, channel: Optional[str] = None) -> int:
+        if channel is not None:
+            return len(self._subscriptions.get(channel, ()))
+        return sum(len(subs) for subs in self._subscriptions.values())
+
+    def dispatch(self, channel: str, data: Any) -> int:
+        """
+        Hand a published message to the clients of its channel.
+
+        Returns:
+            Number of clients the message was queued for
+        """
+        subscriptions = self._subscriptions.get(channel)
+        if not subscriptions:
+            return 0
+        if isinstance(data, bytes):
+            data = data.decode("utf-8")
+        for subscription in subscriptions:
+            subscription.put(str(data))
+        return len(subscriptions)
+
+    def _ensure_listener(self) -> None:
+        loop = asyncio.get_running_loop()
+        if self._listener is not None and not self._listener.done():
+            if self._listener.get_loop() is loop:
+                return
+            # Started by a previous event loop, its connections are unusable
+            self._redis = None
+        self._listener = loop.create_task(self._listen(), name="EventHub")
+
+    async def _listen(self) -> None:
+        delay = MIN_RECONNECT_DELAY
+        while True:
+            pubsub = self._client().pubsub(ignore_subscribe_messages=True)
+            try:
+                await pubsub.psubscribe(self._pattern)
+                delay = MIN_RECONNECT_DELAY
+                async for message in pubsub.listen():
+                    if message["type"] == "pmessage":
+                        channel = message["channel"]
+                        if isinstance(channel, bytes):
+                            channel = channel.decode("utf-8")
+                        self.dispatch(channel, message["data"])
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Event hub subscription failed: {e}")
+            finally:
+                await pubsub.aclose()
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, MAX_RECONNECT_DELAY)
+
+    async def emit(self, channel: str, data: Any) -> None:
+        """Publish an event to a Redis channel."""
+        await self._client().publish(channel, json.dumps(data))
+
+    async def close(self) -> None:
+        """Stop the listener and close the Redis connections."""
+        if self._listener is not None:
+            self._listener.cancel()
+            try:
+                await self._listener
+            except (asyncio.CancelledError, RuntimeError):
+                pass
+            self._listener = None
+        if self._redis is not None:
+            await self._redis.aclose()
+            self._redis = None
+
+
+_event_hub: Optional[EventHub] = None
+_event_hub_lock = threading.Lock()
 
 
-event_emitter = EventEmitter()
+def get_event_hub() -> EventHub:
+    """Get the process-wide event hub."""
+    global _event_hub
+    if _event_hub is None:
+        with _event_hub_lock:
+            if _event_hub is None:
+                _event_hub = EventHub()
+    return _event_hub
 
 
 def init_events(app: FastAPI):
     """Initialize the event system in the FastAPI app"""
-    print("[EventEmitter] Events initialized in FastAPI app")
+    app.router.on_shutdown.append(get_event_hub().close)
@@ -0,0 +1,57 @@
+"""
+Chunked fan-out of enricher launches.
+
+A launch of more than ENRICHER_CHUNK_SIZE entities is split in chunks run as
+a Celery chord: each chunk is a `run_enricher_chunk` task, which writes its
+results to the graph and can run on any worker, and a final
+`merge_enricher_chunks` callback merges their results into the scan. Chunk
+tasks are acknowledged once done, so a chunk lost with its worker is
+redelivered instead of failing the whole launch. If the chord still fails
+(a chunk over the time limit, or the merge itself), the
+`fail_enricher_chunks` errback fails the scan.
+
+Set ENRICHER_CHUNK_SIZE to 0 to run every launch as a single task.
+"""
+
+import os
+from typing import Any, Dict, List, Sequence, Tuple
+
+ENRICHER_CHUNK_SIZE = int(os.getenv("ENRICHER_CHUNK_SIZE", "200"))
+
+
+def should_fan_out(item_count: int, chunk_size: int = ENRICHER_CHUNK_SIZE) -> bool:
+    """Whether a launch of `item_count` entities is split in chunks."""
+    return chunk_size > 0 and item_count > chunk_size
+
+
+def chunk_items(items: Sequence[Any], chunk_size: int) -> List[List[Any]]:
+    """Split items in chunks of at most `chunk_size` items."""
+    if chunk_size <= 0:
+        raise ValueError("chunk_size must be positive")
+    return [
+        list(items[start : start + chunk_size])
+        for start in range(0, len(items), chunk_size)
+    ]
+
+
+def chunk_result(results: List[Any], error: str | None = None) -> Dict[str, Any]:
+    """Result of a chunk task, passed to the merge callback."""
+    return {"results": results, "error": error}
+
+
+def merge_chunk_results(
+    chunk_results: List[Dict[str, Any]],
+) -> Tuple[List[Any], List[str]]:
+    """
+    Merge the results of the chunks of a launch.
+
+    Returns:
+        Results of the chunks, in order, and the errors of the failed chunks
+    """
+    results: List[Any] = []
+    errors: List[str] = []
+    for index, chunk in enumerate(chunk_results):
+        results.extend(chunk.get("results") or [])
+        if chunk.get("error"):
+            errors.append(f"Chunk {index + 1}: {chunk['error']}")
+    return results, errors
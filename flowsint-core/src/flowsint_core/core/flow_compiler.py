@@ -0,0 +1,342 @@
+"""
+Flow compiler.
+
+Compiles the nodes and edges drawn in the flow editor into the steps run by
+the FlowOrchestrator. The graph is indexed once into adjacency maps, cycles
+reachable from an input node are rejected up front, and nodes are walked in
+topological order so that each one is simulated once: compiling costs
+O(nodes + edges) and yields a deduplicated DAG of steps, one per node.
+
+The flow task runs that DAG. Branches, the input-to-leaf step lists shown
+in the editor, are expanded from it. A flow with many diamonds has
+exponentially many paths, so the expansion is capped at `max_branches`
+(FLOW_MAX_BRANCHES, default 1000).
+"""
+
+import os
+from collections import deque
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+from .services.exceptions import ValidationError
+from .types import FlowBranch, FlowDag, FlowDagStep, FlowEdge, FlowNode, FlowStep
+
+DEFAULT_MAX_FLOW_BRANCHES = int(os.getenv("FLOW_MAX_BRANCHES", "1000"))
+
+# Callable that simulates the outputs of an enricher node from its inputs
+OutputSimulator = Callable[[FlowNode, Dict[str, Any]], Dict[str, Any]]
+
+
+class FlowCompilationError(ValidationError):
+    """The flow graph can't be compiled."""
+
+    def __init__(self, message: str = "Flow compilation failed"):
+        super().__init__(message)
+
+
+class FlowCycleError(FlowCompilationError):
+    """The flow graph has a cycle."""
+
+    def __init__(self, cycle: List[str]):
+        self.cycle = cycle
+        super().__init__(f"Flow has a cycle: {' -> '.join(cycle)}")
+
+
+def default_output_simulator(node: FlowNode, inputs: Dict[str, Any]) -> Dict[str, Any]:
+    """Pass the node input through to each of its outputs."""
+    outputs = {}
+    for output in node.data["outputs"].get("properties", []):
+        output_name = output.get("name", "output")
+        outputs[output_name] = inputs.get("input") or f"flowed_{output_name}"
+    return outputs
+
+
+def _is_input_node(node: FlowNode) -> bool:
+    return node.data.get("type") == "type"
+
+
+class FlowCompiler:
+    """
+    Compiles a flow graph for a given initial value.
+
+    Raises:
+        FlowCycleError: If a cycle is reachable from an input node
+    """
+
+    def __init__(
+        self,
+        nodes: List[FlowNode],
+        edges: List[FlowEdge],
+        initial_value: Any,
+        simulate_outputs: Optional[OutputSimulator] = None,
+    ):
+        self._nodes: Dict[str, FlowNode] = {node.id: node for node in nodes}
+        self._inputs: List[str] = [node.id for node in nodes if _is_input_node(node)]
+        # Edges to or from unknown nodes are ignored
+        self._out_edges: Dict[str, List[FlowEdge]] = {n: [] for n in self._nodes}
+        self._in_edges: Dict[str, List[FlowEdge]] = {n: [] for n in self._nodes}
+        for edge in edges:
+            if edge.source in self._nodes and edge.target in self._nodes:
+                self._out_edges[edge.source].append(edge)
+                self._in_edges[edge.target].append(edge)
+
+        self._order = self._topological_order()
+        self._sort_out_edges()
+        self._simulate(initial_value, simulate_outputs or default_output_simulator)
+
+    def _reachable(self) -> Set[str]:
+        """IDs of the nodes reachable from an input node."""
+        reachable = set(self._inputs)
+        pending = list(self._inputs)
+        while pending:
+            for edge in self._out_edges[pending.pop()]:
+                if edge.target not in reachable:
+                    reachable.add(edge.target)
+                    pending.append(edge.target)
+        return reachable
+
+    def _topological_order(self) -> List[str]:
+        """Order the reachable nodes, parents first (Kahn's algorithm)."""
+        reachable = self._reachable()
+        in_degree = {
+            node_id: sum(edge.source in reachable for edge in self._in_edges[node_id])
+            for node_id in reachable
+        }
+        ready = deque(
+            node_id
+            for node_id in self._nodes
+            if node_id in reachable and not in_degree[node_id]
+        )
+        order: List[str] = []
+        while ready:
+            node_id = ready.popleft()
+            order.append(node_id)
+            for edge in self._out_edges[node_id]:
+                in_degree[edge.target] -= 1
+                if not in_degree[edge.target]:
+                    ready.append(edge.target)
+        if len(order) < len(reachable):
+            raise FlowCycleError(self._find_cycle(reachable.difference(order)))
+        return order
+
+    def _find_cycle(self, remaining: Set[str]) -> List[str]:
+        """
+        Find a cycle among the nodes left out of the topological order.
+
+        Each of them has a parent among them, so walking up parents always
+        ends up looping.
+        """
+        node_id = next(node_id for node_id in self._nodes if node_id in remaining)
+        positions: Dict[str, int] = {}
+        walk: List[str] = []
+        while node_id not in positions:
+            positions[node_id] = len(walk)
+            walk.append(node_id)
+            node_id = next(
+                edge.source
+                for edge in self._in_edges[node_id]
+                if edge.source in remaining
+            )
+        # The walk went up the edges, put the cycle back in edge order
+        return [node_id] + walk[positions[node_id] + 1 :][::-1] + [node_id]
+
+    def _sort_out_edges(self) -> None:
+        """Sort the outgoing edges by the shortest path to a leaf of their target."""
+        leaf_distance: Dict[str, int] = {}
+        for node_id in reversed(self._order):
+            distances = [leaf_distance[e.target] for e in self._out_edges[node_id]]
+            leaf_distance[node_id] = 1 + min(distances) if distances else 1
+        for node_id in self._order:
+            self._out_edges[node_id].sort(key=lambda e: leaf_distance[e.target])
+
+    @staticmethod
+    def _edge_input(
+        edge: FlowEdge,
+        source_outputs: Dict[str, Any],
+        fallback_outputs: Optional[Dict[str, Any]],
+    ) -> Dict[str, Any]:
+        """Input a node gets through an edge, from the outputs of its source."""
+        output_key = edge.sourceHandle
+        if not output_key and source_outputs:
+            output_key = next(iter(source_outputs))
+        output_value = source_outputs.get(output_key) if output_key else None
+        if output_value is None and fallback_outputs:
+            output_value = fallback_outputs.get(output_key) if output_key else None
+        return {edge.targetHandle or "input": output_value}
+
+    def _simulate(self, initial_value: Any, simulate_outputs: OutputSimulator) -> None:
+        """Compute the outputs, depth and edge inputs of every node, once."""
+        self._outputs: Dict[str, Dict[str, Any]] = {}
+        self._depths: Dict[str, int] = {}
+        # Node ID -> [(child ID, input given to the child)], in branch order
+        self._children: Dict[str, List[Tuple[str, Dict[str, Any]]]] = {}
+        # Node ID -> {parent ID: input received from the parent}
+        self._parent_inputs: Dict[str, Dict[str, Dict[str, Any]]] = {
+            node_id: {} for node_id in self._order
+        }
+        # Outputs of the first parent, used when an output key is missing
+        first_parent_outputs: Dict[str, Optional[Dict[str, Any]]] = {}
+
+        for node_id in self._order:
+            node = self._nodes[node_id]
+            parent_inputs = self._parent_inputs[node_id]
+            if _is_input_node(node):
+                outputs_array = node.data["outputs"].get("properties", [])
+                first_output_name = (
+                    outputs_array[0].get("name", "output")
+                    if outputs_array
+                    else "output"
+                )
+                outputs = {first_output_name: initial_value}
+            else:
+                first_input = next(iter(parent_inputs.values()), {})
+                outputs = simulate_outputs(node, first_input)
+            self._outputs[node_id] = outputs
+            self._depths.setdefault(node_id, 0)
+
+            self._children[node_id] = []
+            for edge in self._out_edges[node_id]:
+                child_input = self._edge_input(
+                    edge, outputs, first_parent_outputs.get(node_id)
+                )
+                self._children[node_id].append((edge.target, child_input))
+                self._parent_inputs[edge.target].setdefault(node_id, {}).update(
+                    child_input
+                )
+                first_parent_outputs.setdefault(edge.target, outputs)
+                self._depths[edge.target] = max(
+                    self._depths.get(edge.target, 0), self._depths[node_id] + 1
+                )
+
+    def dag(self) -> FlowDag:
+        """The deduplicated DAG of steps, in topological order."""
+        steps = []
+        for node_id in self._order:
+            node = self._nodes[node_id]
+            is_input_node = _is_input_node(node)
+            steps.append(
+                FlowDagStep(
+                    nodeId=node_id,
+                    params=node.data.get("params", {}),
+                    type="type" if is_input_node else "enricher",
+                    inputs={} if is_input_node else self._parent_inputs[node_id],
+                    outputs=self._outputs[node_id],
+                    depth=self._depths[node_id],
+                    parents=list(self._parent_inputs[node_id]),
+                    children=list(
+                        dict.fromkeys(child for child, _ in self._children[node_id])
+                    ),
+                )
+            )
+        return FlowDag(steps=steps)
+
+    def branches(
+        self, max_branches: int = DEFAULT_MAX_FLOW_BRANCHES
+    ) -> List[FlowBranch]:
+        """
+        Expand the DAG into one branch per path from an input node to a leaf.
+
+        The first child of a step continues its branch, each other child
+        starts a new branch sharing the steps so far. Branches are sorted by
+        length.
+
+        Raises:
+            FlowCompilationError: If there are more than `max_branches` branches
+        """
+        if not self._inputs:
+            return [
+                FlowBranch(
+                    id="error",
+                    name="Error",
+                    steps=[
+                        FlowStep(
+                            nodeId="error",
+                            inputs={},
+                            params={},
+                            type="error",
+                            outputs={},
+                            status="error",
+                            branchId="error",
+                            depth=0,
+                        )
+                    ],
+                )
+            ]
+
+        branches: List[FlowBranch] = []
+        branch_counter = 0
+        steps: List[FlowStep] = []
+        # (node ID, branch ID, branch name, starts a new branch, depth, input)
+        pending: List[Tuple[str, str, str, bool, int, Dict[str, Any]]] = []
+        for index in reversed(range(len(self._inputs))):
+            branch_name = f"Flow {index + 1}" if len(self._inputs) > 1 else "Main Flow"
+            pending.append(
+                (self._inputs[index], f"branch-{index}", branch_name, False, 0, {})
+            )
+
+        while pending:
+            node_id, branch_id, branch_name, new_branch, depth, inputs = pending.pop()
+            if new_branch:
+                branch_counter += 1
+                branch_id = f"{branch_id}-{branch_counter}"
+                branch_name = f"{branch_name} (Branch {branch_counter})"
+            del steps[depth:]
+
+            node = self._nodes[node_id]
+            is_input_node = _is_input_node(node)
+            steps.append(
+                FlowStep(
+                    nodeId=node_id,
+                    params=node.data.get("params", {}),
+                    inputs={} if is_input_node else inputs,
+                    outputs=self._outputs[node_id],
+                    type="type" if is_input_node else "enricher",
+                    status="pending",
+                    branchId=branch_id,
+                    depth=depth,
+                )
+            )
+
+            children = self._children[node_id]
+            if not children:
+                if len(branches) >= max_branches:
+                    raise FlowCompilationError(
+                        f"Flow has more than {max_branches} branches"
+                    )
+                branches.append(
+                    FlowBranch(id=branch_id, name=branch_name, steps=steps[:])
+                )
+                continue
+            # Pushed in reverse so they are explored in order
+            for index in reversed(range(len(children))):
+                child_id, child_input = children[index]
+                pending.append(
+                    (
+                        child_id,
+                        branch_id,
+                        branch_name,
+                        index > 0,
+                        depth + 1,
+                        child_input,
+                    )
+                )
+
+        branches.sort(key=lambda branch: len(branch.steps))
+        return branches
+
+
+def compute_flow_branches(
+    initial_value: Any,
+    nodes: List[FlowNode],
+    edges: List[FlowEdge],
+    simulate_outputs: Optional[OutputSimulator] = None,
+    max_branches: int = DEFAULT_MAX_FLOW_BRANCHES,
+) -> List[FlowBranch]:
+    """
+    Compile a flow graph into its branches.
+
+    Raises:
+        FlowCycleError: If a cycle is reachable from an input node
+        FlowCompilationError: If there are more than `max_branches` branches
+    """
+    compiler = FlowCompiler(nodes, edges, initial_value, simulate_outputs)
+    return compiler.branches(max_branches)
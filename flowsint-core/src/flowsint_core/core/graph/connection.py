@@ -7,7 +7,7 @@ connection pooling and transaction management.
 
 import os
 from threading import Lock
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional
 
 from dotenv import load_dotenv
 from neo4j import Driver, GraphDatabase
@@ -109,6 +109,33 @@ class Neo4jConnection:
             result = session.run(query, cleaned_params)
             return result.data()
 
+    def stream(
+        self,
+        query: str,
+        parameters: Dict[str, Any] = None,
+        fetch_size: int = 1000,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Execute a read query and yield records one at a time.
+
+        The session stays open while the caller iterates, and the driver pulls
+        records from the server `fetch_size` at a time, so the full result set
+        is never held in memory.
+
+        Args:
+            query: Cypher query string
+            parameters: Query parameters
+            fetch_size: Number of records fetched per round trip
+
+        Yields:
+            Result records as dictionaries
+        """
+        with self._driver.session(fetch_size=fetch_size) as session:
+            cleaned_params = self._clean_parameters(parameters)
+            result = session.run(query, cleaned_params)
+            for record in result:
+                yield record.data()
+
     @staticmethod
     def _clean_parameters(parameters: Dict[str, Any]) -> Dict[str, Any]:
         """Remove None keys from parameters dict to avoid Neo4j errors."""
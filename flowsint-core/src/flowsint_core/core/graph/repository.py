@@ -6,7 +6,7 @@ handling raw GraphDict object and operations with batching support.
 """
 
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 from .connection import Neo4jConnection
 from .types import GraphDict
@@ -22,17 +22,26 @@ class Neo4jGraphRepository:
     Implements GraphRepositoryProtocol for dependency injection.
     """
 
-    def __init__(self, neo4j_connection: Optional[Neo4jConnection] = None):
+    def __init__(
+        self,
+        neo4j_connection: Optional[Neo4jConnection] = None,
+        unwind_chunk_size: int = 1000,
+    ):
         """
         Initialize the graph repository.
 
         Args:
             neo4j_connection: Optional Neo4j connection instance.
                              If None, uses the singleton instance.
+            unwind_chunk_size: Maximum number of rows sent in a single
+                               UNWIND statement by the bulk write paths.
         """
         self._connection = neo4j_connection or Neo4jConnection.get_instance()
         self._batch_operations: List[Tuple[str, Dict[str, Any]]] = []
+        self._pending_nodes: List[Tuple[GraphDict, str]] = []
+        self._pending_relationships: List[Tuple[GraphDict, str]] = []
         self._batch_size = 100
+        self._unwind_chunk_size = unwind_chunk_size
 
     def create_node(
         self,
@@ -90,18 +99,26 @@ class Neo4jGraphRepository:
             **kwargs: Operation parameters
         """
         if operation_type == "node":
-            query, params = self._build_node_query(**kwargs)
+            # Node and relationship writes are kept as raw objects so that
+            # flush_batch can bucket them into UNWIND statements.
+            self._pending_nodes.append((kwargs["node_obj"], kwargs["sketch_id"]))
         elif operation_type == "relationship":
-            query, params = self._build_relationship_query(**kwargs)
+            self._pending_relationships.append((kwargs["rel_obj"], kwargs["sketch_id"]))
         else:
             raise ValueError(f"Unknown operation type: {operation_type}")
 
-        self._batch_operations.append((query, params))
-
         # Auto-flush if batch is full
-        if len(self._batch_operations) >= self._batch_size:
+        if self._pending_count() >= self._batch_size:
             self.flush_batch()
 
+    def _pending_count(self) -> int:
+        """Number of operations waiting in the batch queue."""
+        return (
+            len(self._pending_nodes)
+            + len(self._pending_relationships)
+            + len(self._batch_operations)
+        )
+
     def _build_node_query(
         self, node_obj: GraphDict, sketch_id: str
     ) -> Tuple[str, Dict[str, Any]]:
@@ -126,6 +143,161 @@ class Neo4jGraphRepository:
 
         return query, params
 
+    @staticmethod
+    def _build_bulk_node_query(node_type: str) -> str:
+        """
+        Build the UNWIND upsert statement for one node type.
+
+        The statement text only depends on the node type, so Neo4j can reuse
+        the cached plan for every chunk of that type. Each row carries its
+        input index so results can be mapped back to the caller's order.
+        """
+        return f"""
+        UNWIND $rows AS row
+        MERGE (n:`{node_type}` {{ nodeLabel: row.node_label, sketch_id: $sketch_id }})
+        ON CREATE SET n.created_at = $created_at
+        SET n += row.props
+        SET n.deleted_at = null
+        RETURN row.idx AS idx, elementId(n) AS id
+        """
+
+    def _build_bulk_node_statements(
+        self,
+        nodes: List[Tuple[int, GraphDict, str]],
+        chunk_size: Optional[int] = None,
+    ) -> Tuple[List[Tuple[str, Dict[str, Any]]], List[str]]:
+        """
+        Group node upserts by (nodeType, sketch_id) into chunked UNWIND statements.
+
+        Args:
+            nodes: List of (input index, GraphDict, sketch_id) tuples
+            chunk_size: Maximum rows per statement (defaults to the repository setting)
+
+        Returns:
+            Tuple of (list of (query, params) statements, list of error messages)
+        """
+        chunk_size = chunk_size or self._unwind_chunk_size
+        created_at = datetime.now(timezone.utc).isoformat()
+        groups: Dict[Tuple[str, str], List[Dict[str, Any]]] = {}
+        errors: List[str] = []
+
+        for idx, node_obj, sketch_id in nodes:
+            node_type = node_obj.get("nodeType")
+            if not node_type:
+                errors.append(f"Node {idx}: Missing required field (nodeType)")
+                continue
+            groups.setdefault((node_type, sketch_id), []).append(
+                {
+                    "idx": idx,
+                    "node_label": node_obj.get("nodeLabel"),
+                    "props": node_obj,  # flat with keys containing "."
+                }
+            )
+
+        statements = []
+        for (node_type, sketch_id), rows in groups.items():
+            statements.extend(
+                self._chunk_rows(
+                    self._build_bulk_node_query(node_type),
+                    rows,
+                    {"sketch_id": sketch_id, "created_at": created_at},
+                    chunk_size,
+                )
+            )
+
+        return statements, errors
+
+    @staticmethod
+    def _chunk_rows(
+        query: str,
+        rows: List[Dict[str, Any]],
+        params: Dict[str, Any],
+        chunk_size: int,
+    ) -> List[Tuple[str, Dict[str, Any]]]:
+        """Split UNWIND rows into statements of at most `chunk_size` rows."""
+        return [
+            (query, {**params, "rows": rows[start : start + chunk_size]})
+            for start in range(0, len(rows), chunk_size)
+        ]
+
+    @staticmethod
+    def _build_bulk_relationship_query(
+        from_type: str, to_type: str, rel_label: str
+    ) -> str:
+        """Build the UNWIND statement for one (from_type, to_type, rel_label) bucket."""
+        return f"""
+        UNWIND $rows AS row
+        MATCH (from:`{from_type}` {{nodeLabel: row.from_label, sketch_id: $sketch_id}})
+        WHERE from.deleted_at IS NULL
+        MATCH (to:`{to_type}` {{nodeLabel: row.to_label, sketch_id: $sketch_id}})
+        WHERE to.deleted_at IS NULL
+        MERGE (from)-[r:`{rel_label}` {{sketch_id: $sketch_id}}]->(to)
+        SET r += row.props
+        SET r.deleted_at = null
+        """
+
+    @staticmethod
+    def _build_bulk_relationship_by_element_id_query(rel_label: str) -> str:
+        """Build the UNWIND statement for element-ID edges sharing a label."""
+        return f"""
+        UNWIND $rows AS row
+        MATCH (from) WHERE elementId(from) = row.from_id
+        MATCH (to) WHERE elementId(to) = row.to_id
+        MERGE (from)-[r:`{rel_label}` {{sketch_id: $sketch_id}}]->(to)
+        SET r += row.props
+        """
+
+    def _build_bulk_relationship_statements(
+        self,
+        edges: List[Tuple[int, GraphDict, str]],
+        chunk_size: Optional[int] = None,
+    ) -> Tuple[List[Tuple[str, Dict[str, Any]]], List[str]]:
+        """
+        Bucket label-matched edges by (from_type, to_type, rel_label, sketch_id).
+
+        Args:
+            edges: List of (input index, GraphDict, sketch_id) tuples
+            chunk_size: Maximum rows per statement (defaults to the repository setting)
+
+        Returns:
+            Tuple of (list of (query, params) statements, list of error messages)
+        """
+        chunk_size = chunk_size or self._unwind_chunk_size
+        buckets: Dict[Tuple[str, str, str, str], List[Dict[str, Any]]] = {}
+        errors: List[str] = []
+
+        for idx, rel_obj, sketch_id in edges:
+            try:
+                key = (
+                    rel_obj["from_type"],
+                    rel_obj["to_type"],
+                    rel_obj["rel_label"],
+                    sketch_id,
+                )
+                row = {
+                    "idx": idx,
+                    "from_label": rel_obj["from_label"],
+                    "to_label": rel_obj["to_label"],
+                    "props": rel_obj,
+                }
+            except KeyError as e:
+                errors.append(f"Edge {idx}: Missing required field ({e.args[0]})")
+                continue
+            buckets.setdefault(key, []).append(row)
+
+        statements = []
+        for (from_type, to_type, rel_label, sketch_id), rows in buckets.items():
+            statements.extend(
+                self._chunk_rows(
+                    self._build_bulk_relationship_query(from_type, to_type, rel_label),
+                    rows,
+                    {"sketch_id": sketch_id},
+                    chunk_size,
+                )
+            )
+
+        return statements, errors
+
     def _build_relationship_query(
         self,
         rel_obj: GraphDict,
@@ -157,23 +329,102 @@ class Neo4jGraphRepository:
         return query, params
 
     def flush_batch(self) -> None:
-        """Execute all batched operations in a single transaction."""
-        if not self._batch_operations:
+        """
+        Execute all batched operations in a single transaction.
+
+        Pending node upserts are sent first as grouped UNWIND statements, so
+        relationships queued in the same batch can match them, followed by
+        the relationship buckets.
+        """
+        if not self._pending_count():
             return
 
         if not self._connection:
-            self._batch_operations.clear()
+            self.clear_batch()
             return
 
         try:
-            self._connection.execute_batch(self._batch_operations)
+            node_statements, _ = self._build_bulk_node_statements(
+                [
+                    (idx, node_obj, sketch_id)
+                    for idx, (node_obj, sketch_id) in enumerate(self._pending_nodes)
+                ]
+            )
+            relationship_statements, _ = self._build_bulk_relationship_statements(
+                [
+                    (idx, rel_obj, sketch_id)
+                    for idx, (rel_obj, sketch_id) in enumerate(
+                        self._pending_relationships
+                    )
+                ]
+            )
+            self._connection.execute_batch(
+                node_statements + relationship_statements + self._batch_operations
+            )
         finally:
-            self._batch_operations.clear()
+            self.clear_batch()
 
     def clear_batch(self) -> None:
         """Clear the batch without executing."""
+        self._pending_nodes.clear()
+        self._pending_relationships.clear()
         self._batch_operations.clear()
 
+    def set_unwind_chunk_size(self, size: int) -> None:
+        """
+        Set the maximum number of rows sent per UNWIND statement.
+
+        Args:
+            size: Number of rows per bulk statement
+        """
+        if size < 1:
+            raise ValueError("Chunk size must be at least 1")
+        self._unwind_chunk_size = size
+
+    def bulk_upsert_nodes(
+        self,
+        nodes: List[GraphDict],
+        sketch_id: str,
+        chunk_size: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """
+        Upsert many nodes with one parameterized UNWIND statement per node type.
+
+        Nodes are grouped by nodeType and each group is sent in chunks of
+        `chunk_size` rows, all inside a single transaction.
+
+        Args:
+            nodes: List of GraphDict objects to upsert
+            sketch_id: Investigation sketch ID
+            chunk_size: Optional override of the repository chunk size
+
+        Returns:
+            Dictionary with:
+                - element_ids: Element IDs aligned with the input list
+                  (None for nodes that were not written)
+                - errors: List of error messages
+        """
+        if not self._connection:
+            return {
+                "element_ids": [None] * len(nodes),
+                "errors": ["No database connection"],
+            }
+
+        element_ids: List[Optional[str]] = [None] * len(nodes)
+        statements, errors = self._build_bulk_node_statements(
+            [(idx, node_obj, sketch_id) for idx, node_obj in enumerate(nodes)],
+            chunk_size=chunk_size,
+        )
+        if not statements:
+            return {"element_ids": element_ids, "errors": errors}
+
+        results = self._connection.execute_batch(statements)
+        for result in results or []:
+            for record in result or []:
+                element_ids[record["idx"]] = record["id"]
+
+        return {"element_ids": element_ids, "errors": errors}
+
     def set_batch_size(self, size: int) -> None:
         """
         Set the batch size for auto-flushing.
@@ -213,42 +464,23 @@ class Neo4jGraphRepository:
         if not nodes:
             return {"nodes_created": 0, "node_ids": [], "errors": []}
 
-        # Build all queries
-        batch_operations = []
-        errors = []
-
-        for idx, node_obj in enumerate(nodes):
-            try:
-                query, params = self._build_node_query(
-                    node_obj=node_obj, sketch_id=sketch_id
-                )
-                batch_operations.append((query, params))
-            except Exception as e:
-                errors.append(f"Node {idx}: {str(e)}")
-
-        # Execute batch
-        if not batch_operations:
-            return {"nodes_created": 0, "node_ids": [], "errors": errors}
-
         try:
-            # Execute all operations in a single transaction
-            results = self._connection.execute_batch(batch_operations)
-
-            # Extract node IDs from results
-            node_ids = []
-            if results:
-                for result in results:
-                    if result and len(result) > 0 and "id" in result[0]:
-                        node_ids.append(result[0]["id"])
-
+            # One UNWIND statement per node type, all in a single transaction
+            result = self.bulk_upsert_nodes(nodes, sketch_id)
+        except Exception as e:
             return {
-                "nodes_created": len(node_ids),
-                "node_ids": node_ids,
-                "errors": errors,
+                "nodes_created": 0,
+                "node_ids": [],
+                "errors": [f"Batch execution failed: {str(e)}"],
             }
-        except Exception as e:
-            errors.append(f"Batch execution failed: {str(e)}")
-            return {"nodes_created": 0, "node_ids": [], "errors": errors}
+
+        # Keep input order so callers can map node_ids back to their inputs
+        node_ids = [eid for eid in result["element_ids"] if eid is not None]
+        return {
+            "nodes_created": len(node_ids),
+            "node_ids": node_ids,
+            "errors": result["errors"],
+        }
 
     def batch_create_edges(
         self,
@@ -273,29 +505,21 @@ class Neo4jGraphRepository:
         if not edges:
             return {"edges_created": 0, "errors": []}
 
-        # Build all queries
-        batch_operations = []
-        errors = []
-
-        for idx, edge in enumerate(edges):
-            try:
-                query, params = self._build_relationship_query(
-                    rel_obj=edge, sketch_id=sketch_id
-                )
-                batch_operations.append((query, params))
-            except Exception as e:
-                errors.append(f"Edge {idx}: {str(e)}")
+        # One UNWIND statement per (from_type, to_type, rel_label) bucket
+        statements, errors = self._build_bulk_relationship_statements(
+            [(idx, edge, sketch_id) for idx, edge in enumerate(edges)]
+        )
 
         # Execute batch
-        if not batch_operations:
+        if not statements:
             return {"edges_created": 0, "errors": errors}
 
         try:
             # Execute all operations in a single transaction
-            self._connection.execute_batch(batch_operations)
+            self._connection.execute_batch(statements)
 
             return {
-                "edges_created": len(batch_operations),
+                "edges_created": sum(len(params["rows"]) for _, params in statements),
                 "errors": errors,
             }
         except Exception as e:
@@ -332,59 +556,51 @@ class Neo4jGraphRepository:
         if not edges:
             return {"edges_created": 0, "errors": []}
 
-        # Build all queries
-        batch_operations = []
+        # Bucket edges by label so each bucket is a single UNWIND statement
+        buckets: Dict[str, List[Dict[str, Any]]] = {}
         errors = []
 
         for idx, edge in enumerate(edges):
-            try:
-                from_element_id = edge.get("from_element_id")
-                to_element_id = edge.get("to_element_id")
-                rel_label = edge.get("rel_label", "RELATED_TO")
-
-                if not from_element_id or not to_element_id:
-                    errors.append(
-                        f"Edge {idx}: Missing required fields (from_element_id or to_element_id)"
-                    )
-                    continue
-
-                edge["sketch_id"] = sketch_id
+            from_element_id = edge.get("from_element_id")
+            to_element_id = edge.get("to_element_id")
+            rel_label = edge.get("rel_label", "RELATED_TO")
 
-                # Build relationship properties string
-                props_str = ", ".join([f"{k}: ${k}_{idx}" for k in edge.keys()])
-                rel_props = (
-                    f"{{{props_str}}}" if props_str else "{sketch_id: $sketch_id}"
+            if not from_element_id or not to_element_id:
+                errors.append(
+                    f"Edge {idx}: Missing required fields (from_element_id or to_element_id)"
                 )
+                continue
 
-                query = f"""
-                MATCH (from) WHERE elementId(from) = $from_id_{idx}
-                MATCH (to) WHERE elementId(to) = $to_id_{idx}
-                MERGE (from)-[r:`{rel_label}` {rel_props}]->(to)
-                """
-
-                # Build params with unique keys for batch execution
-                params = {
-                    f"from_id_{idx}": from_element_id,
-                    f"to_id_{idx}": to_element_id,
+            buckets.setdefault(rel_label, []).append(
+                {
+                    "idx": idx,
+                    "from_id": from_element_id,
+                    "to_id": to_element_id,
+                    "props": {**edge, "sketch_id": sketch_id},
                 }
-                # Add serialized properties with index suffix
-                for k, v in edge.items():
-                    params[f"{k}_{idx}"] = v
+            )
 
-                batch_operations.append((query, params))
-            except Exception as e:
-                errors.append(f"Edge {idx}: {str(e)}")
+        statements = []
+        for rel_label, rows in buckets.items():
+            statements.extend(
+                self._chunk_rows(
+                    self._build_bulk_relationship_by_element_id_query(rel_label),
+                    rows,
+                    {"sketch_id": sketch_id},
+                    self._unwind_chunk_size,
+                )
+            )
 
         # Execute batch
-        if not batch_operations:
+        if not statements:
             return {"edges_created": 0, "errors": errors}
 
         try:
             # Execute all operations in a single transaction
-            self._connection.execute_batch(batch_operations)
+            self._connection.execute_batch(statements)
 
             return {
-                "edges_created": len(batch_operations),
+                "edges_created": sum(len(params["rows"]) for _, params in statements),
                 "errors": errors,
             }
         except Exception as e:
@@ -559,6 +775,89 @@ class Neo4jGraphRepository:
         rels_result = self._connection.query(rels_query, {"node_ids": node_ids})
         return {"nodes": nodes_result, "edges": rels_result or []}
 
+    def iter_sketch_nodes(
+        self, sketch_id: str, chunk_size: int = 1000
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Stream the nodes of a sketch in chunks.
+
+        Records are read through a server-side cursor, so memory use is bounded
+        by `chunk_size` rather than by the size of the sketch.
+
+        Args:
+            sketch_id: Investigation sketch ID
+            chunk_size: Number of node records per yielded chunk
+
+        Yields:
+            Lists of node records with 'id', 'labels' and 'data'
+        """
+        if not self._connection:
+            return
+
+        query = """
+        OPTIONAL MATCH (n)
+        WHERE n.sketch_id = $sketch_id AND n.deleted_at IS NULL
+        WITH n
+        WHERE n IS NOT NULL
+        RETURN elementId(n) as id, labels(n) as labels, properties(n) as data
+        """
+        yield from self._chunk_stream(
+            self._connection.stream(
+                query, {"sketch_id": sketch_id}, fetch_size=chunk_size
+            ),
+            chunk_size,
+        )
+
+    def iter_sketch_edges(
+        self, sketch_id: str, chunk_size: int = 1000
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Stream the relationships of a sketch in chunks.
+
+        Matches the relationships between the nodes of the sketch in a single
+        query anchored on their `sketch_id`, instead of joining against a list
+        of node IDs. Like get_sketch_graph, relationships without a
+        `sketch_id` of their own are included.
+
+        Args:
+            sketch_id: Investigation sketch ID
+            chunk_size: Number of edge records per yielded chunk
+
+        Yields:
+            Lists of edge records with 'id', 'type', 'source', 'target' and 'data'
+        """
+        if not self._connection:
+            return
+
+        query = """
+        MATCH (a {sketch_id: $sketch_id})-[r]->(b {sketch_id: $sketch_id})
+        WHERE r.deleted_at IS NULL
+            AND a.deleted_at IS NULL
+            AND b.deleted_at IS NULL
+        RETURN elementId(r) as id, type(r) as type, elementId(a) as source,
+               elementId(b) as target, properties(r) as data
+        """
+        yield from self._chunk_stream(
+            self._connection.stream(
+                query, {"sketch_id": sketch_id}, fetch_size=chunk_size
+            ),
+            chunk_size,
+        )
+
+    @staticmethod
+    def _chunk_stream(
+        records: Iterator[Dict[str, Any]], chunk_size: int
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """Group a record iterator into lists of at most `chunk_size` records."""
+        chunk: List[Dict[str, Any]] = []
+        for record in records:
+            chunk.append(record)
+            if len(chunk) >= chunk_size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+
     def update_relationship(
         self, element_id: str, rel_obj: GraphDict, sketch_id: str
     ) -> Optional[Dict[str, Any]]:
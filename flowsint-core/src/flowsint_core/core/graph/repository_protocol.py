@@ -5,7 +5,7 @@ This module defines the interface contract that all graph repository
 implementations must follow, enabling dependency injection and easier testing.
 """
 
-from typing import Any, Dict, List, Optional, Protocol
+from typing import Any, Dict, Iterator, List, Optional, Protocol
 
 from .types import GraphDict
 
@@ -83,6 +83,18 @@ class GraphRepositoryProtocol(Protocol):
         """Get all nodes and edges for a sketch."""
         ...
 
+    def iter_sketch_nodes(
+        self, sketch_id: str, chunk_size: int = 1000
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """Stream the nodes of a sketch in chunks."""
+        ...
+
+    def iter_sketch_edges(
+        self, sketch_id: str, chunk_size: int = 1000
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """Stream the edges of a sketch in chunks."""
+        ...
+
     def get_neighbors(self, node_id: str, sketch_id: str) -> Dict[str, Any]:
         """Get a node and all its direct relationships."""
         ...
@@ -111,6 +123,12 @@ class GraphRepositoryProtocol(Protocol):
         """Create multiple edges using element IDs in a single batch."""
         ...
 
+    def bulk_upsert_nodes(
+        self, nodes: List[GraphDict], sketch_id: str, chunk_size: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """Upsert nodes grouped by type. Returns element IDs in input order."""
+        ...
+
     def add_to_batch(self, operation_type: str, **kwargs: Any) -> None:
         """Add an operation to the batch queue."""
         ...
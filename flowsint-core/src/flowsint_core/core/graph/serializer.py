@@ -3,12 +3,37 @@ Graph property serialization utilities.
 
 This module provides utilities for serializing complex Python objects
 into Neo4j-compatible primitive types, following the Single Responsibility Principle.
+
+Nodes read back from our own store are trusted by default: when every
+property of a row maps to a field holding plain JSON values (str, int, bool,
+lists, dicts...), the entity is built with `model_construct` instead of being
+validated again, and only the type's "after" model validators (derived fields
+such as nodeLabel) are replayed on it. Rows with fields that validation would convert (URLs,
+networks, nested models...) are still validated, and `validate=True` forces
+validation for every row.
 """
 
-from typing import Any, Callable, Dict, List, Optional, Type
+import types
+from datetime import datetime
+from functools import lru_cache
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    List,
+    Literal,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+    get_args,
+    get_origin,
+)
 
 from flowsint_types import FlowsintType
-from pydantic import BaseModel, ValidationError
+from pydantic import BaseModel, EmailStr, ValidationError
+from pydantic_core import to_jsonable_python
 
 from flowsint_core.utils import flatten, unflatten
 
@@ -17,6 +42,118 @@ from .types import GraphEdge, GraphNode, NodeMetadata
 # Callable that resolves a type name to a FlowsintType subclass (or None).
 TypeResolver = Callable[[str], Optional[Type[FlowsintType]]]
 
+PROPERTIES_PREFIX = "nodeProperties."
+METADATA_PREFIX = "nodeMetadata."
+
+# Annotations whose validated value is the plain JSON value read from Neo4j
+_PLAIN_TYPES = (str, int, float, bool, type(None), dict, list, EmailStr, Any)
+_SQUARE_NODE_TYPES = ("document", "image", "bankaccount")
+
+
+def _is_plain_annotation(annotation: Any) -> bool:
+    """Whether validating a stored value for this annotation leaves it as is."""
+    if annotation in _PLAIN_TYPES:
+        return True
+    origin = get_origin(annotation)
+    if origin is Literal:
+        return True
+    if origin in (Union, types.UnionType, list, dict):
+        return all(_is_plain_annotation(arg) for arg in get_args(annotation))
+    return False
+
+
+class TypeInfo:
+    """Per-type data used by the serializer, computed once per class."""
+
+    __slots__ = (
+        "node_type",
+        "node_shape",
+        "required_fields",
+        "validated_fields",
+        "after_validators",
+        "constructable",
+    )
+
+    def __init__(self, model: Type[FlowsintType]):
+        self.node_type: str = model.__name__.lower()
+        self.node_shape: str = (
+            "square" if self.node_type in _SQUARE_NODE_TYPES else "circle"
+        )
+        self.required_fields: FrozenSet[str] = frozenset(
+            name for name, field in model.model_fields.items() if field.is_required()
+        )
+        # Fields whose stored value must go through validation
+        self.validated_fields: FrozenSet[str] = frozenset(
+            name
+            for name, field in model.model_fields.items()
+            if not _is_plain_annotation(field.annotation)
+        )
+        # "after" model validators compute derived fields (nodeLabel...) and
+        # are replayed on constructed entities; other modes need validation
+        validators = model.__pydantic_decorators__.model_validators.values()
+        self.after_validators: Tuple[Callable, ...] = tuple(
+            validator.func for validator in validators if validator.info.mode == "after"
+        )
+        self.constructable: bool = len(self.after_validators) == len(validators)
+
+    def can_construct(self, properties: Dict[str, Any]) -> bool:
+        """Whether an entity can be built from trusted properties without validation."""
+        return (
+            self.constructable
+            and self.required_fields.issubset(properties)
+            and self.validated_fields.isdisjoint(properties)
+        )
+
+    def construct(
+        self, model: Type[FlowsintType], properties: Dict[str, Any]
+    ) -> FlowsintType:
+        """Build an entity from trusted properties, computing derived fields."""
+        entity = model.model_construct(**properties)
+        for validator in self.after_validators:
+            entity = validator(entity)
+        return entity
+
+
+@lru_cache(maxsize=1024)
+def get_type_info(model: Type[FlowsintType]) -> TypeInfo:
+    """Get the cached serializer data of a type."""
+    return TypeInfo(model)
+
+
+def _split_node_data(
+    data: Dict[str, Any],
+) -> Tuple[Dict[str, Any], Dict[str, Any], Dict[str, Any]]:
+    """
+    Split a flat Neo4j node into top-level, nodeProperties and nodeMetadata dicts.
+
+    Only the properties and metadata are unflattened, and only when they hold
+    nested keys.
+    """
+    top: Dict[str, Any] = {}
+    properties: Dict[str, Any] = {}
+    metadata: Dict[str, Any] = {}
+    nested = False
+    for key, value in data.items():
+        if key.startswith(PROPERTIES_PREFIX):
+            key = key[len(PROPERTIES_PREFIX) :]
+            properties[key] = value
+        elif key.startswith(METADATA_PREFIX):
+            key = key[len(METADATA_PREFIX) :]
+            metadata[key] = value
+        else:
+            top[key] = value
+            continue
+        nested = nested or "." in key
+    if nested:
+        properties = unflatten(properties)
+        metadata = unflatten(metadata)
+    # Legacy rows may hold the properties as a dict
+    if isinstance(top.get("nodeProperties"), dict):
+        properties = {**top.pop("nodeProperties"), **properties}
+    if isinstance(top.get("nodeMetadata"), dict):
+        metadata = {**top.pop("nodeMetadata"), **metadata}
+    return top, properties, metadata
+
 
 class GraphSerializer:
     """
@@ -55,22 +192,62 @@ class GraphSerializer:
     def flatten(dict: Dict[str, Any]):
         return flatten(dict, remove_empty=False)
 
+    @staticmethod
+    def _default_type_resolver() -> TypeResolver:
+        from flowsint_core.core.services.type_registry_service import (
+            local_type_resolver,
+        )
+
+        return local_type_resolver
+
+    @staticmethod
+    def caching_type_resolver(
+        type_resolver: Optional[TypeResolver] = None,
+    ) -> TypeResolver:
+        """Wrap a type resolver so each type name is only resolved once."""
+        resolve = type_resolver or GraphSerializer._default_type_resolver()
+        resolved: Dict[str, Optional[Type[FlowsintType]]] = {}
+
+        def resolver(type_name: str) -> Optional[Type[FlowsintType]]:
+            if type_name not in resolved:
+                resolved[type_name] = resolve(type_name)
+            return resolved[type_name]
+
+        return resolver
+
     @staticmethod
     def parse_flowsint_type(
         entity: Dict,
         nodeType: str,
         type_resolver: Optional[TypeResolver] = None,
+        validate: bool = True,
     ) -> FlowsintType:
-        if not type_resolver:
-            from flowsint_core.core.services.type_registry_service import (
-                local_type_resolver,
-            )
+        """
+        Build the FlowsintType of a node from its properties.
 
-            type_resolver = local_type_resolver
+        Args:
+            entity: Node properties
+            nodeType: Type name, resolved with `type_resolver`
+            type_resolver: Optional callable to resolve types by name
+            validate: Validate the properties. When False, trusted properties
+                holding only plain values skip validation (see module docstring).
+
+        Raises:
+            ValueError: If the type is unknown
+        """
+        if not type_resolver:
+            type_resolver = GraphSerializer._default_type_resolver()
         DetectedType = type_resolver(nodeType)
         if not DetectedType:
             raise ValueError(f"Unknown type: {nodeType}")
         properties = GraphSerializer._clean_empty_values(entity)
+        if not validate:
+            info = get_type_info(DetectedType)
+            if info.can_construct(properties):
+                try:
+                    return info.construct(DetectedType, properties)
+                except (ValueError, TypeError, AttributeError):
+                    pass  # not as trusted as expected, validate it
         try:
             return DetectedType(**properties)
         except ValidationError as e:
@@ -89,68 +266,91 @@ class GraphSerializer:
     def neo4j_dict_to_graph_node(
         node_dict: Dict[str, Any],
         type_resolver: Optional[TypeResolver] = None,
+        validate: bool = False,
     ) -> GraphNode:
         """Convert a flattened Neo4j node record to a GraphNode instance.
 
-        Unflattens the data, parses the nodeProperties into the appropriate
-        FlowsintType subclass, and constructs a complete GraphNode.
+        Splits the flat data into node fields, nodeProperties and nodeMetadata,
+        parses the nodeProperties into the appropriate FlowsintType subclass,
+        and constructs a complete GraphNode. Trusted rows skip validation
+        unless `validate` is set.
         """
         data = node_dict.get("data")
         node_id = str(node_dict.get("id"))
         if not data:
             raise Exception("Could not find node data to extract.")
-        # unflatten object from neo4j
-        node_dict = unflatten(data)
-        node_type = node_dict.get(
-            "nodeType", node_dict.get("type", "")
-        )  # legacy support type
-        nodeLabel = str(node_dict.get("nodeLabel", node_dict.get("label", "")))
-        node_properties = node_dict.get("nodeProperties", {})
-        node_metadata = node_dict.get("nodeMetadata", {})
+        top, node_properties, node_metadata = _split_node_data(data)
+        node_type = top.get("nodeType", top.get("type", ""))  # legacy support type
+        nodeLabel = str(top.get("nodeLabel", top.get("label", "")))
 
         node_properties.pop(
             "nodeLabel", None
         )  # remove nodeLabel from original pydantic
 
         entity = GraphSerializer.parse_flowsint_type(
-            node_properties, node_type, type_resolver=type_resolver
+            node_properties,
+            node_type,
+            type_resolver=type_resolver,
+            validate=validate,
         )
-        return GraphNode(
+        fields = dict(
             id=node_id,
             nodeLabel=nodeLabel,
             nodeType=node_type,
-            nodeColor=node_dict.get("nodeColor"),
-            nodeSize=node_dict.get("nodeSize"),
-            nodeImage=node_dict.get("nodeImage"),
-            nodeIcon=node_dict.get("nodeIcon"),
-            nodeFlag=node_dict.get("nodeFlag"),
-            nodeShape=node_dict.get("nodeShape"),
-            x=node_dict.get("x"),
-            y=node_dict.get("y"),
+            nodeColor=top.get("nodeColor"),
+            nodeSize=top.get("nodeSize"),
+            nodeImage=top.get("nodeImage"),
+            nodeIcon=top.get("nodeIcon"),
+            nodeFlag=top.get("nodeFlag"),
+            nodeShape=top.get("nodeShape"),
+            x=top.get("x"),
+            y=top.get("y"),
             nodeProperties=entity,
-            nodeMetadata=node_metadata,
+        )
+        if validate:
+            return GraphNode(**fields, nodeMetadata=node_metadata)
+        return GraphNode.model_construct(
+            **fields, nodeMetadata=NodeMetadata.model_validate(node_metadata)
         )
 
     @staticmethod
-    def flowsint_type_to_neo4j_dict(entity: FlowsintType) -> Dict[str, Any]:
-        node_type = entity.__class__.__name__.lower()
-        node_label = entity.nodeLabel
-        node_shape = (
-            "square" if node_type in ["document", "image", "bankaccount"] else "circle"
-        )
-        graph_node = GraphNode(
-            id="",
-            nodeColor=None,
-            nodeIcon=None,
-            nodeImage=None,
-            nodeFlag=None,
-            nodeShape=node_shape,
-            nodeLabel=node_label or "",
-            nodeType=node_type,
-            nodeProperties=entity,
-            nodeMetadata=NodeMetadata(),
+    def flowsint_type_to_neo4j_dict(
+        entity: FlowsintType, created_at: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Convert a FlowsintType to the flattened dict of a new graph node.
+
+        Produces the same dict as wrapping the entity in a GraphNode and
+        calling graph_node_to_neo4j_dict, with a single dump of the entity.
+
+        Args:
+            entity: The FlowsintType to convert
+            created_at: Optional ISO creation date (defaults to now)
+        """
+        info = get_type_info(type(entity))
+        properties = flatten(
+            entity.model_dump(mode="json", serialize_as_any=True),
+            PROPERTIES_PREFIX[:-1],
+            remove_empty=False,
         )
-        return GraphSerializer.graph_node_to_neo4j_dict(graph_node)
+        properties.pop(
+            "nodeProperties.nodeLabel", None
+        )  # remove nodeLabel from original pydantic
+        return {
+            "id": "",
+            "nodeLabel": entity.nodeLabel or "",
+            "nodeType": info.node_type,
+            "nodeSize": None,
+            "nodeColor": None,
+            "nodeIcon": None,
+            "nodeImage": None,
+            "nodeFlag": None,
+            "nodeShape": info.node_shape,
+            "nodeMetadata.created_at": created_at
+            or to_jsonable_python(datetime.now()),
+            **properties,
+            "x": 100.0,
+            "y": 100.0,
+        }
 
     @staticmethod
     def graph_node_to_neo4j_dict(node: GraphNode) -> Dict[str, Any]:
@@ -207,11 +407,16 @@ class GraphSerializer:
     def deserialize_nodes(
         node_dicts: List[Dict[str, Any]],
         type_resolver: Optional[TypeResolver] = None,
+        validate: bool = False,
     ) -> List[GraphNode]:
-        """Convert a list of Neo4j node records to GraphNode instances."""
+        """Convert a list of Neo4j node records to GraphNode instances.
+
+        Each type name is resolved once for the whole list.
+        """
+        type_resolver = GraphSerializer.caching_type_resolver(type_resolver)
         return [
             GraphSerializer.neo4j_dict_to_graph_node(
-                node_dict, type_resolver=type_resolver
+                node_dict, type_resolver=type_resolver, validate=validate
             )
             for node_dict in node_dicts
         ]
@@ -223,8 +428,12 @@ class GraphSerializer:
 
     @staticmethod
     def serialize_flowsint_types(nodes: List[FlowsintType]) -> List[Dict[str, Any]]:
-        """Convert a list of Neo4j node records to GraphNode instances."""
-        return [GraphSerializer.flowsint_type_to_neo4j_dict(node) for node in nodes]
+        """Convert a list of FlowsintTypes to flattened Neo4j node dicts."""
+        created_at = to_jsonable_python(datetime.now())
+        return [
+            GraphSerializer.flowsint_type_to_neo4j_dict(node, created_at=created_at)
+            for node in nodes
+        ]
 
     @staticmethod
     def deserialize_edges(edge_dicts: List[Dict[str, Any]]) -> List[GraphEdge]:
@@ -5,7 +5,7 @@ This module provides a service layer for graph operations,
 integrating repository and logging functionality.
 """
 
-from typing import Any, Dict, List, Optional, Protocol
+from typing import Any, Dict, Iterator, List, Optional, Protocol
 
 from flowsint_types import FlowsintType
 from pydantic import BaseModel
@@ -13,7 +13,7 @@ from pydantic import BaseModel
 from .repository import Neo4jGraphRepository
 from .repository_protocol import GraphRepositoryProtocol
 from .serializer import GraphSerializer, TypeResolver
-from .types import GraphData, GraphDict, GraphNode
+from .types import GraphData, GraphDict, GraphEdge, GraphNode
 
 
 class LoggerProtocol(Protocol):
@@ -147,14 +147,33 @@ class GraphService:
         edges = GraphSerializer.deserialize_edges(graph_data.get("edges", []))
         return GraphData(nodes=nodes, edges=edges)
 
-    def get_nodes_by_ids(self, node_ids: List[str]) -> List[GraphNode]:
+    def iter_sketch_nodes(self, chunk_size: int = 1000) -> Iterator[List[GraphNode]]:
+        """Stream the sketch nodes as chunks of GraphNode instances."""
+        for chunk in self._repository.iter_sketch_nodes(
+            self._sketch_id, chunk_size=chunk_size
+        ):
+            yield GraphSerializer.deserialize_nodes(
+                chunk, type_resolver=self._type_resolver
+            )
+
+    def iter_sketch_edges(self, chunk_size: int = 1000) -> Iterator[List[GraphEdge]]:
+        """Stream the sketch edges as chunks of GraphEdge instances."""
+        for chunk in self._repository.iter_sketch_edges(
+            self._sketch_id, chunk_size=chunk_size
+        ):
+            yield GraphSerializer.deserialize_edges(chunk)
+
+    def get_nodes_by_ids(
+        self, node_ids: List[str], validate: bool = False
+    ) -> List[GraphNode]:
         nodes = self.repository.get_nodes_by_ids(node_ids, self.sketch_id)
         return GraphSerializer.deserialize_nodes(
-            nodes, type_resolver=self._type_resolver
+            nodes, type_resolver=self._type_resolver, validate=validate
         )
 
     def get_nodes_by_ids_for_task(self, node_ids: List[str]) -> List[BaseModel]:
-        nodes = self.get_nodes_by_ids(node_ids)
+        # Enrichers get fully validated entities
+        nodes = self.get_nodes_by_ids(node_ids, validate=True)
         return [GraphSerializer.graph_node_to_flowsint_type(node) for node in nodes]
 
     def create_relationship(
@@ -0,0 +1,294 @@
+"""
+Shared async HTTP client pool for enrichers.
+
+Enrichers used to open a fresh client (or a bare `requests` call) per scan, so
+no connection, TLS session or DNS lookup was ever reused. This module keeps a
+pooled `httpx.AsyncClient` per process and adds:
+
+- keep-alive connection pooling, with HTTP/2 when the `h2` package is installed
+- token-bucket rate limits per host, optionally split per API key
+- automatic retries of idempotent requests on 429/503, honoring the
+  `Retry-After` header up to HTTP_MAX_RETRY_DELAY seconds
+
+Rate limits come from `DEFAULT_RATE_LIMITS` and can be extended or overridden
+with the `HTTP_RATE_LIMITS` environment variable, e.g.
+`HTTP_RATE_LIMITS="api.whoxy.com=2,api.dehashed.com=5/10"` (requests per
+second, with an optional burst size after the slash).
+"""
+
+import asyncio
+import importlib.util
+import os
+import threading
+import time
+import weakref
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, Optional, Tuple
+
+import httpx
+
+# Requests per second and burst size for APIs with documented limits
+DEFAULT_RATE_LIMITS: Dict[str, Tuple[float, int]] = {
+    "api.etherscan.io": (5.0, 5),
+}
+
+RETRY_STATUS_CODES = (429, 503)
+# Methods retried by default, retrying others could repeat their side effects
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE", "TRACE"})
+# Longest wait before a retry, whatever the Retry-After header asks for
+DEFAULT_MAX_RETRY_DELAY = float(os.getenv("HTTP_MAX_RETRY_DELAY", "60"))
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a Retry-After header value.
+
+    Args:
+        value: Either a number of seconds or an HTTP date
+
+    Returns:
+        Seconds to wait, or None if the value is missing or invalid
+    """
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+def parse_rate_limits(value: Optional[str]) -> Dict[str, Tuple[float, int]]:
+    """
+    Parse a `host=rate[/burst]` comma-separated rate limit specification.
+    Malformed entries are ignored.
+    """
+    limits: Dict[str, Tuple[float, int]] = {}
+    for entry in (value or "").split(","):
+        host, _, spec = entry.strip().partition("=")
+        if not host or not spec:
+            continue
+        rate, _, burst = spec.partition("/")
+        try:
+            limits[host.strip().lower()] = (float(rate), int(burst or 1))
+        except ValueError:
+            continue
+    return limits
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket.
+
+    Callers reserve a token and sleep outside the lock, so the bucket can be
+    shared by every event loop and worker thread of the process.
+    """
+
+    def __init__(self, rate: float, burst: int = 1):
+        if rate <= 0:
+            raise ValueError("Rate must be positive")
+        self.rate = rate
+        self.burst = max(1, burst)
+        self._tokens = float(self.burst)
+        self._updated_at = time.monotonic()
+        self._blocked_until = 0.0
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """
+        Take a token.
+
+        Returns:
+            Seconds the caller must wait before sending its request
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.burst, self._tokens + (now - self._updated_at) * self.rate
+            )
+            self._updated_at = now
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+            return max(wait, self._blocked_until - now)
+
+    def defer(self, seconds: float) -> None:
+        """Block the bucket for `seconds`, e.g. after a Retry-After response."""
+        with self._lock:
+            self._blocked_until = max(self._blocked_until, time.monotonic() + seconds)
+
+    async def acquire(self) -> None:
+        wait = self.reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+
+class HttpClientPool:
+    """
+    Process-wide pool of async HTTP clients with per-host rate limiting.
+
+    httpx clients are bound to the event loop that opened their connections,
+    and enrichers run in a fresh loop per task, so one client is kept per
+    running loop. Rate limit buckets are shared by all of them.
+    """
+
+    def __init__(
+        self,
+        timeout: float = 30.0,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        http2: Optional[bool] = None,
+        max_retries: int = 3,
+        backoff_factor: float = 0.5,
+        max_retry_delay: float = DEFAULT_MAX_RETRY_DELAY,
+        rate_limits: Optional[Dict[str, Tuple[float, int]]] = None,
+    ):
+        self.timeout = timeout
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+        )
+        if http2 is None:
+            http2 = importlib.util.find_spec("h2") is not None
+        self.http2 = http2
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.max_retry_delay = max_retry_delay
+        self._rate_limits: Dict[str, Tuple[float, int]] = dict(
+            DEFAULT_RATE_LIMITS if rate_limits is None else rate_limits
+        )
+        self._buckets: Dict[str, TokenBucket] = {}
+        # Event loop -> client, dropped when the loop is garbage collected
+        self._clients = weakref.WeakKeyDictionary()
+        self._lock = threading.Lock()
+
+    def client(self) -> httpx.AsyncClient:
+        """Get the pooled client of the running event loop."""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            client = self._clients.get(loop)
+            if client is None or client.is_closed:
+                client = httpx.AsyncClient(
+                    timeout=self.timeout,
+                    limits=self.limits,
+                    http2=self.http2,
+                )
+                self._clients[loop] = client
+            return client
+
+    def set_rate_limit(self, host: str, rate: float, burst: int = 1) -> None:
+        """
+        Set the rate limit of a host, in requests per second.
+        Existing buckets of that host are reset.
+        """
+        host = host.lower()
+        with self._lock:
+            self._rate_limits[host] = (rate, burst)
+            for key in [k for k in self._buckets if k.split("|", 1)[0] == host]:
+                del self._buckets[key]
+
+    def _bucket(
+        self, host: str, rate_limit_key: Optional[str]
+    ) -> Optional[TokenBucket]:
+        limit = self._rate_limits.get(host)
+        if limit is None:
+            return None
+        key = f"{host}|{rate_limit_key}" if rate_limit_key else host
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                bucket = self._buckets[key] = TokenBucket(*limit)
+            return bucket
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        rate_limit_key: Optional[str] = None,
+        max_retries: Optional[int] = None,
+        **kwargs: Any,
+    ) -> httpx.Response:
+        """
+        Send a request through the pooled client.
+
+        Responses with a 429 or 503 status are retried up to `max_retries`
+        times, waiting for the Retry-After delay (or an exponential backoff),
+        capped at `max_retry_delay`. The delay also holds back the other
+        requests to the same bucket. Requests with a non-idempotent method,
+        such as POST, are only retried when `max_retries` is given.
+
+        Args:
+            method: HTTP method
+            url: Request URL
+            rate_limit_key: Splits the host's rate limit per key (e.g. per API key)
+            max_retries: Overrides the pool's retry count, for any method
+            **kwargs: Passed to httpx.AsyncClient.request
+
+        Returns:
+            The last httpx Response (the status is not checked)
+        """
+        client = self.client()
+        host = (httpx.URL(url).host or "").lower()
+        bucket = self._bucket(host, rate_limit_key)
+        if max_retries is not None:
+            retries = max_retries
+        elif method.upper() in IDEMPOTENT_METHODS:
+            retries = self.max_retries
+        else:
+            retries = 0
+
+        attempt = 0
+        while True:
+            if bucket:
+                await bucket.acquire()
+            response = await client.request(method, url, **kwargs)
+            if response.status_code not in RETRY_STATUS_CODES:
+                return response
+
+            delay = parse_retry_after(response.headers.get("Retry-After"))
+            if delay is None:
+                delay = self.backoff_factor * (2**attempt)
+            delay = min(delay, self.max_retry_delay)
+            if bucket:
+                bucket.defer(delay)
+            if attempt >= retries:
+                return response
+            attempt += 1
+            await asyncio.sleep(delay)
+
+    async def get(self, url: str, **kwargs: Any) -> httpx.Response:
+        return await self.request("GET", url, **kwargs)
+
+    async def post(self, url: str, **kwargs: Any) -> httpx.Response:
+        return await self.request("POST", url, **kwargs)
+
+    async def aclose(self) -> None:
+        """Close the client of the running event loop."""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            client = self._clients.pop(loop, None)
+        if client is not None:
+            await client.aclose()
+
+
+_http_pool: Optional[HttpClientPool] = None
+_http_pool_lock = threading.Lock()
+
+
+def get_http_pool() -> HttpClientPool:
+    """Get the process-wide HTTP client pool."""
+    global _http_pool
+    if _http_pool is None:
+        with _http_pool_lock:
+            if _http_pool is None:
+                rate_limits = dict(DEFAULT_RATE_LIMITS)
+                rate_limits.update(parse_rate_limits(os.getenv("HTTP_RATE_LIMITS")))
+                _http_pool = HttpClientPool(rate_limits=rate_limits)
+    return _http_pool
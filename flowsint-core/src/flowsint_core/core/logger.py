@@ -3,8 +3,9 @@ Modern Logger implementation with Singleton pattern and batch insertion.
 
 Architecture:
 - Singleton: Thread-safe instance
-- Immediate event emission: Real-time display in UI
-- Batched database insertion: Performance optimization
+- Non-blocking event emission: Real-time display in UI, published in the
+  background by EventPublisher
+- Batched database insertion: one multi-row INSERT per batch
 - SOLID principles: Dependency injection via protocols
 - Ordering: Monotonic sequence number + application timestamp
 """
@@ -15,12 +16,12 @@ import time
 from datetime import datetime, timezone
 from queue import Queue
 from typing import Dict, Optional, Union
-from uuid import UUID
+from uuid import UUID, uuid4
 
-from ..tasks.event import emit_event_task
 from .enums import EventLevel
-from .models import Log
+from .event_publisher import get_event_publisher
 from .postgre_db import get_db
+from .repositories import LogRepository
 
 
 class LoggerSingleton:
@@ -28,7 +29,7 @@ class LoggerSingleton:
     Thread-safe Singleton Logger with batched database insertion.
 
     Features:
-    - Immediate event emission for real-time UI updates
+    - Non-blocking event emission for real-time UI updates
     - Batched database writes for performance
     - Thread-safe operations
     - Automatic flush on shutdown
@@ -68,7 +69,7 @@ class LoggerSingleton:
         self._batch_size = batch_size
         self._flush_interval = flush_interval
 
-        # Queue for batch insertion (contains: sequence, timestamp, sketch_id, level, content)
+        # Queue for batch insertion (contains: sequence, log_id, timestamp, sketch_id, level, content)
         self._log_queue: Queue = Queue()
 
         # Monotonic sequence counter for ordering (thread-safe with lock)
@@ -152,23 +153,21 @@ class LoggerSingleton:
             return
 
         try:
-            log_objects = []
-            for sequence, timestamp, sketch_id, level, content in logs_to_insert:
-                log = Log(
-                    sketch_id=str(sketch_id),
-                    type=level.value,
-                    content=content,
-                    created_at=timestamp,  # Use application-side timestamp
-                )
-                log_objects.append(log)
-
-            db.add_all(log_objects)
+            rows = [
+                {
+                    # Same ID as the emitted event
+                    "id": log_id,
+                    "sketch_id": UUID(str(sketch_id)),
+                    "type": level,
+                    "content": content,
+                    "created_at": timestamp,  # Use application-side timestamp
+                }
+                for _, log_id, timestamp, sketch_id, level, content in logs_to_insert
+            ]
+            # Single INSERT, the rows are not loaded back
+            LogRepository(db).bulk_insert(rows)
             db.commit()
 
-            # Refresh to get IDs (needed for event emission tracking)
-            for log in log_objects:
-                db.refresh(log)
-
         except Exception as e:
             db.rollback()
             # Log to standard logging as fallback
@@ -182,7 +181,8 @@ class LoggerSingleton:
         self, log_id: str, sketch_id: str, level: EventLevel, content: Dict
     ) -> None:
         """
-        Emit event immediately for real-time display.
+        Queue event for real-time display. Publishing happens in the
+        background, so this never waits on Redis.
 
         Args:
             log_id: Log entry ID
@@ -191,7 +191,7 @@ class LoggerSingleton:
             content: Log content
         """
         try:
-            emit_event_task.apply(args=[log_id, str(sketch_id), level, content])
+            get_event_publisher().emit(log_id, str(sketch_id), level, content)
         except Exception as e:
             # Don't let event emission errors break logging
             import logging
@@ -206,7 +206,7 @@ class LoggerSingleton:
 
         Process:
         1. Capture timestamp and sequence number immediately
-        2. Emit event immediately (real-time UI)
+        2. Queue event for background publishing (real-time UI)
         3. Queue for batch insertion with ordering info (performance)
 
         Args:
@@ -218,17 +218,17 @@ class LoggerSingleton:
         sequence = self._get_next_sequence()
         timestamp = datetime.now(timezone.utc)
 
-        # Generate a temporary ID for immediate event emission
-        import uuid
-
-        temp_log_id = str(uuid.uuid4())
+        # The log ID is known before insertion, for immediate event emission
+        log_id = uuid4()
 
-        # 1. IMMEDIATE: Emit event for real-time display
-        self._emit_event(temp_log_id, str(sketch_id), level, content)
+        # 1. NON-BLOCKING: Queue event for real-time display
+        self._emit_event(str(log_id), str(sketch_id), level, content)
 
         # 2. BATCHED: Queue for database insertion with ordering info
-        # Format: (sequence, timestamp, sketch_id, level, content)
-        self._log_queue.put((sequence, timestamp, str(sketch_id), level, content))
+        # Format: (sequence, log_id, timestamp, sketch_id, level, content)
+        self._log_queue.put(
+            (sequence, log_id, timestamp, str(sketch_id), level, content)
+        )
 
         # 3. Check if we should flush immediately (batch size reached)
         if self._log_queue.qsize() >= self._batch_size:
@@ -262,13 +262,9 @@ class LoggerSingleton:
 
         # Also publish to status channel for graph refresh
         try:
-            import uuid
-
-            temp_log_id = str(uuid.uuid4())
-            from ..tasks.event import emit_status_event_task
-
-            emit_status_event_task.apply(
-                args=[temp_log_id, str(sketch_id), EventLevel.COMPLETED, message]
+            temp_log_id = str(uuid4())
+            get_event_publisher().emit_status(
+                temp_log_id, str(sketch_id), EventLevel.COMPLETED, message
             )
         except Exception as e:
             import logging
@@ -6,10 +6,12 @@ from sqlalchemy import (
     JSON,
     Boolean,
     Column,
+    Date,
     DateTime,
     Float,
     ForeignKey,
     Index,
+    Integer,
     LargeBinary,
     String,
     Text,
@@ -88,6 +90,13 @@ class Investigation(Base):
 
 
 class Log(Base):
+    """
+    A log line of a sketch.
+
+    On PostgreSQL the table is range-partitioned by month on `created_at`,
+    which is part of the primary key as partitioning requires.
+    """
+
     __tablename__ = "logs"
 
     id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid.uuid4)
@@ -95,6 +104,7 @@ class Log(Base):
     # Allow both server-side default and application-side timestamp
     created_at = mapped_column(
         DateTime(timezone=True),
+        primary_key=True,
         default=lambda: datetime.now(timezone.utc),
         server_default=func.now(),
     )
@@ -105,6 +115,28 @@ class Log(Base):
     )
     type = Column(SQLEnum(EventLevel), default=EventLevel.INFO)
 
+    __table_args__ = (
+        # Keyset pagination of the logs of a sketch
+        Index("idx_logs_sketch_id_created_at_id", "sketch_id", "created_at", "id"),
+    )
+
+
+class LogDailyRollup(Base):
+    """Number of logs per sketch, day, enricher and level, kept after logs expire."""
+
+    __tablename__ = "log_daily_rollups"
+
+    sketch_id: Mapped[uuid.UUID] = mapped_column(
+        Uuid,
+        ForeignKey("sketches.id", onupdate="CASCADE", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    day = mapped_column(Date, primary_key=True)
+    # Empty for logs not emitted by an enricher
+    enricher: Mapped[str] = mapped_column(String, primary_key=True, default="")
+    type = Column(SQLEnum(EventLevel), primary_key=True)
+    count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
 
 class Profile(Base):
     __tablename__ = "profiles"
@@ -132,7 +164,13 @@ class Scan(Base):
     started_at = Column(DateTime, default=datetime.utcnow)
     completed_at = Column(DateTime, nullable=True)
     error = Column(Text, nullable=True)
+    # Results, or their summary when they are in the blob store
     details = Column(JSON, nullable=True)
+    # Blob store key of the compressed results, None when inline
+    result_key = Column(String, nullable=True, index=True)
+    result_count = Column(Integer, nullable=True)
+    # Size of the results JSON, in bytes
+    result_size = Column(Integer, nullable=True)
 
     # Relationships
     sketch = relationship("Sketch", back_populates="scans")
@@ -1,31 +1,65 @@
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Tuple, Union
 from datetime import datetime
 import time
-from pydantic import ValidationError
+from functools import lru_cache
+from pydantic import BaseModel, ValidationError
 from .enricher_base import Enricher
 from flowsint_enrichers import ENRICHER_REGISTRY
-from .types import FlowBranch, FlowStep
+from .types import FlowBranch, FlowDag, FlowDagStep, FlowStep
 from .logger import Logger
+from .result_cache import stable_hash
 from ..utils import to_json_serializable
 import asyncio
+import hashlib
 import json
 import os
 
+# Default number of enricher steps a single flow may run at the same time
+DEFAULT_FLOW_CONCURRENCY = int(os.getenv("FLOW_MAX_CONCURRENCY", "4"))
+
+# Step inputs/outputs larger than this are logged as a count and digest only
+DEFAULT_MAX_LOG_PAYLOAD_BYTES = int(os.getenv("FLOW_LOG_MAX_PAYLOAD_BYTES", "65536"))
+
+# A step is identified by the path of enricher nodeIds leading to it, or by
+# its nodeId alone when running a compiled FlowDag
+StepKey = Tuple[str, ...]
+
+
+@lru_cache(maxsize=None)
+def _primary_field(model: type) -> Optional[str]:
+    """Name of the field flagged as primary on a model, if any."""
+    for name, field in model.model_fields.items():
+        if field.json_schema_extra and field.json_schema_extra.get("primary"):
+            return name
+    return None
+
 
 class FlowOrchestrator(Enricher):
     """
     Orchestrator for running a list of enrichers.
+
+    Runs either the DAG compiled by the FlowCompiler, where each node runs once
+    on the outputs of all its parents, or a list of branches, merged into a DAG
+    of steps so that a shared prefix runs only once. Independent steps run
+    concurrently, up to `max_concurrency`.
     """
 
     def __init__(
         self,
         sketch_id: str,
         scan_id: str,
-        enricher_branches: List[FlowBranch],
+        enricher_branches: Optional[List[FlowBranch]] = None,
         vault=None,
+        max_concurrency: int = DEFAULT_FLOW_CONCURRENCY,
+        max_log_payload_bytes: Optional[int] = DEFAULT_MAX_LOG_PAYLOAD_BYTES,
+        flow_dag: Optional[FlowDag] = None,
     ):
         super().__init__(sketch_id, scan_id, vault=vault)
-        self.enricher_branches = enricher_branches
+        self.enricher_branches = enricher_branches or []
+        self.flow_dag = flow_dag
+        self.max_concurrency = max(1, max_concurrency)
+        # None keeps full payloads in the execution log
+        self.max_log_payload_bytes = max_log_payload_bytes
         self.enrichers = {}  # Map of nodeId -> enricher instance
         self.execution_log_file = None  # Path to the execution log file
         self._create_execution_log()
@@ -33,7 +67,12 @@ class FlowOrchestrator(Enricher):
 
     def _create_execution_log(self) -> None:
         """
-        Create the initial execution log JSON file with enricher configuration.
+        Create the execution journal with a header record.
+
+        The journal is a JSONL file: one header record, one record per step or
+        status change, and a summary footer written by _finalize_execution_log.
+        Records are only ever appended, so each step costs the size of its own
+        entry instead of a rewrite of the whole log.
         """
         try:
             # Create a directory for storing enricher files if it doesn't exist
@@ -41,41 +80,34 @@ class FlowOrchestrator(Enricher):
             os.makedirs(enricher_dir, exist_ok=True)
 
             # Create filename with sketch_id and scan_id
-            filename = f"enricher_execution_{self.sketch_id}_{self.scan_id}.json"
+            filename = f"enricher_execution_{self.sketch_id}_{self.scan_id}.jsonl"
             self.execution_log_file = os.path.join(enricher_dir, filename)
 
-            # Serialize the enricher branches
-            serialized_branches = to_json_serializable(self.enricher_branches)
+            # Count total steps
+            total_steps = len(self._enricher_steps())
+
+            self._execution_summary = {
+                "total_steps": total_steps,
+                "completed_steps": 0,
+                "failed_steps": 0,
+                "cache_hits": 0,
+                "total_execution_time_ms": 0,
+            }
 
-            # Create initial log structure
-            initial_log = {
+            header = {
+                "record": "header",
                 "sketch_id": self.sketch_id,
                 "scan_id": self.scan_id,
                 "created_at": datetime.now().isoformat(),
-                "updated_at": datetime.now().isoformat(),
                 "status": "initialized",
-                "enricher_branches": serialized_branches,
-                "execution_log": [],
-                "summary": {
-                    "total_steps": 0,
-                    "completed_steps": 0,
-                    "failed_steps": 0,
-                    "total_execution_time_ms": 0,
-                },
-                "final_results": {},
+                "enricher_branches": to_json_serializable(self.enricher_branches),
+                "flow_dag": to_json_serializable(self.flow_dag),
+                "total_steps": total_steps,
             }
 
-            # Count total steps
-            total_steps = 0
-            for branch in self.enricher_branches:
-                for step in branch.steps:
-                    if step.type != "type":
-                        total_steps += 1
-            initial_log["summary"]["total_steps"] = total_steps
-
-            # Save initial log file
+            # Start a fresh journal for this scan
             with open(self.execution_log_file, "w", encoding="utf-8") as f:
-                json.dump(initial_log, f, indent=2, ensure_ascii=False)
+                f.write(json.dumps(header, ensure_ascii=False, default=str) + "\n")
 
             Logger.info(
                 self.sketch_id,
@@ -90,45 +122,66 @@ class FlowOrchestrator(Enricher):
             )
             self.execution_log_file = None
 
+    def _append_execution_log(self, record: Dict[str, Any]) -> None:
+        """Append a single record to the execution journal."""
+        with open(self.execution_log_file, "a", encoding="utf-8") as f:
+            f.write(json.dumps(record, ensure_ascii=False, default=str) + "\n")
+
+    def _compact_payload(self, payload: Any) -> Any:
+        """
+        Replace a payload larger than max_log_payload_bytes by its item count,
+        size and SHA-256 digest. Smaller payloads are kept as is.
+        """
+        if payload is None or self.max_log_payload_bytes is None:
+            return payload
+        encoded = json.dumps(payload, ensure_ascii=False, default=str)
+        size = len(encoded.encode("utf-8"))
+        if size <= self.max_log_payload_bytes:
+            return payload
+        return {
+            "count": len(payload) if isinstance(payload, (list, dict)) else None,
+            "bytes": size,
+            "sha256": hashlib.sha256(encoded.encode("utf-8")).hexdigest(),
+        }
+
     def _update_execution_log(
         self, step_entry: Dict[str, Any], status: str = None
     ) -> None:
         """
-        Update the execution log file with a new step entry or status update.
+        Append a step entry and/or a status change to the execution journal.
         """
         if not self.execution_log_file:
             return
 
         try:
-            # Read current log
-            with open(self.execution_log_file, "r", encoding="utf-8") as f:
-                log_data = json.load(f)
-
-            # Update timestamp
-            log_data["updated_at"] = datetime.now().isoformat()
-
             # Update status if provided
             if status:
-                log_data["status"] = status
+                self._append_execution_log(
+                    {
+                        "record": "status",
+                        "status": status,
+                        "timestamp": datetime.now().isoformat(),
+                    }
+                )
 
             # Add step entry if provided
             if step_entry:
-                log_data["execution_log"].append(step_entry)
-
-                # Update summary
+                summary = self._execution_summary
                 if step_entry["status"] == "completed":
-                    log_data["summary"]["completed_steps"] += 1
+                    summary["completed_steps"] += 1
                 elif step_entry["status"] == "error":
-                    log_data["summary"]["failed_steps"] += 1
-
+                    summary["failed_steps"] += 1
+                if step_entry.get("cache_hit"):
+                    summary["cache_hits"] += 1
                 if "execution_time_ms" in step_entry:
-                    log_data["summary"]["total_execution_time_ms"] += step_entry[
+                    summary["total_execution_time_ms"] += step_entry[
                         "execution_time_ms"
                     ]
 
-            # Write updated log
-            with open(self.execution_log_file, "w", encoding="utf-8") as f:
-                json.dump(log_data, f, indent=2, ensure_ascii=False)
+                record = {"record": "step", **step_entry}
+                record["inputs"] = self._compact_payload(step_entry.get("inputs"))
+                record["outputs"] = self._compact_payload(step_entry.get("outputs"))
+                self._append_execution_log(record)
 
         except Exception as e:
             Logger.error(
@@ -137,24 +190,45 @@ class FlowOrchestrator(Enricher):
 
     def _finalize_execution_log(self, final_results: Dict[str, Any]) -> None:
         """
-        Finalize the execution log with final results and status.
+        Append the summary footer to the execution journal.
+
+        Step outputs are already in the step records, so the footer only keeps
+        the counters and the status of every step per branch.
         """
         if not self.execution_log_file:
             return
 
         try:
-            # Read current log
-            with open(self.execution_log_file, "r", encoding="utf-8") as f:
-                log_data = json.load(f)
-
-            # Update final data
-            log_data["updated_at"] = datetime.now().isoformat()
-            log_data["status"] = "completed"
-            log_data["final_results"] = to_json_serializable(final_results)
-
-            # Write final log
-            with open(self.execution_log_file, "w", encoding="utf-8") as f:
-                json.dump(log_data, f, indent=2, ensure_ascii=False)
+            footer = {
+                "record": "summary",
+                "status": "completed",
+                "updated_at": datetime.now().isoformat(),
+                "summary": self._execution_summary,
+                "branches": [
+                    {
+                        "id": branch["id"],
+                        "name": branch["name"],
+                        "steps": [
+                            {
+                                "nodeId": step["nodeId"],
+                                "status": step["status"],
+                                "error": step.get("error"),
+                            }
+                            for step in branch["steps"]
+                        ],
+                    }
+                    for branch in final_results.get("branches", [])
+                ],
+                "steps": [
+                    {
+                        "nodeId": step["nodeId"],
+                        "status": step["status"],
+                        "error": step.get("error"),
+                    }
+                    for step in final_results.get("steps", [])
+                ],
+            }
+            self._append_execution_log(footer)
 
             Logger.info(
                 self.sketch_id,
@@ -209,17 +283,20 @@ class FlowOrchestrator(Enricher):
                 {"message": f"Failed to save enricher branches: {str(e)}"},
             )
 
+    def _enricher_steps(self) -> List[Union[FlowStep, FlowDagStep]]:
+        """Enricher steps of the flow DAG, or of every branch."""
+        if self.flow_dag is not None:
+            steps = self.flow_dag.steps
+        else:
+            steps = [step for branch in self.enricher_branches for step in branch.steps]
+        return [step for step in steps if step.type != "type"]
+
     def _load_enrichers(self) -> None:
-        if not self.enricher_branches:
+        if not self.enricher_branches and self.flow_dag is None:
             raise ValueError("No enricher branches provided")
 
         # Collect all enricher nodes across all branches
-        enricher_nodes = []
-        for branch in self.enricher_branches:
-            for step in branch.steps:
-                if step.type == "type":
-                    continue
-                enricher_nodes.append(step)
+        enricher_nodes = self._enricher_steps()
 
         if not enricher_nodes:
             raise ValueError("No enricher nodes found in enricher branches")
@@ -296,6 +373,42 @@ class FlowOrchestrator(Enricher):
             enricher = self.enrichers.get(step.nodeId)
         return inputs[input_key]
 
+    @staticmethod
+    def item_key(item: Any) -> str:
+        """
+        Canonical identity of an input item.
+
+        Flowsint types are identified by their type and primary field value,
+        anything else by a hash of its content.
+        """
+        if isinstance(item, BaseModel):
+            primary_field = _primary_field(type(item))
+            if primary_field is not None:
+                return f"{type(item).__name__}:{getattr(item, primary_field, None)}"
+        return stable_hash(item)
+
+    def dedup_inputs(self, inputs: Any) -> Tuple[Any, List[str]]:
+        """
+        Drop repeated entities from a list of inputs, keeping the first one.
+
+        Returns:
+            Tuple of (deduplicated inputs, keys of the unique items). Non-list
+            inputs are returned unchanged.
+        """
+        if not isinstance(inputs, list):
+            return inputs, [stable_hash(inputs)]
+        unique: List[Any] = []
+        keys: List[str] = []
+        seen = set()
+        for item in inputs:
+            key = self.item_key(item)
+            if key in seen:
+                continue
+            seen.add(key)
+            unique.append(item)
+            keys.append(key)
+        return unique, keys
+
     def update_results_mapping(
         self,
         outputs: Dict[str, Any],
@@ -341,9 +454,214 @@ class FlowOrchestrator(Enricher):
         finally:
             loop.close()
 
+    def _build_step_dag(self) -> Dict[StepKey, Dict[str, Any]]:
+        """
+        Build the DAG of steps to run.
+
+        Steps of a compiled FlowDag are keyed by their nodeId: a node runs
+        once, on the outputs of all its enricher parents.
+
+        Branches repeat the steps they share with their siblings. Each step is
+        keyed by the nodeId path leading to it, so identical prefixes collapse
+        into a single step, while a node reached through different parents
+        keeps one step per path (it receives different inputs).
+
+        Returns:
+            Ordered mapping of step key -> {"step", "parents", "branch"}, where
+            parents always come before their children. Steps without parents
+            run on the initial values.
+        """
+        dag: Dict[StepKey, Dict[str, Any]] = {}
+        if self.flow_dag is not None:
+            enricher_ids = {step.nodeId for step in self._enricher_steps()}
+            for step in self._enricher_steps():
+                parents = [
+                    (parent,) for parent in step.parents if parent in enricher_ids
+                ]
+                dag[(step.nodeId,)] = {
+                    "step": step,
+                    "parents": parents,
+                    "branch": None,
+                }
+            return dag
+
+        for branch in self.enricher_branches:
+            path: StepKey = ()
+            for step in branch.steps:
+                if step.type == "type":
+                    continue
+                parents = [path] if path else []
+                path = path + (step.nodeId,)
+                if path not in dag:
+                    dag[path] = {"step": step, "parents": parents, "branch": branch}
+        return dag
+
+    @staticmethod
+    def _merge_outputs(outputs: List[Any]) -> Any:
+        """Inputs of a step from the outputs of its parents, in order."""
+        if len(outputs) == 1:
+            return outputs[0]
+        merged: List[Any] = []
+        for output in outputs:
+            if isinstance(output, list):
+                merged.extend(output)
+            elif output:
+                merged.append(output)
+        return merged
+
+    async def _execute_step(
+        self,
+        step: Union[FlowStep, FlowDagStep],
+        branch: Optional[FlowBranch],
+        enricher_inputs: Any,
+        results: Dict[str, Any],
+        results_mapping: Dict[str, Any],
+        enricher_results_cache: Dict[str, Any],
+    ) -> Dict[str, Any]:
+        """
+        Run a single enricher step.
+
+        Returns:
+            Outcome dict with:
+                - status: "completed", "no_inputs", "failed" or "skipped"
+                - step_result: Entry for the branch results (None if skipped)
+                - outputs: Inputs handed to the children of this step
+        """
+        node_id = step.nodeId
+        enricher = self.enrichers.get(node_id)
+
+        if not enricher:
+            Logger.error(
+                self.sketch_id,
+                {"message": f"Enricher not found for node {node_id}"},
+            )
+            return {
+                "status": "skipped",
+                "step_result": None,
+                "outputs": enricher_inputs,
+            }
+
+        enricher_name = enricher.name()
+        step_start_time = time.time()
+
+        step_result = {
+            "nodeId": node_id,
+            "enricher": enricher_name,
+            "status": "error",  # Default to error, will update on success
+        }
+
+        # Create execution log entry
+        log_entry = {
+            "step_id": f"{branch.id}_{node_id}" if branch else node_id,
+            "branch_id": branch.id if branch else None,
+            "branch_name": branch.name if branch else None,
+            "node_id": node_id,
+            "enricher_name": enricher_name,
+            "inputs": to_json_serializable(enricher_inputs),
+            "outputs": None,
+            "status": "running",
+            "error": None,
+            "timestamp": datetime.now().isoformat(),
+            "execution_time_ms": 0,
+        }
+
+        if not enricher_inputs:
+            error_msg = "No inputs available"
+            step_result["error"] = error_msg
+            log_entry["status"] = "error"
+            log_entry["error"] = error_msg
+            log_entry["execution_time_ms"] = int((time.time() - step_start_time) * 1000)
+            self._update_execution_log(log_entry)
+            # Children receive the same (empty) inputs, as in a sequential run
+            return {
+                "status": "no_inputs",
+                "step_result": step_result,
+                "outputs": enricher_inputs,
+            }
+
+        try:
+            # Identical entities reaching a step through several paths are
+            # only enriched once
+            unique_inputs, item_keys = self.dedup_inputs(enricher_inputs)
+            if len(unique_inputs) != len(enricher_inputs):
+                log_entry["deduplicated_inputs"] = len(enricher_inputs) - len(
+                    unique_inputs
+                )
+
+            # Results are shared by every step running the same enricher with
+            # the same params on the same set of entities, whatever their order
+            cache_key = ":".join(
+                [
+                    enricher_name,
+                    stable_hash(step.params or {}),
+                    stable_hash(sorted(item_keys)),
+                ]
+            )
+            if cache_key in enricher_results_cache:
+                # The same key may still be running in a concurrent branch
+                outputs = await asyncio.shield(enricher_results_cache[cache_key])
+                log_entry["cache_hit"] = True
+            else:
+                pending = asyncio.get_running_loop().create_future()
+                enricher_results_cache[cache_key] = pending
+                try:
+                    # Execute the enricher
+                    outputs = await enricher.execute(unique_inputs)
+                    if not isinstance(outputs, (dict, list)):
+                        raise ValueError(
+                            f"Enricher '{enricher_name}' returned unsupported output format"
+                        )
+                except Exception as e:
+                    del enricher_results_cache[cache_key]
+                    pending.set_exception(e)
+                    # Mark the exception as retrieved when nobody is waiting
+                    pending.exception()
+                    raise
+                # Cache the results
+                pending.set_result(outputs)
+                log_entry["cache_hit"] = False
+
+            # Store the outputs in the step result (serialize to avoid JSON issues)
+            step_result["outputs"] = to_json_serializable(outputs)
+            step_result["status"] = "completed"
+
+            # Update log entry with success
+            log_entry["outputs"] = to_json_serializable(outputs)
+            log_entry["status"] = "completed"
+            log_entry["execution_time_ms"] = int((time.time() - step_start_time) * 1000)
+
+            # Update the global results mapping with the outputs
+            self.update_results_mapping(outputs, step.outputs, results_mapping)
+            # Also store the raw outputs in the main results
+            results["results"][node_id] = outputs
+            self._update_execution_log(log_entry)
+            return {
+                "status": "completed",
+                "step_result": step_result,
+                "outputs": outputs,
+            }
+
+        except Exception as e:
+            if isinstance(e, ValidationError):
+                error_msg = f"Validation error: {str(e)}"
+            else:
+                error_msg = f"Error during scan: {str(e)}"
+            Logger.error(self.sketch_id, {"message": error_msg})
+            step_result["error"] = error_msg
+            log_entry["status"] = "error"
+            log_entry["error"] = error_msg
+            log_entry["execution_time_ms"] = int((time.time() - step_start_time) * 1000)
+            results["results"][node_id] = {"error": error_msg}
+            self._update_execution_log(log_entry)
+            return {"status": "failed", "step_result": step_result, "outputs": None}
+
     async def _async_scan(self, values: List[str]) -> Dict[str, Any]:
         """
-        The actual async implementation of the scan logic
+        The actual async implementation of the scan logic.
+
+        Every step of the DAG is scheduled as a task that waits for its
+        parents, then runs under the flow semaphore. A failed step stops the
+        steps depending only on it; other steps keep running.
         """
         # Update execution log to indicate scan has started
         self._update_execution_log(None, "running")
@@ -356,133 +674,66 @@ class FlowOrchestrator(Enricher):
         # Cache for enricher results to avoid recomputation
         enricher_results_cache = {}
 
-        total_steps = sum(len(branch.steps) for branch in self.enricher_branches)
-        completed_steps = 0
+        dag = self._build_step_dag()
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        # Enricher instances are shared per nodeId, never run one twice at once
+        node_locks = {node_id: asyncio.Lock() for node_id in self.enrichers}
+        tasks: Dict[StepKey, asyncio.Task] = {}
 
-        # Process each branch
-        for branch in self.enricher_branches:
-            branch_id = branch.id
-            branch_name = branch.name
-            branch_results = {"id": branch_id, "name": branch_name, "steps": []}
-
-            # Process each step in the branch
+        async def run_step(key: StepKey) -> Dict[str, Any]:
+            dag_step = dag[key]
             enricher_inputs = values
+            if dag_step["parents"]:
+                parent_outcomes = [
+                    await tasks[parent] for parent in dag_step["parents"]
+                ]
+                parent_outputs = [
+                    outcome["outputs"]
+                    for outcome in parent_outcomes
+                    if outcome["status"] not in ("failed", "aborted")
+                ]
+                if not parent_outputs:
+                    return {"status": "aborted", "step_result": None, "outputs": None}
+                enricher_inputs = self._merge_outputs(parent_outputs)
+
+            node_id = dag_step["step"].nodeId
+            async with node_locks.setdefault(node_id, asyncio.Lock()), semaphore:
+                return await self._execute_step(
+                    dag_step["step"],
+                    dag_step["branch"],
+                    enricher_inputs,
+                    results,
+                    results_mapping,
+                    enricher_results_cache,
+                )
+
+        # Parents are created before their children, so every task can
+        # look up its parent's task when it starts
+        for key in dag:
+            tasks[key] = asyncio.create_task(run_step(key))
+        outcomes = dict(zip(tasks.keys(), await asyncio.gather(*tasks.values())))
+
+        # Results of the DAG steps, in topological order
+        if self.flow_dag is not None:
+            results["steps"] = [
+                outcome["step_result"]
+                for outcome in outcomes.values()
+                if outcome["step_result"] is not None
+            ]
+
+        # Rebuild per-branch results in the original branch and step order
+        for branch in self.enricher_branches:
+            branch_results = {"id": branch.id, "name": branch.name, "steps": []}
+            path: StepKey = ()
             for step in branch.steps:
                 if step.type == "type":
                     continue
-
-                node_id = step.nodeId
-                enricher = self.enrichers.get(node_id)
-
-                if not enricher:
-                    Logger.error(
-                        self.sketch_id,
-                        {"message": f"Enricher not found for node {node_id}"},
-                    )
-                    continue
-
-                enricher_name = enricher.name()
-                step_start_time = time.time()
-
-                step_result = {
-                    "nodeId": node_id,
-                    "enricher": enricher_name,
-                    "status": "error",  # Default to error, will update on success
-                }
-
-                # Create execution log entry
-                log_entry = {
-                    "step_id": f"{branch_id}_{node_id}",
-                    "branch_id": branch_id,
-                    "branch_name": branch_name,
-                    "node_id": node_id,
-                    "enricher_name": enricher_name,
-                    "inputs": to_json_serializable(enricher_inputs),
-                    "outputs": None,
-                    "status": "running",
-                    "error": None,
-                    "timestamp": datetime.now().isoformat(),
-                    "execution_time_ms": 0,
-                }
-
-                try:
-                    # Update status for current step
-                    completed_steps += 1
-                    if not enricher_inputs:
-                        error_msg = "No inputs available"
-                        step_result["error"] = error_msg
-                        log_entry["status"] = "error"
-                        log_entry["error"] = error_msg
-                        log_entry["execution_time_ms"] = int(
-                            (time.time() - step_start_time) * 1000
-                        )
-                        self._update_execution_log(log_entry)
-                        branch_results["steps"].append(step_result)
-                        continue
-
-                    # Check if we already have results for this enricher with these inputs
-                    cache_key = f"{node_id}:{str(enricher_inputs)}"
-                    if cache_key in enricher_results_cache:
-                        outputs = enricher_results_cache[cache_key]
-                        log_entry["cache_hit"] = True
-                    else:
-                        # Execute the enricher
-                        outputs = await enricher.execute(enricher_inputs)
-                        if not isinstance(outputs, (dict, list)):
-                            raise ValueError(
-                                f"Enricher '{enricher_name}' returned unsupported output format"
-                            )
-                        # Cache the results
-                        enricher_results_cache[cache_key] = outputs
-                        log_entry["cache_hit"] = False
-
-                    # Store the outputs in the step result (serialize to avoid JSON issues)
-                    step_result["outputs"] = to_json_serializable(outputs)
-                    step_result["status"] = "completed"
-
-                    # Update log entry with success
-                    log_entry["outputs"] = to_json_serializable(outputs)
-                    log_entry["status"] = "completed"
-                    log_entry["execution_time_ms"] = int(
-                        (time.time() - step_start_time) * 1000
-                    )
-
-                    # Update the global results mapping with the outputs
-                    self.update_results_mapping(outputs, step.outputs, results_mapping)
-                    # Also store the raw outputs in the main results
-                    results["results"][node_id] = outputs
-                    enricher_inputs = outputs
-
-                except ValidationError as e:
-                    error_msg = f"Validation error: {str(e)}"
-                    Logger.error(self.sketch_id, {"message": error_msg})
-                    step_result["error"] = error_msg
-                    log_entry["status"] = "error"
-                    log_entry["error"] = error_msg
-                    log_entry["execution_time_ms"] = int(
-                        (time.time() - step_start_time) * 1000
-                    )
-                    results["results"][node_id] = {"error": error_msg}
-                    self._update_execution_log(log_entry)
-                    return results
-
-                except Exception as e:
-                    error_msg = f"Error during scan: {str(e)}"
-                    Logger.error(self.sketch_id, {"message": error_msg})
-                    step_result["error"] = error_msg
-                    log_entry["status"] = "error"
-                    log_entry["error"] = error_msg
-                    log_entry["execution_time_ms"] = int(
-                        (time.time() - step_start_time) * 1000
-                    )
-                    results["results"][node_id] = {"error": error_msg}
-                    self._update_execution_log(log_entry)
-                    return results
-
-                # Update execution log with this step
-                self._update_execution_log(log_entry)
-                branch_results["steps"].append(step_result)
-
+                path = path + (step.nodeId,)
+                outcome = outcomes[path]
+                if outcome["status"] == "aborted":
+                    break
+                if outcome["step_result"] is not None:
+                    branch_results["steps"].append(outcome["step_result"])
             results["branches"].append(branch_results)
 
         Logger.completed(
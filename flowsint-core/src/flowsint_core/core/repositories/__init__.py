@@ -7,6 +7,7 @@ from .analysis_repository import AnalysisRepository
 from .chat_repository import ChatRepository
 from .scan_repository import ScanRepository
 from .log_repository import LogRepository
+from .log_rollup_repository import LogDailyRollupRepository
 from .key_repository import KeyRepository
 from .flow_repository import FlowRepository
 from .custom_type_repository import CustomTypeRepository
@@ -21,6 +22,7 @@ __all__ = [
     "ChatRepository",
     "ScanRepository",
     "LogRepository",
+    "LogDailyRollupRepository",
     "KeyRepository",
     "FlowRepository",
     "CustomTypeRepository",
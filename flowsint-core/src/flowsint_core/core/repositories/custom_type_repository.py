@@ -19,6 +19,15 @@ class CustomTypeRepository(BaseRepository[CustomType]):
             query = query.filter(CustomType.status == status)
         return query.order_by(CustomType.created_at.desc()).all()
 
+    def get_version(self, owner_id: UUID) -> str:
+        """Change stamp (count and last update) of the custom types of a user."""
+        count, updated_at = (
+            self._db.query(func.count(CustomType.id), func.max(CustomType.updated_at))
+            .filter(CustomType.owner_id == owner_id)
+            .one()
+        )
+        return f"{count}:{updated_at.isoformat() if updated_at else ''}"
+
     def get_by_id_and_owner(
         self, custom_type_id: UUID, owner_id: UUID
     ) -> Optional[CustomType]:
@@ -2,7 +2,7 @@
 from typing import List, Optional
 from uuid import UUID
 
-from sqlalchemy import or_
+from sqlalchemy import func, or_
 
 from ..models import EnricherTemplate
 from .base import BaseRepository
@@ -24,6 +24,20 @@ class EnricherTemplateRepository(BaseRepository[EnricherTemplate]):
             query = query.filter(EnricherTemplate.category == category)
         return query.order_by(EnricherTemplate.created_at.desc()).all()
 
+    def get_version(self, owner_id: UUID, include_public: bool = False) -> str:
+        """Change stamp (count and last update) of the templates a user can list."""
+        query = self._db.query(
+            func.count(EnricherTemplate.id), func.max(EnricherTemplate.updated_at)
+        )
+        if include_public:
+            query = query.filter(
+                or_(EnricherTemplate.owner_id == owner_id, EnricherTemplate.is_public)
+            )
+        else:
+            query = query.filter(EnricherTemplate.owner_id == owner_id)
+        count, updated_at = query.one()
+        return f"{count}:{updated_at.isoformat() if updated_at else ''}"
+
     def get_by_owner(
         self, owner_id: UUID, category: Optional[str] = None
     ) -> List[EnricherTemplate]:
@@ -1,11 +1,34 @@
 """Repository for Log model."""
-from datetime import datetime, timedelta, timezone
-from typing import List, Optional
+import re
+from datetime import date, datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 from uuid import UUID
 
+from sqlalchemy import func, insert, text, tuple_
+
 from ..models import Log
 from .base import BaseRepository
 
+# Position of a log in a sketch, newest first: (created_at, id)
+LogCursor = Tuple[datetime, UUID]
+# (sketch ID, day, enricher, level, number of logs)
+LogDailyCount = Tuple[UUID, date, str, Any, int]
+
+_PARTITION_NAME = re.compile(r"^logs_y(\d{4})m(\d{2})$")
+# Catches the logs of months without a partition
+DEFAULT_PARTITION = "logs_default"
+
+
+def add_months(month: date, months: int) -> date:
+    """First day of the month `months` months after the month of `month`."""
+    index = month.year * 12 + month.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(month: date) -> str:
+    """Name of the logs partition of a month, e.g. logs_y2026m01."""
+    return f"logs_y{month.year:04d}m{month.month:02d}"
+
 
 class LogRepository(BaseRepository[Log]):
     model = Log
@@ -15,11 +38,21 @@ class LogRepository(BaseRepository[Log]):
         sketch_id: UUID,
         limit: int = 100,
         since: Optional[datetime] = None,
+        before: Optional[LogCursor] = None,
     ) -> List[Log]:
+        """
+        Logs of a sketch, newest first, keyset-paginated on (created_at, id).
+
+        Args:
+            since: Only logs created after this date. Defaults to the last
+                day, on every page so that paging ends where the first page's
+                window does
+            before: Only logs strictly older than this cursor
+        """
         query = (
             self._db.query(Log)
             .filter(Log.sketch_id == sketch_id)
-            .order_by(Log.created_at.desc())
+            .order_by(Log.created_at.desc(), Log.id.desc())
         )
 
         if since:
@@ -28,8 +61,127 @@ class LogRepository(BaseRepository[Log]):
             query = query.filter(
                 Log.created_at > datetime.now(timezone.utc) - timedelta(days=1)
             )
+        if before is not None:
+            query = query.filter(tuple_(Log.created_at, Log.id) < tuple_(*before))
 
         return query.limit(limit).all()
 
+    def bulk_insert(self, rows: Sequence[Dict[str, Any]]) -> List[UUID]:
+        """
+        Insert logs with multi-row INSERT ... RETURNING.
+
+        Rows are not loaded back into the session.
+
+        Args:
+            rows: Column values of each log
+
+        Returns:
+            IDs of the inserted logs
+        """
+        if not rows:
+            return []
+        result = self._db.execute(insert(Log).returning(Log.id), list(rows))
+        return list(result.scalars())
+
     def delete_by_sketch(self, sketch_id: UUID) -> int:
         return self._db.query(Log).filter(Log.sketch_id == sketch_id).delete()
+
+    def delete_before(self, before: datetime) -> int:
+        return self._db.query(Log).filter(Log.created_at < before).delete()
+
+    def get_oldest_created_at(self) -> Optional[datetime]:
+        return self._db.query(func.min(Log.created_at)).scalar()
+
+    def count_by_day(self, start: datetime, end: datetime) -> List[LogDailyCount]:
+        """Number of logs per sketch, day, enricher and level in [start, end)."""
+        day = func.date(Log.created_at)
+        enricher = func.coalesce(Log.content["enricher"].as_string(), "")
+        rows = (
+            self._db.query(Log.sketch_id, day, enricher, Log.type, func.count())
+            .filter(
+                Log.sketch_id.isnot(None),
+                Log.created_at >= start,
+                Log.created_at < end,
+            )
+            .group_by(Log.sketch_id, day, enricher, Log.type)
+            .all()
+        )
+        return [
+            # SQLite returns dates as strings
+            (sketch_id, date.fromisoformat(str(day)), enricher, level, count)
+            for sketch_id, day, enricher, level, count in rows
+        ]
+
+    # Partitions (PostgreSQL only)
+
+    def is_partitioned(self) -> bool:
+        if self._db.get_bind().dialect.name != "postgresql":
+            return False
+        return bool(
+            self._db.execute(
+                text(
+                    "SELECT EXISTS (SELECT 1 FROM pg_partitioned_table pt "
+                    "JOIN pg_class c ON c.oid = pt.partrelid "
+                    "WHERE c.relname = 'logs' AND pg_table_is_visible(c.oid))"
+                )
+            ).scalar()
+        )
+
+    def get_partition_months(self) -> List[date]:
+        """Months of the monthly partitions, oldest first."""
+        names = self._db.execute(
+            text(
+                "SELECT c.relname FROM pg_inherits i "
+                "JOIN pg_class c ON c.oid = i.inhrelid "
+                "JOIN pg_class p ON p.oid = i.inhparent "
+                "WHERE p.relname = 'logs' AND pg_table_is_visible(p.oid)"
+            )
+        ).scalars()
+        months = []
+        for name in names:
+            # Partitions not named by us are left alone
+            match = _PARTITION_NAME.match(name)
+            if match:
+                months.append(date(int(match.group(1)), int(match.group(2)), 1))
+        return sorted(months)
+
+    def get_default_partition_months(self) -> List[date]:
+        """Months of the logs in the default partition, oldest first."""
+        months = self._db.execute(
+            text(
+                f"SELECT DISTINCT date_trunc('month', created_at AT TIME ZONE 'UTC') "
+                f"FROM {DEFAULT_PARTITION}"
+            )
+        ).scalars()
+        return sorted(month.date() for month in months)
+
+    def create_partition(self, month: date) -> None:
+        """
+        Create the partition of a month.
+
+        Logs of the month in the default partition are moved to it, as a
+        partition can't be created over rows of the default partition.
+        """
+        name = partition_name(month)
+        start = datetime.combine(month, datetime.min.time(), tzinfo=timezone.utc)
+        end = datetime.combine(
+            add_months(month, 1), datetime.min.time(), tzinfo=timezone.utc
+        )
+        self._db.execute(text(f"CREATE TABLE {name} (LIKE logs INCLUDING DEFAULTS)"))
+        self._db.execute(
+            text(
+                f"WITH moved AS (DELETE FROM {DEFAULT_PARTITION} "
+                f"WHERE created_at >= :start AND created_at < :end RETURNING *) "
+                f"INSERT INTO {name} SELECT * FROM moved"
+            ),
+            {"start": start, "end": end},
+        )
+        self._db.execute(
+            text(
+                f"ALTER TABLE logs ATTACH PARTITION {name} "
+                f"FOR VALUES FROM ('{start.isoformat()}') TO ('{end.isoformat()}')"
+            )
+        )
+
+    def drop_partition(self, month: date) -> None:
+        self._db.execute(text(f"DROP TABLE IF EXISTS {partition_name(month)}"))
@@ -0,0 +1,50 @@
+"""Repository for LogDailyRollup model."""
+
+from datetime import date
+from typing import Any, Dict, List, Optional, Sequence
+from uuid import UUID
+
+from sqlalchemy.dialects import postgresql, sqlite
+
+from ..models import LogDailyRollup
+from .base import BaseRepository
+
+
+class LogDailyRollupRepository(BaseRepository[LogDailyRollup]):
+    model = LogDailyRollup
+
+    def get_by_sketch(
+        self, sketch_id: UUID, since: Optional[date] = None
+    ) -> List[LogDailyRollup]:
+        query = self._db.query(LogDailyRollup).filter(
+            LogDailyRollup.sketch_id == sketch_id
+        )
+        if since:
+            query = query.filter(LogDailyRollup.day >= since)
+        return query.order_by(
+            LogDailyRollup.day, LogDailyRollup.enricher, LogDailyRollup.type
+        ).all()
+
+    def upsert(self, rows: Sequence[Dict[str, Any]]) -> int:
+        """
+        Insert rollups, replacing the count of the existing ones.
+
+        Args:
+            rows: sketch_id, day, enricher, type and count of each rollup
+        """
+        if not rows:
+            return 0
+        dialect = self._db.get_bind().dialect.name
+        if dialect not in ("postgresql", "sqlite"):
+            for row in rows:
+                self._db.merge(LogDailyRollup(**row))
+            return len(rows)
+
+        insert = postgresql.insert if dialect == "postgresql" else sqlite.insert
+        statement = insert(LogDailyRollup).values(list(rows))
+        statement = statement.on_conflict_do_update(
+            index_elements=["sketch_id", "day", "enricher", "type"],
+            set_={"count": statement.excluded["count"]},
+        )
+        self._db.execute(statement)
+        return len(rows)
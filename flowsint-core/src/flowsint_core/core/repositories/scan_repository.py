@@ -1,6 +1,6 @@
 """Repository for Scan model."""
 
-from typing import List
+from typing import Iterable, List, Set
 from uuid import UUID
 
 from ..models import Scan, Sketch
@@ -51,3 +51,13 @@ class ScanRepository(BaseRepository[Scan]):
             )
             .all()
         )
+
+    def get_referenced_result_keys(self, result_keys: Iterable[str]) -> Set[str]:
+        """The keys, among `result_keys`, referenced by at least one scan."""
+        rows = (
+            self._db.query(Scan.result_key)
+            .filter(Scan.result_key.in_(list(result_keys)))
+            .distinct()
+            .all()
+        )
+        return {row[0] for row in rows}
@@ -0,0 +1,191 @@
+"""
+Persistent enrichment result cache.
+
+Enricher results are cached per input item, under a key built from:
+- the enricher name and version
+- a hash of its non-secret params
+- a stable content hash of the input item
+
+so re-running an enricher on entities it has already seen (in any sketch)
+skips the network or paid API call. The cache is used by Enricher.map_items()
+for enrichers that set a `cache_ttl`.
+
+The backend is Redis (ENRICHER_CACHE_URL, falling back to REDIS_URL). Set
+ENRICHER_CACHE_ENABLED=false to disable it. Cache errors never fail a scan,
+they are logged and treated as misses.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from typing import Any, Dict, List, Optional, Protocol
+
+import redis
+
+from ..utils import to_json_serializable
+
+logger = logging.getLogger(__name__)
+
+KEY_PREFIX = "enricher_cache"
+
+
+def stable_hash(value: Any) -> str:
+    """
+    Hash a value independently of dict key order and object identity.
+    Pydantic models are hashed by type name and content.
+    """
+
+    def canonical(obj: Any) -> Any:
+        if hasattr(obj, "model_dump"):
+            return [type(obj).__name__, to_json_serializable(obj)]
+        if isinstance(obj, (list, tuple)):
+            return [canonical(item) for item in obj]
+        if isinstance(obj, dict):
+            return {str(key): canonical(item) for key, item in obj.items()}
+        return to_json_serializable(obj)
+
+    payload = json.dumps(
+        canonical(value), sort_keys=True, separators=(",", ":"), default=str
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class ResultCache(Protocol):
+    """Protocol for enrichment result cache backends."""
+
+    def get_many(self, keys: List[str]) -> List[Optional[Any]]:
+        """Get cached values, None for misses."""
+        ...
+
+    def set_many(self, values: Dict[str, Any], ttl: int) -> None:
+        """Store JSON-serializable values for `ttl` seconds."""
+        ...
+
+    def record(self, enricher_name: str, hits: int, misses: int) -> None:
+        """Add to the hit/miss counters of an enricher."""
+        ...
+
+    def stats(self, enricher_name: str) -> Dict[str, int]:
+        """Get the hit/miss counters of an enricher."""
+        ...
+
+
+class RedisResultCache:
+    """Redis-backed result cache, values are stored as JSON strings."""
+
+    def __init__(self, url: str):
+        self._redis = redis.from_url(url, socket_connect_timeout=2, socket_timeout=2)
+
+    def get_many(self, keys: List[str]) -> List[Optional[Any]]:
+        if not keys:
+            return []
+        try:
+            raw_values = self._redis.mget(keys)
+        except redis.RedisError as e:
+            logger.warning(f"Enricher cache read failed: {e}")
+            return [None] * len(keys)
+        return [json.loads(raw) if raw is not None else None for raw in raw_values]
+
+    def set_many(self, values: Dict[str, Any], ttl: int) -> None:
+        if not values:
+            return
+        try:
+            pipe = self._redis.pipeline(transaction=False)
+            for key, value in values.items():
+                pipe.set(key, json.dumps(value), ex=ttl)
+            pipe.execute()
+        except redis.RedisError as e:
+            logger.warning(f"Enricher cache write failed: {e}")
+
+    def record(self, enricher_name: str, hits: int, misses: int) -> None:
+        try:
+            pipe = self._redis.pipeline(transaction=False)
+            pipe.hincrby(f"{KEY_PREFIX}:stats:{enricher_name}", "hits", hits)
+            pipe.hincrby(f"{KEY_PREFIX}:stats:{enricher_name}", "misses", misses)
+            pipe.execute()
+        except redis.RedisError as e:
+            logger.warning(f"Enricher cache stats update failed: {e}")
+
+    def stats(self, enricher_name: str) -> Dict[str, int]:
+        try:
+            raw = self._redis.hgetall(f"{KEY_PREFIX}:stats:{enricher_name}")
+        except redis.RedisError as e:
+            logger.warning(f"Enricher cache stats read failed: {e}")
+            raw = {}
+        return {
+            "hits": int(raw.get(b"hits", 0)),
+            "misses": int(raw.get(b"misses", 0)),
+        }
+
+
+class InMemoryResultCache:
+    """Process-local result cache, mostly useful for tests and development."""
+
+    def __init__(self):
+        self._values: Dict[str, tuple[float, str]] = {}
+        self._stats: Dict[str, Dict[str, int]] = {}
+        self._lock = threading.Lock()
+
+    def get_many(self, keys: List[str]) -> List[Optional[Any]]:
+        now = time.monotonic()
+        results: List[Optional[Any]] = []
+        with self._lock:
+            for key in keys:
+                entry = self._values.get(key)
+                if entry is None or entry[0] <= now:
+                    self._values.pop(key, None)
+                    results.append(None)
+                else:
+                    results.append(json.loads(entry[1]))
+        return results
+
+    def set_many(self, values: Dict[str, Any], ttl: int) -> None:
+        expires_at = time.monotonic() + ttl
+        with self._lock:
+            for key, value in values.items():
+                self._values[key] = (expires_at, json.dumps(value))
+
+    def record(self, enricher_name: str, hits: int, misses: int) -> None:
+        with self._lock:
+            stats = self._stats.setdefault(enricher_name, {"hits": 0, "misses": 0})
+            stats["hits"] += hits
+            stats["misses"] += misses
+
+    def stats(self, enricher_name: str) -> Dict[str, int]:
+        with self._lock:
+            return dict(self._stats.get(enricher_name, {"hits": 0, "misses": 0}))
+
+
+_result_cache: Optional[ResultCache] = None
+_result_cache_lock = threading.Lock()
+
+
+def get_result_cache() -> Optional[ResultCache]:
+    """
+    Get the process-wide result cache.
+
+    Returns:
+        The configured cache, or None if caching is disabled or no backend
+        is configured
+    """
+    global _result_cache
+    if os.getenv("ENRICHER_CACHE_ENABLED", "true").lower() in ("false", "0", "no"):
+        return None
+    if _result_cache is None:
+        url = os.getenv("ENRICHER_CACHE_URL") or os.getenv("REDIS_URL")
+        if not url:
+            return None
+        with _result_cache_lock:
+            if _result_cache is None:
+                _result_cache = RedisResultCache(url)
+    return _result_cache
+
+
+def set_result_cache(cache: Optional[ResultCache]) -> None:
+    """Override the process-wide result cache (None resets to the default)."""
+    global _result_cache
+    with _result_cache_lock:
+        _result_cache = cache
@@ -0,0 +1,129 @@
+"""
+Storage of scan results.
+
+Scan results used to be stored whole in `Scan.details`, tens of MB for
+subdomain or crawler scans, loaded by every query on scans. Results larger
+than SCAN_RESULT_INLINE_MAX_BYTES (default 16 KiB of JSON) are now
+compressed with zstd and stored in the blob store, under the SHA-256 of their
+JSON. The scan row only keeps:
+- `result_key`: the blob key, None when the results are inline
+- `result_count` and `result_size`: number of results and size of their JSON
+- `details`: the results when inline, otherwise a summary with the first
+  SCAN_RESULT_PREVIEW_ITEMS results
+
+The full results are read back with ScanResultStore.load_json().
+
+Blobs are shared by scans with identical results, and scans are also deleted
+with their sketch or investigation, so blobs aren't deleted with their scans.
+The daily `sweep_scan_results` task deletes the blobs no scan references,
+once they are older than SCAN_RESULT_SWEEP_GRACE_HOURS: a blob is written
+before the scan referencing it is committed.
+"""
+
+import hashlib
+import json
+import os
+import threading
+from typing import Any, Dict, Optional
+
+import zstandard
+
+from ..utils import to_json_serializable
+from .blob_store import BlobStore, get_blob_store
+from .models import Scan
+
+SCAN_RESULT_INLINE_MAX_BYTES = int(os.getenv("SCAN_RESULT_INLINE_MAX_BYTES", "16384"))
+SCAN_RESULT_PREVIEW_ITEMS = int(os.getenv("SCAN_RESULT_PREVIEW_ITEMS", "5"))
+SCAN_RESULT_ZSTD_LEVEL = int(os.getenv("SCAN_RESULT_ZSTD_LEVEL", "6"))
+SCAN_RESULT_SWEEP_GRACE_HOURS = int(os.getenv("SCAN_RESULT_SWEEP_GRACE_HOURS", "24"))
+
+
+def _result_count(results: Any) -> int:
+    if isinstance(results, (list, dict)):
+        return len(results)
+    return 0 if results is None else 1
+
+
+def summarize_results(results: Any, preview_items: int) -> Dict[str, Any]:
+    """Summary of offloaded results, kept in `Scan.details`."""
+    summary: Dict[str, Any] = {"offloaded": True, "count": _result_count(results)}
+    if isinstance(results, list):
+        summary["preview"] = results[:preview_items]
+    elif isinstance(results, dict):
+        summary["keys"] = list(results)[:preview_items]
+    return summary
+
+
+class ScanResultStore:
+    """Stores scan results inline or in a blob store, depending on their size."""
+
+    def __init__(
+        self,
+        blob_store: Optional[BlobStore] = None,
+        inline_max_bytes: int = SCAN_RESULT_INLINE_MAX_BYTES,
+        preview_items: int = SCAN_RESULT_PREVIEW_ITEMS,
+        zstd_level: int = SCAN_RESULT_ZSTD_LEVEL,
+    ):
+        self._blob_store = blob_store
+        self._inline_max_bytes = inline_max_bytes
+        self._preview_items = preview_items
+        self._zstd_level = zstd_level
+
+    @property
+    def blob_store(self) -> BlobStore:
+        # Resolved lazily, scans with inline results never need it
+        if self._blob_store is None:
+            self._blob_store = get_blob_store()
+        return self._blob_store
+
+    def save(self, scan: Scan, results: Any) -> None:
+        """Set the results of a scan. The caller commits the scan."""
+        payload = to_json_serializable(results)
+        raw = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+        scan.result_count = _result_count(payload)
+        scan.result_size = len(raw)
+
+        if len(raw) <= self._inline_max_bytes:
+            scan.result_key = None
+            scan.details = payload
+            return
+
+        key = hashlib.sha256(raw).hexdigest()
+        # Written even if the blob exists, which renews its write time so
+        # that the sweep can't delete it before the scan is committed
+        compressor = zstandard.ZstdCompressor(level=self._zstd_level)
+        self.blob_store.put(key, compressor.compress(raw))
+        scan.result_key = key
+        scan.details = summarize_results(payload, self._preview_items)
+
+    def load_json(self, scan: Scan) -> bytes:
+        """
+        The full results of a scan, as JSON.
+
+        Raises:
+            BlobNotFoundError: If the results blob is missing
+        """
+        if scan.result_key is None:
+            return json.dumps(scan.details, separators=(",", ":")).encode("utf-8")
+        compressed = self.blob_store.get(scan.result_key)
+        return zstandard.ZstdDecompressor().decompress(compressed)
+
+    def load(self, scan: Scan) -> Any:
+        """The full results of a scan."""
+        if scan.result_key is None:
+            return scan.details
+        return json.loads(self.load_json(scan))
+
+
+_scan_result_store: Optional[ScanResultStore] = None
+_scan_result_store_lock = threading.Lock()
+
+
+def get_scan_result_store() -> ScanResultStore:
+    """Get the process-wide scan result store."""
+    global _scan_result_store
+    if _scan_result_store is None:
+        with _scan_result_store_lock:
+            if _scan_result_store is None:
+                _scan_result_store = ScanResultStore()
+    return _scan_result_store
@@ -8,6 +8,12 @@ and domain logic, enabling cleaner route handlers and better testability.
 from .analysis_service import AnalysisService, create_analysis_service
 from .auth_service import AuthService, create_auth_service
 from .base import BaseService
+from .catalog_service import (
+    Catalog,
+    CatalogService,
+    create_catalog_service,
+    get_catalog_cache,
+)
 from .chat_service import ChatService, create_chat_service
 from .custom_type_service import CustomTypeService, create_custom_type_service
 from .enricher_service import EnricherService, create_enricher_service
@@ -27,6 +33,10 @@ from .exceptions import (
 from .flow_service import FlowService, create_flow_service
 from .investigation_service import InvestigationService, create_investigation_service
 from .key_service import create_key_service, keyService
+from .log_retention_service import (
+    LogRetentionService,
+    create_log_retention_service,
+)
 from .log_service import LogService, create_log_service
 from .scan_service import ScanService, create_scan_service
 from .sketch_service import SketchService, create_sketch_service
@@ -52,6 +62,11 @@ __all__ = [
     "ConflictError",
     # Base
     "BaseService",
+    # Catalogs
+    "Catalog",
+    "CatalogService",
+    "create_catalog_service",
+    "get_catalog_cache",
     # Services - Phase 1
     "AuthService",
     "create_auth_service",
@@ -71,6 +86,8 @@ __all__ = [
     "create_scan_service",
     "LogService",
     "create_log_service",
+    "LogRetentionService",
+    "create_log_retention_service",
     # Services - Phase 4
     "FlowService",
     "create_flow_service",
@@ -0,0 +1,215 @@
+"""
+Catalog service for the enricher, template and type catalogs.
+
+These catalogs are fetched on every app load and every flow editor open, but
+only change when the code is deployed or when a user edits a template or a
+custom type. Each catalog is built once, encoded to JSON once, and cached per
+process under a version made of:
+- the content hash of the code-defined part (enricher metadata, built-in types)
+- a change stamp (row count and last update) of the templates or custom types
+  it includes, read with a single aggregate query
+
+The catalog ETag is the hash of its encoded content, so clients sending it
+back in If-None-Match get a 304 without the catalog being sent again.
+"""
+
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+from uuid import UUID
+
+from pydantic_core import to_jsonable_python
+from sqlalchemy import inspect as sa_inspect
+from sqlalchemy.orm import Session
+
+from ..models import EnricherTemplate
+from ..repositories import CustomTypeRepository, EnricherTemplateRepository
+from .base import BaseService
+from .enricher_service import EnricherService
+from .type_registry_service import TypeRegistryService
+
+# Number of catalogs (per user and parameters) kept in memory
+DEFAULT_MAX_CATALOGS = int(os.getenv("CATALOG_CACHE_SIZE", "256"))
+
+
+@dataclass(frozen=True)
+class Catalog:
+    """An encoded catalog and its ETag."""
+
+    body: bytes
+    etag: str
+
+
+def encode_catalog(payload: Any) -> Catalog:
+    """Encode a catalog to JSON, the way FastAPI's JSONResponse does."""
+    body = json.dumps(
+        to_jsonable_python(payload),
+        ensure_ascii=False,
+        allow_nan=False,
+        indent=None,
+        separators=(",", ":"),
+    ).encode("utf-8")
+    return Catalog(body=body, etag=f'"{hashlib.sha256(body).hexdigest()[:32]}"')
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Whether an If-None-Match header matches an ETag (weak comparison)."""
+    if not if_none_match:
+        return False
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == etag:
+            return True
+    return False
+
+
+class CatalogCache:
+    """Thread-safe LRU cache of catalogs, by key and version."""
+
+    def __init__(self, max_size: int = DEFAULT_MAX_CATALOGS):
+        self._max_size = max_size
+        self._catalogs: "OrderedDict[Hashable, Tuple[str, Catalog]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, version: str, build: Callable[[], Any]) -> Catalog:
+        """
+        Get the catalog stored under `key`, rebuilt if its version changed.
+
+        Args:
+            key: Catalog key (name and parameters)
+            version: Current version of the catalog content
+            build: Callable returning the catalog content
+        """
+        with self._lock:
+            cached = self._catalogs.get(key)
+            if cached is not None and cached[0] == version:
+                self._catalogs.move_to_end(key)
+                return cached[1]
+        # Built outside the lock, concurrent builds of a catalog are harmless
+        catalog = encode_catalog(build())
+        with self._lock:
+            self._catalogs[key] = (version, catalog)
+            self._catalogs.move_to_end(key)
+            while len(self._catalogs) > self._max_size:
+                self._catalogs.popitem(last=False)
+        return catalog
+
+    def clear(self) -> None:
+        with self._lock:
+            self._catalogs.clear()
+
+
+_catalog_cache: Optional[CatalogCache] = None
+_catalog_cache_lock = threading.Lock()
+
+
+def get_catalog_cache() -> CatalogCache:
+    """Get the process-wide catalog cache."""
+    global _catalog_cache
+    if _catalog_cache is None:
+        with _catalog_cache_lock:
+            if _catalog_cache is None:
+                _catalog_cache = CatalogCache()
+    return _catalog_cache
+
+
+def template_to_dict(template: EnricherTemplate) -> Dict[str, Any]:
+    """Column values of a template, as FastAPI encodes ORM objects."""
+    return {
+        attr.key: getattr(template, attr.key)
+        for attr in sa_inspect(template).mapper.column_attrs
+    }
+
+
+class CatalogService(BaseService):
+    """
+    Service serving the cached enricher, template and type catalogs.
+    """
+
+    def __init__(
+        self,
+        db: Session,
+        custom_type_repo: CustomTypeRepository,
+        enricher_template_repo: EnricherTemplateRepository,
+        cache: Optional[CatalogCache] = None,
+        **kwargs,
+    ):
+        super().__init__(db, **kwargs)
+        self._custom_type_repo = custom_type_repo
+        self._enricher_template_repo = enricher_template_repo
+        self._cache = cache or get_catalog_cache()
+
+    def get_enricher_catalog(
+        self, category: Optional[str], user_id: UUID, enricher_registry
+    ) -> Catalog:
+        """Enrichers and templates of a user, as EnricherService.get_all_enrichers."""
+        version = ":".join(
+            [
+                enricher_registry.version,
+                self._enricher_template_repo.get_version(user_id),
+                # The category may be a custom type
+                self._custom_type_repo.get_version(user_id),
+            ]
+        )
+
+        def build() -> List[Any]:
+            enricher_service = EnricherService(
+                self._db, self._custom_type_repo, self._enricher_template_repo
+            )
+            return [
+                (template_to_dict(item) if isinstance(item, EnricherTemplate) else item)
+                for item in enricher_service.get_all_enrichers(
+                    category, user_id, enricher_registry
+                )
+            ]
+
+        return self._cache.get(("enrichers", user_id, category), version, build)
+
+    def get_template_catalog(
+        self,
+        user_id: UUID,
+        category: Optional[str],
+        include_public: bool,
+        serialize: Callable[[EnricherTemplate], Any],
+    ) -> Catalog:
+        """
+        Templates a user can list, as EnricherTemplateService.list_templates.
+
+        Args:
+            serialize: Converts each template to its listed form
+        """
+        version = self._enricher_template_repo.get_version(user_id, include_public)
+
+        def build() -> List[Any]:
+            if include_public:
+                templates = self._enricher_template_repo.get_by_owner_or_public(
+                    user_id, category
+                )
+            else:
+                templates = self._enricher_template_repo.get_by_owner(user_id, category)
+            return [serialize(template) for template in templates]
+
+        key = ("templates", user_id, category, include_public)
+        return self._cache.get(key, version, build)
+
+    def get_type_catalog(self, user_id: UUID) -> Catalog:
+        """Built-in and custom types of a user, as TypeRegistryService.get_types_list."""
+        version = self._custom_type_repo.get_version(user_id)
+
+        def build() -> List[Dict[str, Any]]:
+            type_registry = TypeRegistryService(self._db, self._custom_type_repo)
+            return type_registry.get_types_list(user_id)
+
+        return self._cache.get(("types", user_id), version, build)
+
+
+def create_catalog_service(db: Session) -> CatalogService:
+    return CatalogService(
+        db=db,
+        custom_type_repo=CustomTypeRepository(db),
+        enricher_template_repo=EnricherTemplateRepository(db),
+    )
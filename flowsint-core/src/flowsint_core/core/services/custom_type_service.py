@@ -11,6 +11,7 @@ from ..models import CustomType
 from ..repositories import CustomTypeRepository
 from .base import BaseService
 from .exceptions import ConflictError, NotFoundError, ValidationError
+from .type_registry_service import get_custom_type_cache
 
 
 class CustomTypeService(BaseService):
@@ -76,6 +77,7 @@ class CustomTypeService(BaseService):
         self._custom_type_repo.add(db_custom_type)
         self._commit()
         self._refresh(db_custom_type)
+        get_custom_type_cache().invalidate(user_id)
 
         return db_custom_type
 
@@ -125,6 +127,7 @@ class CustomTypeService(BaseService):
 
         self._commit()
         self._refresh(custom_type)
+        get_custom_type_cache().invalidate(user_id)
 
         return custom_type
 
@@ -132,6 +135,7 @@ class CustomTypeService(BaseService):
         custom_type = self.get_by_id(custom_type_id, user_id)
         self._custom_type_repo.delete(custom_type)
         self._commit()
+        get_custom_type_cache().invalidate(user_id)
 
     def validate_payload(
         self,
@@ -9,6 +9,7 @@ from sqlalchemy.orm import Session
 
 from ..models import Key
 from ..repositories import KeyRepository
+from ..vault import get_secret_cache
 from .base import BaseService
 from .exceptions import DatabaseError, NotFoundError
 
@@ -50,6 +51,7 @@ class keyService(BaseService):
         key = self.get_key_by_id(key_id, user_id)
         self._key_repo.delete(key)
         self._commit()
+        get_secret_cache().invalidate(user_id, key_id=key.id, key_name=key.name)
 
     def get_decrypted_key(self, name_or_id: str, user_id: UUID) -> Optional[str]:
         return self._vault_service.get_secret(user_id, name_or_id)
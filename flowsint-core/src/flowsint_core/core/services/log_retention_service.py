@@ -0,0 +1,160 @@
+"""
+Log retention service.
+
+On PostgreSQL, logs are range-partitioned by month on `created_at`, so
+expired logs are removed by dropping whole partitions instead of a DELETE
+sweep locking the table. Logs of months without a partition go to a default
+partition. Maintenance, run daily by the `maintain_logs` task:
+- creates the partitions of the current month and the next
+  LOG_PARTITIONS_AHEAD months, and of the months with logs in the default
+  partition (when maintenance didn't run for a while), moving those logs
+- recomputes the daily rollups (logs per sketch, day, enricher and level) of
+  the last LOG_ROLLUP_DAYS days, so scan statistics survive the logs
+- drops the partitions older than LOG_RETENTION_MONTHS months, after rolling
+  them up (0 keeps logs forever)
+
+On other databases (SQLite in development and tests) the table isn't
+partitioned, and expired logs are deleted instead.
+"""
+
+import os
+from datetime import date, datetime, time, timedelta, timezone
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy.orm import Session
+
+from ..repositories import LogDailyRollupRepository, LogRepository
+from ..repositories.log_repository import add_months
+from .base import BaseService
+
+LOG_RETENTION_MONTHS = int(os.getenv("LOG_RETENTION_MONTHS", "6"))
+LOG_PARTITIONS_AHEAD = int(os.getenv("LOG_PARTITIONS_AHEAD", "3"))
+LOG_ROLLUP_DAYS = int(os.getenv("LOG_ROLLUP_DAYS", "2"))
+
+
+def _day_start(day: date) -> datetime:
+    return datetime.combine(day, time.min, tzinfo=timezone.utc)
+
+
+class LogRetentionService(BaseService):
+    """
+    Service for log partitions, retention and rollups.
+    """
+
+    def __init__(
+        self,
+        db: Session,
+        log_repo: LogRepository,
+        rollup_repo: LogDailyRollupRepository,
+        retention_months: int = LOG_RETENTION_MONTHS,
+        partitions_ahead: int = LOG_PARTITIONS_AHEAD,
+        rollup_days: int = LOG_ROLLUP_DAYS,
+        **kwargs,
+    ):
+        super().__init__(db, **kwargs)
+        self._log_repo = log_repo
+        self._rollup_repo = rollup_repo
+        self._retention_months = retention_months
+        self._partitions_ahead = partitions_ahead
+        self._rollup_days = rollup_days
+
+    def ensure_partitions(self, today: date) -> List[date]:
+        """
+        Create the missing partitions, up to `partitions_ahead` months ahead.
+
+        The months with logs in the default partition get their partition
+        too.
+
+        Returns:
+            Months of the created partitions
+        """
+        if not self._log_repo.is_partitioned():
+            return []
+        existing = set(self._log_repo.get_partition_months())
+        current = today.replace(day=1)
+        months = set(self._log_repo.get_default_partition_months())
+        months.update(
+            add_months(current, offset) for offset in range(self._partitions_ahead + 1)
+        )
+        created = []
+        for month in sorted(months):
+            if month not in existing:
+                self._log_repo.create_partition(month)
+                created.append(month)
+        self._commit()
+        return created
+
+    def rollup(self, start: date, end: date) -> int:
+        """
+        Recompute the rollups of the days in [start, end) from the logs.
+
+        Days without logs keep their rollups, so the rollups of expired
+        logs are left untouched.
+
+        Returns:
+            Number of rollups written
+        """
+        counts = self._log_repo.count_by_day(_day_start(start), _day_start(end))
+        written = self._rollup_repo.upsert(
+            [
+                {
+                    "sketch_id": sketch_id,
+                    "day": day,
+                    "enricher": enricher,
+                    "type": level,
+                    "count": count,
+                }
+                for sketch_id, day, enricher, level, count in counts
+            ]
+        )
+        self._commit()
+        return written
+
+    def apply_retention(self, today: date) -> Dict[str, Any]:
+        """
+        Remove the logs of the months older than the retention period.
+
+        The logs are rolled up first.
+        """
+        if self._retention_months <= 0:
+            return {"dropped_partitions": [], "deleted": 0}
+        cutoff = add_months(today.replace(day=1), -self._retention_months)
+
+        if self._log_repo.is_partitioned():
+            dropped = []
+            for month in self._log_repo.get_partition_months():
+                if add_months(month, 1) > cutoff:
+                    break
+                self.rollup(month, add_months(month, 1))
+                self._log_repo.drop_partition(month)
+                self._commit()
+                dropped.append(month.isoformat())
+            return {"dropped_partitions": dropped, "deleted": 0}
+
+        oldest = self._log_repo.get_oldest_created_at()
+        if oldest is None or oldest.date() >= cutoff:
+            return {"dropped_partitions": [], "deleted": 0}
+        self.rollup(oldest.date(), cutoff)
+        deleted = self._log_repo.delete_before(_day_start(cutoff))
+        self._commit()
+        return {"dropped_partitions": [], "deleted": deleted}
+
+    def run_maintenance(self, today: Optional[date] = None) -> Dict[str, Any]:
+        """Create partitions, roll up the last days and apply the retention."""
+        today = today or datetime.now(timezone.utc).date()
+        created = self.ensure_partitions(today)
+        rollups = self.rollup(today - timedelta(days=self._rollup_days), today)
+        result = self.apply_retention(today)
+        return {
+            "created_partitions": [month.isoformat() for month in created],
+            "rollups": rollups,
+            **result,
+        }
+
+
+def create_log_retention_service(db: Session) -> LogRetentionService:
+    return LogRetentionService(
+        db=db,
+        log_repo=LogRepository(db),
+        rollup_repo=LogDailyRollupRepository(db),
+    )
@@ -2,18 +2,47 @@
 Log service for managing event logs.
 """
 
+import base64
 from typing import List, Optional
 from uuid import UUID
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 
 from sqlalchemy.orm import Session
 
-from ..models import Scan
-from ..types import Event
+from ..models import LogDailyRollup, Scan
+from ..types import Event, LogPage
 from ..enums import EventLevel
 from ..repositories import LogRepository, SketchRepository, ScanRepository, InvestigationRepository
+from ..repositories import LogDailyRollupRepository
+from ..repositories.log_repository import LogCursor
 from .base import BaseService
-from .exceptions import NotFoundError, PermissionDeniedError, DatabaseError
+from .exceptions import (
+    NotFoundError,
+    PermissionDeniedError,
+    DatabaseError,
+    ValidationError,
+)
+
+
+def encode_log_cursor(created_at: datetime, log_id: UUID) -> str:
+    """Opaque cursor pointing at a log."""
+    raw = f"{created_at.isoformat()}|{log_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_log_cursor(cursor: str) -> LogCursor:
+    """
+    Decode a cursor made by encode_log_cursor.
+
+    Raises:
+        ValidationError: If the cursor is malformed
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        created_at, log_id = raw.split("|")
+        return datetime.fromisoformat(created_at), UUID(log_id)
+    except (ValueError, UnicodeDecodeError):
+        raise ValidationError("Invalid log cursor")
 
 
 class LogService(BaseService):
@@ -28,10 +57,12 @@ class LogService(BaseService):
         sketch_repo: SketchRepository,
         scan_repo: ScanRepository,
         investigation_repo: InvestigationRepository,
+        rollup_repo: LogDailyRollupRepository,
         **kwargs,
     ):
         super().__init__(db, **kwargs)
         self._log_repo = log_repo
+        self._rollup_repo = rollup_repo
         self._sketch_repo = sketch_repo
         self._scan_repo = scan_repo
         self._investigation_repo = investigation_repo
@@ -52,9 +83,37 @@ class LogService(BaseService):
         limit: int = 100,
         since: Optional[datetime] = None,
     ) -> List[Event]:
+        return self.get_log_page(sketch_id, user_id, limit, since).items
+
+    def get_log_page(
+        self,
+        sketch_id: str,
+        user_id: UUID,
+        limit: int = 100,
+        since: Optional[datetime] = None,
+        cursor: Optional[str] = None,
+    ) -> LogPage:
+        """
+        Get the newest logs of a sketch, or the ones before a cursor.
+
+        Args:
+            since: Only logs created after this date
+            cursor: `next_cursor` of the previous page
+
+        Raises:
+            ValidationError: If the cursor is malformed
+        """
         self._get_sketch_with_permission(sketch_id, user_id, ["read"])
+        before = decode_log_cursor(cursor) if cursor else None
 
-        logs = self._log_repo.get_by_sketch(sketch_id, limit=limit, since=since)
+        # One extra row tells whether there is an older page
+        logs = self._log_repo.get_by_sketch(
+            sketch_id, limit=limit + 1, since=since, before=before
+        )
+        next_cursor = None
+        if len(logs) > limit:
+            logs = logs[:limit]
+            next_cursor = encode_log_cursor(logs[-1].created_at, logs[-1].id)
 
         # Reverse to show chronologically (oldest to newest)
         logs = list(reversed(logs))
@@ -80,7 +139,14 @@ class LogService(BaseService):
                 )
             )
 
-        return results
+        return LogPage(items=results, next_cursor=next_cursor)
+
+    def get_daily_stats(
+        self, sketch_id: str, user_id: UUID, since: Optional[date] = None
+    ) -> List[LogDailyRollup]:
+        """Daily number of logs per enricher and level, kept after logs expire."""
+        self._get_sketch_with_permission(sketch_id, user_id, ["read"])
+        return self._rollup_repo.get_by_sketch(sketch_id, since)
 
     def delete_logs_by_sketch(self, sketch_id: str, user_id: UUID) -> dict:
         self._get_sketch_with_permission(sketch_id, user_id, ["delete"])
@@ -113,4 +179,5 @@ def create_log_service(db: Session) -> LogService:
         sketch_repo=SketchRepository(db),
         scan_repo=ScanRepository(db),
         investigation_repo=investigation_repo,
+        rollup_repo=LogDailyRollupRepository(db),
     )
@@ -2,13 +2,21 @@
 Scan service for managing scans.
 """
 
-from typing import List
+from datetime import datetime, timedelta, timezone
+from itertools import islice
+from typing import List, Optional
 from uuid import UUID
 
 from sqlalchemy.orm import Session
 
+from ..blob_store import BlobNotFoundError
 from ..models import Scan
 from ..repositories import InvestigationRepository, ScanRepository, SketchRepository
+from ..scan_results import (
+    SCAN_RESULT_SWEEP_GRACE_HOURS,
+    ScanResultStore,
+    get_scan_result_store,
+)
 from .base import BaseService
 from .exceptions import NotFoundError, PermissionDeniedError
 
@@ -24,12 +32,14 @@ class ScanService(BaseService):
         scan_repo: ScanRepository,
         sketch_repo: SketchRepository,
         investigation_repo: InvestigationRepository,
+        result_store: Optional[ScanResultStore] = None,
         **kwargs,
     ):
         super().__init__(db, **kwargs)
         self._scan_repo = scan_repo
         self._sketch_repo = sketch_repo
         self._investigation_repo = investigation_repo
+        self._result_store = result_store or get_scan_result_store()
 
     def get_accessible_scans(self, user_id: UUID) -> List[Scan]:
         return self._scan_repo.get_accessible_by_user(user_id)
@@ -57,6 +67,20 @@ class ScanService(BaseService):
 
         return scan
 
+    def get_results(self, scan_id: UUID, user_id: UUID) -> bytes:
+        """
+        Get the full results of a scan, as JSON.
+
+        Raises:
+            NotFoundError: If the scan or its results blob doesn't exist
+            PermissionDeniedError: If the user can't read the scan
+        """
+        scan = self.get_by_id(scan_id, user_id)
+        try:
+            return self._result_store.load_json(scan)
+        except BlobNotFoundError:
+            raise NotFoundError("Scan results not found")
+
     def delete(self, scan_id: UUID, user_id: UUID) -> None:
         scan = self._scan_repo.get_by_id(scan_id)
         if not scan:
@@ -66,9 +90,40 @@ class ScanService(BaseService):
         if sketch:
             self._check_permission(user_id, sketch.investigation_id, ["delete"])
 
+        # Its results blob, if any, is deleted by sweep_unreferenced_results
         self._scan_repo.delete(scan)
         self._commit()
 
+    def sweep_unreferenced_results(
+        self,
+        grace_period: timedelta = timedelta(hours=SCAN_RESULT_SWEEP_GRACE_HOURS),
+        batch_size: int = 500,
+    ) -> int:
+        """
+        Delete the result blobs no scan references.
+
+        Blobs written within `grace_period` are kept, their scan may not be
+        committed yet.
+
+        Returns:
+            Number of deleted blobs
+        """
+        cutoff = datetime.now(timezone.utc) - grace_period
+        blob_store = self._result_store.blob_store
+        old_keys = (
+            key for key, written_at in blob_store.iter_blobs() if written_at < cutoff
+        )
+        deleted = 0
+        while True:
+            batch = list(islice(old_keys, batch_size))
+            if not batch:
+                return deleted
+            referenced = self._scan_repo.get_referenced_result_keys(batch)
+            for key in batch:
+                if key not in referenced:
+                    blob_store.delete(key)
+                    deleted += 1
+
 
 def create_scan_service(db: Session) -> ScanService:
     investigation_repo = InvestigationRepository(db)
@@ -4,7 +4,8 @@ Sketch service for managing sketches and graph operations.
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Dict, List, Optional
+import json
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional
 from uuid import UUID
 
 from sqlalchemy.orm import Session
@@ -137,6 +138,42 @@ class SketchService(BaseService):
         graph = graph_data.model_dump(mode="json", serialize_as_any=True)
         return {"nds": graph["nodes"], "rls": graph["edges"]}
 
+    def stream_graph(
+        self, sketch_id: UUID, user_id: UUID, chunk_size: int = 1000
+    ) -> Iterator[str]:
+        """
+        Stream the sketch graph as NDJSON lines.
+
+        Permissions are checked before the first line is produced. Each line
+        holds one chunk, either {"nds": [...]} or {"rls": [...]}; all node
+        chunks are emitted before the edge chunks.
+        """
+        self._get_sketch_with_permission(sketch_id, user_id, ["read"])
+
+        resolver = (
+            self._type_registry.build_type_resolver(user_id)
+            if self._type_registry
+            else None
+        )
+        graph_service = create_graph_service(
+            sketch_id=str(sketch_id),
+            enable_batching=False,
+            type_resolver=resolver,
+        )
+
+        def _lines() -> Iterator[str]:
+            for nodes in graph_service.iter_sketch_nodes(chunk_size=chunk_size):
+                nds = [
+                    node.model_dump(mode="json", serialize_as_any=True)
+                    for node in nodes
+                ]
+                yield json.dumps({"nds": nds}) + "\n"
+            for edges in graph_service.iter_sketch_edges(chunk_size=chunk_size):
+                rls = [edge.model_dump(mode="json") for edge in edges]
+                yield json.dumps({"rls": rls}) + "\n"
+
+        return _lines()
+
     def add_node(
         self, sketch_id: UUID, user_id: UUID, node: GraphNode
     ) -> Dict[str, Any]:
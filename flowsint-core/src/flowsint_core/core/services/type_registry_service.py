@@ -2,8 +2,14 @@
 Type registry service for managing flowsint types.
 """
 
-from typing import Any, Dict, List, Optional, Type
-from uuid import UUID, uuid4
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple, Type
+from uuid import NAMESPACE_URL, UUID, uuid4, uuid5
 
 from flowsint_types import FlowsintType
 from pydantic import BaseModel, TypeAdapter, create_model
@@ -13,6 +19,13 @@ from ..graph.serializer import TypeResolver
 from ..repositories import CustomTypeRepository
 from .base import BaseService
 
+# Built-in type categories and their schemas depend on code only, so they are
+# built once per process. Their IDs are derived from their keys so that the
+# catalog (and its ETag) is the same in every process.
+_TYPES_NAMESPACE = uuid5(NAMESPACE_URL, "flowsint:types")
+_builtin_types: Optional[List[Dict[str, Any]]] = None
+_builtin_types_lock = threading.Lock()
+
 
 def local_type_resolver(type_name: str) -> Type[FlowsintType] | None:
     """Resolve a type using only the local TYPE_REGISTRY (no DB).
@@ -25,7 +38,16 @@ def local_type_resolver(type_name: str) -> Type[FlowsintType] | None:
 
 
 def _build_pydantic_model_from_schema(name: str, schema: dict) -> Type[FlowsintType]:
-    """Build a dynamic Pydantic model from a custom type JSON schema."""
+    """Build a dynamic Pydantic model from a custom type JSON schema.
+
+    Models are compiled once per name and schema content.
+    """
+    return _compile_model(name, json.dumps(schema))
+
+
+@lru_cache(maxsize=1024)
+def _compile_model(name: str, encoded_schema: str) -> Type[FlowsintType]:
+    schema = json.loads(encoded_schema)
     properties = schema.get("properties", {})
     required = set(schema.get("required", []))
 
@@ -38,19 +60,118 @@ def _build_pydantic_model_from_schema(name: str, schema: dict) -> Type[FlowsintT
     return create_model(name, __base__=FlowsintType, **fields)
 
 
+DEFAULT_CUSTOM_TYPE_CACHE_TTL = float(os.getenv("CUSTOM_TYPE_CACHE_TTL", "60"))
+
+_CacheEntry = Tuple[float, Optional[Type[FlowsintType]]]
+
+
+class CustomTypeModelCache:
+    """
+    Per-owner cache of the models of published custom types, by type name.
+
+    Misses are cached too, so names that are neither built-in nor custom
+    types don't query the database on every node read. Entries expire after
+    `ttl` seconds, which bounds how long other processes (API workers, Celery
+    workers) may use a stale model. In this process, CustomTypeService
+    invalidates the entries of an owner when one of their types changes.
+    """
+
+    def __init__(
+        self,
+        ttl: float = DEFAULT_CUSTOM_TYPE_CACHE_TTL,
+        max_owners: int = 1024,
+        max_types_per_owner: int = 1024,
+    ):
+        self._ttl = ttl
+        self._max_owners = max_owners
+        self._max_types_per_owner = max_types_per_owner
+        # Owner ID -> lowercase type name -> (expiry, model or None for a miss)
+        self._entries: "OrderedDict[UUID, Dict[str, _CacheEntry]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(
+        self, owner_id: UUID, type_name: str
+    ) -> Tuple[bool, Optional[Type[FlowsintType]]]:
+        """
+        Look up a type of an owner.
+
+        Returns:
+            (found, model): found is False when the name isn't cached (or
+            expired); model is None for a cached miss
+        """
+        with self._lock:
+            owner_entries = self._entries.get(owner_id)
+            if owner_entries is None:
+                return False, None
+            self._entries.move_to_end(owner_id)
+            entry = owner_entries.get(type_name.lower())
+            if entry is None:
+                return False, None
+            if entry[0] < time.monotonic():
+                del owner_entries[type_name.lower()]
+                return False, None
+            return True, entry[1]
+
+    def set(
+        self,
+        owner_id: UUID,
+        type_name: str,
+        model: Optional[Type[FlowsintType]],
+    ) -> None:
+        """Cache the model of a type of an owner, None for a miss."""
+        with self._lock:
+            owner_entries = self._entries.setdefault(owner_id, {})
+            self._entries.move_to_end(owner_id)
+            if len(owner_entries) >= self._max_types_per_owner:
+                owner_entries.clear()
+            owner_entries[type_name.lower()] = (time.monotonic() + self._ttl, model)
+            while len(self._entries) > self._max_owners:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, owner_id: Optional[UUID] = None) -> None:
+        """Drop the entries of an owner, or all of them."""
+        with self._lock:
+            if owner_id is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(owner_id, None)
+
+
+_custom_type_cache: Optional[CustomTypeModelCache] = None
+_custom_type_cache_lock = threading.Lock()
+
+
+def get_custom_type_cache() -> CustomTypeModelCache:
+    """Get the process-wide custom type model cache."""
+    global _custom_type_cache
+    if _custom_type_cache is None:
+        with _custom_type_cache_lock:
+            if _custom_type_cache is None:
+                _custom_type_cache = CustomTypeModelCache()
+    return _custom_type_cache
+
+
 class TypeRegistryService(BaseService):
     """
     Service for type registry operations and schema extraction.
     """
 
-    def __init__(self, db: Session, custom_type_repo: CustomTypeRepository, **kwargs):
+    def __init__(
+        self,
+        db: Session,
+        custom_type_repo: CustomTypeRepository,
+        custom_type_cache: Optional[CustomTypeModelCache] = None,
+        **kwargs,
+    ):
         super().__init__(db, **kwargs)
         self._custom_type_repo = custom_type_repo
+        self._custom_type_cache = custom_type_cache or get_custom_type_cache()
 
     def resolve_type(self, type_name: str, user_id: UUID) -> Type[FlowsintType] | None:
         """Resolve a type name to a FlowsintType class.
 
         Checks the local TYPE_REGISTRY first, then falls back to custom types in DB.
+        Custom type models (and misses) are cached per owner.
         """
         from flowsint_types import TYPE_REGISTRY
 
@@ -58,12 +179,19 @@ class TypeRegistryService(BaseService):
         if model:
             return model
 
+        found, model = self._custom_type_cache.get(user_id, type_name)
+        if found:
+            return model
+
         custom_type = self._custom_type_repo.get_published_by_name_and_owner(
             name=type_name, owner_id=user_id
         )
-        if not custom_type:
-            return None
-        return _build_pydantic_model_from_schema(custom_type.name, custom_type.schema)
+        if custom_type:
+            model = _build_pydantic_model_from_schema(
+                custom_type.name, custom_type.schema
+            )
+        self._custom_type_cache.set(user_id, type_name, model)
+        return model
 
     def build_type_resolver(self, user_id: UUID) -> TypeResolver:
         """Return a TypeResolver callable bound to a specific user.
@@ -157,31 +285,48 @@ class TypeRegistryService(BaseService):
             "fields": fields,
         }
 
-    def get_types_list(self, user_id: UUID) -> List[Dict[str, Any]]:
+    def _get_builtin_types(self) -> List[Dict[str, Any]]:
+        """Categories of built-in types with their schemas, built once."""
+        global _builtin_types
+        if _builtin_types is not None:
+            return _builtin_types
         from flowsint_types.registry import get_type
 
-        category_definitions = self._get_category_definitions()
-
-        types = []
-        for category in category_definitions:
-            category_copy = category.copy()
-            children_schemas = []
-
-            for child_def in category["children"]:
-                type_name, label_key, icon = child_def
-                model = get_type(type_name, case_sensitive=True)
-
-                if model:
-                    children_schemas.append(
-                        self._extract_input_schema(
+        with _builtin_types_lock:
+            if _builtin_types is not None:
+                return _builtin_types
+            types = []
+            for category in self._get_category_definitions():
+                category_copy = category.copy()
+                category_copy["id"] = uuid5(_TYPES_NAMESPACE, category["key"])
+                children_schemas = []
+
+                for child_def in category["children"]:
+                    type_name, label_key, icon = child_def
+                    model = get_type(type_name, case_sensitive=True)
+
+                    if model:
+                        schema = self._extract_input_schema(
                             model, label_key=label_key, icon=icon
                         )
-                    )
-                else:
-                    print(f"Warning: Type {type_name} not found in TYPE_REGISTRY")
+                        schema["id"] = uuid5(
+                            _TYPES_NAMESPACE, f"{category['key']}/{type_name}"
+                        )
+                        children_schemas.append(schema)
+                    else:
+                        print(f"Warning: Type {type_name} not found in TYPE_REGISTRY")
 
-            category_copy["children"] = children_schemas
-            types.append(category_copy)
+                category_copy["children"] = children_schemas
+                types.append(category_copy)
+            _builtin_types = types
+        return _builtin_types
+
+    def get_types_list(self, user_id: UUID) -> List[Dict[str, Any]]:
+        # Copy the categories, custom types are added to their children
+        types = [
+            {**category, "children": list(category["children"])}
+            for category in self._get_builtin_types()
+        ]
 
         custom_types = self._custom_type_repo.get_by_owner(user_id, status="published")
 
@@ -231,7 +376,7 @@ class TypeRegistryService(BaseService):
 
             types.append(
                 {
-                    "id": uuid4(),
+                    "id": uuid5(_TYPES_NAMESPACE, f"custom_types/{user_id}"),
                     "type": "custom_types_category",
                     "key": "custom_types",
                     "icon": "custom",
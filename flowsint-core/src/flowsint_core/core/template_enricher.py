@@ -51,6 +51,7 @@ import httpx
 from flowsint_types import FlowsintType, get_type
 
 from flowsint_core.core.enricher_base import Enricher
+from flowsint_core.core.http_client import parse_retry_after
 from flowsint_core.core.logger import Logger
 from flowsint_core.templates.loader.yaml_loader import (
     SSRFError,
@@ -273,7 +274,6 @@ class TemplateEnricher(Enricher):
 
     async def _make_request_with_retry(
         self,
-        client: httpx.AsyncClient,
         method: str,
         url: str,
         headers: Dict[str, str],
@@ -285,7 +285,6 @@ class TemplateEnricher(Enricher):
         Make an HTTP request with retry logic.
 
         Args:
-            client: The httpx AsyncClient
             method: HTTP method (GET, POST)
             url: Request URL
             headers: Request headers
@@ -304,26 +303,28 @@ class TemplateEnricher(Enricher):
 
         for attempt in range(retry_config.max_retries + 1):
             try:
-                if method == "POST":
-                    response = await client.post(
-                        url,
-                        headers=headers,
-                        params=params,
-                        content=body,
-                        timeout=timeout,
-                    )
-                else:
-                    response = await client.get(
-                        url,
-                        headers=headers,
-                        params=params,
-                        timeout=timeout,
-                    )
+                # Retries are driven by the template's retry config, the pool
+                # only applies its rate limits
+                response = await self.http.request(
+                    method if method == "POST" else "GET",
+                    url,
+                    max_retries=0,
+                    headers=headers,
+                    params=params,
+                    content=body if method == "POST" else None,
+                    timeout=timeout,
+                )
 
                 # Check if we should retry based on status code
                 if response.status_code in retry_config.retry_on_status:
                     if attempt < retry_config.max_retries:
                         wait_time = retry_config.backoff_factor * (2**attempt)
+                        # Never retry before the server asked us to
+                        retry_after = parse_retry_after(
+                            response.headers.get("Retry-After")
+                        )
+                        if retry_after is not None:
+                            wait_time = max(wait_time, retry_after)
                         Logger.info(
                             self.sketch_id,
                             {
@@ -379,14 +380,12 @@ class TemplateEnricher(Enricher):
 
     async def _process_single_input(
         self,
-        client: httpx.AsyncClient,
         input_obj: Any,
     ) -> List[Any]:
         """
         Process a single input value through the template.
 
         Args:
-            client: The httpx AsyncClient
             input_obj: The input FlowsintType object
 
         Returns:
@@ -429,7 +428,6 @@ class TemplateEnricher(Enricher):
 
         # Make the request with retry
         response = await self._make_request_with_retry(
-            client=client,
             method=req.method,
             url=url,
             headers=headers,
@@ -486,51 +484,48 @@ class TemplateEnricher(Enricher):
         """
         results: List[Any] = []
 
-        async with httpx.AsyncClient() as client:
-            for input_obj in values:
-                try:
-                    item_results = await self._process_single_input(client, input_obj)
-                    results.extend(item_results)
-                except SSRFError as e:
-                    Logger.info(
-                        self.sketch_id,
-                        {"message": f"SSRF blocked: {e}"},
-                    )
-                    continue
-                except TemplateRenderError as e:
-                    Logger.info(
-                        self.sketch_id,
-                        {"message": f"Template render error: {e}"},
-                    )
-                    continue
-                except httpx.HTTPStatusError as e:
-                    Logger.info(
-                        self.sketch_id,
-                        {
-                            "message": f"HTTP error {e.response.status_code} for {self.request.url}: {e}"
-                        },
-                    )
-                    continue
-                except httpx.TimeoutException:
-                    Logger.info(
-                        self.sketch_id,
-                        {"message": f"Request timeout for {self.request.url}"},
-                    )
-                    continue
-                except TemplateEnricherError as e:
-                    Logger.info(
-                        self.sketch_id,
-                        {"message": f"Template enricher error: {e}"},
-                    )
-                    continue
-                except Exception as e:
-                    Logger.info(
-                        self.sketch_id,
-                        {
-                            "message": f"Unexpected error processing {self.request.url}: {e}"
-                        },
-                    )
-                    continue
+        for input_obj in values:
+            try:
+                item_results = await self._process_single_input(input_obj)
+                results.extend(item_results)
+            except SSRFError as e:
+                Logger.info(
+                    self.sketch_id,
+                    {"message": f"SSRF blocked: {e}"},
+                )
+                continue
+            except TemplateRenderError as e:
+                Logger.info(
+                    self.sketch_id,
+                    {"message": f"Template render error: {e}"},
+                )
+                continue
+            except httpx.HTTPStatusError as e:
+                Logger.info(
+                    self.sketch_id,
+                    {
+                        "message": f"HTTP error {e.response.status_code} for {self.request.url}: {e}"
+                    },
+                )
+                continue
+            except httpx.TimeoutException:
+                Logger.info(
+                    self.sketch_id,
+                    {"message": f"Request timeout for {self.request.url}"},
+                )
+                continue
+            except TemplateEnricherError as e:
+                Logger.info(
+                    self.sketch_id,
+                    {"message": f"Template enricher error: {e}"},
+                )
+                continue
+            except Exception as e:
+                Logger.info(
+                    self.sketch_id,
+                    {"message": f"Unexpected error processing {self.request.url}: {e}"},
+                )
+                continue
 
         return results
 
@@ -24,6 +24,15 @@ class Event(BaseModel):
     )
 
 
+class LogPage(BaseModel):
+    """A page of the logs of a sketch, oldest to newest."""
+
+    items: List[Event] = Field(..., description="Logs of the page")
+    next_cursor: Optional[str] = Field(
+        None, description="Cursor of the previous (older) page, if any"
+    )
+
+
 class FlowNode(BaseModel):
     """Represents a node in a transformation flow with position and data."""
 
@@ -101,6 +110,47 @@ class FlowBranch(BaseModel):
     )
 
 
+class FlowDagStep(BaseModel):
+    """Represents a flow node compiled once, whatever the branches going through it."""
+
+    nodeId: str = Field(..., description="ID of the associated node", title="Node ID")
+    params: Optional[Dict[str, Any]] = Field(
+        None, description="Parameters for the step", title="Parameters"
+    )
+    type: Literal["type", "enricher"] = Field(
+        ...,
+        description="Type of step - either type transformation or enricher",
+        title="Step Type",
+    )
+    inputs: Dict[str, Dict[str, Any]] = Field(
+        default_factory=dict,
+        description="Input data received from each parent step, by parent node ID",
+        title="Inputs",
+    )
+    outputs: Dict[str, Any] = Field(
+        ..., description="Output data from this step", title="Outputs"
+    )
+    depth: int = Field(
+        ...,
+        description="Length of the longest path from an input step",
+        title="Depth",
+    )
+    parents: List[str] = Field(
+        default_factory=list, description="IDs of the parent nodes", title="Parents"
+    )
+    children: List[str] = Field(
+        default_factory=list, description="IDs of the child nodes", title="Children"
+    )
+
+
+class FlowDag(BaseModel):
+    """Represents a compiled flow as a DAG of steps in topological order."""
+
+    steps: List[FlowDagStep] = Field(
+        ..., description="Steps, parents before children", title="Steps"
+    )
+
+
 class Role(str, enum.Enum):
     OWNER = "owner"
     ADMIN = "admin"
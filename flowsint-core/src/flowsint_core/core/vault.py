@@ -1,5 +1,9 @@
 import os
-from typing import Protocol, Optional
+import threading
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Protocol, Optional, Tuple
 import uuid
 from sqlalchemy.orm import Session
 from sqlalchemy import select
@@ -15,6 +19,136 @@ from dotenv import load_dotenv
 load_dotenv()
 
 
+@lru_cache(maxsize=1024)
+def derive_user_data_key(master_key: bytes, salt: bytes, owner: str) -> bytes:
+    """
+    Derive the AES-256 data key of a user from the master key and a salt.
+    Memoized, as the same key rows are decrypted over and over during flows.
+    """
+    hkdf = HKDF(
+        algorithm=hashes.SHA256(),
+        length=32,
+        salt=salt,
+        info=owner.encode("utf-8"),
+    )
+    return hkdf.derive(master_key)
+
+
+# (expires_at, secret, key_id, key_name)
+SecretEntry = Tuple[float, Optional[str], Optional[str], Optional[str]]
+
+
+class SecretCache:
+    """
+    Bounded in-process TTL cache of decrypted secrets.
+
+    Entries are keyed by (owner_id, vault_ref), vault_ref being a key id or
+    name, and remember the id and name of the Key row they came from so
+    updating or deleting that row invalidates every reference to it. Missing
+    secrets are cached too (as None), creating a key invalidates them.
+
+    Other processes only see changes once their entries expire, so the TTL
+    bounds how long a deleted key stays usable by a running worker.
+    """
+
+    def __init__(self, ttl: float = 60.0, max_size: int = 1024):
+        self.ttl = ttl
+        self.max_size = max_size
+        # (owner, ref) -> entry, in least recently used order
+        self._entries: "OrderedDict[Tuple[str, str], SecretEntry]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl > 0 and self.max_size > 0
+
+    def get(self, owner_id, vault_ref: str) -> Tuple[bool, Optional[str]]:
+        """
+        Look up a secret.
+
+        Returns:
+            (found, secret), found is False on a miss or expired entry
+        """
+        key = (str(owner_id), str(vault_ref))
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return False, None
+            if entry[0] <= time.monotonic():
+                del self._entries[key]
+                return False, None
+            self._entries.move_to_end(key)
+            return True, entry[1]
+
+    def set(
+        self,
+        owner_id,
+        vault_ref: str,
+        secret: Optional[str],
+        key_id=None,
+        key_name: Optional[str] = None,
+    ) -> None:
+        if not self.enabled:
+            return
+        key = (str(owner_id), str(vault_ref))
+        with self._lock:
+            self._entries[key] = (
+                time.monotonic() + self.ttl,
+                secret,
+                str(key_id) if key_id is not None else None,
+                key_name,
+            )
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, owner_id, key_id=None, key_name: Optional[str] = None) -> None:
+        """Drop the entries of an owner referencing a Key row by id or name."""
+        owner = str(owner_id)
+        refs = {str(ref) for ref in (key_id, key_name) if ref is not None}
+        with self._lock:
+            for cache_key in [
+                cache_key
+                for cache_key, entry in self._entries.items()
+                if cache_key[0] == owner
+                and (cache_key[1] in refs or entry[2] in refs or entry[3] in refs)
+            ]:
+                del self._entries[cache_key]
+
+    def invalidate_owner(self, owner_id) -> None:
+        """Drop every entry of an owner."""
+        owner = str(owner_id)
+        with self._lock:
+            for cache_key in [k for k in self._entries if k[0] == owner]:
+                del self._entries[cache_key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+_secret_cache: Optional[SecretCache] = None
+_secret_cache_lock = threading.Lock()
+
+
+def get_secret_cache() -> SecretCache:
+    """
+    Get the process-wide secret cache.
+
+    Configured with VAULT_SECRET_CACHE_TTL (seconds, 0 disables it) and
+    VAULT_SECRET_CACHE_SIZE.
+    """
+    global _secret_cache
+    if _secret_cache is None:
+        with _secret_cache_lock:
+            if _secret_cache is None:
+                _secret_cache = SecretCache(
+                    ttl=float(os.getenv("VAULT_SECRET_CACHE_TTL", "60")),
+                    max_size=int(os.getenv("VAULT_SECRET_CACHE_SIZE", "1024")),
+                )
+    return _secret_cache
+
+
 class VaultProtocol(Protocol):
     def get_secret(self, vault_ref: str) -> Optional[str]: ...
     def set_secret(self, vault_ref: str, plain_key: str) -> Key: ...
@@ -48,14 +182,7 @@ class Vault(VaultProtocol):
         """
         Derives an AES-256 from master key, a salt and a context (user_id).
         """
-        hkdf = HKDF(
-            algorithm=hashes.SHA256(),
-            length=32,
-            salt=salt,
-            info=str(self.owner_id).encode("utf-8"),
-        )
-        master_key = self._get_master_key()
-        return hkdf.derive(master_key)
+        return derive_user_data_key(master_key, bytes(salt), str(self.owner_id))
 
     def _encrypt_key(self, plaintext: str):
         """
@@ -120,6 +247,8 @@ class Vault(VaultProtocol):
         self.db.add(new_key)
         self.db.commit()
         self.db.refresh(new_key)
+        # A cached miss (or an older key with that name) must not shadow it
+        get_secret_cache().invalidate(self.owner_id, key_name=vault_ref)
         return new_key
 
     def get_secret(self, vault_ref: str) -> Optional[str]:
@@ -131,6 +260,11 @@ class Vault(VaultProtocol):
         Returns:
             Optional[str]: The decrypted secret value, or None if not found
         """
+        cache = get_secret_cache()
+        found, secret = cache.get(self.owner_id, vault_ref)
+        if found:
+            return secret
+
         try:
             ref_uuid = uuid.UUID(vault_ref)
             stmt = select(Key).where(Key.id == ref_uuid)
@@ -149,6 +283,14 @@ class Vault(VaultProtocol):
                 "ciphertext": row.ciphertext,
             }
             decrypted_key = self._decrypt_key(row_dict)
+            cache.set(
+                self.owner_id,
+                vault_ref,
+                decrypted_key,
+                key_id=row.id,
+                key_name=row.name,
+            )
             return decrypted_key
         else:
+            cache.set(self.owner_id, vault_ref, None)
             return None
@@ -2,8 +2,8 @@
 Import utilities for entity parsing and type detection.
 """
 
-from .entity_detection import detect_type
-from .file_parser import FileParseResult, parse_import_file
+from .entity_detection import TypeMatcher, detect_type, get_type_matcher
+from .file_parser import FileParseResult, iter_import_file, parse_import_file
 from .import_service import (
     EntityMapping,
     ImportResult,
@@ -14,7 +14,10 @@ from .types import EntityPreview
 
 __all__ = [
     "detect_type",
+    "TypeMatcher",
+    "get_type_matcher",
     "parse_import_file",
+    "iter_import_file",
     "FileParseResult",
     "EntityPreview",
     # Import service
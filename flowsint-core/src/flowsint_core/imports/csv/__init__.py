@@ -0,0 +1,6 @@
+from .parse_csv import iter_csv_previews, parse_csv
+
+__all__ = [
+    "iter_csv_previews",
+    "parse_csv",
+]
@@ -0,0 +1,99 @@
+import csv
+import itertools
+from typing import Dict, Iterator, List, Optional, Union
+
+from flowsint_core.core.graph.serializer import TypeResolver
+
+from ..json import node_to_preview
+from ..reader import ImportSource, iter_lines
+from ..types import EntityPreview, FileParseResult
+from ..utils import create_entity_preview, preview_records
+
+# Header names (lowercase) of the columns holding the entity value and type
+VALUE_COLUMNS = ["value", "entity", "indicator", "ioc", "label", "nodelabel"]
+TYPE_COLUMNS = ["type", "nodetype", "entity_type"]
+ID_COLUMNS = ["id"]
+
+CsvRecord = Union[str, Dict[str, Optional[str]]]
+
+
+def _column(header: List[str], names: List[str]) -> Optional[int]:
+    return next((header.index(name) for name in names if name in header), None)
+
+
+def iter_csv_records(source: ImportSource) -> Iterator[CsvRecord]:
+    """
+    Yield the entities of a CSV file, read incrementally.
+
+    With a header naming a value column (value, entity, indicator, ioc,
+    label), each row is one entity, typed by the optional type column and
+    yielded as a node dict. Without a header, every non-empty cell is an
+    entity value, yielded as a string.
+    """
+    reader = csv.reader(iter_lines(source, keepends=True))
+    first = next(reader, None)
+    if first is None:
+        return
+
+    header = [cell.strip().lower() for cell in first]
+    value_column = _column(header, VALUE_COLUMNS)
+
+    if value_column is None:
+        for row in itertools.chain([first], reader):
+            for value in row:
+                value = value.strip()
+                if value:
+                    yield value
+        return
+
+    type_column = _column(header, TYPE_COLUMNS)
+    id_column = _column(header, ID_COLUMNS)
+
+    def cell(row: List[str], column: Optional[int]) -> Optional[str]:
+        if column is None or column >= len(row):
+            return None
+        return row[column].strip() or None
+
+    for row in reader:
+        value = cell(row, value_column)
+        if value is None:
+            continue
+        yield {
+            "id": cell(row, id_column),
+            "nodeType": cell(row, type_column),
+            "nodeLabel": value,
+        }
+
+
+def csv_record_to_preview(
+    record: CsvRecord, type_resolver: Optional[TypeResolver] = None
+) -> Optional[EntityPreview]:
+    if isinstance(record, str):
+        return create_entity_preview(record)
+    return node_to_preview(record, type_resolver=type_resolver)
+
+
+def iter_csv_previews(
+    source: ImportSource, type_resolver: Optional[TypeResolver] = None
+) -> Iterator[EntityPreview]:
+    """Yield an entity for every value of a CSV file."""
+    for record in iter_csv_records(source):
+        preview = csv_record_to_preview(record, type_resolver=type_resolver)
+        if preview:
+            yield preview
+
+
+def parse_csv(
+    file_bytes: ImportSource,
+    max_preview_rows: int,
+    type_resolver: Optional[TypeResolver] = None,
+) -> FileParseResult:
+    """Parse a CSV file of entity values, with or without a header."""
+    try:
+        return preview_records(
+            iter_csv_records(file_bytes),
+            lambda record: csv_record_to_preview(record, type_resolver),
+            max_preview_rows,
+        )
+    except Exception as e:
+        raise ValueError(f"Failed to parse CSV file: {str(e)}")
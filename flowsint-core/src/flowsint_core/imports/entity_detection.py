@@ -1,13 +1,80 @@
 """
 Entity type detection utilities for import feature.
 Provides basic pattern matching for common entity types.
+
+Detection goes through a TypeMatcher, which combines the `detect_pattern` of
+every built-in type into one precompiled regex (alternatives in registry
+order), so a value is matched once instead of going through each type's
+`detect()` in turn. The matched type's `detect()` then confirms the match,
+and if it rejects the value the search resumes with the following types.
 """
 
-from typing import Optional, Type
+import re
+import threading
+from typing import Dict, Iterable, List, Optional, Type
 
 from flowsint_types import TYPE_REGISTRY, FlowsintType
 
 
+class TypeMatcher:
+    """First-match type detection over a combined, precompiled regex."""
+
+    def __init__(self, types: Iterable[Type[FlowsintType]]):
+        self._types: List[Type[FlowsintType]] = [
+            model
+            for model in types
+            if getattr(model, "detect_pattern", None) and hasattr(model, "detect")
+        ]
+        # Start index -> combined regex of the types from that index on
+        self._matchers: Dict[int, re.Pattern] = {}
+
+    @property
+    def types(self) -> List[Type[FlowsintType]]:
+        return list(self._types)
+
+    def _matcher(self, start: int) -> re.Pattern:
+        matcher = self._matchers.get(start)
+        if matcher is None:
+            matcher = self._matchers[start] = re.compile(
+                "|".join(
+                    f"(?P<_{index}>{self._types[index].detect_pattern})"
+                    for index in range(start, len(self._types))
+                )
+            )
+        return matcher
+
+    def match(self, value: str) -> Optional[Type[FlowsintType]]:
+        """Get the first type (in registry order) detecting `value`."""
+        value = value.strip()
+        start = 0
+        while value and start < len(self._types):
+            found = self._matcher(start).fullmatch(value)
+            if found is None:
+                return None
+            index = int(found.lastgroup[1:])
+            if self._types[index].detect(value):
+                return self._types[index]
+            start = index + 1
+        return None
+
+
+_type_matcher: Optional[TypeMatcher] = None
+_type_matcher_size = 0
+_type_matcher_lock = threading.Lock()
+
+
+def get_type_matcher() -> TypeMatcher:
+    """Get the matcher of the built-in types, rebuilt if new types registered."""
+    global _type_matcher, _type_matcher_size
+    types = TYPE_REGISTRY.all_types()
+    if _type_matcher is None or _type_matcher_size != len(types):
+        with _type_matcher_lock:
+            if _type_matcher is None or _type_matcher_size != len(types):
+                _type_matcher = TypeMatcher(types.values())
+                _type_matcher_size = len(types)
+    return _type_matcher
+
+
 def detect_type(value: str) -> Optional[Type[FlowsintType]]:
     """Detect entity type from a string value using built-in type patterns.
 
@@ -15,7 +82,4 @@ def detect_type(value: str) -> Optional[Type[FlowsintType]]:
     don't have detect() methods. For custom type resolution by name, use
     TypeRegistryService.resolve_type().
     """
-    for model in TYPE_REGISTRY.all_types().values():
-        if hasattr(model, "detect") and model.detect(value):
-            return model
-    return None
+    return get_type_matcher().match(value)
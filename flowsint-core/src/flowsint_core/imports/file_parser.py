@@ -1,19 +1,34 @@
 """
 File parsing utilities for entity imports.
-Handles TXT file format only.
-Each line represents ONE entity with a single value.
+Handles TXT, CSV, NDJSON and JSON file formats.
+
+TXT, CSV and NDJSON files are read incrementally, one entity per line (or per
+CSV cell/row). JSON files hold a whole graph (nodes and edges) and are parsed
+at once.
 """
 
 from pathlib import Path
-from typing import BinaryIO, Optional, Union
+from typing import BinaryIO, Iterator, Optional, Union
 
 from flowsint_core.core.graph.serializer import TypeResolver
 
+from .csv import iter_csv_previews, parse_csv
 from .json import parse_json
-from .txt import parse_txt
-from .types import FileParseResult
+from .ndjson import iter_ndjson_previews, parse_ndjson
+from .txt import iter_txt_previews, parse_txt
+from .types import EntityPreview, FileParseResult
+
+STREAMING_EXTENSIONS = [".txt", ".csv", ".ndjson", ".jsonl"]
+ALLOWED_EXTENSIONS = STREAMING_EXTENSIONS + [".json"]
 
-ALLOWED_EXTENSIONS = [".txt", ".json"]
+
+def _file_extension(filename: Optional[str], allowed: list) -> str:
+    file_ext = Path(filename or "").suffix.lower()
+    if file_ext not in allowed:
+        raise ValueError(
+            f"Unsupported file format: {file_ext}. Only those files extensions are supported: {', '.join(allowed)} "
+        )
+    return file_ext
 
 
 def parse_import_file(
@@ -24,23 +39,40 @@ def parse_import_file(
 ) -> FileParseResult | None:
     """
     Parse an uploaded file and analyze its contents.
+    Only the first `max_preview_rows` entities are previewed, all are counted.
     """
+    file_ext = _file_extension(filename, ALLOWED_EXTENSIONS)
 
-    file_ext = Path(filename).suffix.lower()
+    if file_ext == ".txt":
+        return parse_txt(file_content, max_preview_rows)
+    elif file_ext == ".csv":
+        return parse_csv(file_content, max_preview_rows, type_resolver=type_resolver)
+    elif file_ext in [".ndjson", ".jsonl"]:
+        return parse_ndjson(file_content, max_preview_rows, type_resolver=type_resolver)
 
     # Convert file content to bytes if it's a file-like object
     if hasattr(file_content, "read"):
         file_bytes = file_content.read()
     else:
         file_bytes = file_content
+    return parse_json(file_bytes, max_preview_rows, type_resolver=type_resolver)
 
-    # Only supported files
-    if file_ext not in ALLOWED_EXTENSIONS:
-        raise ValueError(
-            f"Unsupported file format: {file_ext}. Only those files extensions are supported: {', '.join(ALLOWED_EXTENSIONS)} "
-        )
+
+def iter_import_file(
+    file_content: Union[bytes, BinaryIO],
+    filename: Optional[str],
+    type_resolver: Optional[TypeResolver] = None,
+) -> Iterator[EntityPreview]:
+    """
+    Yield every entity of a TXT, CSV or NDJSON file, read incrementally.
+
+    Raises:
+        ValueError: For other file formats
+    """
+    file_ext = _file_extension(filename, STREAMING_EXTENSIONS)
 
     if file_ext == ".txt":
-        return parse_txt(file_bytes, max_preview_rows)
-    elif file_ext in [".json"]:
-        return parse_json(file_bytes, max_preview_rows, type_resolver=type_resolver)
+        return iter_txt_previews(file_content)
+    elif file_ext == ".csv":
+        return iter_csv_previews(file_content, type_resolver=type_resolver)
+    return iter_ndjson_previews(file_content, type_resolver=type_resolver)
@@ -3,16 +3,32 @@ Import service for handling file imports into sketches.
 
 This module provides a service layer for import operations,
 handling file parsing, entity conversion, and batch creation.
+
+Nodes are written to the graph in chunks of IMPORT_CHUNK_SIZE, and
+`ImportService.import_file` streams TXT, CSV and NDJSON files straight into
+the graph without building a preview of the whole file first.
 """
 
+import os
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional
+from itertools import islice
+from typing import Any, BinaryIO, Dict, Iterable, List, Optional, Union
 
 from flowsint_types import FlowsintType
 
 from flowsint_core.core.graph import GraphSerializer, GraphService
 from flowsint_core.core.graph.serializer import TypeResolver
 
+from .types import EntityPreview
+
+# Entities previewed by analyze_file (all of them are counted, and the result
+# is flagged as truncated beyond that)
+DEFAULT_MAX_PREVIEW_ROWS = int(os.getenv("IMPORT_MAX_PREVIEW_ROWS", "10000"))
+# Nodes written to the graph per batch
+IMPORT_CHUNK_SIZE = int(os.getenv("IMPORT_CHUNK_SIZE", "1000"))
+
+MAX_REPORTED_ERRORS = 50
+
 
 @dataclass
 class EntityMapping:
@@ -50,6 +66,7 @@ class ImportService:
         self,
         graph_service: GraphService,
         type_resolver: Optional[TypeResolver] = None,
+        chunk_size: int = IMPORT_CHUNK_SIZE,
     ):
         """
         Initialize the import service.
@@ -57,21 +74,23 @@ class ImportService:
         Args:
             graph_service: GraphService instance for database operations
             type_resolver: Optional callable to resolve types by name
+            chunk_size: Number of nodes written to the graph per batch
         """
         self._graph_service = graph_service
         self._type_resolver = type_resolver or graph_service._type_resolver
+        self._chunk_size = max(1, chunk_size)
 
     def analyze_file(
         self,
-        file_content: bytes,
+        file_content: Union[bytes, BinaryIO],
         filename: str,
-        max_preview_rows: int = 10000000,
+        max_preview_rows: int = DEFAULT_MAX_PREVIEW_ROWS,
     ):
         """
         Analyze an uploaded file for import.
 
         Args:
-            file_content: Raw file content as bytes
+            file_content: Raw file content as bytes or a binary file object
             filename: Name of the file (used for extension detection)
             max_preview_rows: Maximum number of rows to preview
 
@@ -119,23 +138,30 @@ class ImportService:
                 status="completed_with_errors" if conversion_errors else "completed",
                 nodes_created=0,
                 nodes_skipped=len(entities_to_import),
-                errors=conversion_errors[:50],
+                errors=conversion_errors[:MAX_REPORTED_ERRORS],
             )
 
-        # Batch create nodes
-        try:
-            nodes = GraphSerializer.serialize_flowsint_types(pydantic_nodes)
-            nodes_result = self._graph_service.batch_create_nodes(nodes=nodes)
-            nodes_created = nodes_result["nodes_created"]
-            node_element_ids = nodes_result.get("node_ids", [])
-            batch_errors = nodes_result.get("errors", [])
-        except Exception as e:
-            return ImportResult(
-                status="failed",
-                nodes_created=0,
-                nodes_skipped=len(entities_to_import),
-                errors=[f"Batch node creation failed: {str(e)}"],
-            )
+        # Batch create nodes, one chunk at a time
+        nodes_created = 0
+        node_element_ids: List[str] = []
+        batch_errors: List[str] = []
+        for start in range(0, len(pydantic_nodes), self._chunk_size):
+            chunk = pydantic_nodes[start : start + self._chunk_size]
+            try:
+                nodes_result = self._write_nodes(chunk)
+            except Exception as e:
+                if not nodes_created:
+                    return ImportResult(
+                        status="failed",
+                        nodes_created=0,
+                        nodes_skipped=len(entities_to_import),
+                        errors=[f"Batch node creation failed: {str(e)}"],
+                    )
+                batch_errors.append(f"Batch node creation failed: {str(e)}")
+                break
+            nodes_created += nodes_result["nodes_created"]
+            node_element_ids.extend(nodes_result.get("node_ids", []))
+            batch_errors.extend(nodes_result.get("errors", []))
 
         # Create edges if provided
         edge_errors = []
@@ -153,9 +179,120 @@ class ImportService:
             status="completed" if not all_errors else "completed_with_errors",
             nodes_created=nodes_created,
             nodes_skipped=nodes_skipped,
-            errors=all_errors[:50],
+            errors=all_errors[:MAX_REPORTED_ERRORS],
+        )
+
+    def import_file(
+        self,
+        file_content: Union[bytes, BinaryIO],
+        filename: str,
+        exclude_types: Optional[Iterable[str]] = None,
+    ) -> ImportResult:
+        """
+        Import every entity of a TXT, CSV or NDJSON file into the sketch.
+
+        The file is read incrementally and nodes are written in chunks, so
+        memory use doesn't grow with the file size. Entities are imported
+        with their detected type, values of unknown type are skipped.
+
+        Args:
+            file_content: Raw file content as bytes or a binary file object
+            filename: Name of the file (used for extension detection)
+            exclude_types: Detected types to leave out
+
+        Returns:
+            ImportResult with status, counts, and any errors
+
+        Raises:
+            ValueError: If file format is unsupported or reading fails
+        """
+        from flowsint_core.imports.file_parser import iter_import_file
+
+        excluded = set(exclude_types or ())
+        previews = (
+            preview
+            for preview in iter_import_file(
+                file_content, filename, type_resolver=self._type_resolver
+            )
+            if preview.detected_type not in excluded
+        )
+
+        nodes_created = 0
+        nodes_skipped = 0
+        unknown_skipped = 0
+        # Only the first errors are kept, the others are just counted
+        errors: List[str] = []
+        error_count = 0
+
+        def report(error: str) -> None:
+            nonlocal error_count
+            error_count += 1
+            if len(errors) < MAX_REPORTED_ERRORS:
+                errors.append(error)
+
+        entity_index = 0
+        while True:
+            chunk = list(islice(previews, self._chunk_size))
+            if not chunk:
+                break
+            pydantic_nodes: List[FlowsintType] = []
+            for preview in chunk:
+                entity_index += 1
+                if preview.detected_type == "Unknown":
+                    unknown_skipped += 1
+                    continue
+                try:
+                    pydantic_nodes.append(self._preview_to_type(preview))
+                except Exception as e:
+                    nodes_skipped += 1
+                    report(f"Entity {entity_index}: {str(e)}")
+            if not pydantic_nodes:
+                continue
+            try:
+                nodes_result = self._write_nodes(pydantic_nodes)
+            except Exception as e:
+                nodes_skipped += len(pydantic_nodes)
+                report(f"Batch node creation failed: {str(e)}")
+                continue
+            nodes_created += nodes_result["nodes_created"]
+            nodes_skipped += len(pydantic_nodes) - nodes_result["nodes_created"]
+            for error in nodes_result.get("errors", []):
+                report(error)
+
+        if error_count > len(errors):
+            errors.append(f"{error_count - len(errors)} more errors not reported")
+        if unknown_skipped:
+            nodes_skipped += unknown_skipped
+            errors.append(f"{unknown_skipped} entities of unknown type were skipped")
+
+        if errors and not nodes_created:
+            status = "failed"
+        elif errors:
+            status = "completed_with_errors"
+        else:
+            status = "completed"
+        return ImportResult(
+            status=status,
+            nodes_created=nodes_created,
+            nodes_skipped=nodes_skipped,
+            errors=errors,
         )
 
+    def _preview_to_type(self, preview: EntityPreview) -> FlowsintType:
+        """Convert a detected entity to its FlowsintType object."""
+        if isinstance(preview.obj, FlowsintType):
+            return preview.obj
+        return GraphSerializer.parse_flowsint_type(
+            entity=dict(preview.obj),
+            nodeType=preview.detected_type,
+            type_resolver=self._type_resolver,
+        )
+
+    def _write_nodes(self, pydantic_nodes: List[FlowsintType]) -> Dict[str, Any]:
+        """Write one chunk of nodes to the graph."""
+        nodes = GraphSerializer.serialize_flowsint_types(pydantic_nodes)
+        return self._graph_service.batch_create_nodes(nodes=nodes)
+
     def _convert_entities(self, entities: List[EntityMapping]) -> Dict[str, Any]:
         """
         Convert entity mappings to FlowsintType objects.
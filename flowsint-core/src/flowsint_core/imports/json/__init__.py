@@ -1,5 +1,6 @@
-from .parse_json import parse_json
+from .parse_json import node_to_preview, parse_json
 
 __all__ = [
+    "node_to_preview",
     "parse_json",
 ]
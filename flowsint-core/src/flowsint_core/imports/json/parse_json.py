@@ -83,23 +83,32 @@ def _get_nodes(
 ) -> List[EntityPreview]:
     results = []
     for node in nodes:
-        node_id = node.get("id")
-        node_type = node.get("nodeType", node.get("type"))
-        label = node.get("nodeLabel", node.get("label"))
-        node_obj = {"nodeType": node_type, "nodeLabel": label, **node}
-        preview = _parse_node(node_obj, type_resolver=type_resolver)
+        preview = node_to_preview(node, type_resolver=type_resolver)
         if preview:
-            results.append(
-                EntityPreview(
-                    node_id=node_id,
-                    obj=preview.obj,
-                    detected_type=preview.detected_type,
-                )
-            )
+            results.append(preview)
 
     return results
 
 
+def node_to_preview(
+    node: Dict,
+    type_resolver: Optional[TypeResolver] = None,
+) -> EntityPreview | None:
+    """Build the preview of a node object (id, type/nodeType, label/nodeLabel)."""
+    node_id = node.get("id")
+    node_type = node.get("nodeType", node.get("type"))
+    label = node.get("nodeLabel", node.get("label"))
+    node_obj = {"nodeType": node_type, "nodeLabel": label, **node}
+    preview = _parse_node(node_obj, type_resolver=type_resolver)
+    if not preview:
+        return None
+    return EntityPreview(
+        node_id=node_id,
+        obj=preview.obj,
+        detected_type=preview.detected_type,
+    )
+
+
 def _parse_node(
     nodeDict: dict,
     type_resolver: Optional[TypeResolver] = None,
@@ -0,0 +1,6 @@
+from .parse_ndjson import iter_ndjson_previews, parse_ndjson
+
+__all__ = [
+    "iter_ndjson_previews",
+    "parse_ndjson",
+]
@@ -0,0 +1,56 @@
+import json
+from typing import Dict, Iterator, Optional
+
+from flowsint_core.core.graph.serializer import TypeResolver
+
+from ..json import node_to_preview
+from ..reader import ImportSource, iter_lines
+from ..types import EntityPreview, FileParseResult
+from ..utils import preview_records
+
+
+def iter_ndjson_records(source: ImportSource) -> Iterator[Dict]:
+    """
+    Yield the node objects of an NDJSON (JSON Lines) file, read incrementally.
+    Each line holds one node, shaped like the nodes of a JSON import.
+
+    Raises:
+        ValueError: On a line that is not a JSON object
+    """
+    for number, line in enumerate(iter_lines(source), start=1):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Invalid JSON on line {number}: {e}")
+        if not isinstance(record, dict):
+            raise ValueError(f"Line {number} is not a JSON object")
+        yield record
+
+
+def iter_ndjson_previews(
+    source: ImportSource, type_resolver: Optional[TypeResolver] = None
+) -> Iterator[EntityPreview]:
+    """Yield an entity for every node of an NDJSON file."""
+    for record in iter_ndjson_records(source):
+        preview = node_to_preview(record, type_resolver=type_resolver)
+        if preview:
+            yield preview
+
+
+def parse_ndjson(
+    file_bytes: ImportSource,
+    max_preview_rows: int,
+    type_resolver: Optional[TypeResolver] = None,
+) -> FileParseResult:
+    """Parse an NDJSON file with one node object per line."""
+    try:
+        return preview_records(
+            iter_ndjson_records(file_bytes),
+            lambda record: node_to_preview(record, type_resolver=type_resolver),
+            max_preview_rows,
+        )
+    except Exception as e:
+        raise ValueError(f"Failed to parse NDJSON file: {str(e)}")
@@ -0,0 +1,41 @@
+"""
+Incremental readers for import files.
+
+Uploads are read line by line from the underlying binary stream (the
+spooled temporary file of an upload, or a bytes buffer), so the size of a
+file never drives the memory used to parse it.
+"""
+
+import io
+from typing import BinaryIO, Iterator, Union
+
+ImportSource = Union[bytes, bytearray, BinaryIO]
+
+
+def open_source(source: ImportSource) -> BinaryIO:
+    """Get a binary stream over raw bytes or an already opened file."""
+    if isinstance(source, (bytes, bytearray)):
+        return io.BytesIO(source)
+    return source
+
+
+def decode_line(raw: bytes) -> str:
+    """Decode a line as UTF-8, falling back to latin-1."""
+    try:
+        return raw.decode("utf-8")
+    except UnicodeDecodeError:
+        return raw.decode("latin-1")
+
+
+def iter_lines(source: ImportSource, keepends: bool = False) -> Iterator[str]:
+    """
+    Yield the decoded lines of a source one at a time.
+
+    Args:
+        source: Raw bytes or a binary file-like object
+        keepends: Keep the line endings (needed by the csv module to parse
+            quoted values spanning several lines)
+    """
+    for raw in open_source(source):
+        line = decode_line(raw)
+        yield line if keepends else line.rstrip("\r\n")
@@ -1,5 +1,6 @@
-from .parse_txt import parse_txt
+from .parse_txt import iter_txt_previews, parse_txt
 
 __all__ = [
+    "iter_txt_previews",
     "parse_txt",
 ]
@@ -37,3 +37,6 @@ class FileParseResult:
     entities: Dict[str, Entity]
     total_entities: int
     edges: Optional[List[Edge]] = field(default_factory=list)
+    # Only the first entities were previewed, importing the preview would
+    # leave the others out
+    truncated: bool = False
@@ -1,8 +1,10 @@
 import re
-from typing import Optional
+from typing import Callable, Dict, Iterable, Optional, TypeVar
 
 from .entity_detection import detect_type
-from .types import EntityPreview
+from .types import Entity, EntityPreview, FileParseResult
+
+T = TypeVar("T")
 
 
 def camel_to_screaming_snake(name):
@@ -45,3 +47,44 @@ def create_entity_preview(row_value: str) -> Optional[EntityPreview]:
         obj=obj,
         detected_type=detected_name,
     )
+
+
+def add_preview(entities: Dict[str, Entity], preview: Optional[EntityPreview]) -> None:
+    """Add a preview to the entities grouped by detected type."""
+    if not preview:
+        return
+    if preview.detected_type in entities:
+        entities[preview.detected_type].results.append(preview)
+    else:
+        entities[preview.detected_type] = Entity(
+            type=preview.detected_type, results=[preview]
+        )
+
+
+def preview_records(
+    records: Iterable[T],
+    to_preview: Callable[[T], Optional[EntityPreview]],
+    max_preview_rows: int,
+) -> FileParseResult:
+    """
+    Preview the first `max_preview_rows` records of a file and count the rest.
+
+    Records are consumed one at a time, and type detection only runs on the
+    previewed ones, so analyzing a large file is bounded in memory.
+
+    Raises:
+        ValueError: If there are no records
+    """
+    entities: Dict[str, Entity] = {}
+    total = 0
+    for record in records:
+        total += 1
+        if total <= max_preview_rows:
+            add_preview(entities, to_preview(record))
+    if not total:
+        raise ValueError("File is empty")
+    return FileParseResult(
+        entities=entities,
+        total_entities=total,
+        truncated=total > max_preview_rows,
+    )
@@ -2,20 +2,27 @@ import asyncio
 import uuid
 from typing import List, Optional
 
-from celery import states
+from celery import chord, states
 from flowsint_enrichers import ENRICHER_REGISTRY, load_all_enrichers
 from sqlalchemy.orm import Session
 
-from flowsint_core.utils import to_json_serializable
-
-from ..core.celery import celery
+from ..core.celery import celery, launch_finished
 from ..core.enums import EventLevel
+from ..core.fan_out import (
+    ENRICHER_CHUNK_SIZE,
+    chunk_items,
+    chunk_result,
+    merge_chunk_results,
+    should_fan_out,
+)
 from ..core.logger import Logger
 from ..core.models import Scan
 from ..core.postgre_db import SessionLocal, get_db
+from ..core.scan_results import get_scan_result_store
 from ..core.services import create_enricher_template_service, create_vault_service
 from ..core.template_enricher import TemplateEnricher
 from ..templates.types import Template
+from ..utils import to_json_serializable
 
 # Auto-discover and register all enrichers
 load_all_enrichers()
@@ -23,6 +30,45 @@ load_all_enrichers()
 db: Session = next(get_db())
 
 
+def _create_enricher(
+    session: Session,
+    enricher_name: str,
+    sketch_id: str | None,
+    scan_id: uuid.UUID,
+    owner_id: Optional[str],
+):
+    # Create vault instance if owner_id is provided
+    vault = None
+    if owner_id:
+        try:
+            vault = create_vault_service(session).for_user(uuid.UUID(owner_id))
+        except Exception as e:
+            Logger.error(sketch_id, {"message": f"Failed to create vault: {str(e)}"})
+
+    if not ENRICHER_REGISTRY.enricher_exists(enricher_name):
+        raise ValueError(f"Enricher '{enricher_name}' not found in registry")
+
+    return ENRICHER_REGISTRY.get_enricher(
+        name=enricher_name,
+        sketch_id=sketch_id,
+        scan_id=scan_id,
+        vault=vault,
+    )
+
+
+def _fail_scan(
+    session: Session, scan_id: str, error: str, overwrite: bool = True
+) -> None:
+    scan = session.query(Scan).filter(Scan.id == uuid.UUID(scan_id)).first()
+    if scan is None:
+        return
+    if not overwrite and scan.status == EventLevel.FAILED:
+        return
+    scan.status = EventLevel.FAILED
+    scan.error = error
+    session.commit()
+
+
 @celery.task(name="run_enricher", bind=True)
 def run_enricher(
     self,
@@ -44,24 +90,34 @@ def run_enricher(
         session.add(scan)
         session.commit()
 
-        # Create vault instance if owner_id is provided
-        vault = None
-        if owner_id:
-            try:
-                vault = create_vault_service(session).for_user(uuid.UUID(owner_id))
-            except Exception as e:
-                Logger.error(
-                    sketch_id, {"message": f"Failed to create vault: {str(e)}"}
-                )
+        if should_fan_out(len(serialized_objects)):
+            if not ENRICHER_REGISTRY.enricher_exists(enricher_name):
+                raise ValueError(f"Enricher '{enricher_name}' not found in registry")
+            scan.status = EventLevel.RUNNING
+            session.commit()
 
-        if not ENRICHER_REGISTRY.enricher_exists(enricher_name):
-            raise ValueError(f"Enricher '{enricher_name}' not found in registry")
+            chunks = chunk_items(serialized_objects, ENRICHER_CHUNK_SIZE)
+            header = [
+                run_enricher_chunk.s(
+                    enricher_name, chunk, sketch_id, owner_id, str(scan_id)
+                )
+                for chunk in chunks
+            ]
+            callback = merge_enricher_chunks.s(
+                str(scan_id), owner_id, len(serialized_objects)
+            )
+            # Fails the scan if a chunk is lost (worker lost, time limit) or
+            # the merge fails
+            callback.on_error(
+                fail_enricher_chunks.s(
+                    str(scan_id), owner_id, len(serialized_objects)
+                )
+            )
+            chord(header)(callback)
+            return {"scan_id": str(scan_id), "chunks": len(chunks)}
 
-        enricher = ENRICHER_REGISTRY.get_enricher(
-            name=enricher_name,
-            sketch_id=sketch_id,
-            scan_id=scan_id,
-            vault=vault,
+        enricher = _create_enricher(
+            session, enricher_name, sketch_id, scan_id, owner_id
         )
 
         # Deserialize objects back into Pydantic models
@@ -69,7 +125,7 @@ def run_enricher(
         results = asyncio.run(enricher.execute(values=serialized_objects))
 
         scan.status = EventLevel.COMPLETED
-        scan.details = to_json_serializable(results)
+        get_scan_result_store().save(scan, results)
         session.commit()
 
         return {"result": scan.details}
@@ -92,6 +148,100 @@ def run_enricher(
         session.close()
 
 
+@celery.task(
+    name="run_enricher_chunk", bind=True, acks_late=True, reject_on_worker_lost=True
+)
+def run_enricher_chunk(
+    self,
+    enricher_name: str,
+    serialized_objects: List[dict],
+    sketch_id: str | None,
+    owner_id: Optional[str],
+    scan_id: str,
+):
+    """Run an enricher on a chunk of a launch, its results go to the graph."""
+    session = SessionLocal()
+
+    try:
+        enricher = _create_enricher(
+            session, enricher_name, sketch_id, uuid.UUID(scan_id), owner_id
+        )
+        results = asyncio.run(enricher.execute(values=serialized_objects))
+        return chunk_result(to_json_serializable(results))
+
+    except Exception as ex:
+        # Reported to the merge callback, the other chunks go on
+        print(f"Error in chunk of scan {scan_id}: {str(ex)}")
+        return chunk_result([], str(ex))
+
+    finally:
+        session.close()
+
+
+@celery.task(name="merge_enricher_chunks")
+def merge_enricher_chunks(
+    chunk_results: List[dict],
+    scan_id: str,
+    owner_id: Optional[str],
+    item_count: int,
+):
+    """Merge the results of the chunks of a launch into its scan."""
+    session = SessionLocal()
+
+    try:
+        scan = session.query(Scan).filter(Scan.id == uuid.UUID(scan_id)).first()
+        if scan is None:
+            # Deleted while running
+            result = {"result": None}
+        else:
+            results, errors = merge_chunk_results(chunk_results)
+            if errors and len(errors) == len(chunk_results):
+                scan.status = EventLevel.FAILED
+            else:
+                scan.status = EventLevel.COMPLETED
+            scan.error = "\n".join(errors) or None
+            get_scan_result_store().save(scan, results)
+            session.commit()
+            result = {"result": scan.details}
+
+    except Exception as ex:
+        session.rollback()
+        error_logs = f"An error occurred: {str(ex)}"
+        print(f"Error merging chunks of scan {scan_id}: {error_logs}")
+        _fail_scan(session, scan_id, error_logs)
+        # The launch is uncounted by fail_enricher_chunks, run on errors
+        raise ex
+
+    finally:
+        session.close()
+
+    if owner_id:
+        launch_finished(owner_id, item_count)
+    return result
+
+
+@celery.task(name="fail_enricher_chunks")
+def fail_enricher_chunks(
+    request,
+    exc,
+    traceback,
+    scan_id: str,
+    owner_id: Optional[str],
+    item_count: int,
+):
+    """Fail the scan of a launch whose chunks or merge failed."""
+    session = SessionLocal()
+
+    try:
+        # Keeps the error of a failed merge
+        error_logs = f"An error occurred: {str(exc)}"
+        _fail_scan(session, scan_id, error_logs, overwrite=False)
+    finally:
+        session.close()
+        if owner_id:
+            launch_finished(owner_id, item_count)
+
+
 @celery.task(name="run_template_enricher", bind=True)
 def run_template_enricher(
     self,
@@ -145,7 +295,7 @@ def run_template_enricher(
         results = asyncio.run(enricher.execute(values=serialized_objects))
 
         scan.status = EventLevel.COMPLETED
-        scan.details = to_json_serializable(results)
+        get_scan_result_store().save(scan, results)
         session.commit()
 
         return {"result": scan.details}
@@ -4,16 +4,15 @@ from typing import List, Optional
 from celery import states
 from sqlalchemy.orm import Session
 
-from flowsint_core.utils import to_json_serializable
-
 from ..core.celery import celery
 from ..core.enums import EventLevel
 from ..core.logger import Logger
 from ..core.models import Scan
 from ..core.orchestrator import FlowOrchestrator
 from ..core.postgre_db import SessionLocal, get_db
+from ..core.scan_results import get_scan_result_store
 from ..core.services import create_vault_service
-from ..core.types import FlowBranch
+from ..core.types import FlowBranch, FlowDag
 
 db: Session = next(get_db())
 
@@ -21,16 +20,22 @@ db: Session = next(get_db())
 @celery.task(name="run_flow", bind=True)
 def run_flow(
     self,
-    enricher_branches,
+    flow: dict | list,
     serialized_objects: List[dict],
     sketch_id: str | None,
     owner_id: Optional[str] = None,
 ):
+    """
+    Run a flow on entities.
+
+    `flow` is the FlowDag compiled by the FlowCompiler, or a list of branches
+    for flows launched before the DAG was sent.
+    """
     session = SessionLocal()
 
     try:
-        if not enricher_branches:
-            raise ValueError("enricher_branches not provided in the input enricher")
+        if not flow:
+            raise ValueError("flow not provided in the input enricher")
 
         scan_id = uuid.UUID(self.request.id)
 
@@ -52,12 +57,17 @@ def run_flow(
                     sketch_id, {"message": f"Failed to create vault: {str(e)}"}
                 )
 
-        enricher_branches = [FlowBranch(**branch) for branch in enricher_branches]
+        if isinstance(flow, dict):
+            flow_kwargs = {"flow_dag": FlowDag(**flow)}
+        else:
+            flow_kwargs = {
+                "enricher_branches": [FlowBranch(**branch) for branch in flow]
+            }
         enricher = FlowOrchestrator(
             sketch_id=sketch_id,
             scan_id=str(scan_id),
-            enricher_branches=enricher_branches,
             vault=vault,
+            **flow_kwargs,
         )
 
         # Use the synchronous scan method which internally handles the async operations
@@ -65,7 +75,7 @@ def run_flow(
         results = enricher.scan(values=serialized_objects)
 
         scan.status = EventLevel.COMPLETED
-        scan.details = to_json_serializable(results)
+        get_scan_result_store().save(scan, results)
         session.commit()
 
         return {"result": scan.details}
@@ -0,0 +1,31 @@
+import logging
+
+from ..core.celery import celery
+from ..core.postgre_db import SessionLocal
+from ..core.services import create_log_retention_service, create_scan_service
+
+logger = logging.getLogger(__name__)
+
+
+@celery.task(name="maintain_logs")
+def maintain_logs_task():
+    """Celery task managing log partitions, rollups and retention (daily)"""
+    session = SessionLocal()
+    try:
+        result = create_log_retention_service(session).run_maintenance()
+        logger.info(f"Log maintenance done: {result}")
+        return result
+    finally:
+        session.close()
+
+
+@celery.task(name="sweep_scan_results")
+def sweep_scan_results_task():
+    """Celery task deleting the scan result blobs no scan references (daily)"""
+    session = SessionLocal()
+    try:
+        deleted = create_scan_service(session).sweep_unreferenced_results()
+        logger.info(f"Scan results sweep done: {deleted} blobs deleted")
+        return deleted
+    finally:
+        session.close()
@@ -0,0 +1 @@
+# Benchmarks for the graph layer and imports
@@ -0,0 +1,75 @@
+"""Throughput of the graph repository and GraphService."""
+
+from flowsint_core.core.graph import GraphService
+
+
+def test_batch_create_nodes(benchmark, store, sketch_nodes):
+    def setup():
+        return (store.new_sketch(),), {}
+
+    benchmark.extra_info["items"] = len(sketch_nodes)
+    node_ids = benchmark.pedantic(
+        lambda sketch_id: store.write_nodes(sketch_id, sketch_nodes),
+        setup=setup,
+        rounds=1,
+    )
+
+    assert len(node_ids) == len(sketch_nodes)
+
+
+def test_batch_create_edges_by_element_id(benchmark, store, sketch_nodes):
+    def setup():
+        sketch_id = store.new_sketch()
+        return (sketch_id, store.write_nodes(sketch_id, sketch_nodes)), {}
+
+    edges_created = benchmark.pedantic(store.write_edges, setup=setup, rounds=1)
+
+    benchmark.extra_info["items"] = edges_created
+    benchmark.extra_info["items_per_second"] = edges_created / benchmark.stats["mean"]
+    assert edges_created > 0
+
+
+def test_get_sketch_graph(benchmark, populated_sketch, sketch_size):
+    sketch_store, sketch_id, _ = populated_sketch
+
+    benchmark.extra_info["items"] = sketch_size
+    graph = benchmark(
+        sketch_store.repository.get_sketch_graph, sketch_id, limit=sketch_size
+    )
+
+    assert len(graph["nodes"]) == sketch_size
+
+
+def test_iter_sketch_nodes(benchmark, populated_sketch, sketch_size):
+    sketch_store, sketch_id, _ = populated_sketch
+
+    def consume():
+        return sum(
+            len(chunk) for chunk in sketch_store.repository.iter_sketch_nodes(sketch_id)
+        )
+
+    benchmark.extra_info["items"] = sketch_size
+    assert benchmark(consume) == sketch_size
+
+
+def test_get_neighbors(benchmark, populated_sketch):
+    sketch_store, sketch_id, node_ids = populated_sketch
+    # The first nodes are linked to by most of the synthetic edges
+    sample = node_ids[:: max(1, len(node_ids) // 100)][:100]
+
+    def neighbors():
+        return [sketch_store.repository.get_neighbors(n, sketch_id) for n in sample]
+
+    benchmark.extra_info["items"] = len(sample)
+    assert all(result["nodes"] for result in benchmark(neighbors))
+
+
+def test_service_get_sketch_graph(benchmark, populated_sketch, sketch_size):
+    sketch_store, sketch_id, _ = populated_sketch
+    service = GraphService(sketch_id=sketch_id, repository=sketch_store.repository)
+
+    benchmark.extra_info["items"] = sketch_size
+    graph = benchmark(service.get_sketch_graph)
+
+    assert len(graph.nodes) == min(sketch_size, 100000)
+    assert graph.edges
@@ -0,0 +1,69 @@
+"""Throughput of file analysis and imports."""
+
+import pytest
+
+from flowsint_core.core.graph import GraphService
+from flowsint_core.imports import EntityMapping, ImportService
+
+from . import synthetic
+
+
+@pytest.fixture(scope="session")
+def txt_file(sketch_size) -> bytes:
+    return synthetic.make_txt_file(sketch_size)
+
+
+def make_import_service(store, sketch_id: str) -> ImportService:
+    return ImportService(GraphService(sketch_id=sketch_id, repository=store.repository))
+
+
+def test_analyze_txt(benchmark, store, txt_file, sketch_size):
+    service = make_import_service(store, store.new_sketch())
+
+    benchmark.extra_info["items"] = sketch_size
+    result = benchmark(service.analyze_file, txt_file, "values.txt")
+
+    assert result.total_entities == sketch_size
+
+
+def test_import_file(benchmark, store, txt_file, sketch_size):
+    def setup():
+        return (make_import_service(store, store.new_sketch()),), {}
+
+    benchmark.extra_info["items"] = sketch_size
+    result = benchmark.pedantic(
+        lambda service: service.import_file(txt_file, "values.txt"),
+        setup=setup,
+        rounds=1,
+    )
+
+    assert result.nodes_created == sketch_size
+
+
+def test_execute_import(benchmark, store, sketch_size):
+    mappings = [
+        EntityMapping(
+            id=str(index),
+            entity_type=entity.__class__.__name__,
+            nodeLabel=entity.nodeLabel,
+            data=entity.model_dump(mode="json"),
+            node_id=str(index),
+        )
+        for index, entity in enumerate(synthetic.iter_entities(sketch_size))
+    ]
+    edges = [
+        {"from_id": str(from_index), "to_id": str(to_index), "label": label}
+        for from_index, to_index, label in synthetic.iter_edge_pairs(sketch_size)
+    ]
+
+    def setup():
+        return (make_import_service(store, store.new_sketch()),), {}
+
+    benchmark.extra_info["items"] = sketch_size
+    result = benchmark.pedantic(
+        lambda service: service.execute_import(mappings, edges),
+        setup=setup,
+        rounds=1,
+    )
+
+    assert result.nodes_created == sketch_size
@@ -0,0 +1,47 @@
+"""Throughput of GraphSerializer conversions."""
+
+import pytest
+
+from flowsint_core.core.graph import GraphSerializer
+
+from . import synthetic
+
+
+@pytest.fixture(scope="session")
+def entities(sketch_size):
+    return list(synthetic.iter_entities(sketch_size))
+
+
+@pytest.fixture(scope="session")
+def node_records(sketch_size):
+    return synthetic.make_node_records(sketch_size)
+
+
+def test_serialize_flowsint_types(benchmark, entities):
+    benchmark.extra_info["items"] = len(entities)
+    nodes = benchmark(GraphSerializer.serialize_flowsint_types, entities)
+
+    assert len(nodes) == len(entities)
+
+
+def test_deserialize_nodes(benchmark, node_records):
+    benchmark.extra_info["items"] = len(node_records)
+    nodes = benchmark(GraphSerializer.deserialize_nodes, node_records)
+
+    assert len(nodes) == len(node_records)
+
+
+def test_round_trip(benchmark, entities):
+    def round_trip():
+        records = [
+            {"id": str(index), "data": node}
+            for index, node in enumerate(
+                GraphSerializer.serialize_flowsint_types(entities)
+            )
+        ]
+        return GraphSerializer.deserialize_nodes(records)
+
+    benchmark.extra_info["items"] = len(entities)
+    nodes = benchmark(round_trip)
+
+    assert nodes[0].nodeProperties == entities[0]
@@ -0,0 +1,67 @@
+"""
+Compare two benchmark result files.
+
+Usage:
+    python -m tests.benchmarks.compare BASELINE.json CURRENT.json [--threshold 0.1]
+
+Prints the mean time of every benchmark present in both files and exits with
+status 1 when one of them got slower by more than the threshold (a ratio,
+0.1 = 10%).
+"""
+
+import argparse
+import json
+import sys
+from typing import Dict, List, Tuple
+
+
+def load_means(path: str) -> Dict[str, float]:
+    with open(path, encoding="utf-8") as f:
+        report = json.load(f)
+    return {bench["fullname"]: bench["stats"]["mean"] for bench in report["benchmarks"]}
+
+
+def compare(
+    baseline: Dict[str, float], current: Dict[str, float], threshold: float
+) -> Tuple[List[Tuple[str, float, float, float]], List[str]]:
+    """
+    Returns:
+        Tuple of (rows of (name, baseline mean, current mean, change ratio),
+        names of the regressed benchmarks)
+    """
+    rows = []
+    regressions = []
+    for name in sorted(baseline.keys() & current.keys()):
+        change = (current[name] - baseline[name]) / baseline[name]
+        rows.append((name, baseline[name], current[name], change))
+        if change > threshold:
+            regressions.append(name)
+    return rows, regressions
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("baseline")
+    parser.add_argument("current")
+    parser.add_argument("--threshold", type=float, default=0.1)
+    args = parser.parse_args(argv)
+
+    baseline = load_means(args.baseline)
+    current = load_means(args.current)
+    rows, regressions = compare(baseline, current, args.threshold)
+
+    width = max((len(name) for name, *_ in rows), default=4)
+    print(f"{'name':<{width}}  {'baseline':>10}  {'current':>10}  {'change':>8}")
+    for name, before, after, change in rows:
+        flag = "  REGRESSION" if name in regressions else ""
+        print(
+            f"{name:<{width}}  {before:>9.4f}s  {after:>9.4f}s  {change:>+7.1%}{flag}"
+        )
+    for name in sorted(baseline.keys() ^ current.keys()):
+        print(f"{name}: only in {'baseline' if name in baseline else 'current'}")
+
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,320 @@
+"""
+Benchmark fixtures for the graph layer and imports.
+
+The benchmark modules are named bench_*.py so the regular test run skips
+them. Run them with:
+
+    uv run pytest tests/benchmarks -o python_files="bench_*.py"
+
+Configuration (environment variables):
+    BENCHMARK_SIZES: Comma-separated sketch sizes among 10k, 100k and 1m
+        (default: 10k)
+    BENCHMARK_BACKENDS: Comma-separated repositories among memory and neo4j
+        (default: memory)
+    BENCHMARK_ROUNDS: Rounds of each read benchmark (default: 3)
+    BENCHMARK_NEO4J_URI, BENCHMARK_NEO4J_USERNAME, BENCHMARK_NEO4J_PASSWORD:
+        Neo4j instance for the neo4j backend (default: NEO4J_URI_BOLT,
+        NEO4J_USERNAME and NEO4J_PASSWORD)
+    BENCHMARK_OUTPUT: Path of the JSON results file
+        (default: .benchmarks/<timestamp>-<commit>.json)
+
+The `benchmark` fixture follows the pytest-benchmark API (`benchmark(fn)`,
+`benchmark.pedantic(...)`, `benchmark.extra_info`) and the results file keeps
+its JSON layout, so runs can be compared with `python -m
+tests.benchmarks.compare`.
+"""
+
+import json
+import os
+import platform
+import statistics
+import subprocess
+import time
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional
+from uuid import uuid4
+
+import pytest
+
+from ..core.graph.in_memory_graph_repository import InMemoryGraphRepository
+from . import synthetic
+
+BACKENDS = ("memory", "neo4j")
+DEFAULT_ROUNDS = int(os.getenv("BENCHMARK_ROUNDS", "3"))
+
+# Read before the test conftest replaces NEO4J_* with dummy credentials
+NEO4J_URI = os.getenv("BENCHMARK_NEO4J_URI", os.getenv("NEO4J_URI_BOLT"))
+NEO4J_USERNAME = os.getenv("BENCHMARK_NEO4J_USERNAME", os.getenv("NEO4J_USERNAME"))
+NEO4J_PASSWORD = os.getenv("BENCHMARK_NEO4J_PASSWORD", os.getenv("NEO4J_PASSWORD"))
+
+_results: List[Dict[str, Any]] = []
+
+
+def _env_list(name: str, default: str, allowed) -> List[str]:
+    values = [v.strip().lower() for v in os.getenv(name, default).split(",")]
+    unknown = [v for v in values if v and v not in allowed]
+    if unknown:
+        raise pytest.UsageError(f"{name}: unknown value(s) {unknown}")
+    return [v for v in values if v]
+
+
+def pytest_generate_tests(metafunc):
+    # Session scope groups the tests by size and backend, so each synthetic
+    # sketch is built once and dropped before the next one
+    if "sketch_size" in metafunc.fixturenames:
+        sizes = _env_list("BENCHMARK_SIZES", "10k", synthetic.SIZES)
+        metafunc.parametrize(
+            "sketch_size",
+            [synthetic.SIZES[size] for size in sizes],
+            ids=sizes,
+            scope="session",
+        )
+    if "backend" in metafunc.fixturenames:
+        metafunc.parametrize(
+            "backend",
+            _env_list("BENCHMARK_BACKENDS", "memory", BACKENDS),
+            scope="session",
+        )
+
+
+class BenchmarkFixture:
+    """Times a callable and records its statistics for the results file."""
+
+    def __init__(self, node: pytest.Item):
+        self._node = node
+        self.extra_info: Dict[str, Any] = {}
+        self.stats: Optional[Dict[str, float]] = None
+
+    def __call__(self, target: Callable, *args: Any, **kwargs: Any) -> Any:
+        return self.pedantic(target, args=args, kwargs=kwargs, rounds=DEFAULT_ROUNDS)
+
+    def pedantic(
+        self,
+        target: Callable,
+        args: tuple = (),
+        kwargs: Optional[Dict[str, Any]] = None,
+        setup: Optional[Callable] = None,
+        rounds: int = 1,
+        warmup_rounds: int = 0,
+        iterations: int = 1,
+    ) -> Any:
+        """
+        Run `target` for `rounds` rounds of `iterations` calls.
+
+        Args:
+            target: Callable to time
+            args: Positional arguments for target
+            kwargs: Keyword arguments for target
+            setup: Untimed callable run before each round; may return a new
+                (args, kwargs) tuple for that round
+            rounds: Number of timed rounds
+            warmup_rounds: Untimed rounds run first
+            iterations: Calls per round (the round time is divided by it)
+
+        Returns:
+            The result of the last call
+        """
+        if self.stats is not None:
+            raise RuntimeError("benchmark can only be used once per test")
+        kwargs = kwargs or {}
+        timings: List[float] = []
+        result = None
+        for round_index in range(warmup_rounds + rounds):
+            round_args, round_kwargs = args, kwargs
+            if setup is not None:
+                prepared = setup()
+                if prepared is not None:
+                    round_args, round_kwargs = prepared
+            start = time.perf_counter()
+            for _ in range(iterations):
+                result = target(*round_args, **round_kwargs)
+            elapsed = (time.perf_counter() - start) / iterations
+            if round_index >= warmup_rounds:
+                timings.append(elapsed)
+        self._record(timings)
+        return result
+
+    def _record(self, timings: List[float]) -> None:
+        mean = statistics.fmean(timings)
+        self.stats = {
+            "min": min(timings),
+            "max": max(timings),
+            "mean": mean,
+            "median": statistics.median(timings),
+            "stddev": statistics.stdev(timings) if len(timings) > 1 else 0.0,
+            "rounds": len(timings),
+            "total": sum(timings),
+            "ops": 1 / mean if mean else 0.0,
+        }
+        items = self.extra_info.get("items")
+        if items and mean:
+            self.extra_info["items_per_second"] = items / mean
+        callspec = getattr(self._node, "callspec", None)
+        _results.append(
+            {
+                "group": self._node.module.__name__.rsplit(".", 1)[-1],
+                "name": self._node.name,
+                "fullname": self._node.nodeid,
+                "params": dict(callspec.params) if callspec else {},
+                "stats": self.stats,
+                "extra_info": self.extra_info,
+            }
+        )
+
+
+@pytest.fixture
+def benchmark(request) -> BenchmarkFixture:
+    return BenchmarkFixture(request.node)
+
+
+def _git(*args: str) -> str:
+    try:
+        return subprocess.run(
+            ["git", *args], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return ""
+
+
+def pytest_sessionfinish(session, exitstatus):
+    if not _results:
+        return
+    commit = _git("rev-parse", "HEAD")
+    now = datetime.now(timezone.utc)
+    output = os.getenv("BENCHMARK_OUTPUT") or os.path.join(
+        ".benchmarks", f"{now:%Y%m%dT%H%M%S}-{commit[:10] or 'nocommit'}.json"
+    )
+    os.makedirs(os.path.dirname(output) or ".", exist_ok=True)
+    report = {
+        "machine_info": {
+            "node": platform.node(),
+            "machine": platform.machine(),
+            "system": platform.system(),
+            "python_version": platform.python_version(),
+            "cpu_count": os.cpu_count(),
+        },
+        "commit_info": {
+            "id": commit,
+            "branch": _git("rev-parse", "--abbrev-ref", "HEAD"),
+            "dirty": bool(_git("status", "--porcelain", "--untracked-files=no")),
+        },
+        "datetime": now.isoformat(),
+        "benchmarks": _results,
+    }
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    reporter = session.config.pluginmanager.get_plugin("terminalreporter")
+    if reporter is not None:
+        reporter.write_sep("-", f"benchmark results written to {output}")
+
+
+# -----------------------------------------------------------------------------
+# Repositories
+# -----------------------------------------------------------------------------
+
+
+@pytest.fixture(scope="session")
+def neo4j_connection():
+    from flowsint_core.core.graph import Neo4jConnection
+
+    if not all([NEO4J_URI, NEO4J_USERNAME, NEO4J_PASSWORD]):
+        pytest.skip("Neo4j credentials are not configured")
+    Neo4jConnection.reset_instance()
+    connection = Neo4jConnection(NEO4J_URI, NEO4J_USERNAME, NEO4J_PASSWORD)
+    if not connection.verify_connectivity():
+        Neo4jConnection.reset_instance()
+        pytest.skip(f"Neo4j is not reachable at {NEO4J_URI}")
+    yield connection
+    Neo4jConnection.reset_instance()
+
+
+def _drop_sketch(connection, sketch_id: str) -> None:
+    """Hard delete a benchmark sketch, in batches."""
+    query = """
+    MATCH (n {sketch_id: $sketch_id})
+    WITH n LIMIT 10000
+    DETACH DELETE n
+    RETURN count(*) AS deleted
+    """
+    while connection.query(query, {"sketch_id": sketch_id})[0]["deleted"]:
+        pass
+
+
+class SketchStore:
+    """A repository plus the benchmark sketches written to it."""
+
+    def __init__(self, backend: str, request):
+        self.backend = backend
+        self._connection = None
+        if backend == "neo4j":
+            from flowsint_core.core.graph import Neo4jGraphRepository
+
+            self._connection = request.getfixturevalue("neo4j_connection")
+            self.repository = Neo4jGraphRepository(self._connection)
+        else:
+            self.repository = InMemoryGraphRepository()
+        self._sketches: List[str] = []
+
+    def new_sketch(self) -> str:
+        sketch_id = f"benchmark-{uuid4()}"
+        self._sketches.append(sketch_id)
+        return sketch_id
+
+    def write_nodes(self, sketch_id: str, nodes: List, chunk_size: int = 1000):
+        """Write nodes in batches and return their element IDs."""
+        node_ids: List[str] = []
+        for chunk in synthetic.chunked(nodes, chunk_size):
+            node_ids.extend(
+                self.repository.batch_create_nodes(chunk, sketch_id)["node_ids"]
+            )
+        return node_ids
+
+    def write_edges(self, sketch_id: str, node_ids: List[str], chunk_size=1000):
+        """Write the synthetic edges between already written nodes."""
+        edges = [
+            {
+                "from_element_id": node_ids[from_index],
+                "to_element_id": node_ids[to_index],
+                "rel_label": label,
+            }
+            for from_index, to_index, label in synthetic.iter_edge_pairs(len(node_ids))
+        ]
+        created = 0
+        for chunk in synthetic.chunked(edges, chunk_size):
+            created += self.repository.batch_create_edges_by_element_id(
+                chunk, sketch_id
+            )["edges_created"]
+        return created
+
+    def close(self) -> None:
+        if self._connection is not None:
+            for sketch_id in self._sketches:
+                _drop_sketch(self._connection, sketch_id)
+        elif isinstance(self.repository, InMemoryGraphRepository):
+            self.repository.clear()
+        self._sketches.clear()
+
+
+@pytest.fixture
+def store(backend, request):
+    """An empty repository of the benchmarked backend."""
+    sketch_store = SketchStore(backend, request)
+    yield sketch_store
+    sketch_store.close()
+
+
+@pytest.fixture(scope="session")
+def sketch_nodes(sketch_size) -> List[Dict[str, Any]]:
+    """Serialized synthetic nodes of the benchmarked size."""
+    return synthetic.make_node_dicts(sketch_size)
+
+
+@pytest.fixture(scope="session")
+def populated_sketch(backend, sketch_size, sketch_nodes, request):
+    """A repository holding one synthetic sketch with its nodes and edges."""
+    sketch_store = SketchStore(backend, request)
+    sketch_id = sketch_store.new_sketch()
+    node_ids = sketch_store.write_nodes(sketch_id, sketch_nodes)
+    sketch_store.write_edges(sketch_id, node_ids)
+    yield sketch_store, sketch_id, node_ids
+    sketch_store.close()
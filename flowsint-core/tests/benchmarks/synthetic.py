@@ -0,0 +1,70 @@
+"""
+Deterministic synthetic sketches for the benchmarks.
+
+Entities cycle through common types (domains, IPs, emails, usernames,
+websites) with unique labels, and edges link each node to a few earlier
+nodes picked with a seeded RNG, so every run writes the same graph.
+"""
+
+import random
+from typing import Callable, Dict, Iterator, List, Tuple
+
+from flowsint_types import Domain, Email, FlowsintType, Ip, Username, Website
+
+from flowsint_core.core.graph import GraphDict, GraphSerializer
+
+SIZES: Dict[str, int] = {"10k": 10_000, "100k": 100_000, "1m": 1_000_000}
+
+EDGE_LABELS = ["RESOLVES_TO", "HAS_EMAIL", "LINKED_TO", "HOSTS"]
+
+ENTITY_FACTORIES: List[Callable[[int], FlowsintType]] = [
+    lambda i: Domain(domain=f"host{i}.example.com"),
+    lambda i: Ip(address=f"10.{i >> 16 & 255}.{i >> 8 & 255}.{i & 255}"),
+    lambda i: Email(email=f"user{i}@example.com"),
+    lambda i: Username(value=f"user_{i}"),
+    lambda i: Website(url=f"https://site{i}.example.com/"),
+]
+
+
+def make_entity(index: int) -> FlowsintType:
+    """Entity number `index` of a synthetic sketch."""
+    return ENTITY_FACTORIES[index % len(ENTITY_FACTORIES)](index)
+
+
+def iter_entities(count: int) -> Iterator[FlowsintType]:
+    for index in range(count):
+        yield make_entity(index)
+
+
+def make_node_dicts(count: int) -> List[GraphDict]:
+    """Serialized (flattened) nodes, as written to the repository."""
+    return GraphSerializer.serialize_flowsint_types(list(iter_entities(count)))
+
+
+def make_node_records(count: int) -> List[Dict]:
+    """Node records shaped like the output of get_sketch_graph."""
+    return [
+        {"id": f"node:{index}", "labels": [node["nodeType"]], "data": node}
+        for index, node in enumerate(make_node_dicts(count))
+    ]
+
+
+def iter_edge_pairs(
+    count: int, edges_per_node: int = 2, seed: int = 0
+) -> Iterator[Tuple[int, int, str]]:
+    """Yield (from_index, to_index, label) edges linking each node to earlier ones."""
+    rng = random.Random(seed)
+    for to_index in range(1, count):
+        for _ in range(min(to_index, edges_per_node)):
+            yield rng.randrange(to_index), to_index, rng.choice(EDGE_LABELS)
+
+
+def make_txt_file(count: int) -> bytes:
+    """A TXT import file with one entity value per line."""
+    lines = (entity.nodeLabel for entity in iter_entities(count))
+    return "\n".join(lines).encode()
+
+
+def chunked(items: List, size: int) -> Iterator[List]:
+    for start in range(0, len(items), size):
+        yield items[start : start + size]
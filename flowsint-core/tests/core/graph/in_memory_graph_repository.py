@@ -3,10 +3,14 @@ In-memory implementation of GraphRepositoryProtocol for testing.
 
 This module provides a lightweight graph repository that stores data in memory,
 enabling fast unit tests without requiring a Neo4j database connection.
+
+Nodes are indexed by (sketch_id, nodeLabel) and edges by node, so writes and
+neighborhood lookups don't scan the whole store. This keeps the repository
+usable as a pure-Python stand-in for Neo4j in the benchmarks (tests/benchmarks).
 """
 
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 from uuid import uuid4
 
 
@@ -21,6 +25,10 @@ class InMemoryGraphRepository:
     def __init__(self):
         self._nodes: Dict[str, Dict[str, Any]] = {}  # element_id -> node_data
         self._edges: Dict[str, Dict[str, Any]] = {}  # element_id -> edge_data
+        # (sketch_id, nodeLabel) -> element_id of the first node with that label
+        self._label_index: Dict[Tuple[Any, Any], str] = {}
+        # node element_id -> element_ids of its edges, in creation order
+        self._node_edges: Dict[str, Dict[str, None]] = {}
         self._batch_operations: List[tuple] = []
         self._batch_size = 100
 
@@ -28,6 +36,39 @@ class InMemoryGraphRepository:
         """Generate a unique element ID."""
         return f"{prefix}:{uuid4()}"
 
+    def _index_node(self, element_id: str) -> None:
+        """Register a node in the label index, unless its label is taken."""
+        node = self._nodes[element_id]
+        self._label_index.setdefault(
+            (node.get("sketch_id"), node.get("nodeLabel")), element_id
+        )
+
+    def _unindex_node(self, element_id: str, key: Tuple[Any, Any]) -> None:
+        """Drop a node from the label index, falling back to another holder."""
+        if self._label_index.get(key) != element_id:
+            return
+        del self._label_index[key]
+        for eid, node in self._nodes.items():
+            if eid != element_id and (
+                node.get("sketch_id"),
+                node.get("nodeLabel"),
+            ) == key:
+                self._label_index[key] = eid
+                break
+
+    def _find_node(self, node_label: Any, sketch_id: str) -> Optional[str]:
+        """Element ID of the node with this label in the sketch, if any."""
+        return self._label_index.get((sketch_id, node_label))
+
+    def _add_edge(self, element_id: str, edge_data: Dict[str, Any]) -> None:
+        self._edges[element_id] = edge_data
+        for node_id in (edge_data.get("source"), edge_data.get("target")):
+            self._node_edges.setdefault(node_id, {})[element_id] = None
+
+    def _edges_of(self, node_id: str) -> List[str]:
+        """Element IDs of the edges touching a node, in creation order."""
+        return list(self._node_edges.get(node_id, ()))
+
     # -------------------------------------------------------------------------
     # Core node operations
     # -------------------------------------------------------------------------
@@ -38,15 +79,12 @@ class InMemoryGraphRepository:
         node_type = node_obj.get("nodeType")
 
         # Check if node already exists (MERGE behavior)
-        for element_id, data in self._nodes.items():
-            if (
-                data.get("nodeLabel") == node_label
-                and data.get("sketch_id") == sketch_id
-            ):
-                # Update existing node
-                self._nodes[element_id].update(node_obj)
-                self._nodes[element_id]["deleted_at"] = None
-                return element_id
+        element_id = self._find_node(node_label, sketch_id)
+        if element_id is not None:
+            # Update existing node
+            self._update_node_data(element_id, node_obj)
+            self._nodes[element_id]["deleted_at"] = None
+            return element_id
 
         # Create new node
         element_id = self._generate_element_id("node")
@@ -57,8 +95,18 @@ class InMemoryGraphRepository:
             "deleted_at": None,
             "_labels": [node_type] if node_type else ["Node"],
         }
+        self._index_node(element_id)
         return element_id
 
+    def _update_node_data(self, element_id: str, updates: Dict[str, Any]) -> None:
+        """Apply updates to a node, keeping the label index in sync."""
+        node = self._nodes[element_id]
+        key = (node.get("sketch_id"), node.get("nodeLabel"))
+        node.update(updates)
+        if (node.get("sketch_id"), node.get("nodeLabel")) != key:
+            self._unindex_node(element_id, key)
+            self._index_node(element_id)
+
     def update_node(
         self, element_id: str, updates: Dict[str, Any], sketch_id: str
     ) -> Optional[str]:
@@ -69,7 +117,7 @@ class InMemoryGraphRepository:
             return None
         if self._nodes[element_id].get("deleted_at") is not None:
             return None
-        self._nodes[element_id].update(updates)
+        self._update_node_data(element_id, updates)
         return element_id
 
     def delete_nodes(self, node_ids: List[str], sketch_id: str) -> int:
@@ -83,10 +131,10 @@ class InMemoryGraphRepository:
                         continue
 
                     # Also soft delete related edges
-                    for edge in self._edges.values():
-                        if edge.get("source") == node_id or edge.get("target") == node_id:
-                            if edge.get("sketch_id") == sketch_id and edge.get("deleted_at") is None:
-                                edge["deleted_at"] = deleted_at
+                    for edge_id in self._edges_of(node_id):
+                        edge = self._edges[edge_id]
+                        if edge.get("sketch_id") == sketch_id and edge.get("deleted_at") is None:
+                            edge["deleted_at"] = deleted_at
 
                     self._nodes[node_id]["deleted_at"] = deleted_at
                     deleted += 1
@@ -149,29 +197,26 @@ class InMemoryGraphRepository:
         rel_label = rel_obj.get("rel_label", "RELATED_TO")
 
         # Find source and target nodes
-        source_id = None
-        target_id = None
-
-        for eid, node in self._nodes.items():
-            if node.get("sketch_id") != sketch_id:
-                continue
-            if node.get("deleted_at") is not None:
-                continue
-            if node.get("nodeLabel") == from_label:
-                source_id = eid
-            if node.get("nodeLabel") == to_label:
-                target_id = eid
+        source_id = self._find_node(from_label, sketch_id)
+        target_id = self._find_node(to_label, sketch_id)
+        if source_id and self._nodes[source_id].get("deleted_at") is not None:
+            source_id = None
+        if target_id and self._nodes[target_id].get("deleted_at") is not None:
+            target_id = None
 
         if source_id and target_id:
             element_id = self._generate_element_id("rel")
-            self._edges[element_id] = {
-                **rel_obj,
-                "source": source_id,
-                "target": target_id,
-                "type": rel_label,
-                "sketch_id": sketch_id,
-                "deleted_at": None,
-            }
+            self._add_edge(
+                element_id,
+                {
+                    **rel_obj,
+                    "source": source_id,
+                    "target": target_id,
+                    "type": rel_label,
+                    "sketch_id": sketch_id,
+                    "deleted_at": None,
+                },
+            )
 
     def create_relationship_by_element_id(
         self,
@@ -196,7 +241,7 @@ class InMemoryGraphRepository:
             "sketch_id": sketch_id,
             "deleted_at": None,
         }
-        self._edges[element_id] = edge_data
+        self._add_edge(element_id, edge_data)
         return {"sketch_id": sketch_id}
 
     def update_relationship(
@@ -269,6 +314,22 @@ class InMemoryGraphRepository:
 
         return {"nodes": nodes, "edges": edges}
 
+    def iter_sketch_nodes(
+        self, sketch_id: str, chunk_size: int = 1000
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """Stream the nodes of a sketch in chunks."""
+        nodes = self.get_sketch_graph(sketch_id, limit=len(self._nodes) + 1)["nodes"]
+        for start in range(0, len(nodes), chunk_size):
+            yield nodes[start : start + chunk_size]
+
+    def iter_sketch_edges(
+        self, sketch_id: str, chunk_size: int = 1000
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """Stream the edges of a sketch in chunks."""
+        edges = self.get_sketch_graph(sketch_id, limit=len(self._nodes) + 1)["edges"]
+        for start in range(0, len(edges), chunk_size):
+            yield edges[start : start + chunk_size]
+
     def get_neighbors(self, node_id: str, sketch_id: str) -> Dict[str, Any]:
         """Get a node and all its direct relationships."""
         if node_id not in self._nodes:
@@ -283,7 +344,8 @@ class InMemoryGraphRepository:
         nodes = {node_id: {"id": node_id, "data": center}}
         edges = {}
 
-        for eid, edge in self._edges.items():
+        for eid in self._edges_of(node_id):
+            edge = self._edges[eid]
             if edge.get("sketch_id") != sketch_id:
                 continue
             if edge.get("deleted_at") is not None:
@@ -337,7 +399,7 @@ class InMemoryGraphRepository:
         # Determine target node ID
         if new_node_id and new_node_id in old_node_ids:
             target_id = new_node_id
-            self._nodes[target_id].update(new_node_data)
+            self._update_node_data(target_id, new_node_data)
             self._nodes[target_id]["deleted_at"] = None
         else:
             target_id = self._generate_element_id("node")
@@ -347,15 +409,22 @@ class InMemoryGraphRepository:
                 "created_at": datetime.now(timezone.utc).isoformat(),
                 "deleted_at": None,
             }
+            self._index_node(target_id)
 
         # Transfer relationships
-        for eid, edge in list(self._edges.items()):
-            if edge.get("deleted_at") is not None:
+        for node_id in old_node_ids:
+            if node_id == target_id:
                 continue
-            if edge.get("source") in old_node_ids and edge.get("source") != target_id:
-                edge["source"] = target_id
-            if edge.get("target") in old_node_ids and edge.get("target") != target_id:
-                edge["target"] = target_id
+            for eid in self._edges_of(node_id):
+                edge = self._edges[eid]
+                if edge.get("deleted_at") is not None:
+                    continue
+                if edge.get("source") == node_id:
+                    edge["source"] = target_id
+                if edge.get("target") == node_id:
+                    edge["target"] = target_id
+                self._node_edges[node_id].pop(eid, None)
+                self._node_edges.setdefault(target_id, {})[eid] = None
 
         # Soft delete old nodes (except target)
         deleted_at = datetime.now(timezone.utc).isoformat()
@@ -390,6 +459,25 @@ class InMemoryGraphRepository:
             "errors": errors,
         }
 
+    def bulk_upsert_nodes(
+        self,
+        nodes: List[Dict[str, Any]],
+        sketch_id: str,
+        chunk_size: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """Upsert nodes grouped by type. Returns element IDs in input order."""
+        element_ids: List[Optional[str]] = []
+        errors = []
+
+        for idx, node_obj in enumerate(nodes):
+            if not node_obj.get("nodeType"):
+                element_ids.append(None)
+                errors.append(f"Node {idx}: Missing required field (nodeType)")
+                continue
+            element_ids.append(self.create_node(node_obj, sketch_id))
+
+        return {"element_ids": element_ids, "errors": errors}
+
     def batch_create_edges_by_element_id(
         self, edges: List[Dict[str, Any]], sketch_id: str
     ) -> Dict[str, Any]:
@@ -506,4 +594,6 @@ class InMemoryGraphRepository:
         """Clear all data (useful between tests)."""
         self._nodes.clear()
         self._edges.clear()
+        self._label_index.clear()
+        self._node_edges.clear()
         self._batch_operations.clear()
@@ -160,7 +160,8 @@ class TestBatchOperations:
             sketch_id="sketch-1",
         )
 
-        assert len(repo._batch_operations) == 1
+        assert len(repo._pending_nodes) == 1
+        assert repo._batch_operations == []
 
     def test_add_to_batch_relationship(self):
         mock_connection = MagicMock()
@@ -178,7 +179,7 @@ class TestBatchOperations:
             sketch_id="sketch-1",
         )
 
-        assert len(repo._batch_operations) == 1
+        assert len(repo._pending_relationships) == 1
 
     def test_add_to_batch_unknown_type_raises(self):
         mock_connection = MagicMock()
@@ -197,7 +198,7 @@ class TestBatchOperations:
             node_obj={"nodeLabel": "test1", "nodeType": "domain"},
             sketch_id="sketch-1",
         )
-        assert len(repo._batch_operations) == 1
+        assert len(repo._pending_nodes) == 1
 
         repo.add_to_batch(
             "node",
@@ -207,7 +208,7 @@ class TestBatchOperations:
 
         # Should have auto-flushed
         mock_connection.execute_batch.assert_called_once()
-        assert len(repo._batch_operations) == 0
+        assert len(repo._pending_nodes) == 0
 
     def test_flush_batch(self):
         mock_connection = MagicMock()
@@ -231,6 +232,51 @@ class TestBatchOperations:
         assert captured_args[1] == ("query2", {"p": 2})
         assert len(repo._batch_operations) == 0
 
+    def test_flush_batch_groups_nodes_before_relationships(self):
+        mock_connection = MagicMock()
+        repo = Neo4jGraphRepository(neo4j_connection=mock_connection)
+
+        repo.add_to_batch(
+            "relationship",
+            rel_obj={
+                "from_type": "domain",
+                "from_label": "a.com",
+                "to_type": "ip",
+                "to_label": "1.1.1.1",
+                "rel_label": "REL",
+            },
+            sketch_id="sketch-1",
+        )
+        repo.add_to_batch(
+            "node",
+            node_obj={"nodeLabel": "a.com", "nodeType": "domain"},
+            sketch_id="sketch-1",
+        )
+        repo.add_to_batch(
+            "node",
+            node_obj={"nodeLabel": "b.com", "nodeType": "domain"},
+            sketch_id="sketch-1",
+        )
+        repo.add_to_batch(
+            "node",
+            node_obj={"nodeLabel": "1.1.1.1", "nodeType": "ip"},
+            sketch_id="sketch-1",
+        )
+
+        repo.flush_batch()
+
+        statements = mock_connection.execute_batch.call_args[0][0]
+        # Two UNWIND node statements (domain, ip) followed by the relationship
+        assert len(statements) == 3
+        assert "UNWIND $rows" in statements[0][0]
+        assert "`domain`" in statements[0][0]
+        assert len(statements[0][1]["rows"]) == 2
+        assert "`ip`" in statements[1][0]
+        assert "MATCH (from:`domain`" in statements[2][0]
+        assert repo._pending_nodes == []
+        assert repo._pending_relationships == []
+        assert repo._batch_operations == []
+
     def test_flush_batch_empty(self):
         mock_connection = MagicMock()
         repo = Neo4jGraphRepository(neo4j_connection=mock_connection)
@@ -276,8 +322,7 @@ class TestBatchCreateNodes:
     def test_batch_create_nodes_success(self):
         mock_connection = MagicMock()
         mock_connection.execute_batch.return_value = [
-            [{"id": "id-1"}],
-            [{"id": "id-2"}],
+            [{"idx": 0, "id": "id-1"}, {"idx": 1, "id": "id-2"}],
         ]
         repo = Neo4jGraphRepository(neo4j_connection=mock_connection)
 
@@ -291,6 +336,27 @@ class TestBatchCreateNodes:
         assert result["nodes_created"] == 2
         assert result["node_ids"] == ["id-1", "id-2"]
         assert result["errors"] == []
+        # Same-type nodes share a single UNWIND statement
+        assert len(mock_connection.execute_batch.call_args[0][0]) == 1
+
+    def test_batch_create_nodes_keeps_input_order_across_types(self):
+        mock_connection = MagicMock()
+        # Results come back grouped by type, not in input order
+        mock_connection.execute_batch.return_value = [
+            [{"idx": 0, "id": "id-a"}, {"idx": 2, "id": "id-c"}],
+            [{"idx": 1, "id": "id-b"}],
+        ]
+        repo = Neo4jGraphRepository(neo4j_connection=mock_connection)
+
+        nodes = [
+            {"nodeLabel": "a.com", "nodeType": "domain"},
+            {"nodeLabel": "1.1.1.1", "nodeType": "ip"},
+            {"nodeLabel": "c.com", "nodeType": "domain"},
+        ]
+
+        result = repo.batch_create_nodes(nodes, sketch_id="sketch-1")
+
+        assert result["node_ids"] == ["id-a", "id-b", "id-c"]
 
     def test_batch_create_nodes_no_connection(self):
         repo = repo_without_connection()
@@ -324,6 +390,57 @@ class TestBatchCreateNodes:
         assert "Batch execution failed" in result["errors"][0]
 
 
+class TestBulkUpsertNodes:
+    def test_bulk_upsert_nodes_chunks_rows(self):
+        mock_connection = MagicMock()
+        mock_connection.execute_batch.return_value = []
+        repo = Neo4jGraphRepository(neo4j_connection=mock_connection)
+
+        nodes = [{"nodeLabel": f"{i}.com", "nodeType": "domain"} for i in range(5)]
+
+        repo.bulk_upsert_nodes(nodes, sketch_id="sketch-1", chunk_size=2)
+
+        statements = mock_connection.execute_batch.call_args[0][0]
+        assert [len(params["rows"]) for _, params in statements] == [2, 2, 1]
+        # Identical statement text for every chunk, so the query plan is reused
+        assert len({query for query, _ in statements}) == 1
+        assert statements[0][1]["sketch_id"] == "sketch-1"
+        assert statements[0][1]["rows"][0] == {
+            "idx": 0,
+            "node_label": "0.com",
+            "props": nodes[0],
+        }
+
+    def test_bulk_upsert_nodes_missing_type(self):
+        mock_connection = MagicMock()
+        mock_connection.execute_batch.return_value = [[{"idx": 1, "id": "id-1"}]]
+        repo = Neo4jGraphRepository(neo4j_connection=mock_connection)
+
+        result = repo.bulk_upsert_nodes(
+            [{"nodeLabel": "x"}, {"nodeLabel": "a.com", "nodeType": "domain"}],
+            sketch_id="sketch-1",
+        )
+
+        assert result["element_ids"] == [None, "id-1"]
+        assert "Missing required field" in result["errors"][0]
+
+    def test_bulk_upsert_nodes_no_connection(self):
+        repo = repo_without_connection()
+
+        result = repo.bulk_upsert_nodes(
+            [{"nodeLabel": "a.com", "nodeType": "domain"}], sketch_id="sketch-1"
+        )
+
+        assert result["element_ids"] == [None]
+        assert "No database connection" in result["errors"]
+
+    def test_set_unwind_chunk_size_invalid(self):
+        repo = Neo4jGraphRepository(neo4j_connection=MagicMock())
+
+        with pytest.raises(ValueError, match="Chunk size must be at least 1"):
+            repo.set_unwind_chunk_size(0)
+
+
 class TestBatchCreateEdges:
     def test_batch_create_edges_success(self):
         mock_connection = MagicMock()
@@ -344,6 +461,46 @@ class TestBatchCreateEdges:
         assert result["edges_created"] == 1
         assert result["errors"] == []
 
+    def test_batch_create_edges_buckets_by_label_tuple(self):
+        mock_connection = MagicMock()
+        repo = Neo4jGraphRepository(neo4j_connection=mock_connection)
+
+        edges = [
+            {
+                "from_type": "cidr",
+                "from_label": "10.0.0.0/30",
+                "to_type": "ip",
+                "to_label": f"10.0.0.{i}",
+                "rel_label": "HAS_IP",
+            }
+            for i in range(3)
+        ] + [
+            {
+                "from_type": "domain",
+                "from_label": "a.com",
+                "to_type": "ip",
+                "to_label": "10.0.0.1",
+                "rel_label": "RESOLVES_TO",
+            },
+            {"from_type": "domain", "rel_label": "BROKEN"},
+        ]
+
+        result = repo.batch_create_edges(edges, sketch_id="sketch-1")
+
+        statements = mock_connection.execute_batch.call_args[0][0]
+        assert len(statements) == 2
+        assert "UNWIND $rows" in statements[0][0]
+        assert "`HAS_IP`" in statements[0][0]
+        assert [row["to_label"] for row in statements[0][1]["rows"]] == [
+            "10.0.0.0",
+            "10.0.0.1",
+            "10.0.0.2",
+        ]
+        assert "`RESOLVES_TO`" in statements[1][0]
+        assert result["edges_created"] == 4
+        assert len(result["errors"]) == 1
+        assert "Edge 4" in result["errors"][0]
+
     def test_batch_create_edges_no_connection(self):
         repo = repo_without_connection()
 
@@ -379,6 +536,32 @@ class TestBatchCreateEdgesByElementId:
         assert result["edges_created"] == 1
         assert result["errors"] == []
 
+    def test_batch_create_edges_by_element_id_uses_stable_statement(self):
+        mock_connection = MagicMock()
+        repo = Neo4jGraphRepository(neo4j_connection=mock_connection)
+        repo.set_unwind_chunk_size(2)
+
+        edges = [
+            {
+                "from_element_id": f"elem-{i}",
+                "to_element_id": "elem-x",
+                "rel_label": "CONNECTS",
+            }
+            for i in range(3)
+        ]
+
+        result = repo.batch_create_edges_by_element_id(edges, sketch_id="sketch-1")
+
+        statements = mock_connection.execute_batch.call_args[0][0]
+        assert [len(params["rows"]) for _, params in statements] == [2, 1]
+        # No per-edge parameter suffixes: every chunk shares the same text
+        assert statements[0][0] == statements[1][0]
+        assert "_0" not in statements[0][0]
+        assert statements[0][1]["rows"][0]["props"]["sketch_id"] == "sketch-1"
+        # Input dictionaries are left untouched
+        assert "sketch_id" not in edges[0]
+        assert result["edges_created"] == 3
+
     def test_batch_create_edges_by_element_id_missing_fields(self):
         mock_connection = MagicMock()
         repo = Neo4jGraphRepository(neo4j_connection=mock_connection)
@@ -536,6 +719,52 @@ class TestGetSketchGraph:
         assert result == {"nodes": [], "edges": []}
 
 
+class TestStreamSketchGraph:
+    def test_iter_sketch_nodes_chunks_cursor(self):
+        mock_connection = MagicMock()
+        mock_connection.stream.return_value = iter(
+            [{"id": f"node-{i}", "labels": ["domain"], "data": {}} for i in range(5)]
+        )
+        repo = Neo4jGraphRepository(neo4j_connection=mock_connection)
+
+        chunks = list(repo.iter_sketch_nodes(sketch_id="sketch-1", chunk_size=2))
+
+        assert [len(chunk) for chunk in chunks] == [2, 2, 1]
+        assert chunks[2][0]["id"] == "node-4"
+        _, params = mock_connection.stream.call_args[0]
+        assert params == {"sketch_id": "sketch-1"}
+        assert mock_connection.stream.call_args[1]["fetch_size"] == 2
+
+    def test_iter_sketch_edges_is_anchored_on_sketch_nodes(self):
+        mock_connection = MagicMock()
+        mock_connection.stream.return_value = iter(
+            [
+                {
+                    "id": "edge-1",
+                    "type": "RESOLVES",
+                    "source": "node-1",
+                    "target": "node-2",
+                    "data": {},
+                }
+            ]
+        )
+        repo = Neo4jGraphRepository(neo4j_connection=mock_connection)
+
+        chunks = list(repo.iter_sketch_edges(sketch_id="sketch-1"))
+
+        assert len(chunks) == 1
+        query = mock_connection.stream.call_args[0][0]
+        assert "(a {sketch_id: $sketch_id})-[r]->(b {sketch_id: $sketch_id})" in query
+        assert "r.sketch_id" not in query
+        assert "$node_ids" not in query
+
+    def test_iter_sketch_nodes_no_connection(self):
+        repo = repo_without_connection()
+
+        assert list(repo.iter_sketch_nodes(sketch_id="sketch-1")) == []
+        assert list(repo.iter_sketch_edges(sketch_id="sketch-1")) == []
+
+
 class TestUpdateRelationship:
     def test_update_relationship_success(self):
         mock_connection = MagicMock()
@@ -1,7 +1,8 @@
 from datetime import datetime
 
 import pytest
-from flowsint_types import Domain, Ip
+from flowsint_types import Domain, Ip, Website
+from pydantic import ValidationError
 
 from flowsint_core.core.graph import (
     GraphEdge,
@@ -320,3 +321,96 @@ class TestGraphDictToGraphNodeErrors:
         node_dict = {"id": "123"}
         with pytest.raises(Exception, match="Could not find node data"):
             GraphSerializer.neo4j_dict_to_graph_node(node_dict)
+
+
+class TestCachedSerialization:
+    def test_fast_write_matches_graph_node_dump(self):
+        entity = Domain(domain="example.com", root=True)
+        fast = GraphSerializer.flowsint_type_to_neo4j_dict(
+            entity, created_at="2026-01-01T00:00:00"
+        )
+        graph_node = GraphNode(
+            id="",
+            nodeShape="circle",
+            nodeLabel=entity.nodeLabel,
+            nodeType="domain",
+            nodeProperties=entity,
+            nodeMetadata=NodeMetadata(created_at=datetime(2026, 1, 1)),
+        )
+        assert fast == GraphSerializer.graph_node_to_neo4j_dict(graph_node)
+        assert list(fast) == list(GraphSerializer.graph_node_to_neo4j_dict(graph_node))
+
+    def test_serialize_batch_shares_creation_date(self):
+        dicts = GraphSerializer.serialize_flowsint_types(
+            [Domain(domain="a.com"), Ip(address="1.1.1.1")]
+        )
+        assert (
+            dicts[0]["nodeMetadata.created_at"] == dicts[1]["nodeMetadata.created_at"]
+        )
+        assert dicts[1]["nodeType"] == "ip"
+
+    @pytest.mark.parametrize(
+        "entity", [Domain(domain="example.com", root=True), Ip(address="1.1.1.1")]
+    )
+    def test_trusted_read_matches_validated_read(self, entity):
+        node_dict = {
+            "id": "1",
+            "data": GraphSerializer.flowsint_type_to_neo4j_dict(entity),
+        }
+        trusted = GraphSerializer.neo4j_dict_to_graph_node(node_dict)
+        validated = GraphSerializer.neo4j_dict_to_graph_node(node_dict, validate=True)
+        assert trusted.model_dump() == validated.model_dump()
+        assert trusted.nodeProperties == entity
+
+    def test_fields_needing_conversion_are_validated(self):
+        entity = Website(url="https://example.com", domain=Domain(domain="example.com"))
+        node_dict = {
+            "id": "1",
+            "data": GraphSerializer.flowsint_type_to_neo4j_dict(entity),
+        }
+        node = GraphSerializer.neo4j_dict_to_graph_node(node_dict)
+        assert isinstance(node.nodeProperties.domain, Domain)
+        assert node.nodeProperties.url == entity.url
+
+    def test_missing_required_field_is_validated(self):
+        node_dict = {
+            "id": "1",
+            "data": {"nodeType": "ip", "nodeLabel": "1.1.1.1", "x": 1.0},
+        }
+        with pytest.raises(ValidationError):
+            GraphSerializer.neo4j_dict_to_graph_node(node_dict)
+
+    def test_validate_filters_invalid_fields(self):
+        node_dict = {
+            "id": "1",
+            "data": {
+                "nodeType": "website",
+                "nodeLabel": "https://example.com",
+                "nodeProperties.url": "https://example.com",
+                "nodeProperties.redirects": ["not a url"],
+            },
+        }
+        node = GraphSerializer.neo4j_dict_to_graph_node(node_dict, validate=True)
+        assert node.nodeProperties.redirects == []
+
+    def test_deserialize_resolves_each_type_once(self):
+        calls = []
+
+        def resolver(name):
+            calls.append(name)
+            return Domain
+
+        node_dicts = [
+            {
+                "id": str(i),
+                "data": {"nodeType": "domain", "nodeProperties.domain": f"{i}.com"},
+            }
+            for i in range(3)
+        ]
+        nodes = GraphSerializer.deserialize_nodes(node_dicts, type_resolver=resolver)
+        assert [node.nodeProperties.domain for node in nodes] == [
+            "0.com",
+            "1.com",
+            "2.com",
+        ]
+        assert calls == ["domain"]
@@ -205,6 +205,34 @@ class TestGetSketchGraph:
         assert len(result.nodes) == 2
 
 
+class TestIterSketchGraph:
+    def test_iter_sketch_graph_with_in_memory(self):
+        repo = InMemoryGraphRepository()
+        service = GraphService(sketch_id="sketch-1", repository=repo)
+
+        for i in range(3):
+            service.create_node(
+                GraphNode(
+                    id=str(i),
+                    nodeLabel=f"node{i}.com",
+                    nodeType="domain",
+                    nodeProperties=Domain(domain=f"node{i}.com"),
+                    nodeMetadata=NodeMetadata(),
+                )
+            )
+        service.create_relationship(
+            Domain(domain="node0.com"), Domain(domain="node1.com"), "LINKS_TO"
+        )
+
+        node_chunks = list(service.iter_sketch_nodes(chunk_size=2))
+        edge_chunks = list(service.iter_sketch_edges(chunk_size=2))
+
+        assert [len(chunk) for chunk in node_chunks] == [2, 1]
+        assert all(isinstance(node, GraphNode) for node in node_chunks[0])
+        assert len(edge_chunks) == 1
+        assert edge_chunks[0][0].label == "LINKS_TO"
+
+
 class TestGetNodesByIds:
     def test_get_nodes_by_ids(self):
         """Test that get_nodes_by_ids calls the repository correctly."""
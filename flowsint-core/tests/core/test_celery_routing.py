@@ -0,0 +1,198 @@
+"""Tests for the Celery queue routing, launch priorities and prefetch."""
+
+from types import SimpleNamespace
+
+import pytest
+import redis
+
+from flowsint_core.core import celery as celery_module
+from flowsint_core.core.celery import (
+    PRIORITY_BULK,
+    PRIORITY_INTERACTIVE,
+    PRIORITY_LOWEST,
+    celery,
+    configure_prefetch,
+    launch_finished,
+    launch_priority,
+    route_task,
+)
+
+
+class FakePipeline:
+    def __init__(self, client):
+        self._client = client
+        self._results = []
+
+    def incr(self, key):
+        self._results.append(self._client.incr(key))
+
+    def expire(self, key, seconds):
+        self._results.append(True)
+
+    def execute(self):
+        return self._results
+
+
+class FakeRedis:
+    def __init__(self):
+        self.values = {}
+
+    def pipeline(self):
+        return FakePipeline(self)
+
+    def incr(self, key):
+        self.values[key] = self.values.get(key, 0) + 1
+        return self.values[key]
+
+    def decr(self, key):
+        self.values[key] = self.values.get(key, 0) - 1
+        return self.values[key]
+
+    def delete(self, key):
+        self.values.pop(key, None)
+
+
+class BrokenRedis:
+    def pipeline(self):
+        raise redis.ConnectionError("down")
+
+
+class TestRouting:
+    def test_tasks_are_routed_by_workload(self):
+        assert route_task("emit_event", [], {}, {}) == {"queue": "events"}
+        assert route_task("run_flow", [], {}, {}) == {"queue": "flows"}
+        assert route_task("run_template_enricher", ["tpl"], {}, {}) == {
+            "queue": "enrichers"
+        }
+        assert route_task("maintain_logs", [], {}, {}) is None
+
+    def test_enrichers_are_routed_to_their_queue(self, monkeypatch):
+        from flowsint_enrichers.registry import ENRICHER_REGISTRY
+
+        docker_enricher = SimpleNamespace(queue="docker")
+        monkeypatch.setattr(
+            ENRICHER_REGISTRY,
+            "get_enricher_class",
+            lambda name: docker_enricher if name == "ip_to_ports" else None,
+        )
+
+        assert route_task("run_enricher", ["ip_to_ports"], {}, {}) == {
+            "queue": "docker"
+        }
+        assert route_task("run_enricher", ["unknown"], {}, {}) == {"queue": "enrichers"}
+        # Chunks of a launch run on the queue of their enricher
+        assert route_task("run_enricher_chunk", ["ip_to_ports"], {}, {}) == {
+            "queue": "docker"
+        }
+
+
+class TestLaunchPriority:
+    def test_interactive_launches_come_first(self):
+        client = FakeRedis()
+
+        assert launch_priority("user", 1, client) == PRIORITY_INTERACTIVE
+        assert client.values == {}
+
+    def test_bulk_launches_of_a_user_lower_their_priority(self):
+        client = FakeRedis()
+
+        priorities = [launch_priority("user", 100, client) for _ in range(3)]
+
+        assert priorities == [PRIORITY_BULK, PRIORITY_BULK + 1, PRIORITY_BULK + 2]
+        # Other users aren't affected
+        assert launch_priority("other", 100, client) == PRIORITY_BULK
+
+    def test_priority_is_capped(self):
+        client = FakeRedis()
+
+        for _ in range(20):
+            priority = launch_priority("user", 100, client)
+
+        assert priority == PRIORITY_LOWEST
+
+    def test_finished_launches_are_no_longer_counted(self):
+        client = FakeRedis()
+        launch_priority("user", 100, client)
+        launch_priority("user", 100, client)
+
+        launch_finished("user", 100, client)
+        launch_finished("user", 100, client)
+
+        assert client.values == {}
+        assert launch_priority("user", 100, client) == PRIORITY_BULK
+
+    def test_redis_errors_fall_back_to_bulk_priority(self):
+        assert launch_priority("user", 100, BrokenRedis()) == PRIORITY_BULK
+
+
+class TestPrefetch:
+    @pytest.fixture
+    def queues(self):
+        queues = celery.amqp.queues
+        yield queues
+        queues._consume_from = None
+
+    def _worker(self, prefetch_multiplier=None):
+        if prefetch_multiplier is None:
+            prefetch_multiplier = celery.conf.worker_prefetch_multiplier
+        return SimpleNamespace(app=celery, prefetch_multiplier=prefetch_multiplier)
+
+    def test_prefetch_is_set_from_the_consumed_queues(self, queues):
+        queues.select(["events"])
+        worker = self._worker()
+
+        configure_prefetch(sender=worker)
+
+        assert worker.prefetch_multiplier == 16
+
+    def test_lowest_prefetch_wins(self, queues):
+        queues.select(["events", "enrichers", "docker"])
+        worker = self._worker()
+
+        configure_prefetch(sender=worker)
+
+        assert worker.prefetch_multiplier == 1
+
+    def test_explicit_prefetch_is_kept(self, queues):
+        queues.select(["events"])
+        worker = self._worker(prefetch_multiplier=8)
+
+        configure_prefetch(sender=worker)
+
+        assert worker.prefetch_multiplier == 8
+
+
+def test_launch_tasks_are_uncounted_after_running(monkeypatch):
+    finished = []
+    monkeypatch.setattr(
+        celery_module,
+        "launch_finished",
+        lambda user_id, item_count: finished.append((user_id, item_count)),
+    )
+    task = SimpleNamespace(name="run_enricher")
+
+    celery_module._on_launch_finished(
+        sender=task, args=["domain_to_ip", [{}] * 10, "sketch", "user"]
+    )
+    celery_module._on_launch_finished(
+        sender=SimpleNamespace(name="emit_event"), args=["id", "sketch", "INFO", {}]
+    )
+
+    assert finished == [("user", 10)]
+
+
+def test_fanned_out_launches_stay_counted(monkeypatch):
+    finished = []
+    monkeypatch.setattr(
+        celery_module,
+        "launch_finished",
+        lambda user_id, item_count: finished.append((user_id, item_count)),
+    )
+
+    celery_module._on_launch_finished(
+        sender=SimpleNamespace(name="run_enricher"),
+        args=["ip_to_ports", [{}] * 1000, "sketch", "user"],
+        retval={"scan_id": "scan", "chunks": 5},
+    )
+
+    assert finished == []
@@ -0,0 +1,107 @@
+"""Tests for the per-item fan-out helper of Enricher."""
+
+import asyncio
+import threading
+import time
+from typing import List
+
+import pytest
+
+from flowsint_core.core.enricher_base import Enricher
+
+
+class FanOutEnricher(Enricher):
+    """Enricher doubling numbers one item at a time."""
+
+    max_concurrency = 3
+    item_timeout = 1.0
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    @classmethod
+    def name(cls) -> str:
+        return "fan_out_enricher"
+
+    @classmethod
+    def category(cls) -> str:
+        return "Test"
+
+    @classmethod
+    def key(cls) -> str:
+        return "value"
+
+    async def scan_item(self, item: int) -> int:
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            # Finish in reverse order to make sure results are reordered
+            await asyncio.sleep(0.01 * (10 - item))
+            if item == 4:
+                raise ValueError("bad item")
+            return item * 2
+        finally:
+            self.in_flight -= 1
+
+    async def scan(self, data: List[int]) -> List[int]:
+        return await self.map_items(data)
+
+
+@pytest.fixture
+def enricher():
+    return FanOutEnricher(sketch_id="test", scan_id="test")
+
+
+def test_results_keep_input_order(enricher):
+    results = asyncio.run(enricher.map_items([1, 2, 3]))
+    assert results == [2, 4, 6]
+
+
+def test_concurrency_is_bounded(enricher):
+    asyncio.run(enricher.map_items(list(range(8)), concurrency=2))
+    assert enricher.max_in_flight == 2
+
+    enricher.max_in_flight = 0
+    asyncio.run(enricher.map_items(list(range(8))))
+    assert enricher.max_in_flight == 3
+
+
+def test_failed_item_yields_none(enricher):
+    results = asyncio.run(enricher.map_items([3, 4, 5]))
+    assert results == [6, None, 10]
+
+
+def test_timed_out_item_yields_none(enricher):
+    async def slow(item):
+        await asyncio.sleep(1 if item == "slow" else 0)
+        return item
+
+    results = asyncio.run(enricher.map_items(["fast", "slow"], slow, timeout=0.05))
+    assert results == ["fast", None]
+
+
+def test_blocking_callable_runs_in_threads(enricher):
+    thread_ids = set()
+
+    def blocking(item):
+        thread_ids.add(threading.get_ident())
+        time.sleep(0.1)
+        return item
+
+    start = time.monotonic()
+    results = asyncio.run(enricher.map_items([1, 2, 3], blocking))
+    elapsed = time.monotonic() - start
+
+    assert results == [1, 2, 3]
+    assert threading.get_ident() not in thread_ids
+    assert elapsed < 0.25
+
+
+def test_scan_item_is_required_without_callable():
+    class PlainEnricher(FanOutEnricher):
+        scan_item = Enricher.scan_item
+
+    enricher = PlainEnricher(sketch_id="test", scan_id="test")
+    assert asyncio.run(enricher.map_items([1])) == [None]
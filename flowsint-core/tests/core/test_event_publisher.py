@@ -0,0 +1,110 @@
+"""Tests for the buffered log event publisher."""
+
+import json
+from unittest.mock import MagicMock
+
+import pytest
+
+from flowsint_core.core.enums import EventLevel
+from flowsint_core.core.event_publisher import EventPublisher
+
+
+class FakePipeline:
+    def __init__(self, redis):
+        self.redis = redis
+        self.commands = []
+
+    def publish(self, channel, message):
+        self.commands.append((channel, json.loads(message)))
+
+    def execute(self):
+        if self.redis.fail:
+            raise ConnectionError("redis is down")
+        self.redis.executed.append(self.commands)
+
+
+class FakeRedis:
+    def __init__(self):
+        self.fail = False
+        self.executed = []
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+
+def make_publisher(**kwargs):
+    publisher = EventPublisher(redis_url="redis://unused", **kwargs)
+    publisher._redis = FakeRedis()
+    # Keep the worker out of the way so tests control publishing
+    publisher._ensure_worker = MagicMock()
+    return publisher
+
+
+class TestEventPublisher:
+    def test_batches_share_one_pipeline(self):
+        publisher = make_publisher()
+        for i in range(3):
+            publisher.emit(f"log-{i}", "sketch", EventLevel.INFO, {"message": i})
+        publisher.emit_status("log-3", "sketch", EventLevel.COMPLETED, {})
+
+        publisher.flush()
+
+        assert len(publisher._redis.executed) == 1
+        batch = publisher._redis.executed[0]
+        assert [channel for channel, _ in batch] == ["sketch"] * 3 + ["sketch_status"]
+        assert batch[0][1]["payload"] == {"message": 0}
+        assert batch[3][1]["type"] == EventLevel.COMPLETED.value
+
+    def test_batch_size_splits_pipelines(self):
+        publisher = make_publisher(batch_size=2)
+        for i in range(5):
+            publisher.emit(f"log-{i}", "sketch", EventLevel.INFO, {})
+
+        publisher.flush()
+
+        assert [len(b) for b in publisher._redis.executed] == [2, 2, 1]
+
+    def test_drop_oldest_keeps_newest_events(self):
+        publisher = make_publisher(max_queue_size=2)
+        for i in range(4):
+            publisher.emit(f"log-{i}", "sketch", EventLevel.INFO, {})
+
+        publisher.flush()
+
+        ids = [event["id"] for _, event in publisher._redis.executed[0]]
+        assert ids == ["log-2", "log-3"]
+        assert publisher.dropped == 2
+
+    def test_drop_newest_keeps_oldest_events(self):
+        publisher = make_publisher(max_queue_size=2, overflow="drop_newest")
+        for i in range(4):
+            publisher.emit(f"log-{i}", "sketch", EventLevel.INFO, {})
+
+        publisher.flush()
+
+        ids = [event["id"] for _, event in publisher._redis.executed[0]]
+        assert ids == ["log-0", "log-1"]
+        assert publisher.dropped == 2
+
+    def test_redis_errors_drop_the_batch(self):
+        publisher = make_publisher()
+        publisher._redis.fail = True
+        publisher.emit("log-0", "sketch", EventLevel.INFO, {})
+
+        publisher.flush()
+
+        assert publisher.dropped == 1
+        assert publisher.queue_size == 0
+
+    def test_unknown_overflow_policy(self):
+        with pytest.raises(ValueError):
+            EventPublisher(overflow="explode")
+
+    def test_worker_publishes_in_background(self):
+        publisher = EventPublisher(redis_url="redis://unused", flush_interval=0.01)
+        publisher._redis = FakeRedis()
+
+        publisher.emit("log-0", "sketch", EventLevel.INFO, {})
+        publisher.shutdown()
+
+        assert publisher._redis.executed[0][0][1]["id"] == "log-0"
@@ -0,0 +1,116 @@
+"""Tests for the SSE event hub."""
+
+import asyncio
+
+import pytest
+
+from flowsint_core.core.events import EventHub, Subscription
+
+
+class FakePubSub:
+    """Pattern subscription fed from an asyncio queue."""
+
+    def __init__(self, redis):
+        self.redis = redis
+        self.closed = False
+
+    async def psubscribe(self, pattern):
+        if self.redis.fail_subscribe:
+            self.redis.fail_subscribe -= 1
+            raise ConnectionError("redis is down")
+        self.redis.patterns.append(pattern)
+
+    async def listen(self):
+        while True:
+            yield await self.redis.messages.get()
+
+    async def aclose(self):
+        self.closed = True
+
+
+class FakeRedis:
+    def __init__(self):
+        self.messages = asyncio.Queue()
+        self.patterns = []
+        self.pubsubs = []
+        self.fail_subscribe = 0
+
+    def pubsub(self, ignore_subscribe_messages=False):
+        pubsub = FakePubSub(self)
+        self.pubsubs.append(pubsub)
+        return pubsub
+
+    def publish(self, channel, data):
+        self.messages.put_nowait(
+            {"type": "pmessage", "channel": channel.encode(), "data": data.encode()}
+        )
+
+    async def aclose(self):
+        pass
+
+
+def make_hub(**kwargs):
+    hub = EventHub(redis_url="redis://unused", **kwargs)
+    hub._redis = FakeRedis()
+    return hub
+
+
+async def next_event(subscription):
+    return await asyncio.wait_for(subscription.get(), timeout=1)
+
+
+@pytest.mark.asyncio
+async def test_one_subscription_serves_every_client():
+    hub = make_hub()
+    async with hub.listen("sketch") as first, hub.listen("sketch") as second:
+        async with hub.listen("sketch_status") as status:
+            hub._redis.publish("sketch", '{"n": 1}')
+            hub._redis.publish("other", '{"n": 2}')
+            hub._redis.publish("sketch_status", '{"n": 3}')
+
+            assert await next_event(first) == '{"n": 1}'
+            assert await next_event(second) == '{"n": 1}'
+            assert await next_event(status) == '{"n": 3}'
+            assert len(hub._redis.pubsubs) == 1
+            assert hub.subscriber_count() == 3
+
+    assert hub.subscriber_count() == 0
+    await hub.close()
+    assert hub._redis is None
+
+
+def test_slow_client_drops_its_oldest_events():
+    subscription = Subscription("sketch", max_size=2)
+    for data in ("a", "b", "c"):
+        subscription.put(data)
+
+    assert subscription.dropped == 1
+    assert [subscription._queue.get_nowait() for _ in range(2)] == ["b", "c"]
+
+
+@pytest.mark.asyncio
+async def test_dispatch_only_queues_for_the_channel_clients():
+    hub = make_hub(client_queue_size=1)
+    async with hub.listen("sketch") as slow, hub.listen("sketch") as fast:
+        assert hub.dispatch("sketch", b"1") == 2
+        assert await next_event(fast) == "1"
+        assert hub.dispatch("sketch", b"2") == 2
+
+        assert await next_event(fast) == "2"
+        assert await next_event(slow) == "2"
+        assert slow.dropped == 1 and fast.dropped == 0
+        assert hub.dispatch("unknown", b"3") == 0
+    await hub.close()
+
+
+@pytest.mark.asyncio
+async def test_listener_reconnects(monkeypatch):
+    monkeypatch.setattr("flowsint_core.core.events.MIN_RECONNECT_DELAY", 0)
+    hub = make_hub()
+    hub._redis.fail_subscribe = 1
+    async with hub.listen("sketch") as subscription:
+        hub._redis.publish("sketch", "after reconnect")
+        assert await next_event(subscription) == "after reconnect"
+        assert hub._redis.pubsubs[0].closed
+        assert len(hub._redis.patterns) == 1
+    await hub.close()
@@ -0,0 +1,131 @@
+"""Tests for the chunked fan-out of enricher launches."""
+
+from types import SimpleNamespace
+
+import pytest
+
+from tests.factories import (
+    InvestigationFactory,
+    ProfileFactory,
+    ScanFactory,
+    SketchFactory,
+)
+from flowsint_core.core.enums import EventLevel
+from flowsint_core.core.fan_out import (
+    chunk_items,
+    chunk_result,
+    merge_chunk_results,
+    should_fan_out,
+)
+from flowsint_core.core.models import Scan
+from flowsint_core.tasks import enricher as enricher_tasks
+
+
+def test_only_large_launches_fan_out():
+    assert not should_fan_out(200, chunk_size=200)
+    assert should_fan_out(201, chunk_size=200)
+    # Disabled
+    assert not should_fan_out(10_000, chunk_size=0)
+
+
+def test_chunk_items():
+    chunks = chunk_items(list(range(7)), 3)
+
+    assert chunks == [[0, 1, 2], [3, 4, 5], [6]]
+
+
+def test_chunk_items_requires_a_positive_size():
+    with pytest.raises(ValueError):
+        chunk_items([1], 0)
+
+
+def test_merge_keeps_results_of_successful_chunks():
+    results, errors = merge_chunk_results(
+        [
+            chunk_result([{"address": "1.1.1.1"}]),
+            chunk_result([], "timeout"),
+            chunk_result([{"address": "8.8.8.8"}]),
+        ]
+    )
+
+    assert results == [{"address": "1.1.1.1"}, {"address": "8.8.8.8"}]
+    assert errors == ["Chunk 2: timeout"]
+
+
+class TestMergeFailures:
+    @pytest.fixture
+    def scan_id(self, db_session, monkeypatch):
+        for factory in (
+            ProfileFactory,
+            InvestigationFactory,
+            SketchFactory,
+            ScanFactory,
+        ):
+            factory._meta.sqlalchemy_session = db_session
+        monkeypatch.setattr(enricher_tasks, "SessionLocal", lambda: db_session)
+        return ScanFactory(status=EventLevel.RUNNING).id
+
+    @pytest.fixture
+    def finished(self, monkeypatch):
+        finished = []
+        monkeypatch.setattr(
+            enricher_tasks,
+            "launch_finished",
+            lambda user_id, item_count: finished.append((user_id, item_count)),
+        )
+        return finished
+
+    def _status(self, db_session, scan_id):
+        scan = db_session.get(Scan, scan_id)
+        return scan.status, scan.error
+
+    def test_failed_merge_fails_the_scan(
+        self, db_session, scan_id, finished, monkeypatch
+    ):
+        def save(scan, results):
+            raise OSError("disk full")
+
+        monkeypatch.setattr(
+            enricher_tasks,
+            "get_scan_result_store",
+            lambda: SimpleNamespace(save=save),
+        )
+
+        with pytest.raises(OSError):
+            enricher_tasks.merge_enricher_chunks(
+                [chunk_result([])], str(scan_id), "user", 1000
+            )
+
+        assert self._status(db_session, scan_id) == (
+            EventLevel.FAILED,
+            "An error occurred: disk full",
+        )
+        # Uncounted by the errback
+        assert finished == []
+
+    def test_failed_chord_fails_the_scan(self, db_session, scan_id, finished):
+        enricher_tasks.fail_enricher_chunks(
+            None, TimeoutError("time limit exceeded"), None, str(scan_id), "user", 1000
+        )
+
+        assert self._status(db_session, scan_id) == (
+            EventLevel.FAILED,
+            "An error occurred: time limit exceeded",
+        )
+        assert finished == [("user", 1000)]
+
+    def test_errback_keeps_the_merge_error(self, db_session, scan_id, finished):
+        scan = db_session.get(Scan, scan_id)
+        scan.status = EventLevel.FAILED
+        scan.error = "An error occurred: disk full"
+        db_session.commit()
+
+        enricher_tasks.fail_enricher_chunks(
+            None, OSError("disk full"), None, str(scan_id), "user", 1000
+        )
+
+        assert self._status(db_session, scan_id) == (
+            EventLevel.FAILED,
+            "An error occurred: disk full",
+        )
+        assert finished == [("user", 1000)]
@@ -0,0 +1,126 @@
+"""Tests for the flow compiler: ordering, DAG, branch expansion and cycles."""
+
+import pytest
+
+from flowsint_core.core.flow_compiler import (
+    FlowCompilationError,
+    FlowCompiler,
+    FlowCycleError,
+    compute_flow_branches,
+)
+from flowsint_core.core.types import FlowEdge, FlowNode
+
+
+def make_node(node_id, is_input=False, outputs=("output",)):
+    return FlowNode(
+        id=node_id,
+        data={
+            "type": "type" if is_input else "enricher",
+            "outputs": {"properties": [{"name": name} for name in outputs]},
+            "params": {"node": node_id},
+        },
+    )
+
+
+def make_edge(source, target):
+    return FlowEdge(id=f"{source}-{target}", source=source, target=target)
+
+
+def branch_paths(branches):
+    return [[step.nodeId for step in branch.steps] for branch in branches]
+
+
+def test_no_input_node_returns_error_branch():
+    branches = compute_flow_branches("value", [make_node("a")], [])
+    assert [branch.id for branch in branches] == ["error"]
+    assert branches[0].steps[0].type == "error"
+
+
+def test_tree_branches():
+    nodes = [make_node("in", is_input=True), make_node("a"), make_node("b")]
+    nodes += [make_node("c")]
+    edges = [make_edge("in", "a"), make_edge("a", "b"), make_edge("in", "c")]
+
+    branches = compute_flow_branches("example.com", nodes, edges)
+
+    # Shortest subtree first, then sorted by length
+    assert branch_paths(branches) == [["in", "c"], ["in", "a", "b"]]
+    assert [branch.id for branch in branches] == ["branch-0", "branch-0-1"]
+    assert branches[1].name == "Main Flow (Branch 1)"
+    assert branches[0].steps[0].outputs == {"output": "example.com"}
+    assert branches[0].steps[1].inputs == {"input": "example.com"}
+    assert [step.depth for step in branches[1].steps] == [0, 1, 2]
+
+
+def test_diamond_is_compiled_once_in_the_dag():
+    nodes = [make_node("in", is_input=True)] + [make_node(n) for n in "abcd"]
+    edges = [
+        make_edge("in", "a"),
+        make_edge("in", "b"),
+        make_edge("a", "c"),
+        make_edge("b", "c"),
+        make_edge("c", "d"),
+    ]
+    calls = []
+
+    def simulate(node, inputs):
+        calls.append(node.id)
+        return {"output": f"{inputs.get('input')}>{node.id}"}
+
+    compiler = FlowCompiler(nodes, edges, "x", simulate_outputs=simulate)
+    dag = compiler.dag()
+
+    assert sorted(calls) == ["a", "b", "c", "d"]
+    assert [step.nodeId for step in dag.steps] == ["in", "a", "b", "c", "d"]
+    step_c = dag.steps[3]
+    assert step_c.parents == ["a", "b"]
+    assert step_c.inputs == {"a": {"input": "x>a"}, "b": {"input": "x>b"}}
+    assert step_c.depth == 2
+    assert dag.steps[4].depth == 3
+    assert branch_paths(compiler.branches()) == [
+        ["in", "a", "c", "d"],
+        ["in", "b", "c", "d"],
+    ]
+
+
+def test_cycle_is_rejected():
+    nodes = [make_node("in", is_input=True)] + [make_node(n) for n in "abc"]
+    edges = [
+        make_edge("in", "a"),
+        make_edge("a", "b"),
+        make_edge("b", "c"),
+        make_edge("c", "a"),
+    ]
+    with pytest.raises(FlowCycleError) as error:
+        FlowCompiler(nodes, edges, "x")
+    assert error.value.cycle == ["a", "b", "c", "a"]
+
+
+def test_unreachable_nodes_and_dangling_edges_are_ignored():
+    nodes = [make_node("in", is_input=True), make_node("a"), make_node("b")]
+    # b -> a doesn't make a from reachable b, and "ghost" doesn't exist
+    edges = [make_edge("in", "a"), make_edge("b", "a"), make_edge("a", "ghost")]
+
+    compiler = FlowCompiler(nodes, edges, "x")
+
+    assert [step.nodeId for step in compiler.dag().steps] == ["in", "a"]
+    assert branch_paths(compiler.branches()) == [["in", "a"]]
+
+
+def test_branch_expansion_is_capped():
+    # A chain of 12 diamonds has 2**12 paths, for only 25 nodes
+    nodes = [make_node("n0", is_input=True)]
+    edges = []
+    for index in range(0, 24, 2):
+        nodes += [make_node(f"n{index + 1}"), make_node(f"n{index + 2}")]
+        edges += [
+            make_edge(f"n{index}", f"n{index + 1}"),
+            make_edge(f"n{index}", f"n{index + 2}"),
+            make_edge(f"n{index + 1}", f"n{index + 2}"),
+        ]
+
+    compiler = FlowCompiler(nodes, edges, "x")
+
+    assert len(compiler.dag().steps) == 25
+    with pytest.raises(FlowCompilationError, match="more than 100 branches"):
+        compiler.branches(max_branches=100)
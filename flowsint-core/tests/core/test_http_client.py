@@ -0,0 +1,149 @@
+"""Tests for the shared HTTP client pool."""
+
+import time
+from email.utils import format_datetime
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from flowsint_core.core.http_client import (
+    HttpClientPool,
+    TokenBucket,
+    parse_rate_limits,
+    parse_retry_after,
+)
+
+
+class TestParsing:
+    def test_retry_after_seconds(self):
+        assert parse_retry_after("3") == 3.0
+        assert parse_retry_after(" 1.5 ") == 1.5
+
+    def test_retry_after_http_date(self):
+        retry_at = datetime.now(timezone.utc) + timedelta(seconds=30)
+        delay = parse_retry_after(format_datetime(retry_at, usegmt=True))
+        assert 25 <= delay <= 30
+
+    def test_retry_after_invalid(self):
+        assert parse_retry_after(None) is None
+        assert parse_retry_after("soon") is None
+
+    def test_rate_limits(self):
+        limits = parse_rate_limits("API.Whoxy.com=2, api.dehashed.com=5/10,bad,x=y")
+        assert limits == {"api.whoxy.com": (2.0, 1), "api.dehashed.com": (5.0, 10)}
+
+
+class TestTokenBucket:
+    def test_burst_then_wait(self):
+        bucket = TokenBucket(rate=10, burst=2)
+        assert bucket.reserve() == 0
+        assert bucket.reserve() == 0
+        assert bucket.reserve() == pytest.approx(0.1, abs=0.02)
+
+    def test_defer_blocks_bucket(self):
+        bucket = TokenBucket(rate=100, burst=5)
+        bucket.defer(2)
+        assert bucket.reserve() == pytest.approx(2, abs=0.05)
+
+    def test_rate_must_be_positive(self):
+        with pytest.raises(ValueError):
+            TokenBucket(rate=0)
+
+
+class TestHttpClientPool:
+    @pytest.mark.asyncio
+    async def test_client_is_reused_within_loop(self):
+        pool = HttpClientPool(rate_limits={})
+        assert pool.client() is pool.client()
+        await pool.aclose()
+
+    @pytest.mark.asyncio
+    async def test_retries_on_retry_after(self, httpx_mock):
+        httpx_mock.add_response(
+            url="https://api.example.com/",
+            status_code=429,
+            headers={"Retry-After": "0"},
+        )
+        httpx_mock.add_response(url="https://api.example.com/", json={"ok": True})
+        pool = HttpClientPool(rate_limits={})
+
+        response = await pool.get("https://api.example.com/")
+
+        assert response.status_code == 200
+        assert len(httpx_mock.get_requests()) == 2
+        await pool.aclose()
+
+    @pytest.mark.asyncio
+    async def test_gives_up_after_max_retries(self, httpx_mock):
+        httpx_mock.add_response(
+            url="https://api.example.com/",
+            status_code=503,
+            headers={"Retry-After": "0"},
+            is_reusable=True,
+        )
+        pool = HttpClientPool(rate_limits={}, max_retries=2)
+
+        response = await pool.get("https://api.example.com/")
+
+        assert response.status_code == 503
+        assert len(httpx_mock.get_requests()) == 3
+        await pool.aclose()
+
+    @pytest.mark.asyncio
+    async def test_post_is_not_retried_by_default(self, httpx_mock):
+        httpx_mock.add_response(
+            url="https://api.example.com/",
+            status_code=503,
+            headers={"Retry-After": "0"},
+            is_reusable=True,
+        )
+        pool = HttpClientPool(rate_limits={})
+
+        response = await pool.post("https://api.example.com/")
+        assert response.status_code == 503
+        assert len(httpx_mock.get_requests()) == 1
+
+        await pool.post("https://api.example.com/", max_retries=1)
+        assert len(httpx_mock.get_requests()) == 3
+        await pool.aclose()
+
+    @pytest.mark.asyncio
+    async def test_retry_after_is_capped(self, httpx_mock):
+        httpx_mock.add_response(
+            url="https://api.example.com/",
+            status_code=429,
+            headers={"Retry-After": "3600"},
+        )
+        httpx_mock.add_response(url="https://api.example.com/")
+        pool = HttpClientPool(rate_limits={}, max_retry_delay=0.01)
+
+        start = time.monotonic()
+        response = await pool.get("https://api.example.com/")
+
+        assert response.status_code == 200
+        assert time.monotonic() - start < 1
+        await pool.aclose()
+
+    @pytest.mark.asyncio
+    async def test_rate_limit_per_host(self, httpx_mock):
+        httpx_mock.add_response(url="https://api.example.com/", is_reusable=True)
+        pool = HttpClientPool(rate_limits={"api.example.com": (20.0, 1)})
+
+        start = time.monotonic()
+        for _ in range(3):
+            await pool.get("https://api.example.com/")
+        elapsed = time.monotonic() - start
+
+        assert elapsed >= 0.09
+        await pool.aclose()
+
+    @pytest.mark.asyncio
+    async def test_rate_limit_key_splits_buckets(self):
+        pool = HttpClientPool(rate_limits={"api.example.com": (1.0, 1)})
+
+        first = pool._bucket("api.example.com", "key-a")
+        second = pool._bucket("api.example.com", "key-b")
+
+        assert first is not second
+        assert first is pool._bucket("api.example.com", "key-a")
+        assert pool._bucket("other.example.com", None) is None
@@ -25,6 +25,7 @@ def mock_db_session():
     session = Mock()
     session.add = Mock()
     session.add_all = Mock()
+    session.execute = MagicMock()
     session.commit = Mock()
     session.refresh = Mock()
     session.rollback = Mock()
@@ -44,9 +45,9 @@ def mock_get_db(mock_db_session):
 
 @pytest.fixture
 def mock_emit_event():
-    """Mock the emit_event_task."""
-    with patch('flowsint_core.core.logger.emit_event_task') as mock:
-        mock.apply = Mock()
+    """Mock the event publisher."""
+    mock = Mock()
+    with patch('flowsint_core.core.logger.get_event_publisher', return_value=mock):
         yield mock
 
 
@@ -111,9 +112,9 @@ class TestLoggingMethods:
 
         logger_instance.info(sketch_id, message)
 
-        # Event should be emitted immediately
-        mock_emit_event.apply.assert_called_once()
-        call_args = mock_emit_event.apply.call_args[1]['args']
+        # Event should be queued for publishing immediately
+        mock_emit_event.emit.assert_called_once()
+        call_args = mock_emit_event.emit.call_args[0]
         assert call_args[1] == sketch_id
         assert call_args[2] == EventLevel.INFO
         assert call_args[3] == message
@@ -128,7 +129,7 @@ class TestLoggingMethods:
 
         logger_instance.error(sketch_id, message)
 
-        call_args = mock_emit_event.apply.call_args[1]['args']
+        call_args = mock_emit_event.emit.call_args[0]
         assert call_args[2] == EventLevel.FAILED
 
     def test_warn_logs_correctly(self, logger_instance, mock_emit_event):
@@ -138,7 +139,7 @@ class TestLoggingMethods:
 
         logger_instance.warn(sketch_id, message)
 
-        call_args = mock_emit_event.apply.call_args[1]['args']
+        call_args = mock_emit_event.emit.call_args[0]
         assert call_args[2] == EventLevel.WARNING
 
     def test_debug_logs_correctly(self, logger_instance, mock_emit_event):
@@ -148,7 +149,7 @@ class TestLoggingMethods:
 
         logger_instance.debug(sketch_id, message)
 
-        call_args = mock_emit_event.apply.call_args[1]['args']
+        call_args = mock_emit_event.emit.call_args[0]
         assert call_args[2] == EventLevel.DEBUG
 
     def test_success_logs_correctly(self, logger_instance, mock_emit_event):
@@ -158,7 +159,7 @@ class TestLoggingMethods:
 
         logger_instance.success(sketch_id, message)
 
-        call_args = mock_emit_event.apply.call_args[1]['args']
+        call_args = mock_emit_event.emit.call_args[0]
         assert call_args[2] == EventLevel.SUCCESS
 
     def test_completed_logs_correctly(self, logger_instance, mock_emit_event):
@@ -168,7 +169,7 @@ class TestLoggingMethods:
 
         logger_instance.completed(sketch_id, message)
 
-        call_args = mock_emit_event.apply.call_args[1]['args']
+        call_args = mock_emit_event.emit.call_args[0]
         assert call_args[2] == EventLevel.COMPLETED
 
     def test_pending_logs_correctly(self, logger_instance, mock_emit_event):
@@ -178,7 +179,7 @@ class TestLoggingMethods:
 
         logger_instance.pending(sketch_id, message)
 
-        call_args = mock_emit_event.apply.call_args[1]['args']
+        call_args = mock_emit_event.emit.call_args[0]
         assert call_args[2] == EventLevel.PENDING
 
     def test_graph_append_logs_correctly(self, logger_instance, mock_emit_event):
@@ -188,7 +189,7 @@ class TestLoggingMethods:
 
         logger_instance.graph_append(sketch_id, message)
 
-        call_args = mock_emit_event.apply.call_args[1]['args']
+        call_args = mock_emit_event.emit.call_args[0]
         assert call_args[2] == EventLevel.GRAPH_APPEND
 
 
@@ -216,7 +217,7 @@ class TestBatchInsertion:
         time.sleep(0.1)  # Give it time to flush
 
         # Verify database operations
-        mock_db_session.add_all.assert_called_once()
+        mock_db_session.execute.assert_called_once()
         mock_db_session.commit.assert_called_once()
 
     def test_manual_flush(self, logger_instance, mock_db_session):
@@ -236,7 +237,7 @@ class TestBatchInsertion:
         assert logger_instance.queue_size == 0
 
         # Verify database operations
-        mock_db_session.add_all.assert_called_once()
+        mock_db_session.execute.assert_called_once()
         mock_db_session.commit.assert_called_once()
 
     def test_batch_worker_flushes_periodically(self, mock_get_db, mock_emit_event, mock_db_session):
@@ -258,7 +259,7 @@ class TestBatchInsertion:
         time.sleep(0.5)
 
         # Verify flush happened
-        assert mock_db_session.add_all.call_count >= 1
+        assert mock_db_session.execute.call_count >= 1
 
         logger.shutdown()
 
@@ -267,7 +268,7 @@ class TestBatchInsertion:
         logger_instance.flush()
 
         # No database operations should occur
-        mock_db_session.add_all.assert_not_called()
+        mock_db_session.execute.assert_not_called()
         mock_db_session.commit.assert_not_called()
 
 
@@ -293,7 +294,7 @@ class TestThreadSafety:
 
         # All logs should be queued or processed
         expected_total = num_threads * logs_per_thread
-        assert mock_emit_event.apply.call_count == expected_total
+        assert mock_emit_event.emit.call_count == expected_total
 
     def test_concurrent_flush(self, logger_instance, mock_db_session):
         """Test that concurrent flush operations are safe."""
@@ -318,7 +319,7 @@ class TestThreadSafety:
         assert logger_instance.queue_size == 0
 
         # At least one flush should have happened
-        assert mock_db_session.add_all.call_count >= 1
+        assert mock_db_session.execute.call_count >= 1
 
 
 class TestShutdown:
@@ -344,7 +345,7 @@ class TestShutdown:
         assert logger.queue_size == 0
 
         # Database operations should have occurred
-        mock_db_session.add_all.assert_called_once()
+        mock_db_session.execute.assert_called_once()
         mock_db_session.commit.assert_called_once()
 
     def test_shutdown_stops_worker_thread(self, mock_get_db, mock_emit_event):
@@ -380,7 +381,7 @@ class TestErrorHandling:
 
     def test_event_emission_error_does_not_crash(self, logger_instance, mock_emit_event):
         """Test that event emission errors don't crash the logger."""
-        mock_emit_event.apply.side_effect = Exception("Event emission error")
+        mock_emit_event.emit.side_effect = Exception("Event emission error")
 
         sketch_id = str(uuid4())
 
@@ -410,7 +411,7 @@ class TestPerformance:
         assert elapsed < 1.0
 
         # All events should be emitted
-        assert mock_emit_event.apply.call_count == num_logs
+        assert mock_emit_event.emit.call_count == num_logs
 
     def test_batch_insertion_is_efficient(self, logger_instance, mock_db_session):
         """Test that batch insertion reduces database calls."""
@@ -424,4 +425,4 @@ class TestPerformance:
 
         # Should make fewer calls than number of logs (due to batching)
         # With batch_size=5 and 50 logs, should make ~10 batch inserts
-        assert mock_db_session.add_all.call_count <= 15  # Some tolerance
+        assert mock_db_session.execute.call_count <= 15  # Some tolerance
@@ -0,0 +1,299 @@
+"""Tests for FlowOrchestrator scheduling, caching and input dedup."""
+
+import asyncio
+import json
+
+import pytest
+
+from flowsint_core.core import orchestrator as orchestrator_module
+from flowsint_core.core.orchestrator import FlowOrchestrator
+from flowsint_core.core.types import FlowBranch, FlowDag, FlowDagStep, FlowStep
+
+
+class FakeEnricher:
+    """Enricher stand-in that records calls and tracks concurrency."""
+
+    def __init__(self, node_name, registry):
+        self._name = node_name
+        self.registry = registry
+        self.calls = []
+
+    def name(self):
+        return self._name
+
+    async def execute(self, values):
+        self.calls.append(list(values))
+        self.registry.in_flight += 1
+        self.registry.max_in_flight = max(
+            self.registry.max_in_flight, self.registry.in_flight
+        )
+        try:
+            await asyncio.sleep(0.05)
+            if self._name in self.registry.failing:
+                raise RuntimeError(f"{self._name} exploded")
+            return [f"{value}>{self._name}" for value in values]
+        finally:
+            self.registry.in_flight -= 1
+
+
+class FakeRegistry:
+    """Minimal ENRICHER_REGISTRY replacement handing out FakeEnricher."""
+
+    def __init__(self, failing=()):
+        self.failing = set(failing)
+        self.instances = {}
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def enricher_exists(self, name):
+        return True
+
+    def get_enricher(self, name, sketch_id, scan_id, vault=None, params=None):
+        enricher = FakeEnricher(name, self)
+        self.instances.setdefault(name, []).append(enricher)
+        return enricher
+
+
+def make_step(node_id, branch_id, depth, step_type="enricher"):
+    return FlowStep(
+        nodeId=node_id,
+        type=step_type,
+        inputs={},
+        outputs={},
+        status="pending",
+        branchId=branch_id,
+        depth=depth,
+    )
+
+
+def make_branch(branch_id, node_ids):
+    steps = [make_step("type-0", branch_id, 0, step_type="type")]
+    steps += [
+        make_step(node_id, branch_id, depth)
+        for depth, node_id in enumerate(node_ids, start=1)
+    ]
+    return FlowBranch(id=branch_id, name=f"Branch {branch_id}", steps=steps)
+
+
+def make_dag(parents_by_node):
+    """FlowDag of enricher nodes, given the parents of each in order."""
+    steps = [FlowDagStep(nodeId="type-0", type="type", outputs={}, depth=0)]
+    depths = {"type-0": 0}
+    for node_id, parents in parents_by_node.items():
+        parents = parents or ["type-0"]
+        depths[node_id] = 1 + max(depths[parent] for parent in parents)
+        steps.append(
+            FlowDagStep(
+                nodeId=node_id,
+                type="enricher",
+                outputs={},
+                depth=depths[node_id],
+                parents=parents,
+            )
+        )
+    return FlowDag(steps=steps)
+
+
+@pytest.fixture
+def registry(monkeypatch, tmp_path):
+    monkeypatch.chdir(tmp_path)
+    fake = FakeRegistry()
+    monkeypatch.setattr(orchestrator_module, "ENRICHER_REGISTRY", fake)
+    return fake
+
+
+class TestFlowOrchestratorConcurrency:
+    def test_independent_branches_run_concurrently(self, registry):
+        branches = [make_branch(str(i), [f"e{i}-1"]) for i in range(4)]
+        flow = FlowOrchestrator("sketch", "scan", branches, max_concurrency=4)
+
+        results = flow.scan(["a"])
+
+        assert registry.max_in_flight == 4
+        assert [b["id"] for b in results["branches"]] == ["0", "1", "2", "3"]
+        for i, branch in enumerate(results["branches"]):
+            assert branch["steps"][0]["status"] == "completed"
+            assert branch["steps"][0]["outputs"] == [f"a>e{i}"]
+
+    def test_max_concurrency_is_respected(self, registry):
+        branches = [make_branch(str(i), [f"e{i}-1"]) for i in range(5)]
+        flow = FlowOrchestrator("sketch", "scan", branches, max_concurrency=2)
+
+        flow.scan(["a"])
+
+        assert registry.max_in_flight == 2
+
+    def test_shared_prefix_runs_once(self, registry):
+        branches = [
+            make_branch("1", ["root-1", "left-2"]),
+            make_branch("2", ["root-1", "right-3"]),
+        ]
+        flow = FlowOrchestrator("sketch", "scan", branches)
+
+        results = flow.scan(["a"])
+
+        # Two branches were compiled, so two instances exist, but only the
+        # one registered under the shared nodeId is executed, and only once
+        root_calls = [c for e in registry.instances["root"] for c in e.calls]
+        assert root_calls == [["a"]]
+        assert results["branches"][0]["steps"][1]["outputs"] == ["a>root>left"]
+        assert results["branches"][1]["steps"][1]["outputs"] == ["a>root>right"]
+        assert results["results"]["root-1"] == ["a>root"]
+
+    def test_failure_only_stops_its_own_branch(self, registry):
+        registry.failing.add("bad")
+        branches = [
+            make_branch("1", ["bad-1", "after-2"]),
+            make_branch("2", ["good-3", "next-4"]),
+        ]
+        flow = FlowOrchestrator("sketch", "scan", branches)
+
+        results = flow.scan(["a"])
+
+        failed, healthy = results["branches"]
+        assert len(failed["steps"]) == 1
+        assert failed["steps"][0]["status"] == "error"
+        assert "bad exploded" in failed["steps"][0]["error"]
+        assert registry.instances["after"][0].calls == []
+        assert results["results"]["bad-1"] == {"error": failed["steps"][0]["error"]}
+        assert [s["status"] for s in healthy["steps"]] == ["completed", "completed"]
+
+    def test_empty_inputs_propagate_as_errors(self, registry):
+        branches = [make_branch("1", ["first-1", "second-2"])]
+        flow = FlowOrchestrator("sketch", "scan", branches)
+
+        results = flow.scan([])
+
+        steps = results["branches"][0]["steps"]
+        assert [s["error"] for s in steps] == ["No inputs available"] * 2
+
+
+class TestFlowOrchestratorDag:
+    def test_each_node_runs_once_on_all_its_parents(self, registry):
+        dag = make_dag(
+            {
+                "root-1": [],
+                "left-2": ["root-1"],
+                "right-3": ["root-1"],
+                "join-4": ["left-2", "right-3"],
+            }
+        )
+        flow = FlowOrchestrator("sketch", "scan", flow_dag=dag)
+
+        results = flow.scan(["a"])
+
+        join_calls = [c for e in registry.instances["join"] for c in e.calls]
+        assert join_calls == [["a>root>left", "a>root>right"]]
+        assert [step["nodeId"] for step in results["steps"]] == [
+            "root-1",
+            "left-2",
+            "right-3",
+            "join-4",
+        ]
+        assert results["branches"] == []
+
+    def test_failed_parent_only_drops_its_outputs(self, registry):
+        registry.failing.add("bad")
+        dag = make_dag(
+            {
+                "bad-1": [],
+                "good-2": [],
+                "join-3": ["bad-1", "good-2"],
+                "after-4": ["bad-1"],
+            }
+        )
+        flow = FlowOrchestrator("sketch", "scan", flow_dag=dag)
+
+        results = flow.scan(["a"])
+
+        assert results["results"]["join-3"] == ["a>good>join"]
+        assert registry.instances["after"][0].calls == []
+        assert [step["nodeId"] for step in results["steps"]] == [
+            "bad-1",
+            "good-2",
+            "join-3",
+        ]
+
+
+class TestFlowOrchestratorDedup:
+    def test_duplicate_inputs_are_enriched_once(self, registry):
+        flow = FlowOrchestrator("sketch", "scan", [make_branch("1", ["e-1"])])
+
+        results = flow.scan(["a", "b", "a"])
+
+        assert registry.instances["e"][0].calls == [["a", "b"]]
+        assert results["results"]["e-1"] == ["a>e", "b>e"]
+
+    def test_same_enricher_shares_results_across_nodes(self, registry):
+        branches = [make_branch("1", ["e-1"]), make_branch("2", ["e-2"])]
+        flow = FlowOrchestrator("sketch", "scan", branches)
+
+        results = flow.scan(["a", "b"])
+
+        calls = [c for e in registry.instances["e"] for c in e.calls]
+        assert calls == [["a", "b"]]
+        assert results["results"]["e-1"] == results["results"]["e-2"]
+
+    def test_item_key_uses_type_and_primary_field(self):
+        from flowsint_types.domain import Domain
+        from flowsint_types.ip import Ip
+
+        assert FlowOrchestrator.item_key(Domain(domain="a.com")) == "Domain:a.com"
+        assert FlowOrchestrator.item_key(
+            Domain(domain="a.com", nodeLabel="other")
+        ) == FlowOrchestrator.item_key(Domain(domain="a.com"))
+        assert FlowOrchestrator.item_key(Ip(address="1.1.1.1")) == "Ip:1.1.1.1"
+        assert FlowOrchestrator.item_key({"b": 1, "a": 2}) == FlowOrchestrator.item_key(
+            {"a": 2, "b": 1}
+        )
+
+
+class TestExecutionJournal:
+    def read_journal(self, flow):
+        with open(flow.execution_log_file, encoding="utf-8") as f:
+            return [json.loads(line) for line in f]
+
+    def test_journal_is_append_only_jsonl(self, registry):
+        branches = [make_branch("1", ["first-1", "second-2"])]
+        flow = FlowOrchestrator("sketch", "scan", branches)
+
+        flow.scan(["a"])
+
+        records = self.read_journal(flow)
+        assert flow.execution_log_file.endswith(".jsonl")
+        assert [r["record"] for r in records] == [
+            "header",
+            "status",
+            "step",
+            "step",
+            "summary",
+        ]
+        assert records[0]["total_steps"] == 2
+        assert records[2]["outputs"] == ["a>first"]
+        summary = records[-1]
+        assert summary["summary"]["completed_steps"] == 2
+        assert summary["branches"][0]["steps"][1] == {
+            "nodeId": "second-2",
+            "status": "completed",
+            "error": None,
+        }
+
+    def test_large_payloads_are_digested(self, registry):
+        branches = [make_branch("1", ["first-1"])]
+        flow = FlowOrchestrator("sketch", "scan", branches, max_log_payload_bytes=20)
+
+        flow.scan(["short", "a-much-longer-input-value"])
+
+        step = self.read_journal(flow)[2]
+        assert step["inputs"]["count"] == 2
+        assert len(step["inputs"]["sha256"]) == 64
+        assert step["outputs"]["count"] == 2
+
+    def test_payload_limit_can_be_disabled(self, registry):
+        branches = [make_branch("1", ["first-1"])]
+        flow = FlowOrchestrator("sketch", "scan", branches, max_log_payload_bytes=None)
+
+        flow.scan(["x" * 1000])
+
+        step = self.read_journal(flow)[2]
+        assert step["inputs"] == ["x" * 1000]
@@ -0,0 +1,132 @@
+"""Tests for the persistent enrichment result cache."""
+
+import asyncio
+from typing import List
+
+import pytest
+from flowsint_types.domain import Domain
+from flowsint_types.ip import Ip
+
+from flowsint_core.core.enricher_base import Enricher
+from flowsint_core.core.result_cache import (
+    InMemoryResultCache,
+    set_result_cache,
+    stable_hash,
+)
+
+
+class CachedResolver(Enricher):
+    """Fake resolver counting lookups."""
+
+    InputType = Domain
+    OutputType = Ip
+    cache_ttl = 60
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.lookups: List[str] = []
+
+    @classmethod
+    def name(cls) -> str:
+        return "cached_resolver"
+
+    @classmethod
+    def category(cls) -> str:
+        return "Test"
+
+    @classmethod
+    def key(cls) -> str:
+        return "domain"
+
+    async def scan_item(self, domain: Domain) -> Ip | None:
+        self.lookups.append(domain.domain)
+        if domain.domain.startswith("bad"):
+            return None
+        return Ip(address="10.0.0.1")
+
+    async def scan(self, data: List[Domain]) -> List[Ip]:
+        return await self.map_items(data)
+
+
+@pytest.fixture
+def cache():
+    cache = InMemoryResultCache()
+    set_result_cache(cache)
+    yield cache
+    set_result_cache(None)
+
+
+def make_enricher(**params):
+    return CachedResolver(
+        sketch_id="test",
+        scan_id="test",
+        params_schema=[
+            {"name": "mode", "type": "string"},
+            {"name": "API_KEY", "type": "vaultSecret"},
+        ],
+        params=params,
+    )
+
+
+class TestStableHash:
+    def test_ignores_dict_key_order(self):
+        assert stable_hash({"a": 1, "b": 2}) == stable_hash({"b": 2, "a": 1})
+
+    def test_models_hash_by_type_and_content(self):
+        assert stable_hash(Domain(domain="a.com")) == stable_hash(
+            Domain(domain="a.com")
+        )
+        assert stable_hash(Domain(domain="a.com")) != stable_hash(
+            Domain(domain="b.com")
+        )
+
+
+class TestInMemoryResultCache:
+    def test_expired_entries_are_misses(self):
+        cache = InMemoryResultCache()
+        cache.set_many({"fresh": 1}, ttl=60)
+        cache.set_many({"stale": 2}, ttl=0)
+        assert cache.get_many(["fresh", "stale", "missing"]) == [1, None, None]
+
+
+class TestMapItemsCache:
+    def test_second_run_hits_cache(self, cache):
+        domains = [Domain(domain="a.com"), Domain(domain="b.com")]
+
+        first = make_enricher()
+        asyncio.run(first.scan(domains))
+        second = make_enricher()
+        results = asyncio.run(second.scan(domains))
+
+        assert second.lookups == []
+        assert all(isinstance(ip, Ip) for ip in results)
+        assert cache.stats("cached_resolver") == {"hits": 2, "misses": 2}
+
+    def test_failed_items_are_not_cached(self, cache):
+        domains = [Domain(domain="bad.com")]
+
+        asyncio.run(make_enricher().scan(domains))
+        enricher = make_enricher()
+        asyncio.run(enricher.scan(domains))
+
+        assert enricher.lookups == ["bad.com"]
+
+    def test_params_change_the_key_but_secrets_do_not(self, cache):
+        domains = [Domain(domain="a.com")]
+        asyncio.run(make_enricher(mode="fast", API_KEY="one").scan(domains))
+
+        rotated = make_enricher(mode="fast", API_KEY="two")
+        asyncio.run(rotated.scan(domains))
+        other_mode = make_enricher(mode="slow", API_KEY="one")
+        asyncio.run(other_mode.scan(domains))
+
+        assert rotated.lookups == []
+        assert other_mode.lookups == ["a.com"]
+
+    def test_cache_disabled_without_ttl(self, cache):
+        enricher = make_enricher()
+        enricher.cache_ttl = None
+        asyncio.run(enricher.scan([Domain(domain="a.com")]))
+        asyncio.run(enricher.scan([Domain(domain="a.com")]))
+
+        assert enricher.lookups == ["a.com", "a.com"]
@@ -0,0 +1,170 @@
+"""Tests for scan result storage."""
+
+from datetime import timedelta
+
+import pytest
+
+from tests.factories import (
+    InvestigationFactory,
+    InvestigationUserRoleFactory,
+    ProfileFactory,
+    ScanFactory,
+    SketchFactory,
+)
+from flowsint_core.core.blob_store import BlobNotFoundError, LocalBlobStore
+from flowsint_core.core.models import Scan
+from flowsint_core.core.repositories import (
+    InvestigationRepository,
+    ScanRepository,
+    SketchRepository,
+)
+from flowsint_core.core.scan_results import ScanResultStore
+from flowsint_core.core.services.exceptions import NotFoundError
+from flowsint_core.core.services.scan_service import ScanService
+from flowsint_core.core.types import Role
+
+
+def make_results(count):
+    return [
+        {"domain": f"sub{i}.example.com", "ip": f"10.0.0.{i % 256}"}
+        for i in range(count)
+    ]
+
+
+@pytest.fixture
+def blob_store(tmp_path):
+    return LocalBlobStore(str(tmp_path))
+
+
+@pytest.fixture
+def store(blob_store):
+    return ScanResultStore(blob_store, inline_max_bytes=1024, preview_items=2)
+
+
+class TestLocalBlobStore:
+    def test_round_trip(self, blob_store):
+        blob_store.put("abcdef", b"data")
+
+        assert blob_store.exists("abcdef")
+        assert blob_store.get("abcdef") == b"data"
+
+        ((key, written_at),) = blob_store.iter_blobs()
+        assert key == "abcdef"
+        assert written_at.tzinfo is not None
+
+        blob_store.delete("abcdef")
+        assert not blob_store.exists("abcdef")
+        assert list(blob_store.iter_blobs()) == []
+        with pytest.raises(BlobNotFoundError):
+            blob_store.get("abcdef")
+
+
+class TestScanResultStore:
+    def test_small_results_stay_inline(self, store, blob_store):
+        scan = Scan()
+        results = make_results(2)
+
+        store.save(scan, results)
+
+        assert scan.result_key is None
+        assert scan.details == results
+        assert scan.result_count == 2
+        assert store.load(scan) == results
+
+    def test_large_results_are_offloaded(self, store, blob_store):
+        scan = Scan()
+        results = make_results(100)
+
+        store.save(scan, results)
+
+        assert blob_store.exists(scan.result_key)
+        assert scan.details == {
+            "offloaded": True,
+            "count": 100,
+            "preview": results[:2],
+        }
+        assert scan.result_count == 100
+        # Stored compressed
+        assert len(blob_store.get(scan.result_key)) < scan.result_size
+        assert store.load(scan) == results
+
+    def test_identical_results_share_a_blob(self, store, tmp_path):
+        first, second = Scan(), Scan()
+
+        store.save(first, make_results(100))
+        store.save(second, make_results(100))
+
+        assert first.result_key == second.result_key
+        assert len([path for path in tmp_path.rglob("*") if path.is_file()]) == 1
+
+
+class TestScanServiceResults:
+    def _setup(self, db_session, store):
+        for factory in (
+            ProfileFactory,
+            InvestigationFactory,
+            InvestigationUserRoleFactory,
+            SketchFactory,
+            ScanFactory,
+        ):
+            factory._meta.sqlalchemy_session = db_session
+        user = ProfileFactory()
+        investigation = InvestigationFactory(owner=user)
+        InvestigationUserRoleFactory(
+            user=user, investigation=investigation, roles=[Role.OWNER]
+        )
+        self.sketch = SketchFactory(investigation=investigation, owner_id=user.id)
+        self.user = user
+        return ScanService(
+            db=db_session,
+            scan_repo=ScanRepository(db_session),
+            sketch_repo=SketchRepository(db_session),
+            investigation_repo=InvestigationRepository(db_session),
+            result_store=store,
+        )
+
+    def _scan(self, db_session, store, results):
+        scan = ScanFactory(sketch=self.sketch)
+        store.save(scan, results)
+        db_session.commit()
+        return scan
+
+    def test_get_results_loads_offloaded_results(self, db_session, store):
+        service = self._setup(db_session, store)
+        scan = self._scan(db_session, store, make_results(100))
+
+        raw = service.get_results(scan.id, self.user.id)
+
+        assert raw == store.load_json(scan)
+
+    def test_get_results_missing_blob(self, db_session, store, blob_store):
+        service = self._setup(db_session, store)
+        scan = self._scan(db_session, store, make_results(100))
+        blob_store.delete(scan.result_key)
+
+        with pytest.raises(NotFoundError):
+            service.get_results(scan.id, self.user.id)
+
+    def test_sweep_keeps_blob_until_last_scan(self, db_session, store, blob_store):
+        service = self._setup(db_session, store)
+        first = self._scan(db_session, store, make_results(100))
+        second = self._scan(db_session, store, make_results(100))
+        key = first.result_key
+
+        service.delete(first.id, self.user.id)
+        assert service.sweep_unreferenced_results(grace_period=timedelta(0)) == 0
+        assert blob_store.exists(key)
+
+        service.delete(second.id, self.user.id)
+        assert blob_store.exists(key)
+        assert service.sweep_unreferenced_results(grace_period=timedelta(0)) == 1
+        assert not blob_store.exists(key)
+
+    def test_sweep_keeps_recent_blobs(self, db_session, store, blob_store):
+        service = self._setup(db_session, store)
+        # Written by a scan that isn't committed yet
+        scan = Scan()
+        store.save(scan, make_results(100))
+
+        assert service.sweep_unreferenced_results() == 0
+        assert blob_store.exists(scan.result_key)
@@ -0,0 +1,200 @@
+import io
+from unittest.mock import MagicMock
+
+import pytest
+from flowsint_types import TYPE_REGISTRY, Domain
+
+from flowsint_core.imports import (
+    ImportService,
+    TypeMatcher,
+    detect_type,
+    iter_import_file,
+    parse_import_file,
+)
+from flowsint_core.imports.import_service import MAX_REPORTED_ERRORS
+
+CORPUS = [
+    "domain.com",
+    "blog.domain.com",
+    "https://www.example.org/path?q=1",
+    "12.34.56.78",
+    "2001:db8::1",
+    "10.0.0.0/8",
+    "AS15169",
+    "john@doe.com",
+    "+33 6 12 34 56 78",
+    "d41d8cd98f00b204e9800998ecf8427e",
+    "1A1zP1eP5QGefi2DMPTfTL5SLmv7DivfNa",
+    "4111 1111 1111 1111",
+    "John Doe",
+    "my_super_username",
+    "443",
+    "not a valid value at all, really",
+    "",
+]
+
+
+def legacy_detect_type(value):
+    for model in TYPE_REGISTRY.all_types().values():
+        if hasattr(model, "detect") and model.detect(value):
+            return model
+    return None
+
+
+@pytest.mark.parametrize("value", CORPUS)
+def test_combined_matcher_matches_detect_methods(value):
+    assert detect_type(value) is legacy_detect_type(value.strip())
+
+
+def test_matcher_only_keeps_types_with_a_pattern():
+    matcher = TypeMatcher(TYPE_REGISTRY.all_types().values())
+    assert Domain in matcher.types
+    assert all(model.detect_pattern for model in matcher.types)
+
+
+def test_types_without_pattern_detect_nothing():
+    for model in TYPE_REGISTRY.all_types().values():
+        if getattr(model, "detect_pattern", None) or not hasattr(model, "detect"):
+            continue
+        assert not any(model.detect(value) for value in CORPUS), model.__name__
+
+
+def test_csv_with_value_and_type_columns():
+    csv_bytes = b"value,type,id\nexample.com,domain,n1\n8.8.8.8,,n2\n"
+
+    result = parse_import_file(csv_bytes, "values.csv")
+
+    assert result.total_entities == 2
+    domain = result.entities["Domain"].results[0]
+    assert domain.obj.domain == "example.com"
+    assert domain.node_id == "n1"
+    assert result.entities["Ip"].results[0].obj.address == "8.8.8.8"
+
+
+def test_csv_without_header_reads_every_cell():
+    csv_bytes = b"example.com,8.8.8.8\njohn@doe.com,\n"
+
+    result = parse_import_file(csv_bytes, "values.csv")
+
+    assert result.total_entities == 3
+    assert set(result.entities) == {"Domain", "Ip", "Email"}
+
+
+def test_ndjson_records_with_and_without_type():
+    ndjson = (
+        b'{"nodeType": "domain", "nodeLabel": "example.com"}\n\n{"label": "8.8.8.8"}\n'
+    )
+
+    result = parse_import_file(io.BytesIO(ndjson), "values.ndjson")
+
+    assert result.total_entities == 2
+    assert result.entities["Domain"].results[0].obj.domain == "example.com"
+    assert result.entities["Ip"].results[0].obj.address == "8.8.8.8"
+
+
+def test_ndjson_invalid_line_is_reported():
+    with pytest.raises(ValueError, match="line 2"):
+        parse_import_file(b'{"label": "a.com"}\n{oops\n', "values.jsonl")
+
+
+def test_preview_is_capped_but_all_entities_counted():
+    txt = "\n".join(f"host{i}.example.com" for i in range(50)).encode()
+
+    result = parse_import_file(io.BytesIO(txt), "values.txt", max_preview_rows=10)
+
+    assert result.total_entities == 50
+    assert len(result.entities["Domain"].results) == 10
+    assert result.truncated
+
+
+def test_small_files_are_not_truncated():
+    result = parse_import_file(b"a.com\nb.com\n", "values.txt", max_preview_rows=2)
+
+    assert not result.truncated
+
+
+def test_iter_import_file_rejects_json():
+    with pytest.raises(ValueError, match="Unsupported file format"):
+        iter_import_file(b"{}", "graph.json")
+
+
+def make_service(chunk_size):
+    graph_service = MagicMock(_type_resolver=None)
+    graph_service.batch_create_nodes.side_effect = lambda nodes: {
+        "nodes_created": len(nodes),
+        "node_ids": [f"el-{i}" for i in range(len(nodes))],
+        "errors": [],
+    }
+    return ImportService(graph_service, type_resolver=None, chunk_size=chunk_size)
+
+
+def test_import_file_writes_nodes_in_chunks():
+    service = make_service(chunk_size=4)
+    txt = "\n".join(f"host{i}.example.com" for i in range(10)).encode()
+
+    result = service.import_file(io.BytesIO(txt), "values.txt")
+
+    assert result.status == "completed"
+    assert result.nodes_created == 10
+    calls = service._graph_service.batch_create_nodes.call_args_list
+    assert [len(c.kwargs["nodes"]) for c in calls] == [4, 4, 2]
+
+
+def test_import_file_excludes_types():
+    service = make_service(chunk_size=10)
+    txt = b"example.com\n8.8.8.8\njohn@doe.com\n"
+
+    result = service.import_file(txt, "values.txt", exclude_types=["Ip"])
+
+    assert result.nodes_created == 2
+    (call,) = service._graph_service.batch_create_nodes.call_args_list
+    types = {node["nodeType"] for node in call.kwargs["nodes"]}
+    assert "ip" not in {t.lower() for t in types}
+
+
+def test_execute_import_writes_nodes_in_chunks():
+    from flowsint_core.imports import EntityMapping
+
+    service = make_service(chunk_size=2)
+    mappings = [
+        EntityMapping(
+            id=str(i),
+            entity_type="Domain",
+            nodeLabel=f"d{i}.com",
+            data={"domain": f"d{i}.com"},
+        )
+        for i in range(5)
+    ]
+
+    result = service.execute_import(mappings)
+
+    assert result.nodes_created == 5
+    calls = service._graph_service.batch_create_nodes.call_args_list
+    assert [len(c.kwargs["nodes"]) for c in calls] == [2, 2, 1]
+
+
+def test_import_file_skips_unknown_types():
+    service = make_service(chunk_size=10)
+    lines = ["example.com"] + [f"not an entity {i}!" for i in range(100)]
+
+    result = service.import_file("\n".join(lines).encode(), "values.txt")
+
+    assert result.status == "completed_with_errors"
+    assert result.nodes_created == 1
+    assert result.nodes_skipped == 100
+    assert result.errors == ["100 entities of unknown type were skipped"]
+
+
+def test_import_file_caps_reported_errors(monkeypatch):
+    service = make_service(chunk_size=10)
+    monkeypatch.setattr(
+        service, "_preview_to_type", MagicMock(side_effect=ValueError("invalid"))
+    )
+    txt = "\n".join(f"host{i}.example.com" for i in range(60)).encode()
+
+    result = service.import_file(txt, "values.txt")
+
+    assert result.status == "failed"
+    assert result.nodes_skipped == 60
+    assert len(result.errors) == MAX_REPORTED_ERRORS + 1
+    assert result.errors[-1] == "10 more errors not reported"
@@ -59,3 +59,47 @@ class TestLogRepository:
         repo = LogRepository(db_session)
         results = repo.get_by_sketch(uuid4(), since=datetime(2000, 1, 1))
         assert len(results) == 0
+
+    def test_get_by_sketch_before_cursor(self, db_session):
+        self._setup(db_session)
+        sketch = SketchFactory()
+        created_at = datetime.now(timezone.utc)
+        # Same timestamp, ordered by ID
+        logs = [LogFactory(sketch_id=sketch.id, created_at=created_at) for _ in range(3)]
+        logs.sort(key=lambda log: log.id, reverse=True)
+
+        repo = LogRepository(db_session)
+        first = repo.get_by_sketch(sketch.id, limit=2)
+        rest = repo.get_by_sketch(
+            sketch.id, limit=2, before=(first[-1].created_at, first[-1].id)
+        )
+
+        assert [log.id for log in first + rest] == [log.id for log in logs]
+
+    def test_get_by_sketch_default_window_applies_to_every_page(self, db_session):
+        self._setup(db_session)
+        sketch = SketchFactory()
+        now = datetime.now(timezone.utc)
+        recent = LogFactory(sketch_id=sketch.id, created_at=now)
+        LogFactory(sketch_id=sketch.id, created_at=now - timedelta(days=2))
+
+        repo = LogRepository(db_session)
+        rest = repo.get_by_sketch(sketch.id, before=(recent.created_at, recent.id))
+
+        assert rest == []
+
+    def test_bulk_insert(self, db_session):
+        self._setup(db_session)
+        sketch = SketchFactory()
+        rows = [
+            {"id": uuid4(), "sketch_id": sketch.id, "content": {"message": str(i)}}
+            for i in range(3)
+        ]
+
+        repo = LogRepository(db_session)
+        ids = repo.bulk_insert(rows)
+        db_session.commit()
+
+        assert set(ids) == {row["id"] for row in rows}
+        assert len(repo.get_by_sketch(sketch.id)) == 3
+        assert repo.bulk_insert([]) == []
@@ -0,0 +1,139 @@
+"""Tests for CatalogService and the catalog cache."""
+
+import json
+from unittest.mock import MagicMock
+
+from tests.factories import CustomTypeFactory, EnricherTemplateFactory, ProfileFactory
+from flowsint_core.core.repositories import (
+    CustomTypeRepository,
+    EnricherTemplateRepository,
+)
+from flowsint_core.core.services.catalog_service import (
+    CatalogCache,
+    CatalogService,
+    etag_matches,
+)
+
+
+class FakeRegistry:
+    version = "v1"
+
+    def list(self, exclude=None, wobbly_type=False):
+        return [{"name": "resolve", "category": "domain"}]
+
+    def list_by_input_type(self, input_type, exclude=None):
+        return self.list()
+
+
+class TestCatalogCache:
+    def test_rebuilds_only_when_version_changes(self):
+        cache = CatalogCache()
+        build = MagicMock(return_value={"items": [1, 2]})
+
+        first = cache.get("key", "v1", build)
+        second = cache.get("key", "v1", build)
+        third = cache.get("key", "v2", build)
+
+        assert build.call_count == 2
+        assert first is second
+        assert json.loads(first.body) == {"items": [1, 2]}
+        # Same content, same ETag
+        assert third.etag == first.etag
+
+    def test_evicts_least_recently_used(self):
+        cache = CatalogCache(max_size=2)
+        build = MagicMock(return_value=[])
+        cache.get("a", "v", build)
+        cache.get("b", "v", build)
+        cache.get("a", "v", build)
+        cache.get("c", "v", build)
+
+        cache.get("a", "v", build)
+        assert build.call_count == 3
+        cache.get("b", "v", build)
+        assert build.call_count == 4
+
+
+def test_etag_matches():
+    assert etag_matches('"abc"', '"abc"')
+    assert etag_matches('W/"abc", "def"', '"def"')
+    assert etag_matches("*", '"abc"')
+    assert not etag_matches('"abc"', '"def"')
+    assert not etag_matches(None, '"abc"')
+
+
+class TestCatalogService:
+    def _setup(self, db_session):
+        ProfileFactory._meta.sqlalchemy_session = db_session
+        CustomTypeFactory._meta.sqlalchemy_session = db_session
+        EnricherTemplateFactory._meta.sqlalchemy_session = db_session
+
+    def _make_service(self, db_session):
+        return CatalogService(
+            db=db_session,
+            custom_type_repo=CustomTypeRepository(db_session),
+            enricher_template_repo=EnricherTemplateRepository(db_session),
+            cache=CatalogCache(),
+        )
+
+    def test_enricher_catalog_includes_templates(self, db_session):
+        self._setup(db_session)
+        user = ProfileFactory()
+        template = EnricherTemplateFactory(owner=user, name="Mine")
+        service = self._make_service(db_session)
+
+        catalog = service.get_enricher_catalog(None, user.id, FakeRegistry())
+
+        items = json.loads(catalog.body)
+        assert items[0]["name"] == "resolve"
+        assert items[1]["name"] == "Mine"
+        assert items[1]["id"] == str(template.id)
+
+    def test_template_change_invalidates_catalog(self, db_session):
+        self._setup(db_session)
+        user = ProfileFactory()
+        EnricherTemplateFactory(owner=user)
+        service = self._make_service(db_session)
+        registry = FakeRegistry()
+
+        first = service.get_enricher_catalog(None, user.id, registry)
+        assert service.get_enricher_catalog(None, user.id, registry) is first
+
+        EnricherTemplateFactory(owner=user)
+        second = service.get_enricher_catalog(None, user.id, registry)
+        assert second.etag != first.etag
+        assert len(json.loads(second.body)) == 3
+
+    def test_public_templates_of_other_users_are_versioned(self, db_session):
+        self._setup(db_session)
+        user = ProfileFactory()
+        other = ProfileFactory()
+        service = self._make_service(db_session)
+
+        def serialize(template):
+            return {"name": template.name}
+
+        first = service.get_template_catalog(user.id, None, True, serialize)
+        EnricherTemplateFactory(owner=other, name="Shared", is_public=True)
+        second = service.get_template_catalog(user.id, None, True, serialize)
+
+        assert json.loads(first.body) == []
+        assert json.loads(second.body) == [{"name": "Shared"}]
+
+    def test_type_catalog_follows_custom_types(self, db_session):
+        self._setup(db_session)
+        user = ProfileFactory()
+        service = self._make_service(db_session)
+
+        first = service.get_type_catalog(user.id)
+        assert service.get_type_catalog(user.id).etag == first.etag
+
+        CustomTypeFactory(owner=user, name="Vehicle", status="published")
+        second = service.get_type_catalog(user.id)
+
+        categories = json.loads(second.body)
+        assert categories[-1]["type"] == "custom_types_category"
+        assert categories[-1]["children"][0]["type"] == "Vehicle"
+        assert second.etag != first.etag
+        # Built-in part is unchanged and identical across builds
+        assert categories[:-1] == json.loads(first.body)
@@ -0,0 +1,129 @@
+"""Tests for log rollups, partitions and retention."""
+
+from datetime import date, datetime, timezone
+from unittest.mock import MagicMock
+
+from tests.factories import (
+    InvestigationFactory,
+    LogFactory,
+    ProfileFactory,
+    SketchFactory,
+)
+from flowsint_core.core.enums import EventLevel
+from flowsint_core.core.models import Log
+from flowsint_core.core.repositories import LogDailyRollupRepository, LogRepository
+from flowsint_core.core.services.log_retention_service import LogRetentionService
+
+
+def at(day, hour=12):
+    return datetime(2026, day.month, day.day, hour, tzinfo=timezone.utc)
+
+
+class TestRollupAndRetention:
+    def _setup(self, db_session, **kwargs):
+        for factory in (ProfileFactory, InvestigationFactory, SketchFactory):
+            factory._meta.sqlalchemy_session = db_session
+        LogFactory._meta.sqlalchemy_session = db_session
+        self.rollups = LogDailyRollupRepository(db_session)
+        return LogRetentionService(
+            db=db_session,
+            log_repo=LogRepository(db_session),
+            rollup_repo=self.rollups,
+            **kwargs,
+        )
+
+    def counts(self, sketch_id):
+        return {
+            (rollup.day, rollup.enricher, rollup.type): rollup.count
+            for rollup in self.rollups.get_by_sketch(sketch_id)
+        }
+
+    def test_rollup_counts_per_day_enricher_and_level(self, db_session):
+        service = self._setup(db_session)
+        sketch = SketchFactory()
+        day = date(2026, 3, 10)
+        for _ in range(2):
+            LogFactory(
+                sketch_id=sketch.id,
+                created_at=at(day),
+                content={"message": "started", "enricher": "domain_to_ip"},
+            )
+        LogFactory(sketch_id=sketch.id, created_at=at(day), type=EventLevel.FAILED)
+        LogFactory(sketch_id=sketch.id, created_at=at(date(2026, 3, 11)))
+
+        assert service.rollup(day, date(2026, 3, 11)) == 2
+        # Recomputing replaces the counts
+        service.rollup(day, date(2026, 3, 11))
+
+        assert self.counts(sketch.id) == {
+            (day, "domain_to_ip", EventLevel.INFO): 2,
+            (day, "", EventLevel.FAILED): 1,
+        }
+
+    def test_retention_rolls_up_then_deletes_expired_logs(self, db_session):
+        service = self._setup(db_session, retention_months=1)
+        sketch = SketchFactory()
+        LogFactory(sketch_id=sketch.id, created_at=at(date(2026, 1, 31)))
+        LogFactory(sketch_id=sketch.id, created_at=at(date(2026, 2, 1)))
+
+        result = service.apply_retention(date(2026, 3, 15))
+
+        assert result == {"dropped_partitions": [], "deleted": 1}
+        assert db_session.query(Log).count() == 1
+        assert self.counts(sketch.id) == {(date(2026, 1, 31), "", EventLevel.INFO): 1}
+
+    def test_zero_retention_keeps_logs(self, db_session):
+        service = self._setup(db_session, retention_months=0)
+        sketch = SketchFactory()
+        LogFactory(sketch_id=sketch.id, created_at=at(date(2020, 1, 1)))
+
+        service.run_maintenance(date(2026, 3, 15))
+
+        assert db_session.query(Log).count() == 1
+
+
+class TestPartitions:
+    def _make_service(self, months, default_months=None, **kwargs):
+        log_repo = MagicMock()
+        log_repo.is_partitioned.return_value = True
+        log_repo.get_partition_months.return_value = months
+        log_repo.get_default_partition_months.return_value = default_months or []
+        log_repo.count_by_day.return_value = []
+        service = LogRetentionService(
+            db=MagicMock(), log_repo=log_repo, rollup_repo=MagicMock(), **kwargs
+        )
+        return service, log_repo
+
+    def test_missing_partitions_are_created_ahead(self):
+        service, log_repo = self._make_service(
+            [date(2026, 10, 1), date(2026, 11, 1)], partitions_ahead=3
+        )
+
+        created = service.ensure_partitions(date(2026, 10, 17))
+
+        assert created == [date(2026, 12, 1), date(2027, 1, 1)]
+        assert log_repo.create_partition.call_count == 2
+
+    def test_months_in_the_default_partition_get_a_partition(self):
+        service, log_repo = self._make_service(
+            [date(2026, 6, 1)],
+            default_months=[date(2026, 7, 1), date(2026, 10, 1)],
+            partitions_ahead=1,
+        )
+
+        created = service.ensure_partitions(date(2026, 10, 17))
+
+        assert created == [date(2026, 7, 1), date(2026, 10, 1), date(2026, 11, 1)]
+
+    def test_expired_partitions_are_rolled_up_and_dropped(self):
+        months = [date(2026, month, 1) for month in range(3, 11)]
+        service, log_repo = self._make_service(months, retention_months=6)
+
+        result = service.apply_retention(date(2026, 10, 17))
+
+        # Months before April are past the 6 months of retention
+        assert result["dropped_partitions"] == ["2026-03-01"]
+        log_repo.drop_partition.assert_called_once_with(date(2026, 3, 1))
+        start, end = log_repo.count_by_day.call_args[0]
+        assert (start.date(), end.date()) == (date(2026, 3, 1), date(2026, 4, 1))
+        log_repo.delete_before.assert_not_called()
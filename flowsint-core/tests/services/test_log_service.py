@@ -0,0 +1,81 @@
+"""Tests for the keyset pagination of LogService."""
+
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+import pytest
+
+from tests.factories import (
+    InvestigationFactory,
+    InvestigationUserRoleFactory,
+    LogFactory,
+    ProfileFactory,
+    SketchFactory,
+)
+from flowsint_core.core.services import ValidationError, create_log_service
+from flowsint_core.core.services.log_service import (
+    decode_log_cursor,
+    encode_log_cursor,
+)
+
+
+class TestLogPages:
+    def _setup(self, db_session):
+        for factory in (
+            ProfileFactory,
+            InvestigationFactory,
+            InvestigationUserRoleFactory,
+            SketchFactory,
+            LogFactory,
+        ):
+            factory._meta.sqlalchemy_session = db_session
+        user = ProfileFactory()
+        investigation = InvestigationFactory(owner=user)
+        InvestigationUserRoleFactory(user=user, investigation=investigation)
+        sketch = SketchFactory(investigation=investigation)
+        return user, sketch
+
+    def test_pages_cover_every_log_once(self, db_session):
+        user, sketch = self._setup(db_session)
+        start = datetime.now(timezone.utc) - timedelta(hours=1)
+        for i in range(5):
+            LogFactory(
+                sketch_id=sketch.id,
+                created_at=start + timedelta(minutes=i),
+                content={"message": str(i)},
+            )
+        service = create_log_service(db_session)
+
+        first = service.get_log_page(sketch.id, user.id, limit=2)
+        second = service.get_log_page(
+            sketch.id, user.id, limit=2, cursor=first.next_cursor
+        )
+        last = service.get_log_page(
+            sketch.id, user.id, limit=2, cursor=second.next_cursor
+        )
+
+        def messages(page):
+            return [event.payload["message"] for event in page.items]
+
+        # Newest page first, each page oldest to newest
+        assert messages(first) == ["3", "4"]
+        assert messages(second) == ["1", "2"]
+        assert messages(last) == ["0"]
+        assert last.next_cursor is None
+
+    def test_invalid_cursor(self, db_session):
+        user, sketch = self._setup(db_session)
+        service = create_log_service(db_session)
+
+        with pytest.raises(ValidationError):
+            service.get_log_page(sketch.id, user.id, cursor="not-a-cursor")
+
+
+def test_cursor_round_trip():
+    log_id = uuid4()
+    created_at = datetime(2026, 1, 2, 3, 4, 5, 678, tzinfo=timezone.utc)
+
+    assert decode_log_cursor(encode_log_cursor(created_at, log_id)) == (
+        created_at,
+        log_id,
+    )
@@ -0,0 +1,112 @@
+"""Tests for custom type resolution and its cache in TypeRegistryService."""
+
+from unittest.mock import MagicMock
+
+from flowsint_types import Domain
+
+from tests.factories import CustomTypeFactory, ProfileFactory
+from flowsint_core.core.repositories import CustomTypeRepository
+from flowsint_core.core.services import type_registry_service
+from flowsint_core.core.services.custom_type_service import CustomTypeService
+from flowsint_core.core.services.type_registry_service import (
+    CustomTypeModelCache,
+    TypeRegistryService,
+)
+
+VEHICLE_SCHEMA = {
+    "type": "object",
+    "properties": {"plate": {"type": "string"}, "color": {"type": "string"}},
+    "required": ["plate"],
+}
+
+
+class TestResolveType:
+    def _setup(self, db_session, monkeypatch):
+        ProfileFactory._meta.sqlalchemy_session = db_session
+        CustomTypeFactory._meta.sqlalchemy_session = db_session
+        self.cache = CustomTypeModelCache()
+        # CustomTypeService invalidates the process-wide cache
+        monkeypatch.setattr(type_registry_service, "_custom_type_cache", self.cache)
+        self.repo = MagicMock(wraps=CustomTypeRepository(db_session))
+        return TypeRegistryService(db=db_session, custom_type_repo=self.repo)
+
+    def test_builtin_types_skip_the_database(self, db_session, monkeypatch):
+        service = self._setup(db_session, monkeypatch)
+        user = ProfileFactory()
+
+        assert service.resolve_type("domain", user.id) is Domain
+        self.repo.get_published_by_name_and_owner.assert_not_called()
+
+    def test_custom_type_model_is_cached(self, db_session, monkeypatch):
+        service = self._setup(db_session, monkeypatch)
+        user = ProfileFactory()
+        CustomTypeFactory(
+            owner=user, name="Vehicle", schema=VEHICLE_SCHEMA, status="published"
+        )
+
+        model = service.resolve_type("vehicle", user.id)
+        assert service.resolve_type("Vehicle", user.id) is model
+        assert model(plate="AB-123").plate == "AB-123"
+        assert self.repo.get_published_by_name_and_owner.call_count == 1
+
+    def test_misses_are_cached(self, db_session, monkeypatch):
+        service = self._setup(db_session, monkeypatch)
+        user = ProfileFactory()
+
+        assert service.resolve_type("unknown", user.id) is None
+        assert service.resolve_type("unknown", user.id) is None
+        assert self.repo.get_published_by_name_and_owner.call_count == 1
+
+    def test_owners_are_cached_separately(self, db_session, monkeypatch):
+        service = self._setup(db_session, monkeypatch)
+        user = ProfileFactory()
+        other = ProfileFactory()
+        CustomTypeFactory(
+            owner=user, name="Vehicle", schema=VEHICLE_SCHEMA, status="published"
+        )
+
+        assert service.resolve_type("vehicle", user.id) is not None
+        assert service.resolve_type("vehicle", other.id) is None
+
+    def test_custom_type_changes_invalidate_the_owner(self, db_session, monkeypatch):
+        service = self._setup(db_session, monkeypatch)
+        user = ProfileFactory()
+        custom_types = CustomTypeService(
+            db=db_session, custom_type_repo=CustomTypeRepository(db_session)
+        )
+
+        assert service.resolve_type("vehicle", user.id) is None
+        created = custom_types.create(
+            "Vehicle", VEHICLE_SCHEMA, user.id, status="published"
+        )
+        assert service.resolve_type("vehicle", user.id) is not None
+
+        custom_types.update(created.id, user.id, status="archived")
+        assert service.resolve_type("vehicle", user.id) is None
+
+        custom_types.update(created.id, user.id, status="published")
+        assert service.resolve_type("vehicle", user.id) is not None
+        custom_types.delete(created.id, user.id)
+        assert service.resolve_type("vehicle", user.id) is None
+
+    def test_unchanged_schema_is_not_recompiled(self, db_session, monkeypatch):
+        service = self._setup(db_session, monkeypatch)
+        user = ProfileFactory()
+        CustomTypeFactory(
+            owner=user, name="Vehicle", schema=VEHICLE_SCHEMA, status="published"
+        )
+
+        model = service.resolve_type("vehicle", user.id)
+        self.cache.invalidate(user.id)
+        assert service.resolve_type("vehicle", user.id) is model
+
+
+def test_cache_entries_expire(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(type_registry_service.time, "monotonic", lambda: now[0])
+    cache = CustomTypeModelCache(ttl=10)
+    cache.set("owner", "Vehicle", Domain)
+
+    assert cache.get("owner", "vehicle") == (True, Domain)
+    now[0] += 11
+    assert cache.get("owner", "vehicle") == (False, None)
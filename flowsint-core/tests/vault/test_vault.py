@@ -3,7 +3,12 @@ import pytest
 import uuid
 import os
 from unittest.mock import Mock, MagicMock
-from flowsint_core.core.vault import Vault
+from flowsint_core.core.vault import (
+    SecretCache,
+    Vault,
+    derive_user_data_key,
+    get_secret_cache,
+)
 from flowsint_core.core.models import Key
 
 
@@ -33,6 +38,14 @@ def mock_master_key(monkeypatch):
     monkeypatch.setenv("MASTER_VAULT_KEY_V1", test_key)
 
 
+@pytest.fixture(autouse=True)
+def clear_secret_cache():
+    """Keep cached secrets from leaking between tests."""
+    get_secret_cache().clear()
+    yield
+    get_secret_cache().clear()
+
+
 class TestVaultInitialization:
     """Tests for Vault initialization."""
 
@@ -234,3 +247,104 @@ class TestVaultEncryptionDecryption:
 
         with pytest.raises(ValueError, match="Missing master key"):
             vault._get_master_key()
+
+
+def make_key_row(owner_id, name="TEST_API_KEY", plain_key="my-secret-api-key-12345"):
+    """Build a mocked Key row holding an encrypted secret."""
+    encrypted_data = Vault(db=MagicMock(), owner_id=owner_id)._encrypt_key(plain_key)
+    row = Mock()
+    row.id = uuid.uuid4()
+    row.name = name
+    row.owner_id = owner_id
+    row.salt = encrypted_data["salt"]
+    row.iv = encrypted_data["iv"]
+    row.ciphertext = encrypted_data["ciphertext"]
+    return row
+
+
+def returning(mock_db, row):
+    mock_result = Mock()
+    mock_result.scalars().first.return_value = row
+    mock_db.execute.return_value = mock_result
+
+
+class TestVaultSecretCache:
+    """Tests for the in-process secret cache."""
+
+    def test_repeated_lookups_hit_the_database_once(self, vault, mock_db, owner_id):
+        returning(mock_db, make_key_row(owner_id))
+
+        assert vault.get_secret("TEST_API_KEY") == "my-secret-api-key-12345"
+        assert vault.get_secret("TEST_API_KEY") == "my-secret-api-key-12345"
+
+        assert mock_db.execute.call_count == 1
+
+    def test_cache_is_scoped_per_owner(self, mock_db, owner_id):
+        returning(mock_db, make_key_row(owner_id))
+        Vault(db=mock_db, owner_id=owner_id).get_secret("TEST_API_KEY")
+
+        returning(mock_db, None)
+        other = Vault(db=mock_db, owner_id=uuid.uuid4())
+
+        assert other.get_secret("TEST_API_KEY") is None
+        assert mock_db.execute.call_count == 2
+
+    def test_missing_secret_is_cached_until_created(self, vault, mock_db, owner_id):
+        returning(mock_db, None)
+        assert vault.get_secret("TEST_API_KEY") is None
+        assert vault.get_secret("TEST_API_KEY") is None
+        assert mock_db.execute.call_count == 1
+
+        vault.set_secret("TEST_API_KEY", "new-value")
+        returning(mock_db, make_key_row(owner_id, plain_key="new-value"))
+
+        assert vault.get_secret("TEST_API_KEY") == "new-value"
+
+    def test_invalidate_drops_id_and_name_references(self, vault, mock_db, owner_id):
+        row = make_key_row(owner_id)
+        returning(mock_db, row)
+        vault.get_secret("TEST_API_KEY")
+        vault.get_secret(str(row.id))
+
+        get_secret_cache().invalidate(owner_id, key_id=row.id, key_name=row.name)
+        returning(mock_db, None)
+
+        assert vault.get_secret("TEST_API_KEY") is None
+        assert vault.get_secret(str(row.id)) is None
+
+    def test_entries_expire(self, monkeypatch):
+        cache = SecretCache(ttl=10, max_size=10)
+        now = [100.0]
+        monkeypatch.setattr("flowsint_core.core.vault.time.monotonic", lambda: now[0])
+
+        cache.set("owner", "ref", "secret")
+        assert cache.get("owner", "ref") == (True, "secret")
+
+        now[0] += 11
+        assert cache.get("owner", "ref") == (False, None)
+
+    def test_cache_is_bounded(self):
+        cache = SecretCache(ttl=60, max_size=2)
+        cache.set("owner", "a", "1")
+        cache.set("owner", "b", "2")
+        cache.get("owner", "a")
+        cache.set("owner", "c", "3")
+
+        assert cache.get("owner", "b") == (False, None)
+        assert cache.get("owner", "a") == (True, "1")
+
+    def test_zero_ttl_disables_the_cache(self):
+        cache = SecretCache(ttl=0)
+        cache.set("owner", "ref", "secret")
+        assert cache.get("owner", "ref") == (False, None)
+
+    def test_derived_keys_are_memoized(self, vault, owner_id):
+        derive_user_data_key.cache_clear()
+        encrypted_data = vault._encrypt_key("value")
+
+        assert vault._decrypt_key(encrypted_data) == "value"
+        assert vault._decrypt_key(encrypted_data) == "value"
+
+        # One derivation to encrypt, one shared by both decryptions
+        info = derive_user_data_key.cache_info()
+        assert (info.misses, info.hits) == (1, 2)
@@ -18,6 +18,9 @@ class AsnToCidrsEnricher(Enricher):
     InputType = ASN
     OutputType = CIDR
 
+    # Runs asnmap in a Docker container
+    queue = "docker"
+
     def __init__(
         self,
         sketch_id: Optional[str] = None,
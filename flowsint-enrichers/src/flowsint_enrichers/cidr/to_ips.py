@@ -16,6 +16,9 @@ class CidrToIpsEnricher(Enricher):
     InputType = CIDR
     OutputType = Ip
 
+    # Runs mapcidr in a Docker container
+    queue = "docker"
+
     def __init__(
         self,
         sketch_id: Optional[str] = None,
@@ -68,45 +71,48 @@ class CidrToIpsEnricher(Enricher):
         # Retrieve API key from vault or environment (optional)
         api_key = self.get_secret("PDCP_API_KEY", os.getenv("PDCP_API_KEY"))
 
-        for cidr in data:
-            try:
-                cidr_ips = []
-                # Use mapcidr tool to get IPs from CIDR, passing the API key
-                ip_addresses = mapcidr.launch(cidr.network, api_key=api_key)
-
-                if ip_addresses:
-                    for ip_str in ip_addresses:
-                        try:
-                            ip = Ip(address=ip_str.strip())
-                            ips.append(ip)
-                            cidr_ips.append(ip)
-                        except Exception as e:
-                            Logger.error(
-                                self.sketch_id,
-                                {"message": f"Failed to parse IP {ip_str}: {str(e)}"},
-                            )
-
-                    Logger.info(
-                        self.sketch_id,
-                        {
-                            "message": f"[MAPCIDR] Found {len(ip_addresses)} IPs for CIDR {cidr.network}"
-                        },
-                    )
-                else:
-                    Logger.warn(
-                        self.sketch_id,
-                        {"message": f"[MAPCIDR] No IPs found for CIDR {cidr.network}"},
-                    )
-
-                if cidr_ips:  # Only add to mapping if we found valid IPs
-                    self._cidr_to_ips_map.append((cidr, cidr_ips))
+        # Expand every CIDR in a single mapcidr run
+        try:
+            ips_by_cidr = mapcidr.launch_batch(
+                [str(cidr.network) for cidr in data], api_key=api_key
+            )
+        except Exception as e:
+            Logger.error(
+                self.sketch_id,
+                {"message": f"Error getting IPs for CIDRs: {e}"},
+            )
+            return ips
 
-            except Exception as e:
-                Logger.error(
+        for cidr in data:
+            cidr_ips = []
+            ip_addresses = ips_by_cidr.get(str(cidr.network), [])
+
+            if ip_addresses:
+                for ip_str in ip_addresses:
+                    try:
+                        ip = Ip(address=ip_str.strip())
+                        ips.append(ip)
+                        cidr_ips.append(ip)
+                    except Exception as e:
+                        Logger.error(
+                            self.sketch_id,
+                            {"message": f"Failed to parse IP {ip_str}: {str(e)}"},
+                        )
+
+                Logger.info(
+                    self.sketch_id,
+                    {
+                        "message": f"[MAPCIDR] Found {len(ip_addresses)} IPs for CIDR {cidr.network}"
+                    },
+                )
+            else:
+                Logger.warn(
                     self.sketch_id,
-                    {"message": f"Error getting IPs for CIDR {cidr.network}: {e}"},
+                    {"message": f"[MAPCIDR] No IPs found for CIDR {cidr.network}"},
                 )
-                continue
+
+            if cidr_ips:  # Only add to mapping if we found valid IPs
+                self._cidr_to_ips_map.append((cidr, cidr_ips))
 
         return ips
 
@@ -1,7 +1,6 @@
 import os
 from typing import List, Dict, Any, Optional, Union
-import requests
-import requests.exceptions
+import httpx
 from datetime import datetime
 from dotenv import load_dotenv
 from flowsint_core.core.enricher_base import Enricher
@@ -110,25 +109,27 @@ class CryptoWalletAddressToTransactions(Enricher):
             "apikey": api_key,
         }
         try:
-            response = requests.get(api_url, params=params)
+            response = await self.http.get(
+                api_url, params=params, rate_limit_key=api_key
+            )
 
             # Raise an exception for HTTP errors (4xx or 5xx status codes)
             response.raise_for_status()
 
-        except requests.exceptions.ConnectionError as e:
+        except httpx.ConnectError as e:
             raise ValueError(
                 f"An error occurred connecting to {api_url}: Connection failed - {str(e)}"
             )
-        except requests.exceptions.Timeout as e:
+        except httpx.TimeoutException as e:
             raise ValueError(
                 f"An error occurred fetching {api_url}: Request timeout - {str(e)}"
             )
-        except requests.exceptions.RequestException as e:
+        except httpx.HTTPError as e:
             raise ValueError(f"An error occurred fetching {api_url}: {str(e)}")
 
         try:
             data = response.json()
-        except requests.exceptions.JSONDecodeError as e:
+        except ValueError as e:
             raise ValueError(
                 f"An error occurred fetching {api_url}: Invalid JSON response - {str(e)}"
             )
@@ -19,6 +19,9 @@ class DomainToAsnEnricher(Enricher):
     InputType = Domain
     OutputType = ASN
 
+    # Runs asnmap in a Docker container
+    queue = "docker"
+
     def __init__(
         self,
         sketch_id: Optional[str] = None,
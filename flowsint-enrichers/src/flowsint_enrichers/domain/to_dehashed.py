@@ -1,6 +1,5 @@
 import json
 import os
-import requests
 
 from typing import Any, Dict, List, Optional
 from flowsint_core.core.enricher_base import Enricher
@@ -70,7 +69,8 @@ class DomainToDehashed(Enricher):
                 headers = {'Dehashed-Api-Key': api_key, 'Content-Type': 'application/json'}
                 raw_data = json.dumps({"query": f"domain:{domain.domain}"})
 
-                api_request = requests.post(f'https://api.dehashed.com/v2/search', data=raw_data, headers=headers, timeout=30)
+                # Searches are read-only, retried on 429 like GET requests
+                api_request = await self.http.post('https://api.dehashed.com/v2/search', content=raw_data, headers=headers, timeout=30, rate_limit_key=api_key, max_retries=self.http.max_retries)
 
                 if api_request.status_code != 200:
                     if api_request.status_code == 401:
@@ -14,6 +14,9 @@ class DomainToDnsEnricher(Enricher):
     InputType = Domain
     OutputType = Ip
 
+    # Runs dnsx in a Docker container
+    queue = "docker"
+
     def __init__(
         self,
         sketch_id: Optional[str] = None,
@@ -81,17 +84,20 @@ class DomainToDnsEnricher(Enricher):
         aaaa = self.params.get("ipv6", "true") == "true"
         api_key = self.get_secret("PDCP_API_KEY", None)
 
-        for d in data:
-            try:
-                ips = dnsx.resolve_domain(d.domain, aaaa=aaaa, api_key=api_key)
-            except Exception as e:
-                Logger.error(
-                    self.sketch_id,
-                    {"message": f"[DNSX] Error resolving {d.domain}: {e}"},
-                )
-                continue
+        # Resolve every domain in a single dnsx run
+        try:
+            ips_by_domain = dnsx.resolve_domains(
+                [d.domain for d in data], aaaa=aaaa, api_key=api_key
+            )
+        except Exception as e:
+            Logger.error(
+                self.sketch_id,
+                {"message": f"[DNSX] Error resolving {len(data)} domain(s): {e}"},
+            )
+            return results
 
-            for ip in ips:
+        for d in data:
+            for ip in ips_by_domain.get(d.domain, []):
                 try:
                     ip_obj = Ip(address=ip)
                 except Exception:
@@ -14,6 +14,10 @@ class ResolveEnricher(Enricher):
     InputType = Domain
     OutputType = Ip
 
+    # DNS lookups are cheap, resolve many domains at once
+    max_concurrency = 32
+    cache_ttl = 3600
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.domain_ip_mapping: List[tuple[Domain, Ip]] = []
@@ -35,22 +39,23 @@ class ResolveEnricher(Enricher):
         """Return formatted markdown documentation for the domain resolver enricher."""
         return ""
 
+    def _resolve(self, domain: Domain) -> Ip | None:
+        try:
+            return Ip(address=socket.gethostbyname(domain.domain))
+        except Exception as e:
+            Logger.info(
+                self.sketch_id,
+                {"message": f"Error resolving {domain.domain}: {e}"},
+            )
+            return None
+
     async def scan(self, data: List[InputType]) -> List[OutputType]:
-        results: List[OutputType] = []
-        self.domain_ip_mapping = []
-        for d in data:
-            try:
-                ip = socket.gethostbyname(d.domain)
-                ip_obj = Ip(address=ip)
-                results.append(ip_obj)
-                self.domain_ip_mapping.append((d, ip_obj))
-            except Exception as e:
-                Logger.info(
-                    self.sketch_id,
-                    {"message": f"Error resolving {d.domain}: {e}"},
-                )
-                continue
-        return results
+        # gethostbyname blocks, map_items runs the lookups in worker threads
+        ips = await self.map_items(data, self._resolve)
+        self.domain_ip_mapping = [
+            (domain, ip_obj) for domain, ip_obj in zip(data, ips) if ip_obj is not None
+        ]
+        return [ip_obj for _, ip_obj in self.domain_ip_mapping]
 
     def postprocess(self, results: List[OutputType], original_input: List[InputType]) -> List[OutputType]:
         for domain_obj, ip_obj in self.domain_ip_mapping:
@@ -21,6 +21,9 @@ class DomainToTLS(Enricher):
     InputType = Domain
     OutputType = Website
 
+    # Runs httpx in a Docker container
+    queue = "docker"
+
     # @classmethod
     # def required_params(cls) -> bool:
     #     return True
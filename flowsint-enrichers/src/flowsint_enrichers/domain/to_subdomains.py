@@ -1,5 +1,5 @@
 import requests
-from typing import List, Union
+from typing import Any, Dict, List, Union
 from flowsint_core.core.enricher_base import Enricher
 from flowsint_enrichers.registry import flowsint_enricher
 from flowsint_types.domain import Domain
@@ -16,6 +16,13 @@ class SubdomainEnricher(Enricher):
     InputType = Domain
     OutputType = Domain
 
+    # Runs subfinder in a Docker container
+    queue = "docker"
+
+    # Each item may start a subfinder container and query crt.sh (60s timeout)
+    max_concurrency = 4
+    item_timeout = 180.0
+
     @classmethod
     def name(cls) -> str:
         return "domain_to_subdomains"
@@ -30,26 +37,26 @@ class SubdomainEnricher(Enricher):
 
     async def scan(self, data: List[InputType]) -> List[OutputType]:
         """Find subdomains using subfinder (Docker) or fallback to crt.sh."""
-        domains: List[OutputType] = []
-
-        for md in data:
-            d = Domain(domain=md.domain)
-            # Try subfinder first (Docker-based)
-            subdomains = self.__get_subdomains_from_subfinder(d.domain)
-
-            # If subfinder fails or returns no results, fallback to crt.sh
-            if not subdomains:
-                Logger.warn(
-                    self.sketch_id,
-                    {
-                        "message": f"subfinder failed for {d.domain}, falling back to crt.sh"
-                    },
-                )
-                subdomains = self.__get_subdomains_from_crtsh(d.domain)
-
-            domains.append({"domain": d.domain, "subdomains": sorted(subdomains)})
+        return [
+            result
+            for result in await self.map_items(data, self.__find_subdomains)
+            if result is not None
+        ]
+
+    def __find_subdomains(self, md: Domain) -> Dict[str, Any]:
+        d = Domain(domain=md.domain)
+        # Try subfinder first (Docker-based)
+        subdomains = self.__get_subdomains_from_subfinder(d.domain)
+
+        # If subfinder fails or returns no results, fallback to crt.sh
+        if not subdomains:
+            Logger.warn(
+                self.sketch_id,
+                {"message": f"subfinder failed for {d.domain}, falling back to crt.sh"},
+            )
+            subdomains = self.__get_subdomains_from_crtsh(d.domain)
 
-        return domains
+        return {"domain": d.domain, "subdomains": sorted(subdomains)}
 
     def __get_subdomains_from_crtsh(self, domain: str) -> set[str]:
         subdomains: set[str] = set()
@@ -17,6 +17,10 @@ class WhoisEnricher(Enricher):
     InputType = Domain
     OutputType = Whois
 
+    # WHOIS records rarely change, and registries throttle aggressively
+    max_concurrency = 5
+    cache_ttl = 86400
+
     @classmethod
     def name(cls) -> str:
         return "domain_to_whois"
@@ -30,84 +34,84 @@ class WhoisEnricher(Enricher):
         return "domain"
 
     async def scan(self, data: List[InputType]) -> List[OutputType]:
-        results: List[OutputType] = []
-        for domain in data:
-            try:
-                whois_info = whois.whois(domain.domain)
-                if whois_info:
-                    # Extract emails from whois data
-                    emails = []
-                    if whois_info.emails:
-                        if isinstance(whois_info.emails, list):
-                            emails = [
-                                Email(email=email)
-                                for email in whois_info.emails
-                                if email
-                            ]
-                        else:
-                            emails = [Email(email=whois_info.emails)]
-
-                    # Convert datetime objects to ISO format strings
-                    creation_date_str = None
-                    if whois_info.creation_date:
-                        if isinstance(whois_info.creation_date, list):
-                            creation_date_str = (
-                                whois_info.creation_date[0].isoformat()
-                                if whois_info.creation_date
-                                else None
-                            )
-                        else:
-                            creation_date_str = whois_info.creation_date.isoformat()
-
-                    expiration_date_str = None
-                    if whois_info.expiration_date:
-                        if isinstance(whois_info.expiration_date, list):
-                            expiration_date_str = (
-                                whois_info.expiration_date[0].isoformat()
-                                if whois_info.expiration_date
-                                else None
-                            )
-                        else:
-                            expiration_date_str = whois_info.expiration_date.isoformat()
-
-                    # Extract registry domain ID
-                    registry_domain_id = None
-                    if (
-                        hasattr(whois_info, "registry_domain_id")
-                        and whois_info.registry_domain_id
-                    ):
-                        registry_domain_id = str(whois_info.registry_domain_id)
-                    elif hasattr(whois_info, "domain_id") and whois_info.domain_id:
-                        registry_domain_id = str(whois_info.domain_id)
-
-                    # Create organization object if org info is available
-                    organization = None
-                    if whois_info.org:
-                        organization = Organization(name=str(whois_info.org))
-
-                    whois_obj = Whois(
-                        domain=domain,
-                        registry_domain_id=registry_domain_id,
-                        registrar=(
-                            str(whois_info.registrar) if whois_info.registrar else None
-                        ),
-                        organization=organization,
-                        city=str(whois_info.city) if whois_info.city else None,
-                        country=str(whois_info.country) if whois_info.country else None,
-                        email=emails[0] if emails else None,
-                        creation_date=creation_date_str,
-                        expiration_date=expiration_date_str,
-                    )
-                    results.append(whois_obj)
-
-            except Exception as e:
-                Logger.error(
-                    self.sketch_id,
-                    {"message": f"Error getting WHOIS for domain {domain.domain}: {e}"},
+        whois_results = await self.map_items(data, self._lookup)
+        return [whois_obj for whois_obj in whois_results if whois_obj is not None]
+
+    def _lookup(self, domain: Domain) -> Whois | None:
+        try:
+            whois_info = whois.whois(domain.domain)
+            if whois_info:
+                # Extract emails from whois data
+                emails = []
+                if whois_info.emails:
+                    if isinstance(whois_info.emails, list):
+                        emails = [
+                            Email(email=email)
+                            for email in whois_info.emails
+                            if email
+                        ]
+                    else:
+                        emails = [Email(email=whois_info.emails)]
+
+                # Convert datetime objects to ISO format strings
+                creation_date_str = None
+                if whois_info.creation_date:
+                    if isinstance(whois_info.creation_date, list):
+                        creation_date_str = (
+                            whois_info.creation_date[0].isoformat()
+                            if whois_info.creation_date
+                            else None
+                        )
+                    else:
+                        creation_date_str = whois_info.creation_date.isoformat()
+
+                expiration_date_str = None
+                if whois_info.expiration_date:
+                    if isinstance(whois_info.expiration_date, list):
+                        expiration_date_str = (
+                            whois_info.expiration_date[0].isoformat()
+                            if whois_info.expiration_date
+                            else None
+                        )
+                    else:
+                        expiration_date_str = whois_info.expiration_date.isoformat()
+
+                # Extract registry domain ID
+                registry_domain_id = None
+                if (
+                    hasattr(whois_info, "registry_domain_id")
+                    and whois_info.registry_domain_id
+                ):
+                    registry_domain_id = str(whois_info.registry_domain_id)
+                elif hasattr(whois_info, "domain_id") and whois_info.domain_id:
+                    registry_domain_id = str(whois_info.domain_id)
+
+                # Create organization object if org info is available
+                organization = None
+                if whois_info.org:
+                    organization = Organization(name=str(whois_info.org))
+
+                whois_obj = Whois(
+                    domain=domain,
+                    registry_domain_id=registry_domain_id,
+                    registrar=(
+                        str(whois_info.registrar) if whois_info.registrar else None
+                    ),
+                    organization=organization,
+                    city=str(whois_info.city) if whois_info.city else None,
+                    country=str(whois_info.country) if whois_info.country else None,
+                    email=emails[0] if emails else None,
+                    creation_date=creation_date_str,
+                    expiration_date=expiration_date_str,
                 )
-                continue
+                return whois_obj
 
-        return results
+        except Exception as e:
+            Logger.error(
+                self.sketch_id,
+                {"message": f"Error getting WHOIS for domain {domain.domain}: {e}"},
+            )
+        return None
 
     def postprocess(self, results: List[OutputType], original_input: List[InputType]) -> List[OutputType]:
         for whois_obj in results:
@@ -18,6 +18,9 @@ class IpToAsnEnricher(Enricher):
     InputType = Ip
     OutputType = ASN
 
+    # Runs asnmap in a Docker container
+    queue = "docker"
+
     def __init__(
         self,
         sketch_id: Optional[str] = None,
@@ -16,6 +16,9 @@ class IpToPortsEnricher(Enricher):
     InputType = Ip
     OutputType = Port
 
+    # Runs naabu in a Docker container
+    queue = "docker"
+
     def __init__(
         self,
         sketch_id: Optional[str] = None,
@@ -129,61 +132,60 @@ class IpToPortsEnricher(Enricher):
             )
             return results
 
+        Logger.info(
+            self.sketch_id,
+            {
+                "message": f"[NAABU] Scanning {len(data)} IP(s) in {mode} mode..."
+            },
+        )
+
+        # Scan every IP in a single naabu run
+        try:
+            ports_by_ip = naabu.launch_batch(
+                targets=[ip.address for ip in data],
+                mode=mode,
+                port_range=port_range,
+                top_ports=top_ports,
+                rate=rate,
+                timeout=timeout,
+                service_detection=service_detection,
+                api_key=api_key,
+            )
+        except Exception as e:
+            Logger.error(
+                self.sketch_id,
+                {"message": f"[NAABU] Error scanning {len(data)} IP(s): {e}"},
+            )
+            return results
+
         for ip in data:
-            try:
-                Logger.info(
-                    self.sketch_id,
-                    {
-                        "message": f"[NAABU] Scanning {ip.address} in {mode} mode..."
-                    },
-                )
+            # Parse results and create Port objects
+            for result in ports_by_ip.get(ip.address, []):
+                # Naabu JSON output format includes: ip, port, protocol, etc.
+                port_number = result.get("port")
+                if not port_number:
+                    continue
 
-                # Launch naabu scan
-                scan_results = naabu.launch(
-                    target=ip.address,
-                    mode=mode,
-                    port_range=port_range,
-                    top_ports=top_ports,
-                    rate=rate,
-                    timeout=timeout,
-                    service_detection=service_detection,
-                    api_key=api_key,
+                port = Port(
+                    number=port_number,
+                    protocol=result.get("protocol", "tcp").upper(),
+                    state="open",  # Naabu only returns open ports
+                    service=result.get("service"),
+                    banner=result.get("version") or result.get("banner"),
                 )
 
-                # Parse results and create Port objects
-                for result in scan_results:
-                    # Naabu JSON output format includes: ip, port, protocol, etc.
-                    port_number = result.get("port")
-                    if not port_number:
-                        continue
-
-                    port = Port(
-                        number=port_number,
-                        protocol=result.get("protocol", "tcp").upper(),
-                        state="open",  # Naabu only returns open ports
-                        service=result.get("service"),
-                        banner=result.get("version") or result.get("banner"),
-                    )
-
-                    # Store the IP address with this port for postprocess
-                    setattr(port, "_ip_address", ip.address)
-
-                    results.append(port)
-
-                    Logger.info(
-                        self.sketch_id,
-                        {
-                            "message": f"[NAABU] Found open port {port.number}/{port.protocol} on {ip.address}"
-                            + (f" ({port.service})" if port.service else "")
-                        },
-                    )
-
-            except Exception as e:
-                Logger.error(
+                # Store the IP address with this port for postprocess
+                setattr(port, "_ip_address", ip.address)
+
+                results.append(port)
+
+                Logger.info(
                     self.sketch_id,
-                    {"message": f"[NAABU] Error scanning {ip.address}: {e}"},
+                    {
+                        "message": f"[NAABU] Found open port {port.number}/{port.protocol} on {ip.address}"
+                        + (f" ({port.service})" if port.service else "")
+                    },
                 )
-                continue
 
         return results
 
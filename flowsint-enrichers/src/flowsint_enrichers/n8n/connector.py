@@ -1,5 +1,4 @@
 import json
-import aiohttp
 from typing import List, Dict, Any, Optional
 from flowsint_core.core.enricher_base import Enricher
 from flowsint_enrichers.registry import flowsint_enricher
@@ -286,56 +285,58 @@ Check Flowsint logs for detailed debugging information.
         )
 
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.post(url, headers=headers, json=payload) as response:
-                    Logger.info(
-                        self.sketch_id,
-                        {
-                            "message": f"n8n webhook responded with status: {response.status}"
-                        },
-                    )
-
-                    # Log the raw response text for debugging
-                    response_text = await response.text()
-                    Logger.info(
-                        self.sketch_id,
-                        {"message": f"n8n webhook raw response: {response_text}"},
-                    )
-
-                    if response.status != 200:
-                        Logger.warn(
-                            self.sketch_id,
-                            {
-                                "message": f"n8n responded with non-200 status: {response.status} - Response: {response_text}"
-                            },
-                        )
-                        raise Exception(
-                            f"n8n responded with {response.status}: {response_text}"
-                        )
-
-                    try:
-                        data = json.loads(response_text)
-                        Logger.info(
-                            self.sketch_id,
-                            {
-                                "message": f"n8n connector received response: {json.dumps(data)}"
-                            },
-                        )
-                        return data
-                    except json.JSONDecodeError as e:
-                        Logger.warn(
-                            self.sketch_id,
-                            {
-                                "message": f"Failed to parse n8n response as JSON: {str(e)} - Raw response: {response_text}"
-                            },
-                        )
-                        # Return the raw text wrapped in a list of dicts as expected
-                        return [
-                            {
-                                "raw_response": response_text,
-                                "error": "Response was not valid JSON",
-                            }
-                        ]
+            # Workflows can be slow, keep aiohttp's former 5 minute timeout
+            response = await self.http.post(
+                url, headers=headers, json=payload, timeout=300
+            )
+            Logger.info(
+                self.sketch_id,
+                {
+                    "message": f"n8n webhook responded with status: {response.status_code}"
+                },
+            )
+
+            # Log the raw response text for debugging
+            response_text = response.text
+            Logger.info(
+                self.sketch_id,
+                {"message": f"n8n webhook raw response: {response_text}"},
+            )
+
+            if response.status_code != 200:
+                Logger.warn(
+                    self.sketch_id,
+                    {
+                        "message": f"n8n responded with non-200 status: {response.status_code} - Response: {response_text}"
+                    },
+                )
+                raise Exception(
+                    f"n8n responded with {response.status_code}: {response_text}"
+                )
+
+            try:
+                data = json.loads(response_text)
+                Logger.info(
+                    self.sketch_id,
+                    {
+                        "message": f"n8n connector received response: {json.dumps(data)}"
+                    },
+                )
+                return data
+            except json.JSONDecodeError as e:
+                Logger.warn(
+                    self.sketch_id,
+                    {
+                        "message": f"Failed to parse n8n response as JSON: {str(e)} - Raw response: {response_text}"
+                    },
+                )
+                # Return the raw text wrapped in a list of dicts as expected
+                return [
+                    {
+                        "raw_response": response_text,
+                        "error": "Response was not valid JSON",
+                    }
+                ]
 
         except Exception as e:
             Logger.warn(
@@ -16,6 +16,9 @@ class OrgToAsnEnricher(Enricher):
     InputType = Organization
     OutputType = ASN
 
+    # Runs asnmap in a Docker container
+    queue = "docker"
+
     def __init__(
         self,
         sketch_id: Optional[str] = None,
@@ -5,10 +5,15 @@ register themselves in the global ENRICHER_REGISTRY.
 
 Auto-discovery is performed by calling load_all_enrichers() which imports all modules
 in the flowsint_enrichers package, triggering the @flowsint_enricher decorators.
+
+Enricher metadata (including the params JSON schema) is computed once and reused
+by the list methods until another enricher is registered.
 """
 
+import hashlib
 import inspect
 import importlib
+import json
 import os
 import sys
 from typing import Dict, Optional, Type, List, Any, TypeVar
@@ -26,6 +31,9 @@ class EnricherRegistry:
 
     def __init__(self):
         self._enrichers: Dict[str, Type[Enricher]] = {}
+        # Enricher name -> metadata, reset when an enricher is registered
+        self._metadata: Optional[Dict[str, Dict[str, Any]]] = None
+        self._version: Optional[str] = None
 
     def register(self, enricher_class: Type[E]) -> Type[E]:
         """
@@ -36,11 +44,16 @@ class EnricherRegistry:
             The same class (for use as a decorator)
         """
         self._enrichers[enricher_class.name()] = enricher_class
+        self._metadata = None
+        self._version = None
         return enricher_class
 
     def enricher_exists(self, name: str) -> bool:
         return name in self._enrichers
 
+    def get_enricher_class(self, name: str) -> Optional[Type[Enricher]]:
+        return self._enrichers.get(name)
+
     def get_enricher(
         self, name: str, sketch_id: str, scan_id: str, **kwargs
     ) -> Enricher:
@@ -65,6 +78,25 @@ class EnricherRegistry:
             "icon": enricher.icon(),
         }
 
+    def _all_metadata(self) -> Dict[str, Dict[str, Any]]:
+        """Metadata of every enricher, by name, computed once."""
+        metadata = self._metadata
+        if metadata is None:
+            metadata = {
+                name: self._create_enricher_metadata(enricher)
+                for name, enricher in self._enrichers.items()
+            }
+            self._metadata = metadata
+        return metadata
+
+    @property
+    def version(self) -> str:
+        """Content hash of the enricher metadata, changes when it does."""
+        if self._version is None:
+            encoded = json.dumps(self._all_metadata(), sort_keys=True, default=str)
+            self._version = hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+        return self._version
+
     def list(
         self, exclude: Optional[List[str]] = None, wobbly_type: Optional[bool] = False
     ) -> List[Dict[str, Any]]:
@@ -72,12 +104,9 @@ class EnricherRegistry:
             exclude = []
         return sorted(
             [
-                {
-                    **self._create_enricher_metadata(enricher),
-                    "wobblyType": wobbly_type,
-                }
-                for enricher in self._enrichers.values()
-                if enricher.name() not in exclude
+                {**metadata, "wobblyType": wobbly_type}
+                for name, metadata in self._all_metadata().items()
+                if name not in exclude
             ],
             key=lambda item: item["name"],
         )
@@ -85,10 +114,9 @@ class EnricherRegistry:
     def list_by_categories(self) -> Dict[str, List[Dict[str, str]]]:
         enrichers_by_category = {}
 
-        for enricher in self._enrichers.values():
-            category = enricher.category()
-            enrichers_by_category.setdefault(category, []).append(
-                self._create_enricher_metadata(enricher)
+        for metadata in self._all_metadata().values():
+            enrichers_by_category.setdefault(metadata["category"], []).append(
+                dict(metadata)
             )
 
         for items in enrichers_by_category.values():
@@ -107,16 +135,16 @@ class EnricherRegistry:
         input_type_lower = input_type.lower()
         if input_type_lower == "any":
             items = [
-                self._create_enricher_metadata(enricher)
-                for enricher in self._enrichers.values()
-                if enricher.name() not in exclude
+                dict(metadata)
+                for name, metadata in self._all_metadata().items()
+                if name not in exclude
             ]
         else:
             items = [
-                self._create_enricher_metadata(enricher)
-                for enricher in self._enrichers.values()
-                if enricher.input_schema()["type"].lower() in ("any", input_type_lower)
-                and enricher.name() not in exclude
+                dict(metadata)
+                for name, metadata in self._all_metadata().items()
+                if metadata["inputs"]["type"].lower() in ("any", input_type_lower)
+                and name not in exclude
             ]
         items.sort(key=lambda x: x["name"])
 
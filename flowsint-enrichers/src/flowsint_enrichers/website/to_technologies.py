@@ -14,6 +14,9 @@ class TechDetectEnricher(Enricher):
     InputType = Website
     OutputType = Technology
 
+    # Runs httpx in a Docker container
+    queue = "docker"
+
     def __init__(
         self,
         sketch_id: Optional[str] = None,
@@ -75,17 +78,19 @@ class TechDetectEnricher(Enricher):
             )
             return results
 
-        for website in data:
-            url = str(website.url)
-            try:
-                probes = httpx.launch(url, args=["-td"])
-            except Exception as e:
-                Logger.error(
-                    self.sketch_id,
-                    {"message": f"[HTTPX] Error probing {url}: {e}"},
-                )
-                continue
+        # Probe every website in a single httpx run
+        urls = [str(website.url) for website in data]
+        try:
+            probes_by_url = httpx.launch_batch(urls, args=["-td"])
+        except Exception as e:
+            Logger.error(
+                self.sketch_id,
+                {"message": f"[HTTPX] Error probing {len(urls)} website(s): {e}"},
+            )
+            return results
 
+        for url in urls:
+            probes = probes_by_url.get(url, [])
             seen: set[tuple[str, Optional[str]]] = set()
             for probe in probes:
                 for entry in probe.get("tech", []) or []:
@@ -1,9 +1,217 @@
+"""
+Docker-backed tool execution.
+
+Every run used to pull the image, start a fresh container, buffer all of its
+output and, on failure, run the same command a second time. Runs now go
+through a small execution engine:
+
+- image presence is checked once per process (`install()` still pulls)
+- commands are dispatched with `docker exec` into a pool of long-lived,
+  pre-started containers per image, so container startup is paid once
+- stdout is streamed to the caller line by line (`DockerTool.stream`)
+- a batch of targets is uploaded into the container as a file and handed to
+  the tool either with a list flag (e.g. `-l targets.txt`) or on stdin
+
+The pool size per image is set with DOCKER_TOOL_POOL_SIZE (default 2), 0
+disables pooling and falls back to one container per run.
+"""
+
+import atexit
+import io
+import json
+import os
+import shlex
+import tarfile
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from typing import Dict, Iterable, Iterator, List, Literal, Optional
+
 from docker import from_env, DockerClient
-from docker.errors import ImageNotFound, APIError, DockerException
+from docker.errors import ImageNotFound, APIError, DockerException, NotFound
 from .base import Tool
 
+DEFAULT_POOL_SIZE = int(os.getenv("DOCKER_TOOL_POOL_SIZE", "2"))
+
+POOL_LABEL = "flowsint.tool-pool"
+
+# Keeps a pooled container alive while it waits for `docker exec` calls
+IDLE_ENTRYPOINT = ["tail", "-f", "/dev/null"]
+
+TARGETS_DIR = "/tmp"
+
+# Bytes of stderr kept to explain a failed run
+STDERR_TAIL_BYTES = 4096
+
+# Image -> entrypoint, for images known to be present in this process
+_image_cache: Dict[str, List[str]] = {}
+_image_cache_lock = threading.Lock()
+
+
+def iter_lines(chunks: Iterable[bytes]) -> Iterator[str]:
+    """
+    Split a stream of byte chunks into decoded lines.
+
+    Chunks may cut lines (or multi-byte characters) anywhere, so the partial
+    tail is kept until its newline arrives. A trailing line without newline
+    is yielded at the end of the stream.
+    """
+    buffer = b""
+    for chunk in chunks:
+        if not chunk:
+            continue
+        buffer += chunk
+        *lines, buffer = buffer.split(b"\n")
+        for line in lines:
+            yield line.decode("utf-8", errors="replace").rstrip("\r")
+    if buffer:
+        yield buffer.decode("utf-8", errors="replace").rstrip("\r")
+
+
+def iter_json_lines(lines: Iterable[str]) -> Iterator[dict]:
+    """Parse JSONL output as it streams, skipping blank and malformed lines."""
+    for line in lines:
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError:
+            continue
+        if isinstance(record, dict):
+            yield record
+
+
+def targets_archive(name: str, targets: Iterable[str]) -> bytes:
+    """Build a tar archive holding a newline-separated target file."""
+    data = "".join(f"{target}\n" for target in targets).encode("utf-8")
+    archive = io.BytesIO()
+    with tarfile.open(fileobj=archive, mode="w") as tar:
+        info = tarfile.TarInfo(name=name)
+        info.size = len(data)
+        info.mtime = int(time.time())
+        tar.addfile(info, io.BytesIO(data))
+    return archive.getvalue()
+
+
+class ContainerPool:
+    """
+    Pool of long-lived containers of one image.
+
+    Each container runs an idle process and gets one `docker exec` at a time.
+    Containers whose exec was interrupted (timeout, abandoned stream, error)
+    are removed instead of being put back.
+    """
+
+    def __init__(self, client: DockerClient, image: str, size: int):
+        self.client = client
+        self.image = image
+        self.size = max(1, size)
+        self._idle: List = []
+        self._count = 0
+        self._condition = threading.Condition()
+
+    def _start_container(self):
+        return self.client.containers.run(
+            self.image,
+            entrypoint=IDLE_ENTRYPOINT,
+            detach=True,
+            remove=True,
+            tty=False,
+            stdin_open=False,
+            network_mode="bridge",
+            environment={"TERM": "dumb"},
+            labels={POOL_LABEL: self.image},
+        )
+
+    @contextmanager
+    def container(self) -> Iterator:
+        """
+        Check out a container for one exec.
+
+        The body must set `healthy = True` on the yielded handle's `state`
+        dict once its exec finished, otherwise the container is discarded.
+        """
+        with self._condition:
+            while not self._idle and self._count >= self.size:
+                self._condition.wait()
+            container = self._idle.pop() if self._idle else None
+            if container is None:
+                self._count += 1
+        if container is None:
+            try:
+                container = self._start_container()
+            except Exception:
+                with self._condition:
+                    self._count -= 1
+                    self._condition.notify()
+                raise
+
+        state = {"healthy": False}
+        try:
+            yield container, state
+        finally:
+            if state["healthy"]:
+                with self._condition:
+                    self._idle.append(container)
+                    self._condition.notify()
+            else:
+                self._discard(container)
+
+    def _discard(self, container) -> None:
+        try:
+            container.remove(force=True)
+        except (NotFound, APIError):
+            pass
+        with self._condition:
+            self._count -= 1
+            self._condition.notify()
+
+    def close(self) -> None:
+        """Remove the idle containers."""
+        with self._condition:
+            idle, self._idle = self._idle, []
+            self._count -= len(idle)
+        for container in idle:
+            try:
+                container.remove(force=True)
+            except (NotFound, APIError, DockerException):
+                pass
+
+
+_pools: Dict[str, ContainerPool] = {}
+_pools_lock = threading.Lock()
+
+
+def get_container_pool(
+    client: DockerClient, image: str, size: Optional[int] = None
+) -> ContainerPool:
+    """Get the process-wide container pool of an image."""
+    with _pools_lock:
+        pool = _pools.get(image)
+        if pool is None:
+            pool = _pools[image] = ContainerPool(
+                client, image, DEFAULT_POOL_SIZE if size is None else size
+            )
+        return pool
+
+
+def close_container_pools() -> None:
+    """Remove the idle containers of every pool of this process."""
+    with _pools_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+    for pool in pools:
+        pool.close()
+
+
+atexit.register(close_container_pools)
+
 
 class DockerTool(Tool):
+    pool_size: Optional[int] = None
+
     def __init__(self, image: str, default_tag: str = "latest"):
         self.image = f"{image}:{default_tag}"
         try:
@@ -23,6 +231,36 @@ class DockerTool(Tool):
             self.client.images.pull(self.image)
         except APIError as e:
             raise RuntimeError(f"Failed to pull image {self.image}: {e.explanation}")
+        with _image_cache_lock:
+            _image_cache.pop(self.image, None)
+        self.ensure_image()
+
+    def ensure_image(self) -> List[str]:
+        """
+        Make sure the image is present, pulling it only if it is missing.
+        The result is cached for the lifetime of the process.
+
+        Returns:
+            The image entrypoint
+        """
+        entrypoint = _image_cache.get(self.image)
+        if entrypoint is not None:
+            return entrypoint
+        try:
+            image = self.client.images.get(self.image)
+        except ImageNotFound:
+            try:
+                print(f"[DockerTool] Pulling image: {self.image}")
+                image = self.client.images.pull(self.image)
+            except APIError as e:
+                raise RuntimeError(
+                    f"Failed to pull image {self.image}: {e.explanation}"
+                )
+        config = image.attrs.get("Config") or {}
+        entrypoint = list(config.get("Entrypoint") or [])
+        with _image_cache_lock:
+            _image_cache[self.image] = entrypoint
+        return entrypoint
 
     def version(self) -> str:
         try:
@@ -46,61 +284,220 @@ class DockerTool(Tool):
         except ImageNotFound:
             return False
 
-    def launch(self, command: str, volumes: dict = None, timeout: int = 30, environment: dict = None):
-        self.install()
-        # Merge default environment with custom environment
+    @staticmethod
+    def build_argv(
+        entrypoint: List[str],
+        command: str,
+        targets_path: Optional[str] = None,
+        targets_via: Literal["file", "stdin"] = "file",
+        targets_flag: str = "-l",
+    ) -> List[str]:
+        """
+        Build the argv of a run.
+
+        With a target file, it is either passed with `targets_flag` or
+        redirected to the tool's stdin through the image shell.
+        """
+        argv = entrypoint + shlex.split(command)
+        if targets_path is None:
+            return argv
+        if targets_via == "stdin":
+            return ["sh", "-c", f"{shlex.join(argv)} < {shlex.quote(targets_path)}"]
+        return argv + [targets_flag, targets_path]
+
+    def stream(
+        self,
+        command: str,
+        targets: Optional[Iterable[str]] = None,
+        targets_via: Literal["file", "stdin"] = "file",
+        targets_flag: str = "-l",
+        environment: Optional[dict] = None,
+        timeout: Optional[float] = None,
+        volumes: Optional[dict] = None,
+    ) -> Iterator[str]:
+        """
+        Run the tool and yield its stdout line by line as it is produced.
+
+        Args:
+            command: Tool arguments (the image entrypoint is prepended)
+            targets: Batch of targets, written to a file in the container
+            targets_via: Pass the target file with `targets_flag` or on stdin
+            targets_flag: Tool flag taking a target list file
+            environment: Extra environment variables (e.g. API keys)
+            timeout: Seconds before the run is killed, None for no limit
+            volumes: Volumes to mount, forces a dedicated container
+
+        Raises:
+            RuntimeError: If the run fails, times out or exits non-zero
+        """
+        entrypoint = self.ensure_image()
         env = {"TERM": "dumb"}  # Set terminal type to avoid TTY issues
         if environment:
             env.update(environment)
+        targets = list(targets) if targets is not None else None
+        targets_path = (
+            f"{TARGETS_DIR}/flowsint-targets-{uuid.uuid4().hex}.txt"
+            if targets is not None
+            else None
+        )
+        argv = self.build_argv(
+            entrypoint, command, targets_path, targets_via, targets_flag
+        )
 
+        pool_size = DEFAULT_POOL_SIZE if self.pool_size is None else self.pool_size
         try:
-            result = self.client.containers.run(
-                self.image,
-                command=command,
-                remove=True,
-                stdout=True,
-                stderr=True,
-                volumes=volumes or {},
-                detach=False,
-                tty=False,
-                network_mode="bridge",
-                stdin_open=False,  # Ensure stdin is not open
-                environment=env,
-            )
-            return result.decode()
-        except ImageNotFound:
-            raise RuntimeError(f"Image {self.image} not found. Did you run install()?")
+            if volumes or pool_size <= 0:
+                yield from self._stream_oneshot(
+                    argv, env, targets, targets_path, timeout, volumes
+                )
+            else:
+                pool = get_container_pool(self.client, self.image, pool_size)
+                yield from self._stream_pooled(
+                    pool, argv, env, targets, targets_path, timeout
+                )
         except DockerException as e:
-            # Try to get more detailed error information
-            error_detail = str(e)
-            if hasattr(e, "response") and hasattr(e.response, "json"):
-                try:
-                    error_json = e.response.json()
-                    error_detail = f"{str(e)} - Details: {error_json}"
-                except:
-                    pass
-
-            # Check if it's a container exit error
-            if "returned non-zero exit status" in str(e):
-                # Try to run the command with stderr capture to see what went wrong
-                try:
-                    test_result = self.client.containers.run(
-                        self.image,
-                        command=command,
-                        remove=True,
-                        stdout=True,
-                        stderr=True,
-                        detach=False,
-                        tty=False,
-                        network_mode="bridge",
-                        stdin_open=False,
-                        environment=env,
-                    )
-                    # If we get here, the command actually worked
-                    return test_result.decode()
-                except DockerException as test_e:
-                    error_detail = f"{str(e)} - Test run also failed: {str(test_e)}"
+            raise RuntimeError(f"Docker error while running {self.image}: {e}")
+
+    def _stream_pooled(
+        self,
+        pool: ContainerPool,
+        argv: List[str],
+        env: dict,
+        targets: Optional[List[str]],
+        targets_path: Optional[str],
+        timeout: Optional[float],
+    ) -> Iterator[str]:
+        api = self.client.api
+        with pool.container() as (container, state):
+            if targets_path is not None:
+                container.put_archive(
+                    TARGETS_DIR,
+                    targets_archive(os.path.basename(targets_path), targets),
+                )
+            exec_id = api.exec_create(
+                container.id, argv, stdout=True, stderr=True, environment=env
+            )["Id"]
+            # The exec process can't be killed on its own, so a timed out run
+            # takes its container down with it
+            stderr = bytearray()
+            with self._watchdog(container, timeout) as timed_out:
+                output = api.exec_start(exec_id, stream=True, demux=True)
+                yield from iter_lines(self._split_demuxed(output, stderr))
+            if timed_out.is_set():
+                raise RuntimeError(f"{self.image} timed out after {timeout}s")
+
+            exit_code = api.exec_inspect(exec_id).get("ExitCode")
+            if targets_path is not None:
+                api.exec_start(
+                    api.exec_create(container.id, ["rm", "-f", targets_path])["Id"]
+                )
+            state["healthy"] = True
+            self._check_exit_code(exit_code, stderr)
 
+    def _stream_oneshot(
+        self,
+        argv: List[str],
+        env: dict,
+        targets: Optional[List[str]],
+        targets_path: Optional[str],
+        timeout: Optional[float],
+        volumes: Optional[dict],
+    ) -> Iterator[str]:
+        container = self.client.containers.create(
+            self.image,
+            entrypoint=argv[:1],
+            command=argv[1:],
+            volumes=volumes or {},
+            tty=False,
+            stdin_open=False,
+            network_mode="bridge",
+            environment=env,
+        )
+        try:
+            if targets_path is not None:
+                container.put_archive(
+                    TARGETS_DIR,
+                    targets_archive(os.path.basename(targets_path), targets),
+                )
+            container.start()
+            with self._watchdog(container, timeout) as timed_out:
+                yield from iter_lines(
+                    container.logs(stream=True, follow=True, stdout=True, stderr=False)
+                )
+            if timed_out.is_set():
+                raise RuntimeError(f"{self.image} timed out after {timeout}s")
+            exit_code = container.wait().get("StatusCode")
+            stderr = container.logs(stdout=False, stderr=True)[-STDERR_TAIL_BYTES:]
+            self._check_exit_code(exit_code, stderr)
+        finally:
+            try:
+                container.remove(force=True)
+            except (NotFound, APIError):
+                pass
+
+    @staticmethod
+    @contextmanager
+    def _watchdog(container, timeout: Optional[float]) -> Iterator[threading.Event]:
+        """Kill `container` if the block runs longer than `timeout` seconds."""
+        timed_out = threading.Event()
+        if not timeout:
+            yield timed_out
+            return
+
+        def expire():
+            timed_out.set()
+            try:
+                container.kill()
+            except (NotFound, APIError):
+                pass
+
+        timer = threading.Timer(timeout, expire)
+        timer.daemon = True
+        timer.start()
+        try:
+            yield timed_out
+        finally:
+            timer.cancel()
+
+    @staticmethod
+    def _split_demuxed(output: Iterable, stderr: bytearray) -> Iterator[bytes]:
+        """Yield the stdout chunks of a demuxed exec stream, keep stderr's tail."""
+        for stdout_chunk, stderr_chunk in output:
+            if stderr_chunk:
+                stderr.extend(stderr_chunk)
+                del stderr[:-STDERR_TAIL_BYTES]
+            if stdout_chunk:
+                yield stdout_chunk
+
+    def _check_exit_code(self, exit_code: Optional[int], stderr: bytes) -> None:
+        if exit_code:
+            detail = bytes(stderr).decode("utf-8", errors="replace").strip()
             raise RuntimeError(
-                f"Docker error while running {self.image}: {error_detail}"
+                f"{self.image} exited with status {exit_code}"
+                + (f": {detail}" if detail else "")
             )
+
+    def launch(
+        self,
+        command: str,
+        volumes: dict = None,
+        timeout: Optional[float] = None,
+        environment: dict = None,
+        targets: Optional[Iterable[str]] = None,
+        targets_via: Literal["file", "stdin"] = "file",
+        targets_flag: str = "-l",
+    ) -> str:
+        """
+        Run the tool to completion and return its stdout.
+        See `stream()` for the arguments.
+        """
+        lines = self.stream(
+            command,
+            targets=targets,
+            targets_via=targets_via,
+            targets_flag=targets_flag,
+            environment=environment,
+            timeout=timeout,
+            volumes=volumes,
+        )
+        return "".join(f"{line}\n" for line in lines)
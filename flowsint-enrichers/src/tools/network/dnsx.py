@@ -1,6 +1,6 @@
 import json
-from typing import List
-from ..dockertool import DockerTool
+from typing import Dict, List
+from ..dockertool import DockerTool, iter_json_lines
 
 
 class DnsxTool(DockerTool):
@@ -124,6 +124,60 @@ class DnsxTool(DockerTool):
 
         return self._parse_resolved_ips(result)
 
+    def resolve_domains(
+        self, domains: List[str], aaaa: bool = True, api_key: str = None
+    ) -> Dict[str, List[str]]:
+        """
+        Resolve a batch of domains in a single dnsx run.
+
+        The domains are passed as a target list and the JSONL output is parsed
+        as it streams. Each record is mapped back to its input through its
+        ``host`` key.
+
+        Args:
+            domains: Domain names to resolve
+            aaaa: Whether to also query AAAA (IPv6) records. Defaults to True.
+            api_key: Optional ProjectDiscovery Cloud Platform API key
+
+        Returns:
+            Mapping of every input domain (in input order) to its ordered,
+            de-duplicated resolved IP addresses, empty if it didn't resolve.
+        """
+        results: Dict[str, List[str]] = {domain: [] for domain in domains}
+        if not results:
+            return results
+        by_host = {domain.lower().rstrip("."): domain for domain in results}
+
+        flags = ["-a"]
+        if aaaa:
+            flags.append("-aaaa")
+        flags += ["-json", "-silent"]
+
+        env = {}
+        if api_key:
+            env["PDCP_API_KEY"] = api_key
+
+        try:
+            lines = self.stream(" ".join(flags), targets=results, environment=env)
+            for record in iter_json_lines(lines):
+                host = str(record.get("host", "")).lower().rstrip(".")
+                domain = by_host.get(host)
+                if domain is None:
+                    continue
+                ips = results[domain]
+                for ip in self._record_ips(record):
+                    if ip not in ips:
+                        ips.append(ip)
+        except Exception as e:
+            raise RuntimeError(f"Error running dnsx: {str(e)}")
+
+        return results
+
+    @staticmethod
+    def _record_ips(record: dict) -> List[str]:
+        """A then AAAA addresses of a dnsx JSON record."""
+        return [ip for key in ("a", "aaaa") for ip in (record.get(key, []) or []) if ip]
+
     @staticmethod
     def _parse_resolved_ips(result: str) -> List[str]:
         """
@@ -148,10 +202,9 @@ class DnsxTool(DockerTool):
             except json.JSONDecodeError:
                 continue
 
-            for key in ("a", "aaaa"):
-                for ip in record.get(key, []) or []:
-                    if ip and ip not in seen:
-                        seen.add(ip)
-                        ips.append(ip)
+            for ip in DnsxTool._record_ips(record):
+                if ip not in seen:
+                    seen.add(ip)
+                    ips.append(ip)
 
         return ips
@@ -1,6 +1,6 @@
 import json
-from typing import Any, List
-from ..dockertool import DockerTool
+from typing import Any, Dict, List
+from ..dockertool import DockerTool, iter_json_lines
 
 
 class HttpxTool(DockerTool):
@@ -73,3 +73,32 @@ class HttpxTool(DockerTool):
                 except json.JSONDecodeError as e:
                     raise e
         return results
+
+    def launch_batch(
+        self, targets: List[str], args: List[str] | None = None
+    ) -> Dict[str, List[dict]]:
+        """
+        Probe a batch of targets in a single httpx run.
+
+        The targets are passed as a target list and the JSONL output is parsed
+        as it streams. Each result is mapped back to its target through its
+        ``input`` key.
+
+        Args:
+            targets: URLs or hosts to probe
+            args: Extra httpx flags (e.g. ["-td"])
+
+        Returns:
+            Mapping of every input target (in input order) to its probe
+            results, empty if the target was unreachable.
+        """
+        results: Dict[str, List[dict]] = {target: [] for target in targets}
+        if not results:
+            return results
+
+        command = " ".join((args or []) + ["-json", "-silent"])
+        for record in iter_json_lines(self.stream(command, targets=results)):
+            target = record.get("input")
+            if target in results:
+                results[target].append(record)
+        return results
@@ -1,4 +1,5 @@
-from typing import List
+import ipaddress
+from typing import Any, Dict, List
 from ..dockertool import DockerTool
 
 
@@ -107,3 +108,59 @@ class MapcidrTool(DockerTool):
             raise RuntimeError(
                 f"Error running mapcidr: {str(e)}. Output: {getattr(e, 'output', 'No output')}"
             )
+
+    def launch_batch(
+        self, cidrs: List[str], api_key: str = None
+    ) -> Dict[str, List[str]]:
+        """
+        Expand a batch of CIDR ranges in a single mapcidr run.
+
+        mapcidr only prints addresses, so each one is mapped back to the
+        input ranges containing it.
+
+        Args:
+            cidrs: CIDR blocks to expand
+            api_key: Optional ProjectDiscovery Cloud Platform API key
+
+        Returns:
+            Mapping of every input CIDR (in input order) to its IP addresses
+        """
+        results: Dict[str, List[str]] = {cidr: [] for cidr in cidrs}
+        if not results:
+            return results
+
+        # Prefix length -> network -> input CIDRs, so an address is matched
+        # with one lookup per distinct prefix length
+        networks: Dict[int, Dict[Any, List[str]]] = {}
+        for cidr in results:
+            network = ipaddress.ip_network(cidr, strict=False)
+            networks.setdefault(network.prefixlen, {}).setdefault(network, []).append(
+                cidr
+            )
+
+        env = {}
+        if api_key:
+            env["PDCP_API_KEY"] = api_key
+
+        try:
+            lines = self.stream(
+                "-silent", targets=results, targets_flag="-cl", environment=env
+            )
+            for line in lines:
+                line = line.strip()
+                try:
+                    address = ipaddress.ip_address(line)
+                except ValueError:
+                    continue
+                for prefixlen, by_network in networks.items():
+                    if prefixlen > address.max_prefixlen:
+                        continue
+                    network = ipaddress.ip_network(
+                        f"{address}/{prefixlen}", strict=False
+                    )
+                    for cidr in by_network.get(network, ()):
+                        results[cidr].append(line)
+        except Exception as e:
+            raise RuntimeError(f"Error running mapcidr: {str(e)}")
+
+        return results
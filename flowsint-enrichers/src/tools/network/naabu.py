@@ -1,6 +1,6 @@
 import json
-from typing import Any, List, Optional, Literal
-from ..dockertool import DockerTool
+from typing import Any, Dict, List, Optional, Literal
+from ..dockertool import DockerTool, iter_json_lines
 
 
 class NaabuTool(DockerTool):
@@ -77,30 +77,9 @@ class NaabuTool(DockerTool):
         Returns:
             List of dictionaries containing port scan results
         """
-        # Build command arguments
-        args = ["-host", target, "-json", "-silent"]
-
-        # Add mode-specific flags
-        if mode == "passive":
-            args.append("-passive")
-        # active mode is the default, no flag needed
-
-        # Add port specification
-        if port_range:
-            args.extend(["-p", port_range])
-        elif top_ports:
-            args.extend(["-top-ports", top_ports])
-        # If neither specified, naabu will use its defaults
-
-        # Add performance options
-        if rate:
-            args.extend(["-rate", str(rate)])
-        if timeout:
-            args.extend(["-timeout", str(timeout)])
-
-        # Add service detection
-        if service_detection:
-            args.append("-sV")
+        args = ["-host", target] + self._build_args(
+            mode, port_range, top_ports, rate, timeout, service_detection
+        )
 
         # Prepare environment variables
         env = {}
@@ -137,3 +116,94 @@ class NaabuTool(DockerTool):
             raise RuntimeError(
                 f"Error running naabu: {str(e)}. Output: {getattr(e, 'output', 'No output')}"
             )
+
+    def launch_batch(
+        self,
+        targets: List[str],
+        mode: Literal["active", "passive"] = "passive",
+        port_range: Optional[str] = None,
+        top_ports: Optional[str] = None,
+        rate: Optional[int] = None,
+        timeout: Optional[int] = None,
+        service_detection: bool = False,
+        api_key: Optional[str] = None,
+    ) -> Dict[str, List[dict]]:
+        """
+        Scan a batch of targets in a single naabu run.
+
+        The targets are passed as a target list (``-list``) and the JSONL
+        output is parsed as it streams. Each result is mapped back to its
+        input through its ``ip`` (or ``host``) key.
+
+        Args:
+            targets: IP addresses to scan
+            See `launch()` for the other arguments.
+
+        Returns:
+            Mapping of every input target (in input order) to its port scan
+            results, empty if no open port was found.
+        """
+        results: Dict[str, List[dict]] = {target: [] for target in targets}
+        if not results:
+            return results
+
+        args = self._build_args(
+            mode, port_range, top_ports, rate, timeout, service_detection
+        )
+        env = {}
+        if api_key:
+            env["PDCP_API_KEY"] = api_key
+
+        try:
+            lines = self.stream(
+                " ".join(args),
+                targets=results,
+                targets_flag="-list",
+                environment=env if env else None,
+            )
+            for record in iter_json_lines(lines):
+                for key in ("ip", "host"):
+                    target = record.get(key)
+                    if target in results:
+                        results[target].append(record)
+                        break
+        except Exception as e:
+            raise RuntimeError(f"Error running naabu: {str(e)}")
+
+        return results
+
+    @staticmethod
+    def _build_args(
+        mode: str,
+        port_range: Optional[str],
+        top_ports: Optional[str],
+        rate: Optional[int],
+        timeout: Optional[int],
+        service_detection: bool,
+    ) -> List[str]:
+        """Build the naabu flags shared by single and batch scans."""
+        args = ["-json", "-silent"]
+
+        # Add mode-specific flags
+        if mode == "passive":
+            args.append("-passive")
+        # active mode is the default, no flag needed
+
+        # Add port specification
+        if port_range:
+            args.extend(["-p", port_range])
+        elif top_ports:
+            args.extend(["-top-ports", top_ports])
+        # If neither specified, naabu will use its defaults
+
+        # Add performance options
+        if rate:
+            args.extend(["-rate", str(rate)])
+        if timeout:
+            args.extend(["-timeout", str(timeout)])
+
+        # Add service detection
+        if service_detection:
+            args.append("-sV")
+
+        return args
@@ -1,3 +1,5 @@
+from unittest.mock import MagicMock
+
 import pytest
 from tests.logger import TestLogger
 
@@ -19,7 +21,7 @@ def setup_test_environment(monkeypatch):
 def mock_logger(monkeypatch):
     """Automatically replace the production Logger with TestLogger for all tests."""
     monkeypatch.setattr("flowsint_core.core.logger.Logger", TestLogger)
-    # Mock the emit_event_task to do nothing
+    # Keep log events away from Redis
     monkeypatch.setattr(
-        "flowsint_core.core.logger.emit_event_task.delay", lambda *args, **kwargs: None
+        "flowsint_core.core.logger.get_event_publisher", lambda: MagicMock()
     )
@@ -74,9 +74,9 @@ class _FakeDnsx:
         self._mapping = mapping
         self.calls = []
 
-    def resolve_domain(self, domain, aaaa=True, api_key=None):
-        self.calls.append((domain, aaaa, api_key))
-        return self._mapping.get(domain, [])
+    def resolve_domains(self, domains, aaaa=True, api_key=None):
+        self.calls.append((domains, aaaa, api_key))
+        return {domain: self._mapping.get(domain, []) for domain in domains}
 
 
 @pytest.mark.asyncio
@@ -114,7 +114,7 @@ async def test_scan_ipv6_param_disables_aaaa(monkeypatch):
     await enricher.scan([Domain(domain="example.com")])
 
     # aaaa flag forwarded to the tool as False
-    assert fake.calls == [("example.com", False, None)]
+    assert fake.calls == [(["example.com"], False, None)]
 
 
 @pytest.mark.asyncio
@@ -71,9 +71,9 @@ class _FakeHttpx:
         self._by_url = by_url
         self.calls = []
 
-    def launch(self, target, args=None):
-        self.calls.append((target, args))
-        return self._by_url.get(target, [])
+    def launch_batch(self, targets, args=None):
+        self.calls.append((targets, args))
+        return {target: self._by_url.get(target, []) for target in targets}
 
 
 @pytest.mark.asyncio
@@ -97,7 +97,7 @@ async def test_scan_extracts_and_dedupes_technologies(monkeypatch):
     assert all(isinstance(t, Technology) for t in results)
     assert all(getattr(t, "_source_url") == "https://example.com/" for t in results)
     # -td flag forwarded to httpx
-    assert fake.calls == [("https://example.com/", ["-td"])]
+    assert fake.calls == [(["https://example.com/"], ["-td"])]
 
 
 @pytest.mark.asyncio
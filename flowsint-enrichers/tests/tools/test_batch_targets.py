@@ -0,0 +1,113 @@
+"""Tests for the batch target APIs of the ProjectDiscovery tool wrappers."""
+
+import json
+
+from tools.network.dnsx import DnsxTool
+from tools.network.httpx import HttpxTool
+from tools.network.mapcidr import MapcidrTool
+from tools.network.naabu import NaabuTool
+
+
+def make_tool(tool_class, lines):
+    """Build a tool without a Docker client, streaming canned output."""
+    tool = object.__new__(tool_class)
+    tool.calls = []
+
+    def stream(command, **kwargs):
+        tool.calls.append((command, kwargs))
+        yield from lines
+
+    tool.stream = stream
+    return tool
+
+
+def jsonl(*records):
+    return [json.dumps(record) for record in records]
+
+
+def test_dnsx_resolve_domains_maps_hosts_back():
+    tool = make_tool(
+        DnsxTool,
+        jsonl(
+            {"host": "b.com", "a": ["2.2.2.2"]},
+            {"host": "A.com", "a": ["1.1.1.1"], "aaaa": ["::1"]},
+            {"host": "unknown.com", "a": ["9.9.9.9"]},
+        )
+        + ["not json"],
+    )
+
+    results = tool.resolve_domains(["a.com", "b.com", "c.com"], api_key="k")
+
+    assert results == {
+        "a.com": ["1.1.1.1", "::1"],
+        "b.com": ["2.2.2.2"],
+        "c.com": [],
+    }
+    command, kwargs = tool.calls[0]
+    assert command == "-a -aaaa -json -silent"
+    assert list(kwargs["targets"]) == ["a.com", "b.com", "c.com"]
+    assert kwargs["environment"] == {"PDCP_API_KEY": "k"}
+
+
+def test_naabu_launch_batch_uses_a_target_list():
+    tool = make_tool(
+        NaabuTool,
+        jsonl(
+            {"ip": "1.1.1.1", "port": 443, "protocol": "tcp"},
+            {"ip": "1.1.1.1", "port": 80, "protocol": "tcp"},
+            {"host": "2.2.2.2", "port": 22, "protocol": "tcp"},
+        ),
+    )
+
+    results = tool.launch_batch(["1.1.1.1", "2.2.2.2", "3.3.3.3"], top_ports="100")
+
+    assert [r["port"] for r in results["1.1.1.1"]] == [443, 80]
+    assert [r["port"] for r in results["2.2.2.2"]] == [22]
+    assert results["3.3.3.3"] == []
+    command, kwargs = tool.calls[0]
+    assert command == "-json -silent -passive -top-ports 100"
+    assert kwargs["targets_flag"] == "-list"
+
+
+def test_httpx_launch_batch_maps_by_input():
+    tool = make_tool(
+        HttpxTool,
+        jsonl(
+            {"input": "https://b.com", "tech": ["nginx"]},
+            {"input": "https://a.com", "tech": ["PHP"]},
+        ),
+    )
+
+    results = tool.launch_batch(["https://a.com", "https://b.com"], args=["-td"])
+
+    assert list(results) == ["https://a.com", "https://b.com"]
+    assert results["https://a.com"][0]["tech"] == ["PHP"]
+    assert tool.calls[0][0] == "-td -json -silent"
+
+
+def test_mapcidr_launch_batch_maps_addresses_to_ranges():
+    tool = make_tool(
+        MapcidrTool,
+        ["10.0.0.1", "10.0.0.2", "10.0.1.1", "2001:db8::1", "garbage"],
+    )
+
+    results = tool.launch_batch(["10.0.0.0/24", "10.0.0.0/16", "2001:db8::/126"])
+
+    assert results == {
+        "10.0.0.0/24": ["10.0.0.1", "10.0.0.2"],
+        "10.0.0.0/16": ["10.0.0.1", "10.0.0.2", "10.0.1.1"],
+        "2001:db8::/126": ["2001:db8::1"],
+    }
+    assert tool.calls[0][1]["targets_flag"] == "-cl"
+
+
+def test_empty_batches_do_not_run_the_tool():
+    for tool_class, method in [
+        (DnsxTool, "resolve_domains"),
+        (HttpxTool, "launch_batch"),
+        (MapcidrTool, "launch_batch"),
+        (NaabuTool, "launch_batch"),
+    ]:
+        tool = make_tool(tool_class, [])
+        assert getattr(tool, method)([]) == {}
+        assert tool.calls == []
@@ -0,0 +1,220 @@
+"""Tests for the DockerTool execution engine, against a fake Docker client."""
+
+import io
+import tarfile
+from unittest.mock import MagicMock
+
+import pytest
+from docker.errors import ImageNotFound
+
+from tools import dockertool
+from tools.dockertool import DockerTool, iter_lines
+
+
+class FakeContainer:
+    def __init__(self, client, entrypoint=None, command=None):
+        self.client = client
+        self.id = f"container-{len(client.started)}"
+        self.entrypoint = entrypoint
+        self.command = command
+        self.archives = []
+        self.removed = False
+        self.killed = False
+
+    def put_archive(self, path, data):
+        with tarfile.open(fileobj=io.BytesIO(data)) as tar:
+            member = tar.getmembers()[0]
+            content = tar.extractfile(member).read().decode()
+        self.archives.append((f"{path}/{member.name}", content))
+
+    def start(self):
+        pass
+
+    def logs(self, stream=False, follow=False, stdout=True, stderr=False):
+        if stream:
+            return iter(self.client.chunks)
+        return b"oneshot stderr"
+
+    def wait(self):
+        return {"StatusCode": self.client.exit_code}
+
+    def kill(self):
+        self.killed = True
+
+    def remove(self, force=False):
+        self.removed = True
+
+
+class FakeApi:
+    def __init__(self, client):
+        self.client = client
+        self.execs = []
+
+    def exec_create(self, container_id, argv, **kwargs):
+        self.execs.append((container_id, argv, kwargs))
+        return {"Id": len(self.execs) - 1}
+
+    def exec_start(self, exec_id, stream=False, demux=False):
+        if stream:
+            return iter((chunk, None) for chunk in self.client.chunks)
+        return b""
+
+    def exec_inspect(self, exec_id):
+        return {"ExitCode": self.client.exit_code}
+
+
+class FakeClient:
+    def __init__(self, chunks=(), exit_code=0, image_present=True):
+        self.chunks = list(chunks)
+        self.exit_code = exit_code
+        self.image_present = image_present
+        self.started = []
+        self.api = FakeApi(self)
+        self.images = MagicMock()
+        image = MagicMock(attrs={"Config": {"Entrypoint": ["dnsx"]}})
+        self.images.get.side_effect = self._get_image
+        self.images.pull.return_value = image
+        self._image = image
+        self.containers = MagicMock()
+        self.containers.run.side_effect = self._run
+        self.containers.create.side_effect = self._create
+
+    def _get_image(self, name):
+        if not self.image_present:
+            raise ImageNotFound(name)
+        return self._image
+
+    def _run(self, image, **kwargs):
+        container = FakeContainer(self, entrypoint=kwargs.get("entrypoint"))
+        self.started.append(container)
+        return container
+
+    def _create(self, image, entrypoint=None, command=None, **kwargs):
+        container = FakeContainer(self, entrypoint=entrypoint, command=command)
+        self.started.append(container)
+        return container
+
+
+class FakeTool(DockerTool):
+    @classmethod
+    def name(cls) -> str:
+        return "fake"
+
+    @classmethod
+    def description(cls) -> str:
+        return "Fake tool."
+
+    @classmethod
+    def category(cls) -> str:
+        return "Testing"
+
+
+@pytest.fixture(autouse=True)
+def reset_engine(monkeypatch):
+    monkeypatch.setattr(dockertool, "_image_cache", {})
+    monkeypatch.setattr(dockertool, "_pools", {})
+
+
+def make_tool(monkeypatch, client, pool_size=None):
+    monkeypatch.setattr(dockertool, "from_env", lambda: client)
+    tool = FakeTool("projectdiscovery/dnsx")
+    tool.pool_size = pool_size
+    return tool
+
+
+def test_iter_lines_handles_split_chunks():
+    chunks = [b'{"a"', b': 1}\n{"b": 2}\n{"c', b'": 3}', "é\n".encode()[:1]]
+    chunks.append("é\n".encode()[1:])
+    assert list(iter_lines(chunks)) == ['{"a": 1}', '{"b": 2}', '{"c": 3}é']
+
+
+def test_image_is_checked_once_per_process(monkeypatch):
+    client = FakeClient(chunks=[b"1.1.1.1\n"])
+    tool = make_tool(monkeypatch, client)
+
+    tool.launch("-silent")
+    tool.launch("-silent")
+
+    assert client.images.get.call_count == 1
+    client.images.pull.assert_not_called()
+
+
+def test_missing_image_is_pulled(monkeypatch):
+    client = FakeClient(image_present=False)
+    tool = make_tool(monkeypatch, client)
+
+    assert tool.ensure_image() == ["dnsx"]
+    client.images.pull.assert_called_once_with("projectdiscovery/dnsx:latest")
+
+
+def test_pooled_container_is_reused(monkeypatch):
+    client = FakeClient(chunks=[b"a\nb", b"\nc\n"])
+    tool = make_tool(monkeypatch, client, pool_size=2)
+
+    assert list(tool.stream("-silent")) == ["a", "b", "c"]
+    assert tool.launch("-silent") == "a\nb\nc\n"
+
+    assert len(client.started) == 1
+    assert client.started[0].entrypoint == dockertool.IDLE_ENTRYPOINT
+    assert client.api.execs[0][1] == ["dnsx", "-silent"]
+
+
+def test_abandoned_stream_discards_its_container(monkeypatch):
+    client = FakeClient(chunks=[b"a\n", b"b\n"])
+    tool = make_tool(monkeypatch, client, pool_size=1)
+
+    lines = tool.stream("-silent")
+    assert next(lines) == "a"
+    lines.close()
+    tool.launch("-silent")
+
+    assert client.started[0].removed
+    assert len(client.started) == 2
+
+
+def test_batch_targets_use_a_target_file(monkeypatch):
+    client = FakeClient(chunks=[b"ok\n"])
+    tool = make_tool(monkeypatch, client, pool_size=1)
+
+    tool.launch("-json", targets=["a.com", "b.com"], targets_flag="-l")
+
+    container = client.started[0]
+    path, content = container.archives[0]
+    assert content == "a.com\nb.com\n"
+    argv = client.api.execs[0][1]
+    assert argv == ["dnsx", "-json", "-l", path]
+    # The target file is removed afterwards
+    assert client.api.execs[1][1] == ["rm", "-f", path]
+
+
+def test_batch_targets_on_stdin(monkeypatch):
+    client = FakeClient(chunks=[b"ok\n"])
+    tool = make_tool(monkeypatch, client, pool_size=1)
+
+    tool.launch("-json", targets=["a.com"], targets_via="stdin")
+
+    path, _ = client.started[0].archives[0]
+    assert client.api.execs[0][1] == ["sh", "-c", f"dnsx -json < {path}"]
+
+
+def test_non_zero_exit_raises(monkeypatch):
+    client = FakeClient(chunks=[b"partial\n"], exit_code=2)
+    tool = make_tool(monkeypatch, client, pool_size=1)
+
+    with pytest.raises(RuntimeError, match="exited with status 2"):
+        tool.launch("-silent")
+    # A failing command doesn't poison the container
+    assert not client.started[0].removed
+
+
+def test_pool_can_be_disabled(monkeypatch):
+    client = FakeClient(chunks=[b"x\n"], exit_code=1)
+    tool = make_tool(monkeypatch, client, pool_size=0)
+
+    with pytest.raises(RuntimeError, match="oneshot stderr"):
+        tool.launch("-silent", targets=["a.com"])
+
+    container = client.started[0]
+    assert container.entrypoint == ["dnsx"]
+    assert container.command[:1] == ["-silent"]
+    assert container.removed
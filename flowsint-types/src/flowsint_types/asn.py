@@ -87,6 +87,9 @@ class ASN(FlowsintType):
         """Parse an ASN from a raw string."""
         return cls(asn_str=line.strip())
 
+    # Regex every detected value fully matches (see FlowsintType)
+    detect_pattern = r"(?i:AS)\d+"
+
     @classmethod
     def detect(cls, line: str) -> bool:
         line = line.strip()
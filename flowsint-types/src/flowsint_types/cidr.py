@@ -23,6 +23,9 @@ class CIDR(FlowsintType):
         """Parse a CIDR from a raw string."""
         return cls(network=line.strip())
 
+    # Regex every detected value fully matches (see FlowsintType)
+    detect_pattern = r"(?s:.*/.*)"
+
     @classmethod
     def detect(cls, line: str) -> bool:
         """Detect if a line of text contains a CIDR block."""
@@ -89,6 +89,9 @@ class CreditCard(FlowsintType):
         """Parse a credit card from a raw string."""
         return cls(card_number=line.strip())
 
+    # Regex every detected value fully matches (see FlowsintType)
+    detect_pattern = r"[\d -]{13,}"
+
     @classmethod
     def detect(cls, line: str) -> bool:
         """Detect if a line of text contains a credit card number."""
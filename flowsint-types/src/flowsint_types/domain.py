@@ -49,6 +49,9 @@ class Domain(FlowsintType):
         """Parse a domain from a raw string."""
         return cls(domain=line.strip())
 
+    # Regex every detected value fully matches (see FlowsintType)
+    detect_pattern = r"(?:[a-zA-Z0-9](?:[a-zA-Z0-9-]{0,61}[a-zA-Z0-9])?\.)+[a-zA-Z]{2,}"
+
     @classmethod
     def detect(cls, line: str) -> bool:
         """Detect if a line of text contains a domain."""
@@ -21,6 +21,9 @@ class Email(FlowsintType):
         """Parse an email from a raw string."""
         return cls(email=line.strip())
 
+    # Regex every detected value fully matches (see FlowsintType)
+    detect_pattern = r"[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}"
+
     @classmethod
     def detect(cls, line: str) -> bool:
         """Detect if a line of text contains an email address."""
@@ -102,6 +102,9 @@ class File(FlowsintType):
             return cls(filename=line, **{hash_field: line.lower()})
         return cls(filename=line)
 
+    # Regex every detected value fully matches (see FlowsintType)
+    detect_pattern = r"[0-9a-fA-F]+"
+
     @classmethod
     def detect(cls, line: str) -> bool:
         """Detect a file hash (MD5 / SHA1 / SHA256) from a single line.
@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import ClassVar, Optional
 
 from pydantic import BaseModel, ConfigDict, Field
 
@@ -24,5 +24,11 @@ class FlowsintType(BaseModel):
         title="Label",
     )
 
+    # Regular expression that every value accepted by the type's `detect()`
+    # fully matches, once stripped. Import detection combines the patterns of
+    # all types into a single precompiled matcher and only calls `detect()` to
+    # confirm a match. Types without a pattern are never auto-detected.
+    detect_pattern: ClassVar[Optional[str]] = None
+
     # Allow extra keys to support additional properties from the user
     model_config = ConfigDict(extra="allow")
@@ -436,6 +436,9 @@ class Individual(FlowsintType):
             # Empty string
             return cls(first_name="", last_name="")
 
+    # Regex every detected value fully matches (see FlowsintType)
+    detect_pattern = r"[^ ]*(?: [^ ]*){1,2}"
+
     @classmethod
     def detect(cls, line: str) -> bool:
         """We can detect an individual only if we can split value in exactly 2 string"""
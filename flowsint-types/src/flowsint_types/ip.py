@@ -51,6 +51,9 @@ class Ip(FlowsintType):
         """Parse an IP address from a raw string."""
         return cls(address=line.strip())
 
+    # Regex every detected value fully matches (see FlowsintType)
+    detect_pattern = r"[0-9a-fA-F:.]+(?:%.+)?"
+
     @classmethod
     def detect(cls, line: str) -> bool:
         """Detect if a line of text contains an IP address."""
@@ -69,6 +69,9 @@ class Phone(FlowsintType):
         """Parse a phone number from a raw string."""
         return cls(number=line.strip())
 
+    # Regex every detected value fully matches (see FlowsintType)
+    detect_pattern = r"(?s:.*\d.*)"
+
     @classmethod
     def detect(cls, line: str) -> bool:
         """Detect if a line of text contains a phone number."""
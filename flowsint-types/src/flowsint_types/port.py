@@ -46,6 +46,9 @@ class Port(FlowsintType):
         """Parse a port from a raw string."""
         return cls(number=int(line.strip()))
 
+    # Regex every detected value fully matches (see FlowsintType)
+    detect_pattern = r"\d+"
+
     @classmethod
     def detect(cls, line: str) -> bool:
         """Detect if a line of text contains a port number."""
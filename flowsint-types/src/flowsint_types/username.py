@@ -53,6 +53,9 @@ class Username(FlowsintType):
         """Parse a username from a raw string."""
         return cls(value=line.strip())
 
+    # Regex every detected value fully matches (see FlowsintType)
+    detect_pattern = r"[a-zA-Z0-9_-]{3,80}"
+
     @classmethod
     def detect(cls, line: str) -> bool:
         """Detect if a line of text contains a username."""
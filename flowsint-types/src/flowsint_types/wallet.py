@@ -59,6 +59,11 @@ class CryptoWallet(FlowsintType):
         """Parse a crypto wallet from a raw string."""
         return cls(address=line.strip())
 
+    # Regex every detected value fully matches (see FlowsintType)
+    detect_pattern = (
+        r"0x[a-fA-F0-9]{40}|[13][a-km-zA-HJ-NP-Z1-9]{25,34}|bc1[a-z0-9]{39,59}"
+    )
+
     @classmethod
     def detect(cls, line: str) -> bool:
         """Detect if a line of text contains a cryptocurrency wallet address."""
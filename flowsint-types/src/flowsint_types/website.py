@@ -54,6 +54,9 @@ class Website(FlowsintType):
         """Parse a website from a raw string."""
         return cls(url=line.strip())
 
+    # Regex every detected value fully matches (see FlowsintType)
+    detect_pattern = r"https?://[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}(?:/.*)?"
+
     @classmethod
     def detect(cls, line: str) -> bool:
         """Detect if a line of text contains a website URL."""